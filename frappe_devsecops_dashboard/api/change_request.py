@@ -6,9 +6,12 @@ Whitelisted methods for CRUD operations on Change Request DocType
 import frappe
 from frappe import _
 from typing import Dict, List, Any, Optional
+from frappe_devsecops_dashboard.api.conditional_get import conditional_get, parse_json_filters
+from frappe_devsecops_dashboard.api.request_cache import prefetch_users
 
 
 @frappe.whitelist()
+@conditional_get(lambda filters=None, **kwargs: [('Change Request', parse_json_filters(filters))])
 def get_change_requests(
     fields: Optional[str] = None,
     filters: Optional[str] = None,
@@ -27,7 +30,9 @@ def get_change_requests(
         order_by: Sort order (e.g., "modified desc")
 
     Returns:
-        Dict with 'data' (list of records) and 'total' (count)
+        Dict with 'data' (list of records), 'total' (count) and 'etag'.
+        When the request's If-None-Match matches the etag, returns
+        {'success': True, 'unchanged': True, 'etag': ...} instead.
     """
     try:
         import json
@@ -118,14 +123,12 @@ def get_change_request(name: str) -> Dict[str, Any]:
 
         # Enrich approvers with full names from User DocType
         if data.get('change_approvers'):
+            users = prefetch_users([approver.get('user') for approver in data['change_approvers']])
             for approver in data['change_approvers']:
                 if approver.get('user'):
-                    try:
-                        user_doc = frappe.get_doc('User', approver['user'])
-                        approver['user_full_name'] = user_doc.full_name or approver['user']
-                    except Exception:
-                        # If user not found, use the user ID
-                        approver['user_full_name'] = approver['user']
+                    # If user not found, use the user ID
+                    user = users.get(approver['user']) or {}
+                    approver['user_full_name'] = user.get('full_name') or approver['user']
 
         # Enrich with incident details if linked
         if data.get('incident'):
@@ -823,17 +826,14 @@ def get_change_request_activity(change_request_name: str, limit: int = 10) -> Di
 		)
 
 		# Enhance comment data with user information
+		users = prefetch_users([comment.get("comment_email") for comment in comments])
 		for comment in comments:
-			try:
-				# Try to get full name from User DocType using comment_email
-				user_email = comment.get("comment_email")
-				if user_email:
-					user_doc = frappe.get_doc("User", user_email)
-					comment["owner_name"] = user_doc.full_name or user_email
-				else:
-					comment["owner_name"] = comment.get("comment_by") or "Unknown"
-			except:
-				comment["owner_name"] = comment.get("comment_by") or comment.get("comment_email") or "Unknown"
+			# Try to get full name from User DocType using comment_email
+			user_email = comment.get("comment_email")
+			if user_email and users.get(user_email):
+				comment["owner_name"] = users[user_email].get("full_name") or user_email
+			else:
+				comment["owner_name"] = comment.get("comment_by") or user_email or "Unknown"
 
 		frappe.logger().info(f"[Change Request Comments] Retrieved {len(comments)} comments for {change_request_name}")
 
@@ -0,0 +1,145 @@
+"""
+Conditional GET Support
+
+Lets polling endpoints answer "nothing changed" without building their
+response body. The validator (ETag) is derived from the max `modified`
+timestamp and row count of each permission-filtered source set, plus the
+caller and the request arguments. Clients send it back in If-None-Match.
+"""
+
+import frappe
+import hashlib
+import inspect
+import json
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def conditional_get(get_sources: Callable[..., Iterable[Tuple]]):
+    """
+    Decorator to answer polling requests with {unchanged: true} when the data is unchanged.
+
+    Usage:
+        @frappe.whitelist()
+        @conditional_get(lambda filters=None, **kwargs: [("Change Request", parse_json_filters(filters))])
+        def get_change_requests(filters=None):
+            pass
+
+    get_sources receives the endpoint arguments by name and returns
+    (doctype, filters) or (doctype, filters, ignore_permissions) tuples. The
+    ETag is set as a response header and returned as "etag" in dict
+    responses. When the request's If-None-Match header matches, the endpoint
+    is not called and {"success": True, "unchanged": True, "etag": ...} is
+    returned instead.
+
+    Args:
+        get_sources: Callable returning the source sets of the endpoint
+
+    Returns:
+        Decorated function
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                etag = get_collection_etag(func.__name__, get_sources(**bound.arguments), bound.arguments)
+            except Exception:
+                # Invalid arguments - let the endpoint report the error itself
+                return func(*args, **kwargs)
+
+            set_etag_header(etag)
+
+            if etag in get_if_none_match():
+                return {"success": True, "unchanged": True, "etag": etag}
+
+            result = func(*args, **kwargs)
+
+            if isinstance(result, dict) and result.get("success") is not False:
+                result["etag"] = etag
+
+            return result
+
+        return wrapper
+    return decorator
+
+
+def get_collection_etag(endpoint: str, sources: Iterable[Tuple], arguments: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a weak ETag for an endpoint from its source sets
+
+    Args:
+        endpoint: Endpoint name
+        sources: (doctype, filters[, ignore_permissions]) tuples
+        arguments: Endpoint arguments (different pages/filters get different ETags)
+
+    Returns:
+        Weak ETag string, e.g. W/"3f2a..."
+    """
+    validator = json.dumps(
+        {
+            "endpoint": endpoint,
+            "user": frappe.session.user,
+            "arguments": arguments or {},
+            "sources": [get_source_validator(*source) for source in sources]
+        },
+        sort_keys=True,
+        default=str
+    )
+    return f'W/"{hashlib.sha1(validator.encode()).hexdigest()}"'
+
+
+def get_source_validator(doctype: str, filters=None, ignore_permissions: bool = False) -> List:
+    """
+    Get [max(modified), count] of the rows of doctype the caller can read
+
+    Runs one aggregate query; no rows are materialized.
+
+    Args:
+        doctype: DocType to check
+        filters: frappe.get_list filters
+        ignore_permissions: Use frappe.get_all (for supporting doctypes like ToDo)
+
+    Returns:
+        list: [max modified as string, row count]
+    """
+    get_rows = frappe.get_all if ignore_permissions else frappe.get_list
+
+    try:
+        rows = get_rows(
+            doctype,
+            fields=["max(modified) as last_modified", "count(name) as count"],
+            filters=filters or {},
+            limit_page_length=None
+        )
+    except frappe.PermissionError:
+        # The endpoint returns nothing from this doctype either
+        return [doctype, None, 0]
+
+    row = rows[0] if rows else {}
+    return [doctype, str(row.get("last_modified") or ""), row.get("count") or 0]
+
+
+def get_if_none_match() -> List[str]:
+    """Get the ETags sent by the client in the If-None-Match header"""
+    header = frappe.get_request_header("If-None-Match") if getattr(frappe.local, "request", None) else None
+    if not header:
+        return []
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def set_etag_header(etag: str) -> None:
+    """Set the ETag response header when the running Frappe version supports response headers"""
+    response_headers = getattr(frappe.local, "response_headers", None)
+    if response_headers is not None:
+        response_headers["ETag"] = etag
+
+
+def parse_json_filters(filters) -> Any:
+    """Parse a JSON filters argument the same way the list endpoints do"""
+    if not filters:
+        return []
+    return json.loads(filters) if isinstance(filters, str) else filters
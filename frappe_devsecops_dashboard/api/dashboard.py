@@ -8,35 +8,111 @@ from frappe import _
 from frappe.utils import flt, cint, getdate, today
 from frappe.desk.form.assign_to import add as assign_to_user
 from typing import Dict, List, Any
+from frappe_devsecops_dashboard.api.dashboard_cache import cache_by_permissions
+from frappe_devsecops_dashboard.api.conditional_get import conditional_get
+from frappe_devsecops_dashboard.api.request_cache import prefetch_users, prefetch_task_types
+from frappe_devsecops_dashboard.api.task_type_catalog import (
+    get_task_type_catalog,
+    get_task_type_priorities,
+    has_unrestricted_task_type_access
+)
+
+
+# Default and maximum number of projects returned per page in paginated mode
+DASHBOARD_DEFAULT_PAGE_LENGTH = 50
+DASHBOARD_MAX_PAGE_LENGTH = 500
+
+# Project fields loaded for every dashboard project card
+DASHBOARD_PROJECT_FIELDS = [
+    "name",
+    "project_name",
+    "status",
+    "percent_complete",
+    "customer",
+    "project_type",
+    "priority",
+    "expected_start_date",
+    "expected_end_date",
+    "actual_start_date",
+    "actual_end_date",
+    "cost_center",
+    "department",
+    "custom_software_product",
+    "custom_default_raci_template",
+    "custom_zenhub_workspace_id",
+    "custom_zenhub_project_id",
+    "modified"
+]
+
+
+def get_dashboard_data_sources(**kwargs):
+    """Source sets whose max(modified) and count validate a get_dashboard_data response"""
+    return [
+        ("Project", {"status": ["!=", "Cancelled"]}),
+        ("Task", {}),
+        ("Task Type", {}, True),
+        ("ToDo", {"reference_type": "Task"}, True)
+    ]
 
 
 @frappe.whitelist(allow_guest=True)
-def get_dashboard_data():
+@conditional_get(get_dashboard_data_sources)
+@cache_by_permissions(("Project", "Task", "Task Type"))
+def get_dashboard_data(mode="full", cursor=None, page_length=None):
     """
     Get comprehensive dashboard data using ERPNext Project and Task Type integration
     Uses Frappe ORM with permission-aware queries to ensure proper access control
 
+    Args:
+        mode (str): "full" embeds each project's tasks, "summary" omits them
+            (load them lazily with get_dashboard_project_tasks)
+        cursor (str): Opaque next_cursor from a previous page
+        page_length (int): Projects per page; enables keyset pagination over
+            (modified desc, name desc). Defaults to all projects in "full" mode
+            without a cursor, otherwise DASHBOARD_DEFAULT_PAGE_LENGTH.
+
     Returns:
-        dict: Dashboard data with projects, metrics, and lifecycle phases
+        dict: Dashboard data with projects, metrics, and lifecycle phases.
+            Paginated responses include next_cursor (None on the last page);
+            metrics and lifecycle_phases are only returned on the first page.
+            Includes an etag; when the request's If-None-Match matches it,
+            {"success": True, "unchanged": True, "etag": ...} is returned instead.
     """
     try:
-        # Get projects with associated tasks and task types
-        projects = get_projects_with_tasks()
+        include_tasks = mode != "summary"
+        paginate = bool(cursor or page_length or not include_tasks)
 
-        # Calculate dashboard metrics
-        metrics = calculate_dashboard_metrics(projects)
+        if not paginate:
+            # Get projects with associated tasks and task types
+            projects = get_projects_with_tasks()
 
-        # Get DevSecOps lifecycle phases from Task Types
-        lifecycle_phases = get_devsecops_lifecycle_phases()
+            return {
+                "success": True,
+                "projects": projects,
+                "metrics": calculate_dashboard_metrics(projects),
+                "lifecycle_phases": get_devsecops_lifecycle_phases(),
+                "timestamp": frappe.utils.now()
+            }
 
-        return {
+        page_length = min(cint(page_length) or DASHBOARD_DEFAULT_PAGE_LENGTH, DASHBOARD_MAX_PAGE_LENGTH)
+        projects_data, next_cursor = get_project_page(cursor, page_length)
+
+        result = {
             "success": True,
-            "projects": projects,
-            "metrics": metrics,
-            "lifecycle_phases": lifecycle_phases,
+            "mode": "full" if include_tasks else "summary",
+            "projects": load_projects_with_tasks(projects_data, include_tasks=include_tasks),
+            "next_cursor": next_cursor,
             "timestamp": frappe.utils.now()
         }
 
+        if not cursor:
+            # Portfolio-wide metrics come from snapshots where the user can read every Task,
+            # so the first page stays cheap
+            result["metrics"] = calculate_dashboard_metrics(get_projects_with_tasks(include_tasks=False))
+            result["lifecycle_phases"] = get_devsecops_lifecycle_phases()
+
+        return result
+
     except frappe.PermissionError:
         frappe.log_error("Permission denied for dashboard data", "DevSecOps Dashboard")
         return {
@@ -54,6 +130,14 @@ def get_dashboard_data():
             "error": "You don't have permission to access dashboard data",
             "timestamp": frappe.utils.now()
         }
+    except frappe.ValidationError as e:
+        return {
+            "success": False,
+            "projects": [],
+            "lifecycle_phases": [],
+            "error": str(e),
+            "timestamp": frappe.utils.now()
+        }
     except Exception as e:
         frappe.log_error(f"Dashboard API Error: {str(e)}", "DevSecOps Dashboard")
         return {
@@ -73,11 +157,94 @@ def get_dashboard_data():
         }
 
 
-def get_projects_with_tasks():
+def encode_project_cursor(project):
+    """
+    Encode the keyset position of a project row as an opaque cursor
+
+    Args:
+        project (dict): Project row with modified and name
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    import base64
+    import json
+
+    raw = json.dumps([str(project.get('modified')), project.get('name')])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_project_cursor(cursor):
+    """
+    Decode a cursor created by encode_project_cursor
+
+    Args:
+        cursor (str): Opaque cursor string
+
+    Returns:
+        tuple: (modified, name)
+    """
+    import base64
+    import json
+
+    try:
+        modified, name = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        return modified, name
+    except Exception:
+        frappe.throw(_("Invalid dashboard cursor"), frappe.ValidationError)
+
+
+def get_project_page(cursor=None, page_length=DASHBOARD_DEFAULT_PAGE_LENGTH):
+    """
+    Get one page of permitted projects using keyset pagination
+
+    Orders by (modified desc, name desc) and continues strictly after the
+    cursor position, so pages stay stable while rows are inserted.
+
+    Args:
+        cursor (str): Opaque cursor from the previous page (None for first page)
+        page_length (int): Number of projects to return
+
+    Returns:
+        tuple: (list of project rows, next cursor or None)
+    """
+    filters = [["status", "!=", "Cancelled"]]
+    or_filters = None
+
+    if cursor:
+        # (modified, name) < (cursor_modified, cursor_name)
+        cursor_modified, cursor_name = decode_project_cursor(cursor)
+        filters.append(["modified", "<=", cursor_modified])
+        or_filters = [
+            ["modified", "<", cursor_modified],
+            ["name", "<", cursor_name]
+        ]
+
+    projects_data = frappe.get_list(
+        "Project",
+        fields=DASHBOARD_PROJECT_FIELDS,
+        filters=filters,
+        or_filters=or_filters,
+        order_by="modified desc, name desc",
+        limit_page_length=page_length + 1
+    )
+
+    next_cursor = None
+    if len(projects_data) > page_length:
+        projects_data = projects_data[:page_length]
+        next_cursor = encode_project_cursor(projects_data[-1])
+
+    return projects_data, next_cursor
+
+
+def get_projects_with_tasks(include_tasks=True):
     """
     Get all projects with their associated tasks and progress data
     Uses frappe.get_list() which respects user permissions
 
+    Args:
+        include_tasks (bool): Embed each project's tasks in the result
+
     Returns:
         list: List of projects with task data and lifecycle progress (only those user has access to)
     """
@@ -87,26 +254,7 @@ def get_projects_with_tasks():
         # Only returns projects the current user has read access to
         projects_data = frappe.get_list(
             "Project",
-            fields=[
-                "name",
-                "project_name",
-                "status",
-                "percent_complete",
-                "customer",
-                "project_type",
-                "priority",
-                "expected_start_date",
-                "expected_end_date",
-                "actual_start_date",
-                "actual_end_date",
-                "cost_center",
-                "department",
-                "custom_software_product",
-                "custom_default_raci_template",
-                "custom_zenhub_workspace_id",
-                "custom_zenhub_project_id",
-                "modified"
-            ],
+            fields=DASHBOARD_PROJECT_FIELDS,
             filters={
                 "status": ["!=", "Cancelled"]
             },
@@ -114,21 +262,8 @@ def get_projects_with_tasks():
             limit_page_length=None  # Get all projects user has access to
         )
 
-        # Enhance each project with task and lifecycle data
-        enhanced_projects = []
-        for project in projects_data:
-            try:
-                enhanced_project = enhance_project_with_task_data(project)
-                enhanced_projects.append(enhanced_project)
-            except frappe.PermissionError:
-                # Skip projects user doesn't have access to
-                continue
-            except Exception as e:
-                # Log error but continue with other projects
-                frappe.log_error(f"Error enhancing project {project.get('name')}: {str(e)}", "DevSecOps Dashboard")
-                continue
-
-        return enhanced_projects
+        # Enhance all projects with task and lifecycle data using set-based queries
+        return load_projects_with_tasks(projects_data, include_tasks=include_tasks)
 
     except frappe.PermissionError:
         # User doesn't have permission to access projects
@@ -139,145 +274,351 @@ def get_projects_with_tasks():
         return []
 
 
-def enhance_project_with_task_data(project):
+# Task fields embedded in every dashboard project payload
+DASHBOARD_TASK_FIELDS = [
+    "name",
+    "subject",
+    "status",
+    "type",
+    "progress",
+    "priority",
+    "exp_start_date",
+    "exp_end_date",
+    "act_start_date",
+    "act_end_date",
+    "completed_on",
+    "is_milestone",
+    "owner",
+    "description",
+    "custom_zenhub_epic_id",
+    "idx"
+]
+
+# Task fields needed to calculate phases and progress when no snapshot exists
+DASHBOARD_SUMMARY_TASK_FIELDS = [
+    "name",
+    "type",
+    "status"
+]
+
+
+def load_projects_with_tasks(projects, include_tasks=True):
+    """
+    Enhance a batch of projects with task information and lifecycle phases
+
+    Issues a fixed number of queries regardless of how many projects or tasks
+    are involved (Project Users, Tasks, Task Types, ToDo assignments and User
+    names) and joins the results in memory.
+
+    With include_tasks, phases, progress and task counts are calculated from
+    the embedded tasks, so they always match the task list. Without it they
+    are read from the Project Dashboard Snapshot table when the user can read
+    every Task (snapshots count all tasks); projects without a snapshot, and
+    users with restricted Task access, fall back to the live calculation.
+
+    Args:
+        projects (list): Basic project rows (as returned by frappe.get_list)
+        include_tasks (bool): Embed the enriched task list in each project.
+            When False the "tasks" key is omitted and tasks are only loaded
+            (minimal fields) for projects that are not served from snapshots.
+
+    Returns:
+        list: Enhanced projects in the same order as the input
     """
-    Enhance project data with task information and lifecycle phases
+    if not projects:
+        return []
+
+    project_names = [p.get('name') for p in projects if p and p.get('name')]
+
+    snapshots = {} if include_tasks else get_dashboard_snapshots(project_names)
+    project_managers = get_project_managers([name for name in project_names if name not in snapshots])
+    if include_tasks:
+        tasks_by_project, task_type_priorities = get_tasks_by_project(project_names)
+    else:
+        tasks_by_project, task_type_priorities = get_tasks_by_project(
+            [name for name in project_names if name not in snapshots],
+            summary_only=True
+        )
+
+    enhanced_projects = []
+    for project in projects:
+        if not project:
+            continue
+        try:
+            project_name = project.get('name')
+            snapshot = snapshots.get(project_name)
+            project['project_manager'] = snapshot.get('project_manager') if snapshot else project_managers.get(project_name)
+            enhanced_project = build_project_payload(
+                project,
+                tasks_by_project.get(project_name, []),
+                task_type_priorities,
+                snapshot
+            )
+            if not include_tasks:
+                enhanced_project.pop('tasks', None)
+            enhanced_projects.append(enhanced_project)
+        except Exception as e:
+            # Log error but continue with other projects
+            frappe.log_error(f"Error enhancing project {project.get('name')}: {str(e)}", "DevSecOps Dashboard")
+            continue
+
+    return enhanced_projects
+
+
+def get_dashboard_snapshots(project_names):
+    """
+    Get precomputed Project Dashboard Snapshots for the given projects
+
+    Snapshots count every task of a project, so they are only used for users
+    whose Task read access is unrestricted (see has_unrestricted_task_read);
+    anyone else gets counts calculated from the tasks they can read. Guests
+    see no tasks, so they never use snapshots (their projects are always
+    reported with zero tasks).
 
     Args:
-        project (dict): Basic project data
+        project_names (list): Names of projects the user already has access to
 
     Returns:
-        dict: Enhanced project with task and lifecycle data
+        dict: Project name -> snapshot values
     """
-    project_name = project.get('name')
+    if not project_names or not has_unrestricted_task_read():
+        return {}
 
-    # Get project manager from users child table
     try:
-        project_doc = frappe.get_doc("Project", project_name)
-        project_manager_name = None
+        from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.project_dashboard_snapshot.project_dashboard_snapshot import (
+            get_project_snapshots
+        )
+        return get_project_snapshots(project_names)
+    except Exception as e:
+        frappe.log_error(f"Error fetching dashboard snapshots: {str(e)}", "DevSecOps Dashboard")
+        return {}
 
-        # Loop through project users to find Project Manager
-        if project_doc.users:
-            for user_record in project_doc.users:
-                # Check custom_business_function field
-                business_func = user_record.get("custom_business_function")
 
-                if business_func == "Project Manager":
-                    project_manager_name = user_record.get("full_name") or user_record.user
-                    break
+def has_unrestricted_task_read(user=None):
+    """
+    Check whether a user can read every Task, so task counters built from all
+    tasks (Project Dashboard Snapshots) match what the user would see
 
-        project['project_manager'] = project_manager_name
+    Access is restricted when the user has no role-based Task read, has any
+    User Permissions, reads Tasks only as owner, or Task reads go through
+    permission_query_conditions / has_permission hooks.
+
+    Args:
+        user (str): User to check (defaults to the session user)
+
+    Returns:
+        bool: True when snapshot counters are safe to show to the user
+    """
+    from frappe.core.doctype.user_permission.user_permission import get_user_permissions
+    from frappe.permissions import get_role_permissions
+
+    user = user or frappe.session.user
+    if user == "Administrator":
+        return True
+    if user == "Guest":
+        return False
+
+    try:
+        if "Task" in (frappe.get_hooks("permission_query_conditions") or {}) or "Task" in (frappe.get_hooks("has_permission") or {}):
+            return False
+
+        if get_user_permissions(user):
+            return False
+
+        role_permissions = get_role_permissions(frappe.get_meta("Task"), user)
+        if not role_permissions.get("read") or (role_permissions.get("if_owner") or {}).get("read"):
+            return False
     except Exception as e:
-        frappe.log_error(f"Error fetching project manager for {project_name}: {str(e)}", "Project Manager Fetch Error")
-        project['project_manager'] = None
+        frappe.log_error(f"Error checking Task read access: {str(e)}", "DevSecOps Dashboard")
+        return False
+
+    return True
+
+
+def get_project_managers(project_names):
+    """
+    Get the Project Manager for each project from the Project User child table
+
+    Args:
+        project_names (list): Names of projects the user already has access to
+
+    Returns:
+        dict: Project name -> project manager full name (or user id)
+    """
+    if not project_names:
+        return {}
 
-    # Get tasks for this project
     try:
-        # For project detail view, show ALL tasks to authenticated users
-        # Users can see tasks they're working on even if not explicitly assigned via ToDo
-        current_user = frappe.session.user
+        project_users = frappe.get_all(
+            "Project User",
+            filters={
+                "parenttype": "Project",
+                "parent": ["in", project_names],
+                "custom_business_function": "Project Manager"
+            },
+            fields=["parent", "user", "full_name"],
+            order_by="idx asc"
+        )
+    except Exception as e:
+        frappe.log_error(f"Error fetching project managers: {str(e)}", "Project Manager Fetch Error")
+        return {}
 
-        # Check if user is authenticated (not Guest)
-        is_authenticated = current_user != "Guest"
+    project_managers = {}
+    for user_record in project_users:
+        # First Project Manager row wins, matching the child table order
+        if user_record.get('parent') not in project_managers:
+            project_managers[user_record.get('parent')] = user_record.get('full_name') or user_record.get('user')
 
-        # If authenticated, show ALL tasks; if Guest, no tasks
-        if is_authenticated:
-            # Administrators and Project Managers see ALL tasks in the project
-            tasks = frappe.get_list(
-                "Task",
-                fields=[
-                    "name",
-                    "subject",
-                    "status",
-                    "type",
-                    "progress",
-                    "priority",
-                    "exp_start_date",
-                    "exp_end_date",
-                    "act_start_date",
-                    "act_end_date",
-                    "completed_on",
-                    "is_milestone",
-                    "owner",
-                    "description",
-                    "custom_zenhub_epic_id",
-                    "idx"
-                ],
-                filters={
-                    "project": project_name
-                },
-                order_by="type, idx",
-                limit_page_length=None
-            )
-        else:
-            # Guest users see no tasks
-            tasks = []
+    return project_managers
 
-        # Enhance tasks with task type information and assignments using ORM
-        enhanced_tasks = []
-        for task in tasks:
-            try:
-                # Get task type description and priority if type exists
-                if task.get('type'):
-                    task_type_doc = frappe.get_doc("Task Type", task.get('type'))
-                    task['task_type_description'] = task_type_doc.get('description', '')
-                    task['task_type_priority'] = task_type_doc.get('custom_priority') or 999
-                else:
-                    task['task_type_description'] = ''
-                    task['task_type_priority'] = 999
 
-                # Get task assignments from ToDo doctype
-                from frappe_devsecops_dashboard.api.task import get_task_assignments
-                task_assignments = get_task_assignments(task.get('name'))
-                task['assigned_users'] = task_assignments
+def get_tasks_by_project(project_names, summary_only=False):
+    """
+    Get tasks for many projects, enriched with Task Type details and assignments
 
-                # For backward compatibility, create a comma-separated string of assigned names
-                if task_assignments:
-                    task['assigned_to'] = ', '.join([a['full_name'] for a in task_assignments])
-                else:
-                    task['assigned_to'] = ''
-
-                enhanced_tasks.append(task)
-            except frappe.DoesNotExistError:
-                # Task type doesn't exist, continue without description
-                task['task_type_description'] = ''
-                task['task_type_priority'] = 999
-                task['assigned_users'] = []
-                task['assigned_to'] = ''
-                enhanced_tasks.append(task)
-            except frappe.PermissionError:
-                # User doesn't have access to this task type, skip description
-                task['task_type_description'] = ''
-                task['task_type_priority'] = 999
-                task['assigned_users'] = []
-                task['assigned_to'] = ''
-                enhanced_tasks.append(task)
+    Args:
+        project_names (list): Names of projects the user already has access to
+        summary_only (bool): Only load the fields needed for phase/progress
+            calculation and skip assignment lookups
 
-        tasks = enhanced_tasks
+    Returns:
+        tuple: (dict of project name -> list of tasks, dict of Task Type -> priority)
+    """
+    # Guest users see no tasks
+    if not project_names or frappe.session.user == "Guest":
+        return {}, {}
 
+    try:
+        tasks = frappe.get_list(
+            "Task",
+            fields=(DASHBOARD_SUMMARY_TASK_FIELDS if summary_only else DASHBOARD_TASK_FIELDS) + ["project"],
+            filters={
+                "project": ["in", project_names]
+            },
+            order_by="type asc, idx asc",
+            limit_page_length=None
+        )
     except frappe.PermissionError:
-        # User doesn't have permission to access tasks for this project
-        frappe.log_error(f"Permission denied for tasks in project {project_name}", "DevSecOps Dashboard")
-        tasks = []
+        # User doesn't have permission to access tasks for these projects
+        frappe.log_error("Permission denied for dashboard tasks", "DevSecOps Dashboard")
+        return {}, {}
+    except Exception as e:
+        frappe.log_error(f"Error fetching dashboard tasks: {str(e)}", "DevSecOps Dashboard")
+        return {}, {}
+
+    task_types = get_task_type_details({t.get('type') for t in tasks if t.get('type')})
+    task_type_priorities = {name: details.get('priority') or 999 for name, details in task_types.items()}
+
+    tasks_by_project = {}
+    if summary_only:
+        for task in tasks:
+            tasks_by_project.setdefault(task.pop('project'), []).append(task)
+        return tasks_by_project, task_type_priorities
+
+    from frappe_devsecops_dashboard.api.task import get_bulk_task_assignments
+    assignments_by_task = get_bulk_task_assignments([t.get('name') for t in tasks])
+
+    for task in tasks:
+        task_type = task_types.get(task.get('type')) or {}
+        task['task_type_description'] = task_type.get('description') or ''
+        task['task_type_priority'] = task_type.get('priority') or 999
+
+        # Get task assignments from ToDo doctype
+        task_assignments = assignments_by_task.get(task.get('name'), [])
+        task['assigned_users'] = task_assignments
+
+        # For backward compatibility, create a comma-separated string of assigned names
+        task['assigned_to'] = ', '.join([a['full_name'] for a in task_assignments]) if task_assignments else ''
+
+        tasks_by_project.setdefault(task.pop('project'), []).append(task)
+
+    return tasks_by_project, task_type_priorities
+
+
+def get_task_type_details(task_type_names):
+    """
+    Get description and priority for a set of Task Types in a single query
+
+    Args:
+        task_type_names (iterable): Task Type names
+
+    Returns:
+        dict: Task Type name -> {"description", "priority"}
+    """
+    task_type_names = [name for name in (task_type_names or []) if name]
+    if not task_type_names:
+        return {}
+
+    try:
+        task_types = prefetch_task_types(task_type_names)
     except Exception as e:
-        frappe.log_error(f"Error fetching tasks for project {project_name}: {str(e)}", "DevSecOps Dashboard")
-        tasks = []
+        frappe.log_error(f"Error fetching Task Type details: {str(e)}", "DevSecOps Dashboard")
+        return {}
 
-    # Calculate lifecycle phases based on Task Types with null safety
-    lifecycle_phases = calculate_project_lifecycle_phases(tasks) if tasks else []
+    return {
+        name: {
+            "description": tt.get('description') or '',
+            "priority": tt.get('custom_priority') or 999
+        }
+        for name, tt in task_types.items()
+        if tt
+    }
+
+
+def enhance_project_with_task_data(project):
+    """
+    Enhance project data with task information and lifecycle phases
+
+    Args:
+        project (dict): Basic project data
 
-    # Calculate overall project metrics with null safety
-    total_tasks = len(tasks) if tasks else 0
-    completed_tasks = len([t for t in tasks if t and t.get('status') == 'Completed']) if tasks else 0
+    Returns:
+        dict: Enhanced project with task and lifecycle data
+    """
+    enhanced_projects = load_projects_with_tasks([project])
+    if enhanced_projects:
+        return enhanced_projects[0]
 
-    # Determine current phase with null safety
-    current_phase = determine_current_phase(lifecycle_phases) if lifecycle_phases else 'Planning'
+    return build_project_payload(project, [])
 
-    # Calculate actual progress (override project percent_complete if we have task data)
-    actual_progress = calculate_actual_progress(tasks) if tasks else (project.get('percent_complete') or 0)
 
-    # Calculate completion rate with null safety
-    completion_rate = flt((completed_tasks / total_tasks * 100), 2) if total_tasks and total_tasks > 0 else 0
+def build_project_payload(project, tasks, task_type_priorities=None, snapshot=None):
+    """
+    Build the dashboard payload for a project from its already-loaded tasks
+
+    Args:
+        project (dict): Basic project data (with project_manager set)
+        tasks (list): Enhanced tasks belonging to the project
+        task_type_priorities (dict): Optional Task Type -> priority map
+        snapshot (dict): Optional Project Dashboard Snapshot values; when given,
+            phases, counts and progress are taken from it instead of recalculated
+
+    Returns:
+        dict: Enhanced project with task and lifecycle data
+    """
+    if snapshot:
+        lifecycle_phases = snapshot.get('delivery_phases') or []
+        total_tasks = cint(snapshot.get('task_count'))
+        completed_tasks = cint(snapshot.get('completed_tasks'))
+        current_phase = snapshot.get('current_phase') or 'Planning'
+        actual_progress = snapshot.get('progress') if total_tasks else (project.get('percent_complete') or 0)
+        completion_rate = flt(snapshot.get('completion_rate'), 2)
+    else:
+        # Calculate lifecycle phases based on Task Types with null safety
+        lifecycle_phases = calculate_project_lifecycle_phases(tasks, task_type_priorities) if tasks else []
+
+        # Calculate overall project metrics with null safety
+        total_tasks = len(tasks) if tasks else 0
+        completed_tasks = len([t for t in tasks if t and t.get('status') == 'Completed']) if tasks else 0
+
+        # Determine current phase with null safety
+        current_phase = determine_current_phase(lifecycle_phases) if lifecycle_phases else 'Planning'
+
+        # Calculate actual progress (override project percent_complete if we have task data)
+        actual_progress = calculate_actual_progress(tasks) if tasks else (project.get('percent_complete') or 0)
+
+        # Calculate completion rate with null safety
+        completion_rate = flt((completed_tasks / total_tasks * 100), 2) if total_tasks and total_tasks > 0 else 0
 
     return {
         "id": project.get('name') or 'Unknown',
@@ -309,13 +650,14 @@ def enhance_project_with_task_data(project):
     }
 
 
-def calculate_project_lifecycle_phases(tasks):
+def calculate_project_lifecycle_phases(tasks, task_type_priorities=None):
     """
     Calculate lifecycle phases based on Task Types and their progress with null safety
     Ordered by Task Type custom_priority field (ascending)
 
     Args:
         tasks (list): List of tasks for a project
+        task_type_priorities (dict): Optional Task Type -> priority map; fetched when omitted
 
     Returns:
         list: Lifecycle phases with progress data (empty list if no tasks)
@@ -335,20 +677,13 @@ def calculate_project_lifecycle_phases(tasks):
                 task_types[task_type] = []
             task_types[task_type].append(task)
 
-        # Fetch Task Type priorities from database
-        task_type_priorities = {}
-        try:
-            task_type_list = frappe.get_all(
-                'Task Type',
-                fields=['name', 'custom_priority'],
-                filters={'name': ['in', list(task_types.keys())]}
-            )
-            task_type_priorities = {
-                tt['name']: tt.get('custom_priority') or 999
-                for tt in task_type_list
-            }
-        except Exception as e:
-            frappe.log_error(f"Error fetching Task Type priorities: {str(e)}", "DevSecOps Dashboard")
+        # Read Task Type priorities from the catalog unless the caller already has them
+        if task_type_priorities is None:
+            task_type_priorities = {}
+            try:
+                task_type_priorities = get_task_type_priorities()
+            except Exception as e:
+                frappe.log_error(f"Error fetching Task Type priorities: {str(e)}", "DevSecOps Dashboard")
 
         # Sort task types by custom_priority (ascending), then by name
         sorted_task_types = sorted(
@@ -544,6 +879,24 @@ def calculate_dashboard_metrics(projects):
         }
 
 
+def list_task_types():
+    """
+    List the Task Types the current user can read, ordered by custom_priority, then name
+
+    Returns:
+        list: Task Type rows with name, description and custom_priority
+    """
+    if has_unrestricted_task_type_access():
+        return [dict(tt) for tt in get_task_type_catalog()]
+
+    return frappe.get_list(
+        "Task Type",
+        fields=["name", "description", "custom_priority"],
+        order_by="custom_priority asc, name asc",
+        limit_page_length=None
+    )
+
+
 def get_devsecops_lifecycle_phases():
     """
     Get the standard DevSecOps lifecycle phases from Task Types
@@ -558,12 +911,8 @@ def get_devsecops_lifecycle_phases():
         # frappe.get_list() automatically filters based on user permissions
         # Only returns Task Types the current user has read access to
         # Order by custom_priority (ascending) to maintain DevSecOps timeline order
-        task_types = frappe.get_list(
-            "Task Type",
-            fields=["name", "description", "custom_priority"],
-            order_by="custom_priority asc, name asc",
-            limit_page_length=None
-        )
+        # Users who can read every Task Type are served from the shared catalog
+        task_types = list_task_types()
 
         return [
             {
@@ -654,6 +1003,55 @@ def get_project_details(project_name):
         }
 
 
+@frappe.whitelist()
+def get_dashboard_project_tasks(project_name):
+    """
+    Get the embedded dashboard task list for a single project
+
+    Companion to get_dashboard_data(mode="summary"): returns tasks in the same
+    shape as the "tasks" array of a full-mode project card.
+
+    Args:
+        project_name (str): Name of the project
+
+    Returns:
+        dict: Success status and list of enriched tasks
+    """
+    try:
+        if not frappe.db.exists("Project", project_name):
+            return {
+                "success": False,
+                "error": f"Project '{project_name}' does not exist",
+                "tasks": []
+            }
+
+        if not frappe.has_permission("Project", "read", project_name):
+            frappe.throw(_('Permission denied'), frappe.PermissionError)
+
+        tasks_by_project, _task_type_priorities = get_tasks_by_project([project_name])
+
+        return {
+            "success": True,
+            "project": project_name,
+            "tasks": tasks_by_project.get(project_name, [])
+        }
+
+    except frappe.PermissionError:
+        frappe.log_error(f"Permission denied for project {project_name}", "DevSecOps Dashboard")
+        return {
+            "success": False,
+            "error": "You don't have permission to access this project",
+            "tasks": []
+        }
+    except Exception as e:
+        frappe.log_error(f"Get Dashboard Project Tasks Error: {str(e)}", "DevSecOps Dashboard")
+        return {
+            "success": False,
+            "error": "An error occurred while fetching project tasks",
+            "tasks": []
+        }
+
+
 # ============================================================================
 # ATTACHMENTS API ENDPOINTS
 # ============================================================================
@@ -696,12 +1094,10 @@ def get_project_files(project_name):
         )
 
         # Enhance file data with user information
+        users = prefetch_users([file.get("owner") for file in files])
         for file in files:
-            try:
-                owner_doc = frappe.get_doc("User", file.get("owner"))
-                file["owner_name"] = owner_doc.full_name or file.get("owner")
-            except:
-                file["owner_name"] = file.get("owner")
+            owner = users.get(file.get("owner")) or {}
+            file["owner_name"] = owner.get("full_name") or file.get("owner")
 
         return {
             "success": True,
@@ -911,13 +1307,14 @@ def get_project_comments(project_name):
         )
 
         # Enhance comment data with user information
+        users = prefetch_users([comment.get("owner") for comment in comments])
         for comment in comments:
-            try:
-                owner_doc = frappe.get_doc("User", comment.get("owner"))
-                comment["owner_name"] = owner_doc.full_name or comment.get("owner")
-                comment["owner_email"] = owner_doc.email
-                comment["user_image"] = owner_doc.user_image
-            except:
+            owner = users.get(comment.get("owner"))
+            if owner:
+                comment["owner_name"] = owner.get("full_name") or comment.get("owner")
+                comment["owner_email"] = owner.get("email")
+                comment["user_image"] = owner.get("user_image")
+            else:
                 comment["owner_name"] = comment.get("owner")
                 comment["owner_email"] = ""
                 comment["user_image"] = None
@@ -1397,15 +1794,18 @@ def get_software_product_team_members(product_name):
 
         # Extract team members with user details
         team_members = []
+        users = prefetch_users([member.member for member in product.team_members])
         for member in product.team_members:
             # Get user details
-            user_doc = frappe.get_doc("User", member.member)
+            user = users.get(member.member)
+            if not user:
+                frappe.throw(_("User {0} not found").format(member.member), frappe.DoesNotExistError)
 
             team_members.append({
                 "user": member.member,
-                "email": user_doc.email,
-                "full_name": user_doc.full_name,
-                "user_image": user_doc.user_image,
+                "email": user.get("email"),
+                "full_name": user.get("full_name"),
+                "user_image": user.get("user_image"),
                 "role": member.role,  # This maps to business_function in project
                 "business_function": member.role  # Direct mapping
             })
@@ -1503,11 +1903,7 @@ def get_task_types():
         dict: Success status and list of task types with priorities
     """
     try:
-        task_types = frappe.get_list(
-            "Task Type",
-            fields=["name", "description", "custom_priority"],
-            order_by="custom_priority asc, name asc"
-        )
+        task_types = list_task_types()
 
         return {
             "success": True,
@@ -2063,6 +2459,7 @@ def update_project_manager(project_name, user_id):
 
 
 @frappe.whitelist()
+@cache_by_permissions(("Project", "Task"))
 def get_project_metrics(project_name):
     """Get project task metrics"""
     try:
@@ -2259,9 +2656,10 @@ def get_project_tasks(project_name):
         )
 
         # Enrich tasks with assignment information
-        from frappe_devsecops_dashboard.api.task import get_task_assignments
+        from frappe_devsecops_dashboard.api.task import get_bulk_task_assignments
+        assignments_by_task = get_bulk_task_assignments([task.get('name') for task in tasks])
         for task in tasks:
-            task_assignments = get_task_assignments(task.get('name'))
+            task_assignments = assignments_by_task.get(task.get('name'), [])
             task['assigned_users'] = task_assignments
             # For backward compatibility, create a comma-separated string of assigned names
             if task_assignments:
@@ -2361,19 +2759,21 @@ def update_project_user(project_name, user_id, user_fields=None):
 
 
 
-@frappe.whitelist()
-def get_dashboard_metrics(metric_type="all", **filters):
+@cache_by_permissions(("Project", "Change Request", "Devsecops Dashboard Incident"))
+def get_dashboard_metrics_by_type(metric_type="all", filters=None):
     """
-    Unified metrics API endpoint for all dashboard types
-    Accepts metric_type parameter to specify which metrics to retrieve
+    Unified metrics for all dashboard types
+    Called by get_dashboard_metrics when a metric_type parameter is given
 
     Args:
         metric_type (str): Type of metrics to retrieve ('change_requests', 'incidents', 'projects', 'all')
-        **filters: Additional filters for the metrics query
+        filters (dict): Additional filters for the metrics query
 
     Returns:
         dict: Metrics data in consistent JSON format with null safety
     """
+    filters = filters or {}
+
     try:
         result = {
             "success": True,
@@ -2422,6 +2822,51 @@ def get_dashboard_metrics(metric_type="all", **filters):
         }
 
 
+def get_grouped_counts(doctype, group_by_fields, filters=None):
+    """
+    Count permitted rows of a doctype grouped by one or more fields
+
+    Runs a single COUNT(*) ... GROUP BY query through frappe.get_list, so the
+    caller's permission conditions are applied but no row names are
+    materialized.
+
+    Args:
+        doctype (str): DocType to count
+        group_by_fields (list): Fields to group by (e.g. ["status"])
+        filters: Optional frappe.get_list filters
+
+    Returns:
+        list: Rows with the group_by fields and a "count" column
+    """
+    return frappe.get_list(
+        doctype,
+        fields=list(group_by_fields) + ["count(name) as count"],
+        filters=filters or {},
+        group_by=", ".join(group_by_fields),
+        order_by=f"{group_by_fields[0]} asc",
+        limit_page_length=None
+    ) or []
+
+
+def sum_grouped_counts(rows, field=None, values=None):
+    """
+    Sum the "count" column of get_grouped_counts rows
+
+    Args:
+        rows (list): Result of get_grouped_counts
+        field (str): Optional field to match against values
+        values (list): Values of field to include (all rows when omitted)
+
+    Returns:
+        int: Total count of matching groups
+    """
+    return sum(
+        cint(row.get("count"))
+        for row in rows or []
+        if field is None or row.get(field) in values
+    )
+
+
 def get_change_requests_metrics(filters=None):
     """
     Calculate Change Requests metrics with null safety
@@ -2440,22 +2885,17 @@ def get_change_requests_metrics(filters=None):
         if filters.get("status"):
             query_filters["approval_status"] = filters["status"]
 
-        # Get all change requests
-        change_requests = frappe.get_list(
-            "Change Request",
-            filters=query_filters,
-            fields=["name", "approval_status"],
-            limit_page_length=None
-        ) or []
+        # Count change requests per approval status in one aggregate query
+        counts = get_grouped_counts("Change Request", ["approval_status"], query_filters)
 
         # Calculate metrics with null safety
         metrics = {
-            "total": len(change_requests) if change_requests else 0,
-            "pending": len([cr for cr in change_requests if cr.get("approval_status") == "Pending"]) if change_requests else 0,
-            "approved": len([cr for cr in change_requests if cr.get("approval_status") == "Approved"]) if change_requests else 0,
-            "rejected": len([cr for cr in change_requests if cr.get("approval_status") == "Rejected"]) if change_requests else 0,
-            "in_progress": len([cr for cr in change_requests if cr.get("approval_status") == "In Progress"]) if change_requests else 0,
-            "completed": len([cr for cr in change_requests if cr.get("approval_status") == "Completed"]) if change_requests else 0,
+            "total": sum_grouped_counts(counts),
+            "pending": sum_grouped_counts(counts, "approval_status", ["Pending"]),
+            "approved": sum_grouped_counts(counts, "approval_status", ["Approved"]),
+            "rejected": sum_grouped_counts(counts, "approval_status", ["Rejected"]),
+            "in_progress": sum_grouped_counts(counts, "approval_status", ["In Progress"]),
+            "completed": sum_grouped_counts(counts, "approval_status", ["Completed"]),
             "avg_approval_time": 24  # Default value
         }
 
@@ -2536,24 +2976,19 @@ def get_incidents_metrics(filters=None):
         if filters.get("severity"):
             query_filters["severity"] = filters["severity"]
 
-        # Get all incidents
-        incidents = frappe.get_list(
-            "Incident",
-            filters=query_filters,
-            fields=["name", "status", "severity"],
-            limit_page_length=None
-        ) or []
+        # Count incidents per status and severity in one aggregate query
+        counts = get_grouped_counts("Devsecops Dashboard Incident", ["status", "severity"], query_filters)
 
         # Calculate metrics with null safety
         metrics = {
-            "total": len(incidents) if incidents else 0,
-            "open": len([inc for inc in incidents if inc.get("status") == "Open"]) if incidents else 0,
-            "in_progress": len([inc for inc in incidents if inc.get("status") == "In Progress"]) if incidents else 0,
-            "resolved": len([inc for inc in incidents if inc.get("status") == "Resolved"]) if incidents else 0,
-            "critical": len([inc for inc in incidents if inc.get("severity") == "Critical"]) if incidents else 0,
-            "high": len([inc for inc in incidents if inc.get("severity") == "High"]) if incidents else 0,
-            "medium": len([inc for inc in incidents if inc.get("severity") == "Medium"]) if incidents else 0,
-            "low": len([inc for inc in incidents if inc.get("severity") == "Low"]) if incidents else 0,
+            "total": sum_grouped_counts(counts),
+            "open": sum_grouped_counts(counts, "status", ["Open"]),
+            "in_progress": sum_grouped_counts(counts, "status", ["In Progress"]),
+            "resolved": sum_grouped_counts(counts, "status", ["Resolved"]),
+            "critical": sum_grouped_counts(counts, "severity", ["Critical"]),
+            "high": sum_grouped_counts(counts, "severity", ["High"]),
+            "medium": sum_grouped_counts(counts, "severity", ["Medium"]),
+            "low": sum_grouped_counts(counts, "severity", ["Low"]),
             "avg_resolution_time": 48  # Default value
         }
 
@@ -2596,7 +3031,7 @@ def get_incidents_data(filters=None):
 
         # Get incidents
         incidents = frappe.get_list(
-            "Incident",
+            "Devsecops Dashboard Incident",
             filters=query_filters,
             fields=[
                 "name",
@@ -2632,20 +3067,15 @@ def get_projects_metrics(filters=None):
     try:
         filters = filters or {}
 
-        # Get all projects
-        projects = frappe.get_list(
-            "Project",
-            filters={"status": ["!=", "Cancelled"]},
-            fields=["name", "status"],
-            limit_page_length=None
-        ) or []
+        # Count projects per status in one aggregate query
+        counts = get_grouped_counts("Project", ["status"], {"status": ["!=", "Cancelled"]})
 
         # Calculate metrics with null safety
         metrics = {
-            "total": len(projects) if projects else 0,
-            "active": len([p for p in projects if p.get("status") == "Open"]) if projects else 0,
-            "completed": len([p for p in projects if p.get("status") == "Completed"]) if projects else 0,
-            "on_hold": len([p for p in projects if p.get("status") == "On Hold"]) if projects else 0
+            "total": sum_grouped_counts(counts),
+            "active": sum_grouped_counts(counts, "status", ["Open"]),
+            "completed": sum_grouped_counts(counts, "status", ["Completed"]),
+            "on_hold": sum_grouped_counts(counts, "status", ["On Hold"])
         }
 
         return metrics
@@ -2914,19 +3344,37 @@ def create_project(project_name, project_type, expected_start_date, expected_end
 
 
 @frappe.whitelist(allow_guest=True)
-def get_dashboard_metrics():
+def get_dashboard_metrics(metric_type=None, **filters):
     """
-    Get optimized dashboard metrics with efficient database queries
-    Uses frappe.db.count() and aggregation for performance
+    Get dashboard metrics with one aggregate query per doctype
+
+    Without metric_type, returns the summary counts for projects, the current
+    user's assigned tasks, incidents and change requests. Each count comes from
+    a permission-aware COUNT(*) ... GROUP BY query, so the cost does not grow
+    with the number of rows.
+
+    With metric_type ('change_requests', 'incidents', 'projects', 'all'),
+    returns the detailed metrics (and data) from get_dashboard_metrics_by_type.
+    Detailed metrics require a logged-in user.
+
+    Args:
+        metric_type (str): Optional type of detailed metrics to retrieve
+        **filters: Additional filters for the detailed metrics query
 
     Returns:
         dict: Dashboard metrics with project, task, incident, and change request counts
     """
+    if metric_type:
+        if frappe.session.user == "Guest":
+            frappe.throw(_("Login required to view detailed dashboard metrics"), frappe.PermissionError)
+        return get_dashboard_metrics_by_type(metric_type, filters)
+
     try:
-        # Count projects by status using optimized queries
-        total_projects = len(frappe.get_list("Project", fields=["name"]))
-        active_projects = len(frappe.get_list("Project", filters=[["status", "=", "Open"]], fields=["name"]))
-        completed_projects = len(frappe.get_list("Project", filters=[["status", "=", "Completed"]], fields=["name"]))
+        # Count projects by status
+        project_counts = get_grouped_counts("Project", ["status"])
+        total_projects = sum_grouped_counts(project_counts)
+        active_projects = sum_grouped_counts(project_counts, "status", ["Open"])
+        completed_projects = sum_grouped_counts(project_counts, "status", ["Completed"])
 
         # Count tasks by status - only for tasks assigned to current user
         current_user = frappe.session.user
@@ -2938,7 +3386,8 @@ def get_dashboard_metrics():
                 'allocated_to': current_user
             },
             fields=['reference_name'],
-            pluck='reference_name'
+            pluck='reference_name',
+            distinct=True
         )
 
         if not assigned_task_names:
@@ -2947,20 +3396,23 @@ def get_dashboard_metrics():
             in_progress_tasks = 0
             overdue_tasks = 0
         else:
-            total_tasks = len(frappe.get_list("Task", filters=[["name", "in", assigned_task_names]], fields=["name"]))
-            completed_tasks = len(frappe.get_list("Task", filters=[["name", "in", assigned_task_names], ["status", "=", "Completed"]], fields=["name"]))
-            in_progress_tasks = len(frappe.get_list("Task", filters=[["name", "in", assigned_task_names], ["status", "in", ["Open", "Working"]]], fields=["name"]))
-            overdue_tasks = len(frappe.get_list("Task", filters=[["name", "in", assigned_task_names], ["status", "=", "Overdue"]], fields=["name"]))
-
-        # Count incidents by status using optimized queries
-        total_incidents = len(frappe.get_list("Devsecops Dashboard Incident", fields=["name"]))
-        open_incidents = len(frappe.get_list("Devsecops Dashboard Incident", filters=[["status", "in", ["Open", "Acknowledged", "In Progress"]]], fields=["name"]))
-        critical_incidents = len(frappe.get_list("Devsecops Dashboard Incident", filters=[["severity", "=", "S1 - Critical"]], fields=["name"]))
-
-        # Count change requests by approval status using optimized queries
-        total_change_requests = len(frappe.get_list("Change Request", fields=["name"]))
-        pending_approvals = len(frappe.get_list("Change Request", filters=[["approval_status", "=", "Pending"]], fields=["name"]))
-        approved_requests = len(frappe.get_list("Change Request", filters=[["approval_status", "=", "Approved"]], fields=["name"]))
+            task_counts = get_grouped_counts("Task", ["status"], [["name", "in", assigned_task_names]])
+            total_tasks = sum_grouped_counts(task_counts)
+            completed_tasks = sum_grouped_counts(task_counts, "status", ["Completed"])
+            in_progress_tasks = sum_grouped_counts(task_counts, "status", ["Open", "Working"])
+            overdue_tasks = sum_grouped_counts(task_counts, "status", ["Overdue"])
+
+        # Count incidents by status and severity
+        incident_counts = get_grouped_counts("Devsecops Dashboard Incident", ["status", "severity"])
+        total_incidents = sum_grouped_counts(incident_counts)
+        open_incidents = sum_grouped_counts(incident_counts, "status", ["Open", "Acknowledged", "In Progress"])
+        critical_incidents = sum_grouped_counts(incident_counts, "severity", ["S1 - Critical"])
+
+        # Count change requests by approval status
+        change_request_counts = get_grouped_counts("Change Request", ["approval_status"])
+        total_change_requests = sum_grouped_counts(change_request_counts)
+        pending_approvals = sum_grouped_counts(change_request_counts, "approval_status", ["Pending"])
+        approved_requests = sum_grouped_counts(change_request_counts, "approval_status", ["Approved"])
 
         # Calculate completion rates
         task_completion_rate = flt((completed_tasks / total_tasks * 100), 2) if total_tasks > 0 else 0
@@ -0,0 +1,200 @@
+"""
+Dashboard Response Cache
+
+Caches dashboard endpoint responses keyed by a fingerprint of the caller's
+effective permissions, so users with identical access share one cache entry.
+Entries are invalidated by per-doctype version tokens that doc_events bump.
+"""
+
+import frappe
+import hashlib
+import json
+from functools import partial, wraps
+from typing import Any, Callable, Dict, Iterable, List
+
+
+# Doctypes whose read permissions decide what the dashboard endpoints return
+PERMISSION_DOCTYPES = ("Project", "Task", "Change Request", "Devsecops Dashboard Incident")
+
+# Documents that change dashboard output without being one of the cached doctypes
+VERSION_DOCTYPE_MAP = {
+    "ToDo": "Task"
+}
+
+CACHE_KEY_PREFIX = "devsecops_dashboard_cache"
+VERSION_KEY_PREFIX = "devsecops_dashboard_cache_version"
+DASHBOARD_CACHE_TTL = 300  # 5 minutes
+
+
+def cache_by_permissions(doctypes: Iterable[str], ttl: int = DASHBOARD_CACHE_TTL):
+    """
+    Decorator to cache a dashboard endpoint per permission fingerprint.
+
+    Usage:
+        @frappe.whitelist()
+        @cache_by_permissions(("Project", "Task"))
+        def get_project_metrics(project_name):
+            pass
+
+    Only successful responses (dicts without success=False) are cached.
+    Caching is skipped while running tests, where writes are rolled back
+    instead of committed.
+
+    Args:
+        doctypes: Doctypes whose version tokens invalidate the cached response
+        ttl: Time to live in seconds
+
+    Returns:
+        Decorated function
+    """
+    doctypes = tuple(doctypes)
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            if frappe.flags.in_test:
+                return func(*args, **kwargs)
+
+            try:
+                cache_key = get_response_cache_key(func.__name__, doctypes, args, kwargs)
+                cached = frappe.cache().get_value(cache_key)
+                if cached is not None:
+                    return cached
+            except Exception as e:
+                frappe.log_error(f"Dashboard cache lookup failed: {str(e)}", "DevSecOps Dashboard Cache")
+                return func(*args, **kwargs)
+
+            result = func(*args, **kwargs)
+
+            if not (isinstance(result, dict) and result.get("success") is False):
+                try:
+                    frappe.cache().set_value(cache_key, result, expires_in_sec=ttl)
+                except Exception:
+                    pass  # Fail silently to not break functionality
+
+            return result
+
+        return wrapper
+    return decorator
+
+
+def get_response_cache_key(endpoint: str, doctypes: Iterable[str], args: tuple, kwargs: Dict[str, Any]) -> str:
+    """Build the cache key from endpoint arguments, permission fingerprint and doctype versions"""
+    key_data = json.dumps(
+        {
+            "args": args,
+            "kwargs": kwargs,
+            "permissions": get_permission_fingerprint(),
+            "versions": get_cache_versions(doctypes)
+        },
+        sort_keys=True,
+        default=str
+    )
+    return f"{CACHE_KEY_PREFIX}:{endpoint}:{hashlib.sha1(key_data.encode()).hexdigest()}"
+
+
+def get_permission_fingerprint(user: str = None) -> str:
+    """
+    Fingerprint the caller's effective read access on the dashboard doctypes
+
+    Users with the same roles and User Permissions share a fingerprint. When
+    access can depend on the individual user (if_owner rules, documents shared
+    with the user, or custom permission hooks) the user id is included so the
+    entry is not shared.
+
+    Args:
+        user: User to fingerprint (defaults to the session user)
+
+    Returns:
+        Hex digest identifying the permission set
+    """
+    from frappe.core.doctype.user_permission.user_permission import get_user_permissions
+
+    user = user or frappe.session.user
+
+    fingerprint = {
+        "roles": sorted(frappe.get_roles(user)),
+        "user_permissions": {
+            allow: sorted(
+                (str(p.get("doc")), str(p.get("applicable_for") or ""))
+                for p in permissions
+            )
+            for allow, permissions in sorted((get_user_permissions(user) or {}).items())
+        }
+    }
+
+    if has_user_specific_access(user):
+        fingerprint["user"] = user
+
+    return hashlib.sha1(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()
+
+
+def has_user_specific_access(user: str) -> bool:
+    """Check whether any dashboard doctype grants access that depends on the user id itself"""
+    from frappe.permissions import get_role_permissions
+    from frappe.share import get_shared
+
+    if user == "Administrator":
+        return False
+
+    permission_hooks = set(frappe.get_hooks("permission_query_conditions") or {}) | set(frappe.get_hooks("has_permission") or {})
+
+    for doctype in PERMISSION_DOCTYPES:
+        try:
+            meta = frappe.get_meta(doctype)
+        except frappe.DoesNotExistError:
+            # Optional doctype not installed on this site
+            continue
+
+        if doctype in permission_hooks:
+            return True
+
+        role_permissions = get_role_permissions(meta, user)
+        if (role_permissions.get("if_owner") or {}).get("read"):
+            return True
+
+        if get_shared(doctype, user):
+            return True
+
+    return False
+
+
+def get_cache_versions(doctypes: Iterable[str]) -> List[str]:
+    """Get the current version token of each doctype"""
+    return [frappe.cache().get_value(f"{VERSION_KEY_PREFIX}:{doctype}") or "0" for doctype in doctypes]
+
+
+def bump_cache_version(doctype: str) -> None:
+    """Invalidate every cached response that depends on doctype"""
+    frappe.cache().set_value(f"{VERSION_KEY_PREFIX}:{doctype}", frappe.generate_hash(length=10))
+
+
+def bump_dashboard_cache_version(doc, method=None):
+    """
+    Hook for on_update / after_delete events of dashboard doctypes.
+
+    The version is bumped immediately and again after the transaction
+    commits, so a response cached from pre-commit data by a concurrent
+    request is discarded as well.
+
+    Args:
+        doc: The changed document
+        method: The hook method name
+    """
+    try:
+        doctype = VERSION_DOCTYPE_MAP.get(doc.doctype, doc.doctype)
+
+        if doc.doctype == "ToDo" and doc.get("reference_type") != "Task":
+            return
+
+        bump_cache_version(doctype)
+
+        after_commit = getattr(frappe.db, "after_commit", None)
+        if after_commit is not None:
+            after_commit.add(partial(bump_cache_version, doctype))
+
+    except Exception as e:
+        frappe.log_error(
+            f"Error bumping dashboard cache version for {doc.doctype} {doc.name}: {str(e)}",
+            "DevSecOps Dashboard Cache"
+        )
@@ -8,9 +8,12 @@ import frappe
 from frappe import _
 from typing import Dict, Any, Optional
 import json
+from frappe_devsecops_dashboard.api.conditional_get import conditional_get, parse_json_filters
+from frappe_devsecops_dashboard.api.request_cache import prefetch_users
 
 
 @frappe.whitelist()
+@conditional_get(lambda filters=None, **kwargs: [('Devsecops Dashboard Incident', parse_json_filters(filters))])
 def get_incidents(
     fields: Optional[str] = None,
     filters: Optional[str] = None,
@@ -29,7 +32,9 @@ def get_incidents(
         order_by: Sort order (e.g., "modified desc")
 
     Returns:
-        Dict with 'data' (list of records) and 'total' (count)
+        Dict with 'data' (list of records), 'total' (count) and 'etag'.
+        When the request's If-None-Match matches the etag, returns
+        {'success': True, 'unchanged': True, 'etag': ...} instead.
     """
     try:
         # Parse fields
@@ -161,13 +166,11 @@ def get_incident(name: str) -> Dict[str, Any]:
 
         # Enrich timeline with user full names
         if data.get('incident_timeline'):
+            users = prefetch_users([item.get('user') for item in data['incident_timeline']])
             for timeline_item in data['incident_timeline']:
                 if timeline_item.get('user'):
-                    try:
-                        user_doc = frappe.get_doc('User', timeline_item['user'])
-                        timeline_item['user_full_name'] = user_doc.full_name or timeline_item['user']
-                    except Exception:
-                        timeline_item['user_full_name'] = timeline_item['user']
+                    user = users.get(timeline_item['user']) or {}
+                    timeline_item['user_full_name'] = user.get('full_name') or timeline_item['user']
 
         return {
             'success': True,
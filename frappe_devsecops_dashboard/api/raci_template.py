@@ -7,6 +7,7 @@ import frappe
 from frappe import _
 from typing import Dict, Any, Optional
 import json
+from frappe_devsecops_dashboard.api.request_cache import get_task_type
 
 
 @frappe.whitelist()
@@ -443,11 +444,7 @@ def get_project_template_tasks(project_template: str) -> Dict[str, Any]:
                         # Get task type priority
                         task_type_priority = 999  # Default priority for uncategorized
                         if task_type and task_type != 'Uncategorized':
-                            try:
-                                task_type_doc = frappe.get_doc('Task Type', task_type)
-                                task_type_priority = task_type_doc.custom_priority or 999
-                            except Exception:
-                                task_type_priority = 999
+                            task_type_priority = (get_task_type(task_type) or {}).get('custom_priority') or 999
 
                         tasks_with_types.append({
                             'task_link': task_row.task,
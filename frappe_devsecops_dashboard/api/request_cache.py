@@ -0,0 +1,116 @@
+"""
+Request-Scoped Memoization
+
+Memoizes User lookups on frappe.local for the lifetime of a single request
+(or background job), so repeated lookups inside one API call collapse to one
+query. Frappe resets frappe.local between requests, so nothing is shared
+across users or requests. Task Type lookups are served from the
+process-wide catalog in task_type_catalog.py.
+
+Usage:
+    users = prefetch_users([c.owner for c in comments])
+    for comment in comments:
+        comment["owner_name"] = get_user_full_name(comment.owner)
+"""
+
+import frappe
+from typing import Any, Dict, Iterable, Optional
+
+
+MEMO_ATTRIBUTE = "devsecops_request_memo"
+
+USER_FIELDS = ["name", "email", "full_name", "user_image"]
+
+
+def get_request_memo(namespace: str) -> Dict[str, Any]:
+    """Get the memo dict of a namespace for the current request"""
+    memo = getattr(frappe.local, MEMO_ATTRIBUTE, None)
+    if memo is None:
+        memo = {}
+        setattr(frappe.local, MEMO_ATTRIBUTE, memo)
+    return memo.setdefault(namespace, {})
+
+
+def clear_request_memo() -> None:
+    """Drop all memoized values (e.g. after updating a User within the same request)"""
+    setattr(frappe.local, MEMO_ATTRIBUTE, {})
+
+
+def prefetch(namespace: str, doctype: str, names: Iterable[str], fields: list) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Load the rows of doctype not yet memoized with a single query
+
+    Names that do not exist are memoized as None so they are not queried again.
+
+    Args:
+        namespace: Memo namespace
+        doctype: DocType to load
+        names: Document names
+        fields: Fields to load (must include "name")
+
+    Returns:
+        dict: name -> row (or None) for every requested name
+    """
+    memo = get_request_memo(namespace)
+    names = {name for name in (names or []) if name}
+
+    missing = [name for name in names if name not in memo]
+    if missing:
+        rows = frappe.get_all(doctype, filters={"name": ["in", missing]}, fields=fields)
+        for row in rows:
+            memo[row.get("name")] = row
+        for name in missing:
+            memo.setdefault(name, None)
+
+    return {name: memo.get(name) for name in names}
+
+
+def prefetch_users(emails: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Memoize name, email, full_name and user_image of many Users in one query
+
+    Args:
+        emails: User ids
+
+    Returns:
+        dict: user id -> user row (None for unknown users)
+    """
+    return prefetch("User", "User", emails, USER_FIELDS)
+
+
+def get_user(email: str) -> Optional[Dict[str, Any]]:
+    """Get a memoized User row (None for unknown users)"""
+    if not email:
+        return None
+    return prefetch_users([email]).get(email)
+
+
+def get_user_full_name(email: str) -> str:
+    """Get a User's full name, falling back to the user id"""
+    user = get_user(email)
+    return (user or {}).get("full_name") or email
+
+
+def prefetch_task_types(names: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Get name, description and custom_priority of many Task Types
+
+    Served from the process-wide Task Type catalog, so no query is issued
+    unless the catalog has to be reloaded.
+
+    Args:
+        names: Task Type names
+
+    Returns:
+        dict: Task Type name -> row (None for unknown Task Types)
+    """
+    from frappe_devsecops_dashboard.api.task_type_catalog import get_catalog_task_type
+
+    return {name: get_catalog_task_type(name) for name in {name for name in (names or []) if name}}
+
+
+def get_task_type(name: str) -> Optional[Dict[str, Any]]:
+    """Get a Task Type row from the catalog (None for unknown Task Types)"""
+    if not name:
+        return None
+    return prefetch_task_types([name]).get(name)
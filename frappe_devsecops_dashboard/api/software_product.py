@@ -7,6 +7,7 @@ import frappe
 from frappe import _
 from typing import Dict, Any, Optional
 import json
+from frappe_devsecops_dashboard.api.request_cache import prefetch_users
 
 
 @frappe.whitelist()
@@ -136,17 +137,13 @@ def get_product_detail(name: str) -> Dict[str, Any]:
 
         # Enrich team members with full user details (full_name, email, user_image)
         if data.get('team_members'):
+            users = prefetch_users([member.get('member') for member in data['team_members']])
             for team_member in data['team_members']:
                 if team_member.get('member'):
-                    try:
-                        user_doc = frappe.get_doc('User', team_member['member'])
-                        team_member['member_full_name'] = user_doc.full_name or team_member['member']
-                        team_member['member_email'] = user_doc.email or ''
-                        team_member['member_user_image'] = user_doc.user_image or ''
-                    except Exception:
-                        team_member['member_full_name'] = team_member['member']
-                        team_member['member_email'] = ''
-                        team_member['member_user_image'] = ''
+                    user = users.get(team_member['member']) or {}
+                    team_member['member_full_name'] = user.get('full_name') or team_member['member']
+                    team_member['member_email'] = user.get('email') or ''
+                    team_member['member_user_image'] = user.get('user_image') or ''
 
         # Fetch project_template from linked RACI Template
         if data.get('default_raci_template'):
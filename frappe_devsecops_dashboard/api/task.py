@@ -6,6 +6,7 @@ Whitelisted methods for Task operations including comments and assignments
 import frappe
 from frappe import _
 from typing import Dict, Any, List
+from frappe_devsecops_dashboard.api.request_cache import prefetch_users, get_user_full_name
 
 
 @frappe.whitelist()
@@ -39,7 +40,7 @@ def add_task_comment(task_name: str, content: str) -> Dict[str, Any]:
 
         # Get current user info
         user = frappe.session.user
-        user_fullname = frappe.db.get_value('User', user, 'full_name') or user
+        user_fullname = get_user_full_name(user)
 
         # Add comment using Frappe's built-in method
         comment = doc.add_comment(
@@ -132,17 +133,14 @@ def get_task_comments(task_name: str, start: int = 0, limit: int = 100) -> Dict[
         )
 
         # Enrich comments with user full names
+        users = prefetch_users([comment.get('comment_by') or comment.get('owner') for comment in comments])
         for comment in comments:
             # Try to get full name from comment_by or owner
             user_id = comment.get('comment_by') or comment.get('owner')
             if user_id:
-                try:
-                    user_full_name = frappe.db.get_value('User', user_id, 'full_name')
-                    comment['user_full_name'] = user_full_name or user_id
-                    comment['user_email'] = user_id
-                except Exception:
-                    comment['user_full_name'] = user_id
-                    comment['user_email'] = user_id
+                user = users.get(user_id) or {}
+                comment['user_full_name'] = user.get('full_name') or user_id
+                comment['user_email'] = user_id
             else:
                 comment['user_full_name'] = 'Unknown User'
                 comment['user_email'] = ''
@@ -180,42 +178,65 @@ def get_task_assignments(task_name: str) -> List[Dict[str, str]]:
     Returns:
         List of dictionaries with user assignment information
     """
+    return get_bulk_task_assignments([task_name]).get(task_name, [])
+
+
+def get_bulk_task_assignments(task_names: List[str]) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Get assigned users for many tasks at once from ToDo doctype
+
+    Issues one ToDo query and one User query regardless of how many tasks
+    are passed in.
+
+    Args:
+        task_names: List of Task names/IDs
+
+    Returns:
+        Dict mapping task name to its list of assignment dictionaries
+    """
+    task_names = [name for name in (task_names or []) if name]
+    if not task_names:
+        return {}
+
     try:
-        # Query ToDo table for active assignments to this task
+        # Query ToDo table for active assignments to these tasks
         assignments = frappe.get_all(
             'ToDo',
             filters={
                 'reference_type': 'Task',
-                'reference_name': task_name,
+                'reference_name': ['in', task_names],
                 'status': ['in', ['Open', 'Pending']]  # Only active assignments
             },
-            fields=['allocated_to', 'name', 'status', 'priority', 'date'],
+            fields=['reference_name', 'allocated_to', 'name', 'status', 'priority', 'date'],
             order_by='creation asc'
         )
 
-        # Enrich with user full names
-        enriched_assignments = []
+        # Resolve all assignee full names in a single query
+        users = prefetch_users([a.get('allocated_to') for a in assignments])
+
+        assignments_by_task = {}
         for assignment in assignments:
             user_email = assignment.get('allocated_to')
-            if user_email:
-                full_name = frappe.db.get_value('User', user_email, 'full_name')
-                # Convert date to string for JSON serialization
-                due_date = assignment.get('date')
-                if due_date:
-                    due_date = str(due_date)
-
-                enriched_assignments.append({
-                    'user_email': user_email,
-                    'full_name': full_name or user_email,
-                    'status': assignment.get('status'),
-                    'priority': assignment.get('priority'),
-                    'due_date': due_date
-                })
-
-        return enriched_assignments
+            if not user_email:
+                continue
+
+            # Convert date to string for JSON serialization
+            due_date = assignment.get('date')
+            if due_date:
+                due_date = str(due_date)
+
+            assignments_by_task.setdefault(assignment.get('reference_name'), []).append({
+                'user_email': user_email,
+                'full_name': (users.get(user_email) or {}).get('full_name') or user_email,
+                'status': assignment.get('status'),
+                'priority': assignment.get('priority'),
+                'due_date': due_date
+            })
+
+        return assignments_by_task
     except Exception as e:
-        frappe.log_error(f"Error fetching assignments for Task {task_name}: {str(e)}", "Task API")
-        return []
+        frappe.log_error(f"Error fetching assignments for Tasks {', '.join(task_names[:10])}: {str(e)}", "Task API")
+        return {}
 
 
 @frappe.whitelist()
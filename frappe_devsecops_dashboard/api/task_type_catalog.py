@@ -0,0 +1,112 @@
+"""
+Task Type Catalog
+
+Task Types (the DevSecOps lifecycle phases) change rarely but are read by
+every dashboard phase calculation. The catalog keeps name, description and
+custom_priority of all Task Types in process memory, stamped with the
+"Task Type" dashboard cache version. Workers share one copy through the
+Redis cache, and saving a Task Type bumps the version (see
+dashboard_cache.bump_dashboard_cache_version), which makes every process
+reload it on next use.
+"""
+
+import frappe
+from typing import Any, Dict, List, Optional
+from frappe_devsecops_dashboard.api.dashboard_cache import get_cache_versions
+
+
+CATALOG_CACHE_KEY = "devsecops_task_type_catalog"
+CATALOG_FIELDS = ["name", "description", "custom_priority"]
+
+# Process-wide copies per site: {site: {"version": str, "rows": list, "by_name": dict}}
+_catalogs: Dict[str, Dict[str, Any]] = {}
+
+
+def get_task_type_catalog() -> List[Dict[str, Any]]:
+    """
+    Get all Task Types ordered by custom_priority, then name
+
+    Rows must not be modified by callers; copy them before adding keys.
+
+    Returns:
+        list: Task Type rows with name, description and custom_priority
+    """
+    return _get_catalog()["rows"]
+
+
+def get_catalog_task_type(name: str) -> Optional[Dict[str, Any]]:
+    """Get a single Task Type row from the catalog (None if it does not exist)"""
+    return _get_catalog()["by_name"].get(name)
+
+
+def get_task_type_priorities() -> Dict[str, int]:
+    """Get the Task Type -> priority map used to order lifecycle phases (999 when unset)"""
+    return {name: row.get("custom_priority") or 999 for name, row in _get_catalog()["by_name"].items()}
+
+
+def has_unrestricted_task_type_access(user: str = None) -> bool:
+    """
+    Check whether the user can read every Task Type
+
+    Users restricted by User Permissions must keep using frappe.get_list so
+    they only see the Task Types they are allowed to.
+    """
+    from frappe.core.doctype.user_permission.user_permission import get_user_permissions
+
+    user = user or frappe.session.user
+    if not frappe.has_permission("Task Type", "read", user=user):
+        return False
+    return not (get_user_permissions(user) or {}).get("Task Type")
+
+
+def _get_catalog() -> Dict[str, Any]:
+    """Get the current catalog, reloading it when the Task Type version changed"""
+    if frappe.flags.in_test:
+        # Test writes are rolled back, so a shared copy could outlive its rows
+        return _build_catalog(None, _load_rows())
+
+    site = getattr(frappe.local, "site", None)
+    version = get_cache_versions(("Task Type",))[0]
+
+    catalog = _catalogs.get(site)
+    if catalog and catalog["version"] == version:
+        return catalog
+
+    cache_key = f"{CATALOG_CACHE_KEY}:{version}"
+    rows = None
+    try:
+        rows = frappe.cache().get_value(cache_key)
+    except Exception:
+        pass  # Fall back to the database
+
+    if rows is None:
+        rows = _load_rows()
+        try:
+            frappe.cache().set_value(cache_key, rows, expires_in_sec=86400)
+        except Exception:
+            pass  # Fail silently to not break functionality
+
+    catalog = _build_catalog(version, rows)
+    _catalogs[site] = catalog
+    return catalog
+
+
+def _load_rows() -> List[Dict[str, Any]]:
+    """Load all Task Types from the database"""
+    return [
+        dict(row)
+        for row in frappe.get_all(
+            "Task Type",
+            fields=CATALOG_FIELDS,
+            order_by="custom_priority asc, name asc",
+            limit_page_length=None
+        )
+    ]
+
+
+def _build_catalog(version: Optional[str], rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "version": version,
+        "rows": rows,
+        "by_name": {row.get("name"): row for row in rows}
+    }
@@ -11,18 +11,50 @@ License: MIT
 import frappe
 import requests
 import base64
+import hashlib
 import json as json_lib
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from frappe_devsecops_dashboard.api.zenhub_api_decorator import log_zenhub_api_call
-
-# Zenhub GraphQL API endpoint
-ZENHUB_GRAPHQL_ENDPOINT = "https://api.zenhub.com/public/graphql"
+from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_issue.zenhub_issue import (
+    get_mirror_sync_state,
+    get_mirrored_issues,
+    get_mirrored_state_totals,
+    is_workspace_mirrored
+)
+from frappe_devsecops_dashboard.api.zenhub_client import (
+    ZENHUB_GRAPHQL_ENDPOINT,
+    get_single_flight_key,
+    post_graphql,
+    run_concurrently,
+    single_flight
+)
 
 # Cache keys
 ZENHUB_TOKEN_CACHE_KEY = "zenhub_api_token"
 ZENHUB_TOKEN_CACHE_TTL = 3600
 GITHUB_USER_CACHE_KEY_PREFIX = "github_user_"
 GITHUB_USER_CACHE_TTL = 86400
+SPRINT_DATA_CACHE_KEY_PREFIX = "zenhub_sprint_data_"
+SPRINT_DATA_CACHE_TTL = 300
+# With webhooks enabled, changed sprints are evicted by the webhook receiver,
+# so the reports can be kept much longer
+SPRINT_DATA_WEBHOOK_CACHE_TTL = 3600
+
+# Per-sprint stakeholder reports: closed sprints can no longer change and are kept
+# indefinitely (keyed by sprint ID and end date); open sprints are kept for a day and
+# only recomputed when their issues change
+SPRINT_REPORT_CACHE_KEY_PREFIX = "zenhub_sprint_report_"
+SPRINT_REPORT_OPEN_CACHE_TTL = 86400
+
+# Issues fetched per GraphQL request when paginating a workspace (Zenhub allows up to 100)
+ZENHUB_ISSUES_PAGE_SIZE = 100
+
+# Epics resolved per batched GraphQL document; each alias pulls a full child issue
+# list, so keep chunks small enough to stay under Zenhub's query complexity limit
+ZENHUB_EPIC_BATCH_SIZE = 15
+
+# Related issues returned with a task summary
+TASK_RELATED_ISSUES_LIMIT = 50
 
 
 
@@ -85,6 +117,24 @@ def get_zenhub_token() -> Optional[str]:
         raise
 
 
+def is_zenhub_webhook_enabled() -> bool:
+    """
+    Whether Zenhub webhooks are enabled in Zenhub Settings.
+
+    When they are, caches are evicted on change by api.zenhub_webhook and
+    can use their longer TTLs.
+    """
+    try:
+        return bool(frappe.get_cached_doc("Zenhub Settings").get("enable_webhooks"))
+    except Exception:
+        return False
+
+
+def get_sprint_data_cache_ttl() -> int:
+    """TTL for cached sprint reports, longer when webhooks evict them on change"""
+    return SPRINT_DATA_WEBHOOK_CACHE_TTL if is_zenhub_webhook_enabled() else SPRINT_DATA_CACHE_TTL
+
+
 def decode_zenhub_user_id(zenhub_user_id: str) -> Optional[int]:
     """
     Decode a Zenhub user ID to extract the GitHub user ID.
@@ -232,6 +282,53 @@ def execute_graphql_query(
     """
     Execute a GraphQL query against the Zenhub API with optional logging.
 
+    Identical queries (same query text and variables) issued at the same time
+    by different requests are coalesced: one request calls Zenhub and the
+    others wait for its result. Mutations are never coalesced.
+
+    Args:
+        query (str): The GraphQL query string
+        variables (dict): Variables for the GraphQL query
+        log_to_db (bool): Whether to log this query to Zenhub GraphQL API Log
+        reference_doctype (str): DocType for logging (if log_to_db=True)
+        reference_docname (str): Document name for logging (if log_to_db=True)
+        operation_name (str): Name of the operation for logging (if log_to_db=True)
+
+    Returns:
+        dict: The GraphQL response data
+
+    Raises:
+        requests.exceptions.RequestException: For network errors
+        frappe.AuthenticationError: For authentication failures
+        frappe.ValidationError: For invalid responses
+    """
+    def call():
+        return _execute_graphql_query(
+            query,
+            variables,
+            log_to_db=log_to_db,
+            reference_doctype=reference_doctype,
+            reference_docname=reference_docname,
+            operation_name=operation_name
+        )
+
+    if query.strip().startswith("mutation"):
+        return call()
+
+    return single_flight(get_single_flight_key(query, variables), call)
+
+
+def _execute_graphql_query(
+    query: str,
+    variables: Dict[str, Any],
+    log_to_db: bool = False,
+    reference_doctype: Optional[str] = None,
+    reference_docname: Optional[str] = None,
+    operation_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Execute a GraphQL query against the Zenhub API with optional logging (no coalescing).
+
     Args:
         query (str): The GraphQL query string
         variables (dict): Variables for the GraphQL query
@@ -279,23 +376,8 @@ def execute_graphql_query(
     # Original implementation (without logging)
     token = get_zenhub_token()
 
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-
-    payload = {
-        "query": query,
-        "variables": variables
-    }
-
     try:
-        response = requests.post(
-            ZENHUB_GRAPHQL_ENDPOINT,
-            headers=headers,
-            json=payload,
-            timeout=30  # 30 second timeout
-        )
+        response = post_graphql(query, variables, token=token)
 
         # Handle HTTP errors
         if response.status_code == 401:
@@ -529,17 +611,22 @@ def get_workspace_issues_query() -> str:
     GraphQL query to fetch ALL issues directly from a workspace (not via sprints).
 
     This is the primary query to use when you want all workspace issues
-    regardless of sprint assignment.
+    regardless of sprint assignment. Returns one page; use
+    iter_workspace_issues() to follow the pageInfo cursors.
 
     Uses only fields confirmed to exist in Zenhub's GraphQL schema.
     """
     return """
-    query GetWorkspaceIssues($workspaceId: ID!) {
+    query GetWorkspaceIssues($workspaceId: ID!, $first: Int = 100, $after: String) {
       workspace(id: $workspaceId) {
         id
         name
-        issues(first: 100) {
+        issues(first: $first, after: $after) {
           totalCount
+          pageInfo {
+            hasNextPage
+            endCursor
+          }
           nodes {
             id
             title
@@ -573,6 +660,64 @@ def get_workspace_issues_query() -> str:
     """
 
 
+def iter_workspace_issues(
+    workspace_id: str,
+    page_size: Optional[int] = None,
+    workspace_info: Optional[Dict[str, Any]] = None,
+    reference_doctype: Optional[str] = None,
+    reference_docname: Optional[str] = None,
+    operation_name: Optional[str] = None
+):
+    """
+    Yield every issue of a workspace, fetching one page at a time.
+
+    Follows pageInfo.endCursor with the `after` argument until hasNextPage
+    is false, so workspaces with more than one page are not truncated and
+    only one page is held in memory at a time.
+
+    Args:
+        workspace_id (str): The Zenhub workspace ID
+        page_size (int): Issues per request (default ZENHUB_ISSUES_PAGE_SIZE)
+        workspace_info (dict): Optional dict filled with the workspace "id",
+            "name" and "total_count" once the first page has been fetched
+        reference_doctype (str): DocType for API logging
+        reference_docname (str): Document name for API logging
+        operation_name (str): Operation name for API logging
+
+    Yields:
+        dict: Raw issue nodes as returned by get_workspace_issues_query()
+    """
+    page_size = min(int(page_size or ZENHUB_ISSUES_PAGE_SIZE), ZENHUB_ISSUES_PAGE_SIZE)
+    query = get_workspace_issues_query()
+    after = None
+
+    while True:
+        response_data = execute_graphql_query(
+            query,
+            {"workspaceId": workspace_id, "first": page_size, "after": after},
+            log_to_db=bool(reference_doctype),
+            reference_doctype=reference_doctype,
+            reference_docname=reference_docname,
+            operation_name=operation_name
+        )
+
+        workspace = (response_data or {}).get("workspace") or {}
+        issues_container = workspace.get("issues") or {}
+
+        if workspace_info is not None and after is None:
+            workspace_info.update({
+                "id": workspace.get("id"),
+                "name": workspace.get("name"),
+                "total_count": issues_container.get("totalCount")
+            })
+
+        for issue in issues_container.get("nodes") or []:
+            yield issue
+
+        page_info = issues_container.get("pageInfo") or {}
+        after = page_info.get("endCursor")
+        if not page_info.get("hasNextPage") or not after:
+            break
 
 
 def get_workspace_issues_query_edges() -> str:
@@ -600,24 +745,18 @@ def get_workspace_issues_query_edges() -> str:
     """
 
 
-def get_stakeholder_sprint_query() -> str:
+def get_stakeholder_sprint_list_query() -> str:
     """
-    Optimized GraphQL query for stakeholder-focused sprint reporting.
+    GraphQL query listing a workspace's recent sprints without their issues.
 
-    Fetches only essential data needed for executive-level reporting:
-    - Sprint metadata (name, dates, state)
-    - Issue counts and status distribution
-    - Epic information for unique epic count
-    - Assignee information for team workload
-    - Story points for capacity planning
-
-    This query is optimized for performance and reduced payload size.
+    Used to decide which sprints need their issues fetched for the stakeholder
+    report; closed sprints already in the per-sprint cache are skipped.
 
     Returns:
         str: The GraphQL query string
     """
     return """
-    query GetStakeholderSprintData($workspaceId: ID!) {
+    query GetStakeholderSprintList($workspaceId: ID!) {
       workspace(id: $workspaceId) {
         id
         name
@@ -628,33 +767,71 @@ def get_stakeholder_sprint_query() -> str:
             state
             startDate
             endDate
-            issues(first: 100) {
-              totalCount
-              nodes {
-                id
-                state
-                estimate { value }
-                assignees {
-                  nodes {
-                    id
-                    login
-                    name
-                  }
-                }
-                epic {
-                  issue {
-                    id
-                    title
-                  }
-                }
-              }
-            }
           }
         }
       }
     }
     """
 
+
+def get_stakeholder_sprints_by_id_query(count: int) -> str:
+    """
+    Optimized GraphQL query for stakeholder-focused sprint reporting.
+
+    Fetches only essential data needed for executive-level reporting, for the
+    given sprints only, through aliased node(id:) selections (sprint0, sprint1, ...):
+    - Sprint metadata (name, dates, state)
+    - Issue counts and status distribution
+    - Epic information for unique epic count
+    - Assignee information for team workload
+    - Story points for capacity planning
+
+    Args:
+        count (int): Number of sprints in the document
+
+    Returns:
+        str: The GraphQL query string
+    """
+    variables = ", ".join(f"$id{i}: ID!" for i in range(count))
+    selections = "\n".join(
+        f"""
+      sprint{i}: node(id: $id{i}) {{
+        ... on Sprint {{
+          id
+          name
+          state
+          startDate
+          endDate
+          issues(first: 100) {{
+            totalCount
+            nodes {{
+              id
+              state
+              estimate {{ value }}
+              assignees {{
+                nodes {{
+                  id
+                  login
+                  name
+                }}
+              }}
+              epic {{
+                issue {{
+                  id
+                  title
+                }}
+              }}
+            }}
+          }}
+        }}
+      }}"""
+        for i in range(count)
+    )
+    return f"""
+    query GetStakeholderSprints({variables}) {{{selections}
+    }}
+    """
+
 def get_epics_query() -> str:
     """
     GraphQL query to fetch Epics in a workspace.
@@ -722,6 +899,100 @@ def get_issues_by_epic_query() -> str:
     }
     """
 
+def get_issues_by_epics_query(count: int) -> str:
+    """
+    GraphQL document that fetches the child issues of several Epics at once.
+
+    Each Epic is resolved through an aliased node(id:) selection (epic0, epic1, ...)
+    bound to its own $idN variable, so one request replaces one call per Epic.
+
+    Args:
+        count (int): Number of Epics in the document
+
+    Returns:
+        str: GraphQL query string
+    """
+    variables = ", ".join(f"$id{i}: ID!" for i in range(count))
+    selections = "\n".join(
+        f"""
+        epic{i}: node(id: $id{i}) {{
+            ... on Issue {{
+                id
+                childIssues {{
+                    nodes {{
+                        id
+                        title
+                        state
+                        number
+                        htmlUrl
+                        estimate {{ value }}
+                        assignees {{
+                            nodes {{
+                                id
+                                login
+                                name
+                            }}
+                        }}
+                        pipeline {{
+                            name
+                        }}
+                        blockedBy {{
+                            nodes {{
+                                id
+                                title
+                                state
+                            }}
+                        }}
+                    }}
+                }}
+            }}
+        }}"""
+        for i in range(count)
+    )
+    return f"""
+    query GetIssuesByEpics({variables}) {{{selections}
+    }}
+    """
+
+
+def get_epic_node_query() -> str:
+    """
+    GraphQL query for one Epic and its child issues through node(id:).
+
+    Used when an Epic is not in the workspace snapshot yet (e.g. created since
+    the snapshot was taken), so only that Epic is fetched instead of the
+    whole workspace.
+    """
+    return """
+    query GetEpicNode($epicId: ID!) {
+        node(id: $epicId) {
+            ... on Issue {
+                id
+                title
+                type
+                state
+                number
+                htmlUrl
+                estimate { value }
+                repository { name }
+                childIssues {
+                    nodes {
+                        id
+                        title
+                        type
+                        state
+                        number
+                        htmlUrl
+                        estimate { value }
+                        repository { name }
+                    }
+                }
+            }
+        }
+    }
+    """
+
+
 @frappe.whitelist()
 def fetch_software_products_zenhub() -> Dict[str, Any]:
     """
@@ -749,18 +1020,14 @@ def get_zenhub_projects(workspace_id: str) -> Dict[str, Any]:
     
     Actually, we can use the `searchIssues` or just `issues` query and check the type field.
     """
-    query = get_workspace_issues_query() # Reusing general issue query
     try:
-        data = execute_graphql_query(
-            query,
-            {"workspaceId": workspace_id},
-            log_to_db=True,
+        # Reusing general issue query, streamed across all pages
+        issues = iter_workspace_issues(
+            workspace_id,
             reference_doctype="Software Product",
             reference_docname=workspace_id,
             operation_name="getZenhubProjects"
         )
-        workspace = data.get("workspace", {})
-        issues = workspace.get("issues", {}).get("nodes", [])
         
         # Filter for type == 'Project' (case insensitive) or PROJ- prefix in title
         projects = []
@@ -840,38 +1107,123 @@ def get_issues_by_epic(zenhub_issue_id: str) -> Dict[str, Any]:
             operation_name="getIssuesByEpic"
         )
         issue = data.get("issue", {})
-        child_issues = issue.get("childIssues", {}).get("nodes", [])
-        
-        processed_issues = []
-        for child in child_issues:
-            # Flatten assignees
-            assignees = []
-            for a in child.get("assignees", {}).get("nodes", []):
-                assignees.append(a.get("name") or a.get("login"))
-
-            # Flatten blockedBy
-            blockers = []
-            for b in child.get("blockedBy", {}).get("nodes", []):
-                blockers.append({"id": b.get("id"), "title": b.get("title"), "state": b.get("state")})
-
-            processed_issues.append({
-                "id": child.get("id"),
-                "title": child.get("title"),
-                "state": child.get("state"),
-                "number": child.get("number"),
-                "htmlUrl": child.get("htmlUrl"),
-                "estimate": child.get("estimate", {}).get("value", 0),
-                "assignees": assignees,
-                "pipeline": child.get("pipeline", {}).get("name"),
-                "blockedBy": blockers
-            })
-            
-        return {"success": True, "issues": processed_issues}
+        return {"success": True, "issues": process_epic_child_issues(issue)}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
-def calculate_sprint_metrics(sprint_data: Dict[str, Any]) -> Dict[str, Any]:
+@frappe.whitelist()
+def get_issues_by_epics(zenhub_issue_ids: Union[str, List[str]]) -> Dict[str, Any]:
+    """
+    Fetch child issues of several Epics in as few GraphQL requests as possible.
+
+    Epic IDs are split into chunks of ZENHUB_EPIC_BATCH_SIZE; each chunk is one
+    aliased node(id:) query, and chunks are sent concurrently. A chunk that fails
+    only marks its own Epics as failed, and an error on one alias (an unknown
+    or deleted Epic) only marks that Epic.
+
+    Args:
+        zenhub_issue_ids: List (or JSON-encoded list) of Zenhub Epic issue IDs
+
+    Returns:
+        dict: {"success": bool, "issues_by_epic": {epic_id: [issues]}, "errors": {epic_id: message}}
+    """
+    from frappe_devsecops_dashboard.api.zenhub_bulk import parse_batch_response
+    from frappe_devsecops_dashboard.api.zenhub_graphql_logger import execute_graphql_query_with_logging
+
+    try:
+        epic_ids = frappe.parse_json(zenhub_issue_ids) if isinstance(zenhub_issue_ids, str) else zenhub_issue_ids
+        # Preserve order, drop blanks and duplicates
+        epic_ids = list(dict.fromkeys(eid for eid in (epic_ids or []) if eid))
+        if not epic_ids:
+            return {"success": True, "issues_by_epic": {}, "errors": {}}
+
+        chunks = [
+            epic_ids[i:i + ZENHUB_EPIC_BATCH_SIZE]
+            for i in range(0, len(epic_ids), ZENHUB_EPIC_BATCH_SIZE)
+        ]
+
+        def fetch_chunk(chunk):
+            def call():
+                # Raw response, so an error on one alias (e.g. a deleted epic)
+                # only fails that epic; return exceptions so other chunks still count
+                try:
+                    data, _ = execute_graphql_query_with_logging(
+                        query=get_issues_by_epics_query(len(chunk)),
+                        variables={f"id{i}": epic_id for i, epic_id in enumerate(chunk)},
+                        reference_doctype="Task",
+                        reference_docname=chunk[0],
+                        operation_name="getIssuesByEpics",
+                        operation_type="Query"
+                    )
+                    return parse_batch_response(data, chunk, alias_prefix="epic", missing_message="Epic not found")
+                except Exception as e:
+                    return e
+            return call
+
+        results = run_concurrently(
+            {str(index): fetch_chunk(chunk) for index, chunk in enumerate(chunks)}
+        )
+
+        issues_by_epic = {}
+        errors = {}
+        for index, chunk in enumerate(chunks):
+            outcome = results[str(index)]
+            if isinstance(outcome, Exception):
+                for epic_id in chunk:
+                    errors[epic_id] = str(outcome)
+                continue
+
+            found, missing = outcome
+            errors.update(missing)
+            for epic_id, epic in found.items():
+                issues_by_epic[epic_id] = process_epic_child_issues(epic)
+
+        return {"success": bool(issues_by_epic) or not errors, "issues_by_epic": issues_by_epic, "errors": errors}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def process_epic_child_issues(issue: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten the childIssues of an Epic issue node into the shape the UI expects.
+
+    Args:
+        issue (dict): Issue node with a childIssues connection
+
+    Returns:
+        list: Processed child issues
+    """
+    child_issues = (issue.get("childIssues") or {}).get("nodes", [])
+
+    processed_issues = []
+    for child in child_issues:
+        # Flatten assignees
+        assignees = []
+        for a in child.get("assignees", {}).get("nodes", []):
+            assignees.append(a.get("name") or a.get("login"))
+
+        # Flatten blockedBy
+        blockers = []
+        for b in child.get("blockedBy", {}).get("nodes", []):
+            blockers.append({"id": b.get("id"), "title": b.get("title"), "state": b.get("state")})
+
+        processed_issues.append({
+            "id": child.get("id"),
+            "title": child.get("title"),
+            "state": child.get("state"),
+            "number": child.get("number"),
+            "htmlUrl": child.get("htmlUrl"),
+            "estimate": (child.get("estimate") or {}).get("value", 0),
+            "assignees": assignees,
+            "pipeline": (child.get("pipeline") or {}).get("name"),
+            "blockedBy": blockers
+        })
+
+    return processed_issues
+
+
+def calculate_sprint_metrics(sprint_data: Dict[str, Any], include_issues: bool = True) -> Dict[str, Any]:
     """
     Calculate sprint metrics from raw Zenhub sprint data.
 
@@ -880,8 +1232,13 @@ def calculate_sprint_metrics(sprint_data: Dict[str, Any]) -> Dict[str, Any]:
     assignees do not contribute to any team member totals. Issues without estimates
     are treated as 0 points.
 
+    Issues are consumed in a single pass, so issues.nodes may be a list or an
+    iterator such as iter_workspace_issues().
+
     Args:
         sprint_data (dict): Raw sprint data from Zenhub GraphQL API
+        include_issues (bool): Build the per-issue "issues" array; pass False
+            when streaming large workspaces and only totals are needed
 
     Returns:
         dict: Calculated metrics including story points, utilization, issue counts,
@@ -891,21 +1248,11 @@ def calculate_sprint_metrics(sprint_data: Dict[str, Any]) -> Dict[str, Any]:
     sprint_id_ctx = sprint_data.get("id")
     sprint_name_ctx = sprint_data.get("name")
 
-    # Log ONLY if there are zero issues - this could indicate a problem
-    if len(issues) == 0:
-        try:
-            frappe.log_error(
-                title="Zenhub Sprint Has Zero Issues",
-                message=f"Sprint '{sprint_name_ctx}' ({sprint_id_ctx}) returned 0 issues. Issues container: {json_lib.dumps(sprint_data.get('issues'))}"
-            )
-        except Exception:
-            pass
-
     total_story_points = 0
     completed_story_points = 0
 
     issue_counts = {
-        "total": len(issues),
+        "total": 0,
         "completed": 0,
         "in_progress": 0,
         "blocked": 0
@@ -947,6 +1294,8 @@ def calculate_sprint_metrics(sprint_data: Dict[str, Any]) -> Dict[str, Any]:
     issues_array: List[Dict[str, Any]] = []
 
     for issue in issues:
+        issue_counts["total"] += 1
+
         # Determine points and state
         estimate = issue.get("estimate") or {}
         points = estimate.get("value", 0) if isinstance(estimate, dict) else 0
@@ -998,20 +1347,21 @@ def calculate_sprint_metrics(sprint_data: Dict[str, Any]) -> Dict[str, Any]:
         github_number = issue.get("number")
         html_url = issue.get("htmlUrl")
 
-        issues_array.append({
-            "issue_id": issue.get("id"),
-            "github_number": github_number,
-            "github_url": html_url,
-            "repository": repo_name,
-            "title": issue.get("title"),
-            "status": status_bucket,
-            "state": state,
-            "story_points": points,
-            "assignees": assignees_list,
-            "blocked_by": [],  # Not available in current Zenhub schema
-            "epic": epic_info,
-            "sprint": {"id": sprint_id_ctx, "name": sprint_name_ctx},
-        })
+        if include_issues:
+            issues_array.append({
+                "issue_id": issue.get("id"),
+                "github_number": github_number,
+                "github_url": html_url,
+                "repository": repo_name,
+                "title": issue.get("title"),
+                "status": status_bucket,
+                "state": state,
+                "story_points": points,
+                "assignees": assignees_list,
+                "blocked_by": [],  # Not available in current Zenhub schema
+                "epic": epic_info,
+                "sprint": {"id": sprint_id_ctx, "name": sprint_name_ctx},
+            })
 
         # Accumulate global totals
         total_story_points += points
@@ -1049,6 +1399,16 @@ def calculate_sprint_metrics(sprint_data: Dict[str, Any]) -> Dict[str, Any]:
             if state in ["closed", "done", "completed"]:
                 team_member_points[assignee_id]["completed_story_points"] += points
 
+    # Log ONLY if there are zero issues - this could indicate a problem
+    if issue_counts["total"] == 0:
+        try:
+            frappe.log_error(
+                title="Zenhub Sprint Has Zero Issues",
+                message=f"Sprint '{sprint_name_ctx}' ({sprint_id_ctx}) returned 0 issues."
+            )
+        except Exception:
+            pass
+
     # Calculate utilization percentage (global)
     remaining_story_points = total_story_points - completed_story_points
     utilization_percentage = (
@@ -1290,6 +1650,115 @@ def transform_stakeholder_sprint_data(sprint: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def get_stakeholder_sprint_reports(
+    sprints: List[Dict[str, Any]],
+    project_id: str,
+    force_refresh: bool = False
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Stakeholder reports for the listed sprints, reusing per-sprint cache entries.
+
+    Closed sprints found in the cache are returned as-is without fetching their
+    issues. Open (active and future) sprints are refetched; their metrics are
+    recomputed only when the fetched sprint differs from the cached one.
+
+    Args:
+        sprints (list): Sprint nodes from get_stakeholder_sprint_list_query
+        project_id (str): Project for API log references
+        force_refresh (bool): Ignore cached entries and recompute every sprint
+
+    Returns:
+        tuple: (reports in sprint order, number of closed sprints served from cache)
+    """
+    cache = frappe.cache()
+    reports = {}
+    open_entries = {}
+    to_fetch = []
+
+    for sprint in sprints:
+        sprint_id = sprint.get("id")
+        entry = None if force_refresh else _load_sprint_report_entry(get_sprint_report_cache_key(sprint))
+
+        if entry and is_closed_sprint(sprint):
+            reports[sprint_id] = entry["report"]
+            continue
+
+        if entry:
+            open_entries[sprint_id] = entry
+        to_fetch.append(sprint_id)
+
+    cached_count = len(reports)
+
+    if to_fetch:
+        response_data = execute_graphql_query(
+            get_stakeholder_sprints_by_id_query(len(to_fetch)),
+            {f"id{i}": sprint_id for i, sprint_id in enumerate(to_fetch)},
+            log_to_db=True,
+            reference_doctype="Project",
+            reference_docname=project_id,
+            operation_name="getStakeholderSprintData"
+        )
+
+        for i, sprint_id in enumerate(to_fetch):
+            sprint_data = response_data.get(f"sprint{i}")
+            if not sprint_data:
+                continue
+
+            digest = hashlib.sha1(
+                json_lib.dumps(sprint_data, sort_keys=True, default=str).encode()
+            ).hexdigest()
+            entry = open_entries.get(sprint_id)
+            if entry and entry.get("hash") == digest:
+                report = entry["report"]
+            else:
+                report = transform_stakeholder_sprint_data(sprint_data)
+
+            try:
+                cache.set_value(
+                    get_sprint_report_cache_key(sprint_data),
+                    json_lib.dumps({"hash": digest, "report": report}),
+                    expires_in_sec=None if is_closed_sprint(sprint_data) else SPRINT_REPORT_OPEN_CACHE_TTL
+                )
+            except Exception as cache_error:
+                frappe.log_error(
+                    title="Zenhub Cache Error",
+                    message=f"Failed to cache sprint report {sprint_id}: {str(cache_error)}"
+                )
+
+            reports[sprint_id] = report
+
+    return [reports[s.get("id")] for s in sprints if s.get("id") in reports], cached_count
+
+
+def get_sprint_report_cache_key(sprint: Dict[str, Any]) -> str:
+    """
+    Cache key for one sprint's stakeholder report.
+
+    Closed sprints are keyed by ID and end date, so a sprint whose end date is
+    edited after closing gets a fresh entry.
+    """
+    if is_closed_sprint(sprint):
+        return f"{SPRINT_REPORT_CACHE_KEY_PREFIX}closed_{sprint.get('id')}_{sprint.get('endDate')}"
+    return f"{SPRINT_REPORT_CACHE_KEY_PREFIX}open_{sprint.get('id')}"
+
+
+def is_closed_sprint(sprint: Dict[str, Any]) -> bool:
+    """Whether a Zenhub sprint is closed, so its issues can no longer change"""
+    return (sprint.get("state") or "").upper() == "CLOSED"
+
+
+def _load_sprint_report_entry(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Cached {"hash", "report"} entry, or None when missing or unreadable"""
+    cached = frappe.cache().get_value(cache_key)
+    if not cached:
+        return None
+    try:
+        entry = json_lib.loads(cached)
+    except Exception:
+        return None
+    return entry if isinstance(entry, dict) and "report" in entry else None
+
+
 @frappe.whitelist()
 @log_zenhub_api_call(
     operation_name="getSprintData",
@@ -1382,20 +1851,17 @@ def get_sprint_data(project_id: str, sprint_states: Optional[str] = None, force_
 
         # Fetch ALL workspace issues directly (not just sprint issues)
         # This ensures we get all issues regardless of sprint assignment
-        variables = {"workspaceId": workspace_id}
-        response_data = None
+        workspace = {}
         query_used = "workspace_issues"
 
         try:
-            query = get_workspace_issues_query()
-            response_data = execute_graphql_query(
-                query,
-                variables,
-                log_to_db=True,
+            all_issues = list(iter_workspace_issues(
+                workspace_id,
+                workspace_info=workspace,
                 reference_doctype="Project",
                 reference_docname=project_id,
                 operation_name="getWorkspaceIssuesForSprint"
-            )
+            ))
         except Exception as e:
             frappe.log_error(
                 title="Zenhub Workspace Issues Query Failed",
@@ -1403,12 +1869,9 @@ def get_sprint_data(project_id: str, sprint_states: Optional[str] = None, force_
             )
             raise
 
-        # Extract workspace and issues
-        workspace = response_data.get("workspace", {})
-
         # Log diagnostic info about the workspace response
         try:
-            issues_count = len(workspace.get("issues", {}).get("nodes", []))
+            issues_count = len(all_issues)
             frappe.log_error(
                 title="Zenhub Workspace Response Debug",
                 message=f"Workspace ID: {workspace.get('id')}, Name: {workspace.get('name')}, Issues count: {issues_count}, Query used: {query_used}"
@@ -1420,9 +1883,7 @@ def get_sprint_data(project_id: str, sprint_states: Optional[str] = None, force_
         pipelines_list = []
 
         # Get all workspace issues
-        issues_container = workspace.get("issues", {})
-        all_issues = issues_container.get("nodes", [])
-        total_count = issues_container.get("totalCount", len(all_issues))
+        total_count = workspace.get("total_count") or len(all_issues)
 
         # Log issues count
         try:
@@ -1459,7 +1920,7 @@ def get_sprint_data(project_id: str, sprint_states: Optional[str] = None, force_
             frappe.cache().set_value(
                 cache_key,
                 json_lib.dumps(result),
-                expires_in_sec=SPRINT_DATA_CACHE_TTL
+                expires_in_sec=get_sprint_data_cache_ttl()
             )
         except Exception as cache_error:
             # Don't fail if caching fails
@@ -1487,9 +1948,12 @@ def get_workspace_issues(project_id: str, page_size: int = 100) -> Dict[str, Any
     """
     Fetch ALL issues from a Zenhub workspace (not filtered by sprints).
 
+    Served from the local Zenhub Issue mirror when the workspace has synced
+    recently; otherwise fetched live from Zenhub.
+
     Args:
         project_id (str): The Frappe Project doctype name/ID
-        page_size (int): Number of issues to fetch (default 100)
+        page_size (int): Issues fetched per request (default 100); all pages are returned
 
     Returns:
         dict: JSON response with issues and counts
@@ -1535,24 +1999,40 @@ def get_workspace_issues(project_id: str, page_size: int = 100) -> Dict[str, Any
                 "error_type": "validation_error",
             }
 
-        # Execute GraphQL query
-        query = get_workspace_issues_query()
-        variables = {"workspaceId": workspace_id, "first": int(page_size)}
-        response_data = execute_graphql_query(
-            query,
-            variables,
-            log_to_db=True,
+        if is_workspace_mirrored(workspace_id):
+            mirrored = get_mirrored_issues(workspace_id)
+            transformed_issues = [
+                {
+                    "id": issue.zenhub_issue_id,
+                    "title": issue.title,
+                    "state": (issue.state or "").lower(),
+                    "story_points": issue.estimate or 0,
+                    "assignees": [{"id": a.assignee_id, "name": a.assignee_name} for a in issue.assignees],
+                    "sprint_id": None,
+                }
+                for issue in mirrored
+            ]
+            return {
+                "success": True,
+                "workspace_id": workspace_id,
+                "workspace_name": mirrored[0].workspace_name if mirrored else get_mirror_sync_state(workspace_id).get("workspace_name"),
+                "issues": transformed_issues,
+                "total_issues": len(transformed_issues),
+                "unassigned_to_sprint": len(transformed_issues),
+                "_from_mirror": True,
+            }
+
+        # Fetch every page of workspace issues
+        workspace = {}
+        issues_nodes = iter_workspace_issues(
+            workspace_id,
+            page_size=page_size,
+            workspace_info=workspace,
             reference_doctype="Project",
             reference_docname=project_id,
             operation_name="getProjectIssues"
         )
 
-        # Extract workspace and issues
-        workspace = response_data.get("workspace", {})
-        issues_edge = workspace.get("issues", {})
-        issues_nodes = issues_edge.get("nodes", [])
-        total_count = issues_edge.get("totalCount", len(issues_nodes))
-
         # Transform issues to the expected shape
         transformed_issues: List[Dict[str, Any]] = []
         for issue in issues_nodes:
@@ -1575,6 +2055,8 @@ def get_workspace_issues(project_id: str, page_size: int = 100) -> Dict[str, Any
                 }
             )
 
+        total_count = workspace.get("total_count") or len(transformed_issues)
+
         # Since sprint association is not fetched here, treat all as unassigned
         unassigned_count = sum(1 for _ in transformed_issues)  # equals total_count
 
@@ -1622,6 +2104,9 @@ def get_stakeholder_sprint_report(project_id: str, force_refresh: bool = False)
     - Sprint health indicators
 
     This is optimized for performance and reduced payload size compared to get_sprint_data.
+    The report is cached for 5 minutes; underneath, each sprint's report is cached
+    on its own (see get_stakeholder_sprint_reports), so closed sprints are never
+    refetched or recomputed.
 
     Args:
         project_id (str): The Frappe Project doctype name/ID
@@ -1683,25 +2168,24 @@ def get_stakeholder_sprint_report(project_id: str, force_refresh: bool = False)
                 "error_type": "validation_error"
             }
 
-        # Execute GraphQL query
-        query = get_stakeholder_sprint_query()
-        variables = {"workspaceId": workspace_id}
+        # List the sprints, then fetch issues only for those not cached
         response_data = execute_graphql_query(
-            query,
-            variables,
+            get_stakeholder_sprint_list_query(),
+            {"workspaceId": workspace_id},
             log_to_db=True,
             reference_doctype="Project",
             reference_docname=project_id,
-            operation_name="getStakeholderSprintData"
+            operation_name="getStakeholderSprintList"
         )
 
-        # Extract workspace and sprints
-        workspace = response_data.get("workspace", {})
-        sprints_container = workspace.get("sprints", {})
-        sprints_nodes = sprints_container.get("nodes", [])
+        workspace = response_data.get("workspace") or {}
+        sprints_nodes = (workspace.get("sprints") or {}).get("nodes", [])
 
-        # Transform sprints to stakeholder format
-        transformed_sprints = [transform_stakeholder_sprint_data(s) for s in sprints_nodes]
+        transformed_sprints, cached_count = get_stakeholder_sprint_reports(
+            sprints_nodes,
+            project_id,
+            force_refresh=force_refresh
+        )
 
         result = {
             "success": True,
@@ -1709,6 +2193,7 @@ def get_stakeholder_sprint_report(project_id: str, force_refresh: bool = False)
             "workspace_name": workspace.get("name"),
             "sprints": transformed_sprints,
             "_cached": False,
+            "_cached_sprints": cached_count,
             "_fetched_at": frappe.utils.now()
         }
 
@@ -1717,7 +2202,7 @@ def get_stakeholder_sprint_report(project_id: str, force_refresh: bool = False)
             frappe.cache().set_value(
                 cache_key,
                 json_lib.dumps(result),
-                expires_in_sec=SPRINT_DATA_CACHE_TTL
+                expires_in_sec=get_sprint_data_cache_ttl()
             )
         except Exception as cache_error:
             frappe.log_error(
@@ -1769,50 +2254,48 @@ def get_workspace_summary(workspace_id: str, project_id: Optional[str] = None) -
                 "error_type": "validation_error"
             }
 
-        # Fetch workspace data using GraphQL with logging
-        variables = {"workspaceId": workspace_id}
-        response_data = execute_graphql_query(
-            get_workspace_issues_query(),
-            variables,
-            log_to_db=True,
-            reference_doctype="Software Product",
-            reference_docname=workspace_id,
-            operation_name="getWorkspaceSummary"
-        )
-
-        workspace = response_data.get("workspace", {})
-        issues_container = workspace.get("issues", {})
-        all_issues = issues_container.get("nodes", [])
+        # Stream all workspace issues page by page using GraphQL with logging
+        workspace = {}
+        projects_data = {}
+        completed_counter = {"completed": 0}
+
+        def group_by_project(issues):
+            # Group by project if repository info available, while metrics consume the stream
+            for issue in issues:
+                repo = issue.get("repository") or {}
+                repo_name = repo.get("name", "Unknown")
+                if repo_name not in projects_data:
+                    projects_data[repo_name] = {
+                        "name": repo_name,
+                        "issue_count": 0,
+                        "story_points": 0,
+                        "completed_points": 0
+                    }
+                projects_data[repo_name]["issue_count"] += 1
+                estimate = issue.get("estimate") or {}
+                points = estimate.get("value", 0) if isinstance(estimate, dict) else 0
+                projects_data[repo_name]["story_points"] += points
+                if issue.get("state") in ["closed", "done", "completed"]:
+                    projects_data[repo_name]["completed_points"] += points
+                    completed_counter["completed"] += 1
+                yield issue
 
         # Process issues and calculate metrics
         metrics = calculate_sprint_metrics({
             "id": workspace_id,
-            "name": workspace.get("name", "Workspace"),
-            "issues": {"nodes": all_issues}
-        })
-
-        # Group by project if repository info available
-        projects_data = {}
-        for issue in all_issues:
-            repo = issue.get("repository", {})
-            repo_name = repo.get("name", "Unknown")
-            if repo_name not in projects_data:
-                projects_data[repo_name] = {
-                    "name": repo_name,
-                    "issue_count": 0,
-                    "story_points": 0,
-                    "completed_points": 0
-                }
-            projects_data[repo_name]["issue_count"] += 1
-            estimate = issue.get("estimate") or {}
-            points = estimate.get("value", 0) if isinstance(estimate, dict) else 0
-            projects_data[repo_name]["story_points"] += points
-            if issue.get("state") in ["closed", "done", "completed"]:
-                projects_data[repo_name]["completed_points"] += points
+            "name": "Workspace",
+            "issues": {"nodes": group_by_project(iter_workspace_issues(
+                workspace_id,
+                workspace_info=workspace,
+                reference_doctype="Software Product",
+                reference_docname=workspace_id,
+                operation_name="getWorkspaceSummary"
+            ))}
+        }, include_issues=False)
 
         # Calculate overall health
-        total_issues = len(all_issues)
-        completed_issues = sum(1 for i in all_issues if i.get("state") in ["closed", "done", "completed"])
+        total_issues = metrics.get("issues_summary", {}).get("total", 0)
+        completed_issues = completed_counter["completed"]
         progress_pct = (completed_issues / total_issues * 100) if total_issues > 0 else 0
 
         health_status = "on_track"
@@ -1908,45 +2391,108 @@ def get_project_summary(project_id: str, zenhub_workspace_id: str = None) -> Dic
                 "error_type": "validation_error"
             }
 
-        # Fetch project tasks
-        tasks = frappe.get_all(
-            "Task",
-            filters={"project": project_id},
-            fields=["name", "subject", "status", "priority", "exp_end_date", "progress", "type"]
-        )
+        def fetch_tasks():
+            return frappe.get_all(
+                "Task",
+                filters={"project": project_id},
+                fields=["name", "subject", "status", "priority", "exp_end_date", "progress", "type"]
+            )
 
-        # Fetch workspace issues
-        variables = {"workspaceId": workspace_id}
-        response_data = execute_graphql_query(
-            get_workspace_issues_query(),
-            variables,
-            log_to_db=True,
-            reference_doctype="Project",
-            reference_docname=project_id,
-            operation_name="getTaskProgressTracking"
-        )
-        workspace = response_data.get("workspace", {})
-        all_issues = workspace.get("issues", {}).get("nodes", [])
+        def summarize_mirrored_issues():
+            # Per-state totals aggregated in SQL from the local Zenhub Issue mirror
+            zenhub_total = 0
+            zenhub_completed = 0
+            total_story_points = 0
+            completed_story_points = 0
+            issues_by_status = {"done": 0, "in_progress": 0, "to_do": 0, "in_review": 0, "blocked": 0}
+            for row in get_mirrored_state_totals(workspace_id):
+                zenhub_total += row.issues
+                total_story_points += frappe.utils.flt(row.story_points)
+                if row.state in ["closed", "done", "completed"]:
+                    zenhub_completed += row.issues
+                    completed_story_points += frappe.utils.flt(row.story_points)
+                    issues_by_status["done"] += row.issues
+                elif row.state in ["in_progress", "in progress", "working"]:
+                    issues_by_status["in_progress"] += row.issues
+                elif row.state in ["review", "in_review"]:
+                    issues_by_status["in_review"] += row.issues
+                elif row.state == "blocked":
+                    issues_by_status["blocked"] += row.issues
+                else:
+                    issues_by_status["to_do"] += row.issues
+
+            return {
+                "workspace": {"name": frappe.db.get_value("Zenhub Issue", {"workspace_id": workspace_id}, "workspace_name")},
+                "total": zenhub_total,
+                "completed": zenhub_completed,
+                "total_story_points": total_story_points,
+                "completed_story_points": completed_story_points,
+                "by_status": issues_by_status
+            }
+
+        def summarize_zenhub_issues():
+            # Stream workspace issues page by page and calculate Zenhub metrics in one pass
+            workspace = {}
+            zenhub_total = 0
+            zenhub_completed = 0
+            total_story_points = 0
+            completed_story_points = 0
+            issues_by_status = {"done": 0, "in_progress": 0, "to_do": 0, "in_review": 0, "blocked": 0}
+            for issue in iter_workspace_issues(
+                workspace_id,
+                workspace_info=workspace,
+                reference_doctype="Project",
+                reference_docname=project_id,
+                operation_name="getTaskProgressTracking"
+            ):
+                estimate = issue.get("estimate")
+                points = estimate.get("value", 0) if isinstance(estimate, dict) else 0
+                is_completed = issue.get("state") in ["closed", "done", "completed"]
+
+                zenhub_total += 1
+                total_story_points += points
+                if is_completed:
+                    zenhub_completed += 1
+                    completed_story_points += points
+
+                # Group Zenhub issues by status
+                state = (issue.get("state") or "").lower()
+                if state in ["closed", "done", "completed"]:
+                    issues_by_status["done"] += 1
+                elif state in ["in_progress", "in progress", "working"]:
+                    issues_by_status["in_progress"] += 1
+                elif state in ["review", "in_review"]:
+                    issues_by_status["in_review"] += 1
+                elif state == "blocked":
+                    issues_by_status["blocked"] += 1
+                else:
+                    issues_by_status["to_do"] += 1
+
+            return {
+                "workspace": workspace,
+                "total": zenhub_total,
+                "completed": zenhub_completed,
+                "total_story_points": total_story_points,
+                "completed_story_points": completed_story_points,
+                "by_status": issues_by_status
+            }
+
+        if is_workspace_mirrored(workspace_id):
+            tasks = fetch_tasks()
+            zenhub_metrics = summarize_mirrored_issues()
+        else:
+            # The Zenhub round trips overlap with the local Task query
+            results = run_concurrently({"tasks": fetch_tasks, "zenhub": summarize_zenhub_issues})
+            tasks = results["tasks"]
+            zenhub_metrics = results["zenhub"]
+        zenhub_total = zenhub_metrics["total"]
+        issues_by_status = zenhub_metrics["by_status"]
 
         # Calculate project metrics
         total_tasks = len(tasks)
         completed_tasks = sum(1 for t in tasks if t.status in ["Completed", "Closed"])
         in_progress_tasks = sum(1 for t in tasks if t.status in ["Working", "In Progress"])
 
-        # Calculate Zenhub metrics
-        zenhub_total = len(all_issues)
-        zenhub_completed = sum(1 for i in all_issues if i.get("state") in ["closed", "done", "completed"])
-        total_story_points = sum(
-            (i.get("estimate") or {}).get("value", 0)
-            for i in all_issues
-            if isinstance(i.get("estimate"), dict)
-        )
-        completed_story_points = sum(
-            (i.get("estimate") or {}).get("value", 0)
-            for i in all_issues
-            if i.get("state") in ["closed", "done", "completed"] and isinstance(i.get("estimate"), dict)
-        )
-
         # Group tasks by status
         tasks_by_status = {}
         for task in tasks:
@@ -1955,21 +2501,6 @@ def get_project_summary(project_id: str, zenhub_workspace_id: str = None) -> Dic
                 tasks_by_status[status] = 0
             tasks_by_status[status] += 1
 
-        # Group Zenhub issues by status
-        issues_by_status = {"done": 0, "in_progress": 0, "to_do": 0, "in_review": 0, "blocked": 0}
-        for issue in all_issues:
-            state = (issue.get("state") or "").lower()
-            if state in ["closed", "done", "completed"]:
-                issues_by_status["done"] += 1
-            elif state in ["in_progress", "in progress", "working"]:
-                issues_by_status["in_progress"] += 1
-            elif state in ["review", "in_review"]:
-                issues_by_status["in_review"] += 1
-            elif state == "blocked":
-                issues_by_status["blocked"] += 1
-            else:
-                issues_by_status["to_do"] += 1
-
         # Calculate health status
         completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         health_status = "healthy"
@@ -1983,7 +2514,7 @@ def get_project_summary(project_id: str, zenhub_workspace_id: str = None) -> Dic
             "project_id": project_id,
             "project_name": project.project_name,
             "workspace_id": workspace_id,
-            "workspace_name": workspace.get("name"),
+            "workspace_name": zenhub_metrics["workspace"].get("name"),
             "tasks_summary": {
                 "total": total_tasks,
                 "completed": completed_tasks,
@@ -1993,10 +2524,10 @@ def get_project_summary(project_id: str, zenhub_workspace_id: str = None) -> Dic
             },
             "zenhub_summary": {
                 "total_issues": zenhub_total,
-                "completed_issues": zenhub_completed,
-                "total_story_points": total_story_points,
-                "completed_story_points": completed_story_points,
-                "remaining_story_points": total_story_points - completed_story_points,
+                "completed_issues": zenhub_metrics["completed"],
+                "total_story_points": zenhub_metrics["total_story_points"],
+                "completed_story_points": zenhub_metrics["completed_story_points"],
+                "remaining_story_points": zenhub_metrics["total_story_points"] - zenhub_metrics["completed_story_points"],
                 "by_status": issues_by_status
             },
             "health_status": health_status,
@@ -2022,6 +2553,79 @@ def get_project_summary(project_id: str, zenhub_workspace_id: str = None) -> Dic
         }
 
 
+def find_task_related_issues(task, workspace_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Zenhub issues related to a Task, resolved from the workspace issue index.
+
+    The Task's Epic (custom_zenhub_epic_id) and its child issues come first,
+    then issues whose titles contain every token of the Task name or subject.
+    An Epic missing from the snapshot is fetched alone with a node(id:) query.
+
+    Args:
+        task: Frappe Task document
+        workspace_id (str): Zenhub workspace ID of the Task's Project
+
+    Returns:
+        dict: Workspace ID and name with up to TASK_RELATED_ISSUES_LIMIT
+              related issues, or None when nothing is related
+    """
+    from frappe_devsecops_dashboard.api.zenhub_workspace_helper import (
+        compact_workspace_issue,
+        get_workspace_issue_index
+    )
+
+    index = get_workspace_issue_index(workspace_id)
+    related = []
+
+    epic_id = task.get("custom_zenhub_epic_id")
+    if epic_id:
+        if index.has_epic(epic_id):
+            related.extend(index.get_epic_issues(epic_id))
+        else:
+            response_data = execute_graphql_query(
+                get_epic_node_query(),
+                {"epicId": epic_id},
+                log_to_db=True,
+                reference_doctype="Task",
+                reference_docname=task.name,
+                operation_name="getTaskZenhubEpic"
+            )
+            epic = (response_data or {}).get("node")
+            if epic:
+                related.append(compact_workspace_issue(epic))
+                related.extend(
+                    compact_workspace_issue(child)
+                    for child in (epic.get("childIssues") or {}).get("nodes") or []
+                )
+
+    # Epics created from Tasks are titled "{project}-{subject}"
+    related.extend(index.find_issues_by_title(task.name))
+    related.extend(index.find_issues_by_title(task.subject))
+
+    related_issues = {}
+    for issue in related:
+        if issue.get("id") and issue["id"] not in related_issues:
+            related_issues[issue["id"]] = {
+                "id": issue["id"],
+                "title": issue.get("title"),
+                "number": issue.get("number"),
+                "state": issue.get("state"),
+                "story_points": issue.get("estimate") or 0,
+                "repository": issue.get("repository"),
+                "html_url": issue.get("html_url")
+            }
+
+    if not related_issues:
+        return None
+
+    return {
+        "workspace_id": workspace_id,
+        "workspace_name": index.workspace_name,
+        "epic_id": epic_id,
+        "related_issues": list(related_issues.values())[:TASK_RELATED_ISSUES_LIMIT]
+    }
+
+
 @frappe.whitelist()
 def get_task_summary(task_id: str) -> Dict[str, Any]:
     """
@@ -2098,47 +2702,11 @@ def get_task_summary(task_id: str) -> Dict[str, Any]:
             limit=10
         )
 
-        # If we have a workspace, try to find related Zenhub issues
+        # If we have a workspace, look up related Zenhub issues
         zenhub_related = None
         if workspace_id:
-            # Search for issues related to this task
-            variables = {"workspaceId": workspace_id}
             try:
-                response_data = execute_graphql_query(
-                    get_workspace_issues_query(),
-                    variables,
-                    log_to_db=True,
-                    reference_doctype="Task",
-                    reference_docname=task_id,
-                    operation_name="getTaskZenhubRelated"
-                )
-                workspace = response_data.get("workspace", {})
-                all_issues = workspace.get("issues", {}).get("nodes", [])
-
-                # Find issues that might be related
-                task_name_normalized = task_id.lower().replace("-", " ")
-                related_issues = []
-                for issue in all_issues[:50]:
-                    issue_title = (issue.get("title") or "").lower()
-                    if task_name_normalized in issue_title or issue_title in task_name_normalized:
-                        estimate = issue.get("estimate") or {}
-                        points = estimate.get("value", 0) if isinstance(estimate, dict) else 0
-                        related_issues.append({
-                            "id": issue.get("id"),
-                            "title": issue.get("title"),
-                            "number": issue.get("number"),
-                            "state": issue.get("state"),
-                            "story_points": points,
-                            "repository": issue.get("repository", {}).get("name"),
-                            "html_url": issue.get("htmlUrl")
-                        })
-
-                if related_issues:
-                    zenhub_related = {
-                        "workspace_id": workspace_id,
-                        "workspace_name": workspace.get("name"),
-                        "related_issues": related_issues
-                    }
+                zenhub_related = find_task_related_issues(task, workspace_id)
             except Exception:
                 pass
 
@@ -2,6 +2,8 @@
 Zenhub API Logging Decorator
 
 Provides a decorator to automatically log Zenhub API calls to the database.
+Entries are buffered and bulk-inserted in the background (see
+queue_zenhub_api_log), so logging adds no write transaction to the request.
 
 Author: Frappe DevSecOps Dashboard
 License: MIT
@@ -13,7 +15,7 @@ import traceback
 from functools import wraps
 from typing import Any, Callable, Dict, Optional
 from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_graphql_api_log.zenhub_graphql_api_log import (
-    create_zenhub_api_log
+    queue_zenhub_api_log
 )
 
 
@@ -103,9 +105,9 @@ def log_zenhub_api_call(
             finally:
                 response_time_ms = int((time.time() - start_time) * 1000)
 
-                # Log to database directly
+                # Buffer the log entry for a background bulk insert
                 try:
-                    create_zenhub_api_log(
+                    queue_zenhub_api_log(
                         reference_doctype=reference_doctype,
                         reference_docname=reference_docname or "API Call",
                         operation_type="Query",
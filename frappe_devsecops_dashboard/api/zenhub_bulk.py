@@ -0,0 +1,229 @@
+"""
+Zenhub Bulk Mutations
+
+Creates many Zenhub entities with a few requests instead of one request (or
+several) per entity, for onboarding flows such as setup_product_workspace
+and create_zenhub_entities:
+- Items are sent in aliased batches (item0: createIssue(input: $input0) ...)
+- Batches run concurrently, bounded by zenhub_client.run_concurrently
+- Outcomes are per item, so a rejected alias or a failed batch only fails
+  its own items
+- Callers record each batch's successes as it completes, so rerunning a
+  partially failed plan only sends what is still missing
+
+Author: Frappe DevSecOps Dashboard
+License: MIT
+"""
+
+import hashlib
+import json as json_lib
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import frappe
+from frappe_devsecops_dashboard.api.zenhub_client import run_concurrently
+
+# Aliases per mutation document; Zenhub runs them one after another, so larger
+# batches trade request count for longer requests and query complexity
+ZENHUB_MUTATION_BATCH_SIZE = 10
+
+# Progress of a bulk plan (item key -> result), kept long enough to resume
+BULK_PROGRESS_CACHE_KEY_PREFIX = "zenhub_bulk_progress_"
+BULK_PROGRESS_TTL = 7 * 86400
+
+
+def build_batch_mutation(
+    operation_name: str,
+    selection: str,
+    variable_types: Dict[str, str],
+    count: int,
+    shared_variable_types: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    GraphQL document repeating one mutation selection under aliases.
+
+    Every $name of variable_types in the selection is renamed to $name<i> for
+    alias item<i>; shared variables keep their names and are declared once.
+
+    Args:
+        operation_name (str): GraphQL operation name
+        selection (str): Mutation field with its sub-selection, e.g.
+            "createIssue(input: $input) { issue { id } }"
+        variable_types (dict): Per-item variable name -> GraphQL type
+        count (int): Number of aliases
+        shared_variable_types (dict): Variables common to every alias
+
+    Returns:
+        str: GraphQL mutation string
+    """
+    declarations = [f"${name}: {gql_type}" for name, gql_type in (shared_variable_types or {}).items()]
+    declarations += [
+        f"${name}{i}: {gql_type}"
+        for i in range(count)
+        for name, gql_type in variable_types.items()
+    ]
+
+    aliases = []
+    for i in range(count):
+        aliased = selection
+        for name in variable_types:
+            aliased = re.sub(rf"\${name}\b", f"${name}{i}", aliased)
+        aliases.append(f"    item{i}: {aliased}")
+
+    aliases_block = "\n".join(aliases)
+    return f"mutation {operation_name}({', '.join(declarations)}) {{\n{aliases_block}\n}}"
+
+
+def run_mutation_batches(
+    items: Dict[str, Dict[str, Any]],
+    operation_name: str,
+    selection: str,
+    variable_types: Dict[str, str],
+    reference_doctype: str,
+    reference_docname: str,
+    shared_variables: Optional[Dict[str, Any]] = None,
+    shared_variable_types: Optional[Dict[str, str]] = None,
+    on_batch_success: Optional[Callable[[Dict[str, Any]], None]] = None,
+    batch_size: int = ZENHUB_MUTATION_BATCH_SIZE,
+    token: Optional[str] = None
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Send one mutation per item in aliased, concurrently sent batches.
+
+    Args:
+        items (dict): Item key -> its variables (names from variable_types)
+        operation_name (str): GraphQL operation name, also used for API logging
+        selection (str): Mutation selection, see build_batch_mutation()
+        variable_types (dict): Per-item variable name -> GraphQL type
+        reference_doctype (str): DocType for API logging
+        reference_docname (str): Document name for API logging
+        shared_variables (dict): Variables common to every alias
+        shared_variable_types (dict): GraphQL types of the shared variables
+        on_batch_success (callable): Called with {item key: result} as soon as
+            a batch returns, inside that batch's own database transaction
+        batch_size (int): Aliases per request
+        token (str): Zenhub API token (fetched when omitted)
+
+    Returns:
+        tuple: ({item key: mutation result}, {item key: error message})
+    """
+    from frappe_devsecops_dashboard.api.zenhub_graphql_logger import execute_graphql_query_with_logging
+
+    keys = list(items)
+    chunks = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+
+    def send_chunk(chunk):
+        def call():
+            variables = dict(shared_variables or {})
+            for i, key in enumerate(chunk):
+                for name, value in items[key].items():
+                    variables[f"{name}{i}"] = value
+
+            # Return the error instead of raising so other batches still count
+            try:
+                data, _ = execute_graphql_query_with_logging(
+                    query=build_batch_mutation(
+                        operation_name, selection, variable_types, len(chunk), shared_variable_types
+                    ),
+                    variables=variables,
+                    reference_doctype=reference_doctype,
+                    reference_docname=reference_docname,
+                    operation_name=operation_name,
+                    operation_type="Mutation",
+                    token=token
+                )
+                succeeded, failed = parse_batch_response(data, chunk)
+                if succeeded and on_batch_success:
+                    on_batch_success(succeeded)
+                return succeeded, failed
+            except Exception as e:
+                return {}, {key: str(e) for key in chunk}
+        return call
+
+    outcomes = run_concurrently({str(index): send_chunk(chunk) for index, chunk in enumerate(chunks)})
+
+    results = {}
+    errors = {}
+    for index in range(len(chunks)):
+        succeeded, failed = outcomes[str(index)]
+        results.update(succeeded)
+        errors.update(failed)
+
+    return results, errors
+
+
+def parse_batch_response(
+    data: Dict[str, Any],
+    keys: List[str],
+    alias_prefix: str = "item",
+    missing_message: str = "No result returned"
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Split an aliased response into per-item results and errors.
+
+    GraphQL errors carry the alias as the first element of their path; an
+    alias that returned nothing without its own error gets the request-level
+    error (HTTP failure, timeout or an unattributed GraphQL error).
+
+    Args:
+        data (dict): Raw response body ({"data": ..., "errors": [...]})
+        keys (list): Item keys in alias order
+        alias_prefix (str): Alias of item i is f"{alias_prefix}{i}"
+        missing_message (str): Error for an empty alias when nothing else failed
+
+    Returns:
+        tuple: ({item key: result}, {item key: error message})
+    """
+    data = data or {}
+    payload = data.get("data") or {}
+
+    alias_errors = {}
+    general_errors = []
+    for error in data.get("errors") or []:
+        path = error.get("path") or []
+        message = error.get("message", "Unknown error")
+        if path and str(path[0]).startswith(alias_prefix):
+            alias_errors.setdefault(path[0], []).append(message)
+        else:
+            general_errors.append(message)
+
+    fallback = "; ".join(general_errors) or data.get("error") or missing_message
+
+    succeeded = {}
+    failed = {}
+    for i, key in enumerate(keys):
+        alias = f"{alias_prefix}{i}"
+        result = payload.get(alias)
+        if result and alias not in alias_errors:
+            succeeded[key] = result
+        else:
+            failed[key] = "; ".join(alias_errors.get(alias, [])) or fallback
+
+    return succeeded, failed
+
+
+def get_bulk_plan_key(*parts: Any) -> str:
+    """Stable key of a bulk plan from what defines it (target IDs, item keys)"""
+    return hashlib.sha1(json_lib.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def get_bulk_progress(plan_key: str) -> Dict[str, Any]:
+    """Results recorded so far for a plan (item key -> result)"""
+    try:
+        progress = frappe.cache().hgetall(f"{BULK_PROGRESS_CACHE_KEY_PREFIX}{plan_key}") or {}
+        return {key: json_lib.loads(value) for key, value in progress.items()}
+    except Exception:
+        return {}
+
+
+def record_bulk_progress(plan_key: str, results: Dict[str, Any]) -> None:
+    """Record completed items of a plan; one hash field per item, so concurrent batches don't overwrite each other"""
+    try:
+        cache = frappe.cache()
+        name = f"{BULK_PROGRESS_CACHE_KEY_PREFIX}{plan_key}"
+        for key, result in results.items():
+            cache.hset(name, key, json_lib.dumps(result, default=str))
+        cache.expire(cache.make_key(name), BULK_PROGRESS_TTL)
+    except Exception as e:
+        # The entities exist either way; only resuming this plan is affected
+        frappe.logger().warning(f"[zenhub_bulk] Could not record progress of plan {plan_key}: {str(e)}")
@@ -0,0 +1,500 @@
+"""
+Zenhub HTTP Client
+
+Single place where HTTP requests to the Zenhub GraphQL API are made. Every
+worker process keeps one requests.Session with a tuned connection pool, so
+sequential calls (e.g. background jobs creating projects and epics) reuse
+the same keep-alive TLS connection instead of opening a new one per call.
+Token retrieval, headers, timeouts and rate limiting are applied here for all
+callers: a token bucket in Redis keeps every worker together under the
+Zenhub quota, and rate-limited or failed idempotent calls are retried with
+jittered exponential backoff, honouring Retry-After.
+Independent calls can be issued at the same time with run_concurrently, and
+identical queries issued at the same moment by different requests are
+coalesced into one call with single_flight.
+
+Usage:
+    response = post_graphql(query, {"workspaceId": workspace_id})
+    data = response.json()
+
+    results = run_concurrently({
+        "issues": lambda: fetch_issues(workspace_id),
+        "sprints": lambda: fetch_sprints(workspace_id)
+    })
+
+Author: Frappe DevSecOps Dashboard
+License: MIT
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+import frappe
+import requests
+from concurrent.futures import ThreadPoolExecutor, wait
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Dict, Optional
+
+# Zenhub GraphQL API endpoint
+ZENHUB_GRAPHQL_ENDPOINT = "https://api.zenhub.com/public/graphql"
+
+# Default request timeout in seconds
+ZENHUB_REQUEST_TIMEOUT = 30
+
+# Connection pool sizing: one host, a few concurrent requests per worker
+ZENHUB_POOL_CONNECTIONS = 2
+ZENHUB_POOL_MAXSIZE = 10
+
+# Client-side throttle shared by all workers (per API token): sustained rate and burst size
+ZENHUB_RATE_LIMIT_PER_MINUTE = 100
+ZENHUB_RATE_LIMIT_BURST = 10
+# Longest a call waits for the throttle before it is sent anyway
+ZENHUB_THROTTLE_MAX_WAIT = 30
+RATE_LIMIT_KEY_PREFIX = "zenhub_rate_limit_"
+
+# Retries: 429 responses are always retried (the call was not processed);
+# 5xx responses, timeouts and connection errors only for queries, not mutations
+ZENHUB_MAX_RETRIES = 3
+ZENHUB_RETRY_BASE_DELAY = 1
+ZENHUB_RETRY_MAX_DELAY = 30
+ZENHUB_RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Web requests must finish well within the worker timeout, so there a call
+# waits at most this long in total for the throttle and between retries, then
+# fails with RateLimitExceededError. Background jobs use the limits above.
+ZENHUB_INTERACTIVE_WAIT_BUDGET = 5
+
+# Atomically refill the bucket and take one token. Returns 0 when a token was
+# taken, otherwise the milliseconds until one is available.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate / 1000)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity * 1000 / rate) + 1000)
+return wait
+"""
+
+# Maximum Zenhub calls run at the same time by run_concurrently
+ZENHUB_MAX_CONCURRENT_REQUESTS = 4
+
+# Single-flight: the leader's lock outlives its request timeout, and its result
+# is kept just long enough for every waiting follower to read it
+SINGLE_FLIGHT_KEY_PREFIX = "zenhub_single_flight_"
+SINGLE_FLIGHT_LOCK_TTL = ZENHUB_REQUEST_TIMEOUT + 5
+SINGLE_FLIGHT_RESULT_TTL = 10
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+SINGLE_FLIGHT_MAX_POLL_INTERVAL = 0.5
+
+# Errors shared with followers, so they fail the same way as the leader
+SINGLE_FLIGHT_SHARED_ERRORS = ("AuthenticationError", "RateLimitExceededError", "ValidationError")
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+
+
+def get_zenhub_session() -> requests.Session:
+    """
+    Get the worker's shared Zenhub session
+
+    A new session is created after a fork, so processes never share sockets.
+
+    Returns:
+        requests.Session: Session with a pooled, keep-alive HTTPS adapter
+    """
+    global _session, _session_pid
+
+    if _session is not None and _session_pid == os.getpid():
+        return _session
+
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=ZENHUB_POOL_CONNECTIONS,
+                pool_maxsize=ZENHUB_POOL_MAXSIZE
+            )
+            session.mount("https://", adapter)
+            session.headers.update({
+                "Content-Type": "application/json",
+                "User-Agent": "Frappe-DevSecOps-Dashboard"
+            })
+            _session = session
+            _session_pid = os.getpid()
+
+    return _session
+
+
+def get_zenhub_headers(token: Optional[str] = None) -> Dict[str, str]:
+    """
+    Get the request headers for a Zenhub API call
+
+    Args:
+        token: Zenhub API token (fetched from Zenhub Settings if not provided)
+
+    Returns:
+        dict: Authorization and Content-Type headers
+    """
+    if not token:
+        from frappe_devsecops_dashboard.api.zenhub import get_zenhub_token
+        token = get_zenhub_token()
+
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json"
+    }
+
+
+def post_graphql(
+    query: str,
+    variables: Optional[Dict[str, Any]] = None,
+    token: Optional[str] = None,
+    timeout: int = ZENHUB_REQUEST_TIMEOUT,
+    max_retries: int = ZENHUB_MAX_RETRIES
+) -> requests.Response:
+    """
+    POST a GraphQL query or mutation to Zenhub over the shared session
+
+    Every attempt first takes a token from the shared rate-limit bucket.
+    429 responses are retried after Retry-After (or a jittered exponential
+    backoff); 5xx responses, timeouts and connection errors are retried only
+    for queries, since a mutation may already have been applied. Once
+    retries are exhausted the last response is returned (or the last
+    exception raised), so callers handle errors as before.
+
+    In web requests, throttle waits and retry delays share a budget of
+    ZENHUB_INTERACTIVE_WAIT_BUDGET seconds: when the throttle cannot be
+    passed in time RateLimitExceededError is raised, and a retry that would
+    overrun the budget is not made.
+
+    Args:
+        query: GraphQL query/mutation string
+        variables: Variables for the query
+        token: Zenhub API token (fetched from Zenhub Settings if not provided)
+        timeout: Request timeout in seconds
+        max_retries: Retries after the first attempt (0 disables retries)
+
+    Returns:
+        requests.Response: The raw HTTP response
+    """
+    headers = get_zenhub_headers(token)
+    is_mutation = query.strip().startswith("mutation")
+    bucket_key = get_rate_limit_key(headers["Authorization"])
+    deadline = time.monotonic() + ZENHUB_INTERACTIVE_WAIT_BUDGET if is_interactive_request() else None
+
+    attempt = 0
+    while True:
+        max_wait = ZENHUB_THROTTLE_MAX_WAIT if deadline is None else max(deadline - time.monotonic(), 0)
+        if not acquire_rate_limit_token(bucket_key, max_wait) and deadline is not None:
+            frappe.throw(
+                "Zenhub API rate limit exceeded. Please try again later.",
+                frappe.RateLimitExceededError
+            )
+
+        error = None
+        try:
+            response = get_zenhub_session().post(
+                ZENHUB_GRAPHQL_ENDPOINT,
+                json={"query": query, "variables": variables or {}},
+                headers=headers,
+                timeout=timeout
+            )
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            if is_mutation or attempt >= max_retries:
+                raise
+            error = e
+            delay = get_retry_delay(attempt)
+        else:
+            retryable = response.status_code == 429 or (
+                not is_mutation and response.status_code in ZENHUB_RETRY_STATUS_CODES
+            )
+            if not retryable or attempt >= max_retries:
+                return response
+
+            delay = get_retry_delay(attempt, response.headers.get("Retry-After"))
+            if response.status_code == 429:
+                # Make every worker using this token back off, not just this one
+                pause_rate_limit(bucket_key, delay)
+
+        if deadline is not None and time.monotonic() + delay > deadline:
+            # Out of budget for this web request: fail now, not at the worker timeout
+            if error:
+                raise error
+            return response
+
+        frappe.logger().warning(
+            f"[zenhub_client] Retrying Zenhub call in {delay:.1f}s (attempt {attempt + 1} of {max_retries})"
+        )
+        time.sleep(delay)
+        attempt += 1
+
+
+def get_rate_limit_key(authorization: str) -> str:
+    """Get the rate-limit bucket name of an API token (the token itself is not stored)"""
+    return f"{RATE_LIMIT_KEY_PREFIX}{hashlib.sha1(authorization.encode()).hexdigest()[:16]}"
+
+
+def is_interactive_request() -> bool:
+    """Whether Zenhub calls are made for a web request rather than a background job"""
+    return bool(getattr(frappe.local, "request", None) or frappe.flags.zenhub_interactive)
+
+
+def acquire_rate_limit_token(bucket_key: str, max_wait: float = ZENHUB_THROTTLE_MAX_WAIT) -> bool:
+    """
+    Wait until the shared token bucket allows another call
+
+    Gives up after max_wait seconds; background callers then send the call
+    anyway, so a misconfigured bucket can slow them down but never block
+    them. Without Redis the throttle is skipped.
+
+    Returns:
+        bool: True when a token was taken (or Redis is unavailable)
+    """
+    rate = ZENHUB_RATE_LIMIT_PER_MINUTE / 60.0
+    deadline = time.monotonic() + max_wait
+
+    try:
+        cache = frappe.cache()
+        key = cache.make_key(bucket_key)
+        pause_key = cache.make_key(f"{bucket_key}_pause")
+
+        while time.monotonic() < deadline:
+            pause_ms = cache.pttl(pause_key)
+            if pause_ms and pause_ms > 0:
+                wait_ms = pause_ms
+            else:
+                wait_ms = int(cache.eval(
+                    TOKEN_BUCKET_SCRIPT, 1, key,
+                    rate, ZENHUB_RATE_LIMIT_BURST, int(time.time() * 1000)
+                ))
+                if wait_ms <= 0:
+                    return True
+
+            time.sleep(min(wait_ms / 1000.0, max(deadline - time.monotonic(), 0)))
+    except Exception:
+        return True  # Redis unavailable: call without the shared throttle
+
+    return False
+
+
+def pause_rate_limit(bucket_key: str, seconds: float) -> None:
+    """Hold every call sharing the bucket for the given time (after a 429)"""
+    try:
+        cache = frappe.cache()
+        cache.set(cache.make_key(f"{bucket_key}_pause"), 1, px=max(int(seconds * 1000), 1))
+    except Exception:
+        pass  # Each worker still honours its own retry delay
+
+
+def get_retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Get the delay before a retry
+
+    Uses Retry-After (seconds or an HTTP date) when Zenhub sends it, otherwise
+    an exponential backoff with full jitter, capped at ZENHUB_RETRY_MAX_DELAY.
+
+    Args:
+        attempt: Retries already made (0 for the first retry)
+        retry_after: Value of the Retry-After response header
+
+    Returns:
+        float: Seconds to wait
+    """
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0), ZENHUB_RETRY_MAX_DELAY)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after).timestamp()
+                return min(max(retry_at - time.time(), 0), ZENHUB_RETRY_MAX_DELAY)
+            except (TypeError, ValueError):
+                pass  # Unparseable header, fall back to backoff
+
+    return random.uniform(0, min(ZENHUB_RETRY_BASE_DELAY * (2 ** attempt), ZENHUB_RETRY_MAX_DELAY))
+
+
+def run_concurrently(
+    calls: Dict[str, Callable[[], Any]],
+    max_workers: int = ZENHUB_MAX_CONCURRENT_REQUESTS
+) -> Dict[str, Any]:
+    """
+    Run independent Zenhub calls at the same time in a bounded thread pool
+
+    Each call runs in its own Frappe context for the current site and user
+    (with its own database connection), and its writes such as API logs and
+    Error Logs are committed when it returns. Exceptions are re-raised here
+    once every call has finished. Calls run one after the other in tests and
+    outside a site context.
+
+    Args:
+        calls: Key -> zero-argument callable
+        max_workers: Maximum calls running at the same time
+
+    Returns:
+        dict: Key -> return value of its callable
+    """
+    site = getattr(frappe.local, "site", None)
+    if len(calls) <= 1 or not site or frappe.flags.in_test:
+        return {key: call() for key, call in calls.items()}
+
+    sites_path = getattr(frappe.local, "sites_path", None) or "."
+    user = frappe.session.user
+    interactive = is_interactive_request()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls)), thread_name_prefix="zenhub") as executor:
+        futures = {
+            key: executor.submit(_run_in_site_context, site, sites_path, user, call, interactive)
+            for key, call in calls.items()
+        }
+        wait(futures.values())
+
+    return {key: future.result() for key, future in futures.items()}
+
+
+def _run_in_site_context(site: str, sites_path: str, user: str, call: Callable[[], Any], interactive: bool = False) -> Any:
+    """Run a call in a fresh Frappe context, committing its writes"""
+    frappe.init(site=site, sites_path=sites_path)
+    # The thread has no request of its own but serves the caller's one
+    frappe.flags.zenhub_interactive = interactive
+    try:
+        frappe.connect()
+        frappe.set_user(user)
+        result = call()
+        frappe.db.commit()
+        return result
+    except Exception:
+        if getattr(frappe.local, "db", None):
+            frappe.db.rollback()
+        raise
+    finally:
+        frappe.destroy()
+
+
+def get_single_flight_key(query: str, variables: Optional[Dict[str, Any]] = None) -> str:
+    """Hash a query and its variables into a single-flight key"""
+    payload = json.dumps({"query": query, "variables": variables or {}}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def single_flight(key: str, call: Callable[[], Any]) -> Any:
+    """
+    Coalesce identical calls made at the same time by different requests
+
+    The first caller (the leader) takes a short-lived Redis lock and makes the
+    call. Callers arriving while the lock is held (followers) wait for the
+    leader's result instead of calling Zenhub again, and re-raise its error
+    when it failed with a Frappe error. The lock holds a token unique to the
+    flight and the result is stored under it, so followers never read the
+    outcome of an earlier flight of the same key. If the leader disappears
+    without a result, followers make the call themselves. Without Redis,
+    every caller makes its own call.
+
+    Args:
+        key: Single-flight key (see get_single_flight_key)
+        call: Zero-argument callable returning a JSON-serializable result
+
+    Returns:
+        The result of call, made by this caller or by the leader
+    """
+    try:
+        cache = frappe.cache()
+        lock_key = cache.make_key(f"{SINGLE_FLIGHT_KEY_PREFIX}lock_{key}")
+        flight = frappe.generate_hash(length=16)
+        is_leader = cache.set(lock_key, flight, nx=True, ex=SINGLE_FLIGHT_LOCK_TTL)
+        if not is_leader:
+            flight = _get_single_flight_token(cache, lock_key)
+    except Exception:
+        return call()  # Redis unavailable
+
+    if not flight:
+        return call()  # The leader released the lock before we could join its flight
+
+    result_key = cache.make_key(f"{SINGLE_FLIGHT_KEY_PREFIX}result_{key}_{flight}")
+
+    if is_leader:
+        try:
+            result = call()
+        except Exception as e:
+            error_type = next((name for name in SINGLE_FLIGHT_SHARED_ERRORS if isinstance(e, getattr(frappe, name))), None)
+            if error_type:
+                _publish_single_flight_result(cache, result_key, {"error": str(e), "error_type": error_type})
+            raise
+        else:
+            _publish_single_flight_result(cache, result_key, {"data": result})
+            return result
+        finally:
+            try:
+                # The lock may have expired and been taken by a newer flight
+                if _get_single_flight_token(cache, lock_key) == flight:
+                    cache.delete(lock_key)
+            except Exception:
+                pass  # The lock expires on its own
+
+    try:
+        outcome = _wait_for_single_flight_result(cache, lock_key, result_key, flight)
+    except Exception:
+        outcome = None  # Redis became unavailable while waiting
+
+    if outcome is None:
+        return call()  # The leader failed unexpectedly or timed out
+
+    if "error" in outcome:
+        frappe.throw(outcome["error"], getattr(frappe, outcome["error_type"]))
+
+    return outcome["data"]
+
+
+def _get_single_flight_token(cache, lock_key: str) -> Optional[str]:
+    """Token of the flight currently holding the lock, if any"""
+    value = cache.get(lock_key)
+    if isinstance(value, bytes):
+        value = value.decode()
+    return value or None
+
+
+def _publish_single_flight_result(cache, result_key: str, outcome: Dict[str, Any]) -> None:
+    """Store the leader's outcome for its followers"""
+    try:
+        cache.set(result_key, json.dumps(outcome, default=str), ex=SINGLE_FLIGHT_RESULT_TTL)
+    except Exception:
+        pass  # Followers fall back to making the call
+
+
+def _read_single_flight_result(cache, result_key: str) -> Optional[Dict[str, Any]]:
+    """Read the leader's outcome straight from Redis (not the request-local cache)"""
+    value = cache.get(result_key)
+    return json.loads(value) if value else None
+
+
+def _wait_for_single_flight_result(cache, lock_key: str, result_key: str, flight: str) -> Optional[Dict[str, Any]]:
+    """Wait until the leader publishes its outcome or releases the lock without one"""
+    deadline = time.monotonic() + SINGLE_FLIGHT_LOCK_TTL
+    interval = SINGLE_FLIGHT_POLL_INTERVAL
+
+    while time.monotonic() < deadline:
+        outcome = _read_single_flight_result(cache, result_key)
+        if outcome is not None:
+            return outcome
+        if _get_single_flight_token(cache, lock_key) != flight:
+            # Released (and maybe taken by a new flight): the outcome is
+            # published just before the lock is dropped
+            return _read_single_flight_result(cache, result_key)
+        time.sleep(interval)
+        interval = min(interval * 2, SINGLE_FLIGHT_MAX_POLL_INTERVAL)
+
+    return None
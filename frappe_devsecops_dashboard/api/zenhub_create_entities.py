@@ -19,11 +19,45 @@ import frappe
 import requests
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Union
 from pathlib import Path
 
 # Import existing Zenhub utilities
 from .zenhub import get_zenhub_token, execute_graphql_query, ZENHUB_GRAPHQL_ENDPOINT
+from .zenhub_bulk import get_bulk_plan_key, get_bulk_progress, record_bulk_progress, run_mutation_batches
+
+# Mutation selections batched by create_epics(); same inputs as create_epic()
+CREATE_EPIC_SELECTION = """createIssue(input: {
+        repositoryId: $repositoryId
+        title: $title
+        body: $body
+        issueType: EPIC
+      }) {
+        issue {
+          id
+          number
+          title
+          body
+          state
+          type
+          createdAt
+        }
+        errors {
+          message
+        }
+      }"""
+
+LINK_EPIC_SELECTION = """addIssueToProject(input: {
+        issueId: $issueId
+        projectId: $projectId
+      }) {
+        issue {
+          id
+        }
+        errors {
+          message
+        }
+      }"""
 
 
 def get_or_create_workspace(workspace_name: str, workspace_id: Optional[str] = None) -> Dict[str, Any]:
@@ -204,24 +238,19 @@ def get_or_create_project(workspace_id: str, project_name: str, project_id: Opti
             raise
 
 
-def create_epic(workspace_id: str, project_id: str, epic_title: str, epic_description: Optional[str] = None) -> Dict[str, Any]:
+def get_epic_repository(workspace_id: str) -> Dict[str, Any]:
     """
-    Create a new epic in a Zenhub project.
-    
-    Note: Epics in Zenhub are typically GitHub issues with a specific type.
-    This function creates an epic issue in the workspace.
-    
+    Get the repository epics are created in.
+
+    Epics are created as issues in a repository; the first repository of the
+    workspace is used (you can modify this logic to select a specific repo).
+
     Args:
         workspace_id (str): The Zenhub workspace ID
-        project_id (str): The Zenhub project ID
-        epic_title (str): Title of the epic
-        epic_description (str, optional): Description of the epic
-        
+
     Returns:
-        dict: Created epic data with ID
+        dict: Repository "id" and "name"
     """
-    # First, we need to get a repository ID from the workspace
-    # Epics are created as issues in a repository
     query = """
     query GetWorkspaceRepositories($workspaceId: ID!) {
       workspace(id: $workspaceId) {
@@ -234,33 +263,51 @@ def create_epic(workspace_id: str, project_id: str, epic_title: str, epic_descri
       }
     }
     """
-    
-    try:
-        # Get repositories in the workspace
-        repo_result = execute_graphql_query(
-            query,
-            {"workspaceId": workspace_id},
-            log_to_db=True,
-            reference_doctype="Software Product",
-            reference_docname=workspace_id,
-            operation_name="getWorkspaceRepositories"
+
+    repo_result = execute_graphql_query(
+        query,
+        {"workspaceId": workspace_id},
+        log_to_db=True,
+        reference_doctype="Software Product",
+        reference_docname=workspace_id,
+        operation_name="getWorkspaceRepositories"
+    )
+
+    if "workspace" not in repo_result:
+        frappe.throw("Failed to fetch workspace repositories", frappe.ValidationError)
+
+    repositories = repo_result["workspace"].get("repositoriesConnection", {}).get("nodes", [])
+
+    if not repositories:
+        frappe.throw(
+            "No repositories found in workspace. Please add a GitHub repository to the workspace first.",
+            frappe.ValidationError
         )
+
+    return {"id": repositories[0]["id"], "name": repositories[0]["name"]}
+
+
+def create_epic(workspace_id: str, project_id: str, epic_title: str, epic_description: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Create a new epic in a Zenhub project.
+    
+    Note: Epics in Zenhub are typically GitHub issues with a specific type.
+    This function creates an epic issue in the workspace.
+    
+    Args:
+        workspace_id (str): The Zenhub workspace ID
+        project_id (str): The Zenhub project ID
+        epic_title (str): Title of the epic
+        epic_description (str, optional): Description of the epic
         
-        if "workspace" not in repo_result:
-            frappe.throw("Failed to fetch workspace repositories", frappe.ValidationError)
-        
-        repositories = repo_result["workspace"].get("repositoriesConnection", {}).get("nodes", [])
-        
-        if not repositories:
-            frappe.throw(
-                "No repositories found in workspace. Please add a GitHub repository to the workspace first.",
-                frappe.ValidationError
-            )
-        
-        # Use the first repository (you can modify this logic to select a specific repo)
-        repository_id = repositories[0]["id"]
-        repository_name = repositories[0]["name"]
-        
+    Returns:
+        dict: Created epic data with ID
+    """
+    try:
+        repository = get_epic_repository(workspace_id)
+        repository_id = repository["id"]
+        repository_name = repository["name"]
+
         frappe.logger().info(f"Using repository: {repository_name} (ID: {repository_id})")
         
         # Create epic as an issue with epic type
@@ -372,6 +419,147 @@ def create_epic(workspace_id: str, project_id: str, epic_title: str, epic_descri
         raise
 
 
+def plan_epics(epic_titles: Union[str, List[str], None]) -> List[str]:
+    """
+    Validate the epic titles of a run before anything is created.
+
+    Args:
+        epic_titles: List (or JSON-encoded list) of epic titles
+
+    Returns:
+        list: Stripped titles in their original order
+
+    Raises:
+        frappe.ValidationError: For blank or duplicate titles
+    """
+    if isinstance(epic_titles, str):
+        epic_titles = frappe.parse_json(epic_titles)
+
+    titles = [str(title or "").strip() for title in epic_titles or []]
+    if any(not title for title in titles):
+        frappe.throw("Epic titles cannot be blank", frappe.ValidationError)
+
+    duplicates = sorted({title for title in titles if titles.count(title) > 1})
+    if duplicates:
+        frappe.throw(f"Duplicate epic titles: {', '.join(duplicates)}", frappe.ValidationError)
+
+    return titles
+
+
+def create_epics(
+    workspace_id: str,
+    project_id: str,
+    epic_titles: List[str],
+    token: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, str], int]:
+    """
+    Create several epics in a Zenhub project with batched mutations.
+
+    The repository is looked up once, epics are created in aliased batches
+    and then linked to the project in aliased batches (see api.zenhub_bulk).
+    Created and linked epics are recorded per run (workspace, project and
+    titles), so running the same titles again after a partial failure only
+    creates and links what is still missing.
+
+    Args:
+        workspace_id (str): The Zenhub workspace ID
+        project_id (str): The Zenhub project ID
+        epic_titles (list): Titles validated by plan_epics()
+        token (str, optional): Zenhub API token
+
+    Returns:
+        tuple: (created epics in create_epic() format and title order,
+                {title: error} for epics that could not be created,
+                number of epics already created by an earlier run)
+    """
+    plan_key = get_bulk_plan_key("epics", workspace_id, project_id, epic_titles)
+    progress = get_bulk_progress(plan_key)
+
+    repository = get_epic_repository(workspace_id)
+    frappe.logger().info(f"Using repository: {repository['name']} (ID: {repository['id']})")
+
+    issues = {
+        title: progress[f"create:{title}"]
+        for title in epic_titles
+        if progress.get(f"create:{title}")
+    }
+    resumed = len(issues)
+
+    def record_created(results):
+        created = {title: _get_created_issue(result) for title, result in results.items()}
+        record_bulk_progress(plan_key, {f"create:{title}": issue for title, issue in created.items() if issue})
+
+    created, failed = run_mutation_batches(
+        {
+            title: {
+                "title": title,
+                "body": f"Epic created on {datetime.now().strftime('%Y-%m-%d')}"
+            }
+            for title in epic_titles
+            if title not in issues
+        },
+        operation_name="createEpicIssues",
+        selection=CREATE_EPIC_SELECTION,
+        variable_types={"title": "String!", "body": "String"},
+        shared_variables={"repositoryId": repository["id"]},
+        shared_variable_types={"repositoryId": "ID!"},
+        reference_doctype="Software Product",
+        reference_docname=workspace_id,
+        on_batch_success=record_created,
+        token=token
+    )
+
+    for title, result in created.items():
+        issue = _get_created_issue(result)
+        if issue:
+            issues[title] = issue
+        else:
+            failed[title] = "; ".join(
+                err.get("message", "Unknown error") for err in result.get("errors") or []
+            ) or "Epic creation returned no issue data"
+
+    linked, link_errors = run_mutation_batches(
+        {
+            title: {"issueId": issue["id"]}
+            for title, issue in issues.items()
+            if not progress.get(f"link:{title}")
+        },
+        operation_name="linkEpicsToProject",
+        selection=LINK_EPIC_SELECTION,
+        variable_types={"issueId": "ID!"},
+        shared_variables={"projectId": project_id},
+        shared_variable_types={"projectId": "ID!"},
+        reference_doctype="Software Product",
+        reference_docname=workspace_id,
+        on_batch_success=lambda results: record_bulk_progress(
+            plan_key, {f"link:{title}": True for title, result in results.items() if not result.get("errors")}
+        ),
+        token=token
+    )
+    for title, result in linked.items():
+        if result.get("errors"):
+            link_errors[title] = result["errors"]
+    for title, error in link_errors.items():
+        frappe.logger().warning(f"Epic '{title}' created but failed to link to project: {error}")
+
+    epics = [
+        {"success": True, "epic": issues[title], "repository": repository}
+        for title in epic_titles
+        if title in issues
+    ]
+    frappe.logger().info(
+        f"✅ Created {len(epics) - resumed} epic(s), {resumed} from an earlier run, {len(failed)} failed"
+    )
+    return epics, failed, resumed
+
+
+def _get_created_issue(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The issue of a createIssue payload, unless the payload reported errors"""
+    if not result or result.get("errors"):
+        return None
+    return result.get("issue")
+
+
 def save_ids_to_markdown(results: Dict[str, Any], output_file: Optional[str] = None) -> str:
     """
     Save the created entity IDs to a markdown file.
@@ -492,6 +680,9 @@ def create_zenhub_entities(
     
     Note: Workspaces and Projects should be created via Zenhub UI first.
     This function creates epics (GitHub issues) in the specified workspace/project.
+    The titles are validated before anything is created, and epics are created
+    in batches; after a partial failure, run it again with the same titles to
+    create only the missing epics.
     
     Args:
         workspace_id (str): The Zenhub workspace ID (required)
@@ -503,9 +694,6 @@ def create_zenhub_entities(
     Returns:
         dict: Results containing all created entities
     """
-    if epic_titles is None:
-        epic_titles = []
-    
     results = {
         "workspace": None,
         "project": None,
@@ -513,38 +701,55 @@ def create_zenhub_entities(
     }
     
     try:
-        # Step 1: Get Workspace
+        # Step 1: Validate the plan
+        epic_titles = plan_epics(epic_titles)
+        if not project_id and not project_name:
+            frappe.throw("Either project_id or project_name must be provided", frappe.ValidationError)
+
+        # Step 2: Get Workspace
         frappe.logger().info(f"Fetching workspace: {workspace_id}")
         workspace_result = get_or_create_workspace("", workspace_id)
         results["workspace"] = workspace_result["workspace"]
         workspace_id = workspace_result["workspace"]["id"]
         
-        # Step 2: Get or Find Project
+        # Step 3: Get or Find Project
         if project_id:
             frappe.logger().info(f"Fetching project: {project_id}")
             project_result = get_or_create_project(workspace_id, "", project_id)
-        elif project_name:
+        else:
             frappe.logger().info(f"Searching for project: {project_name}")
             project_result = get_or_create_project(workspace_id, project_name)
-        else:
-            frappe.throw("Either project_id or project_name must be provided", frappe.ValidationError)
         
         results["project"] = project_result["project"]
         project_id = project_result["project"]["id"]
         
-        # Step 3: Create Epics
+        # Step 4: Create Epics
+        failed_epics = {}
+        resumed = 0
         if epic_titles:
-            for epic_title in epic_titles:
-                frappe.logger().info(f"Creating epic: {epic_title}")
-                epic_result = create_epic(workspace_id, project_id, epic_title)
-                results["epics"].append(epic_result)
+            frappe.logger().info(f"Creating {len(epic_titles)} epic(s)")
+            results["epics"], failed_epics, resumed = create_epics(workspace_id, project_id, epic_titles)
         
-        # Step 4: Save to markdown
+        # Step 5: Save to markdown
         output_path = save_ids_to_markdown(results, output_file)
+
+        if failed_epics:
+            return {
+                "success": False,
+                "error": (
+                    f"{len(failed_epics)} of {len(epic_titles)} epic(s) could not be created; "
+                    "run again with the same titles to create the rest"
+                ),
+                "failed_epics": failed_epics,
+                "resumed_epics": resumed,
+                "results": results,
+                "output_file": output_path
+            }
         
         return {
             "success": True,
             "message": f"Successfully created {len(epic_titles)} epic(s) in Zenhub",
+            "resumed_epics": resumed,
             "results": results,
             "output_file": output_path
         }
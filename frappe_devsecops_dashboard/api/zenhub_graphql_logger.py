@@ -2,7 +2,9 @@
 Zenhub GraphQL API Logger Wrapper
 
 This module wraps Zenhub GraphQL API calls with comprehensive logging
-to track all API interactions for debugging and monitoring.
+to track all API interactions for debugging and monitoring. Per-call entries
+are buffered and bulk-inserted in the background; async operation logs are
+written immediately because their name is needed for later updates.
 
 Author: Frappe DevSecOps Dashboard
 License: MIT
@@ -14,14 +16,15 @@ import time
 import traceback
 import json
 from typing import Dict, Any, Optional, Tuple
+from frappe_devsecops_dashboard.api.zenhub_client import ZENHUB_GRAPHQL_ENDPOINT, post_graphql
 from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_graphql_api_log.zenhub_graphql_api_log import (
     create_zenhub_api_log,
+    queue_zenhub_api_log,
+    serialize_log_payload,
     log_zenhub_success,
     log_zenhub_error
 )
 
-ZENHUB_GRAPHQL_ENDPOINT = "https://api.zenhub.com/public/graphql"
-
 
 def execute_graphql_query_with_logging(
     query: str,
@@ -65,17 +68,7 @@ def execute_graphql_query_with_logging(
         }
 
         # Make API request
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-
-        response = requests.post(
-            ZENHUB_GRAPHQL_ENDPOINT,
-            json=request_payload,
-            headers=headers,
-            timeout=30
-        )
+        response = post_graphql(query, request_payload["variables"], token=token)
 
         http_status_code = response.status_code
         response_time_ms = int((time.time() - start_time) * 1000)
@@ -125,8 +118,8 @@ def execute_graphql_query_with_logging(
         response_time_ms = int((time.time() - start_time) * 1000)
         error_message = "Request timeout after 30 seconds"
 
-        # Log timeout directly
-        create_zenhub_api_log(
+        # Log timeout
+        queue_zenhub_api_log(
             reference_doctype=reference_doctype,
             reference_docname=reference_docname,
             operation_type=operation_type,
@@ -194,7 +187,7 @@ def update_async_operation_log(
         log_doc.status = status
 
         if response_data:
-            log_doc.response_data = json.dumps(response_data, indent=2)
+            log_doc.response_data = serialize_log_payload(response_data)
 
         if error_message:
             log_doc.error_message = error_message
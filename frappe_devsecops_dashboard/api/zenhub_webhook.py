@@ -0,0 +1,208 @@
+"""
+Zenhub Webhook Receiver
+
+Zenhub (or a relay in front of it) posts issue, estimate, pipeline and sprint
+events to this endpoint. Each event is verified against the webhook secret in
+Zenhub Settings, mapped to the workspace, sprint and epic it touches, and only
+the cache entries built from those are evicted. Caches can therefore keep their
+longer webhook TTLs without serving stale boards.
+
+- POST /api/method/frappe_devsecops_dashboard.api.zenhub_webhook.receive_zenhub_webhook
+  Header X-Zenhub-Signature: sha256=<hex HMAC-SHA256 of the raw body>
+
+Author: Frappe DevSecOps Dashboard
+License: MIT
+"""
+
+import hashlib
+import hmac
+import json as json_lib
+from typing import Any, Dict, List, Optional
+
+import frappe
+from frappe_devsecops_dashboard.api.zenhub import (
+    SPRINT_DATA_CACHE_KEY_PREFIX,
+    SPRINT_REPORT_CACHE_KEY_PREFIX,
+    is_zenhub_webhook_enabled
+)
+from frappe_devsecops_dashboard.api.zenhub_workspace_helper import evict_workspace_snapshot
+from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_issue.zenhub_issue import (
+    queue_workspace_issue_sync
+)
+
+WEBHOOK_SIGNATURE_HEADERS = ("X-Zenhub-Signature", "X-Hub-Signature-256")
+
+# Event type prefixes (Zenhub sends e.g. "issue_transfer" for pipeline moves,
+# "estimate_set"/"estimate_cleared", "issue_reprioritized")
+WEBHOOK_EVENT_KINDS = (
+    ("pipeline", ("issue_transfer", "pipeline_")),
+    ("estimate", ("estimate_",)),
+    ("sprint", ("sprint_",)),
+    ("issue", ("issue_",))
+)
+
+
+@frappe.whitelist(allow_guest=True, methods=["POST"])
+def receive_zenhub_webhook() -> Dict[str, Any]:
+    """
+    Receive a Zenhub event and evict the caches it affects.
+
+    Returns:
+        dict: {"success": True, "event": kind, "evicted": [...]} or an error
+              with a 401/403 status for unsigned or disabled webhooks
+    """
+    if not is_zenhub_webhook_enabled():
+        frappe.local.response["http_status_code"] = 403
+        return {"success": False, "error": "Zenhub webhooks are disabled", "error_type": "permission_error"}
+
+    body = frappe.request.get_data() or b""
+    if not verify_webhook_signature(body, _get_signature_header()):
+        frappe.local.response["http_status_code"] = 401
+        return {"success": False, "error": "Invalid webhook signature", "error_type": "authentication_error"}
+
+    payload = _parse_payload(body)
+    event_type = str(payload.get("type") or payload.get("event") or "")
+    kind = get_webhook_event_kind(event_type)
+    if not kind:
+        return {"success": True, "event": event_type, "ignored": True, "evicted": []}
+
+    try:
+        evicted = evict_for_event(
+            workspace_id=_first(payload, "workspace_id", ("workspace", "id")),
+            sprint_id=_first(payload, "sprint_id", ("sprint", "id")),
+            epic_id=_first(payload, "epic_id", ("epic", "id"))
+        )
+    except Exception as e:
+        frappe.log_error(
+            title="Zenhub Webhook Error",
+            message=f"Failed to evict caches for {event_type}: {str(e)}"
+        )
+        return {"success": False, "error": str(e), "error_type": "api_error"}
+
+    return {"success": True, "event": kind, "evicted": evicted}
+
+
+def verify_webhook_signature(body: bytes, signature: Optional[str]) -> bool:
+    """
+    Check an HMAC-SHA256 signature of the raw body against the webhook secret.
+
+    Args:
+        body (bytes): Raw request body
+        signature (str): Header value, "sha256=<hex>" or the bare hex digest
+
+    Returns:
+        bool: True only when a secret is configured and the signature matches
+    """
+    if not signature:
+        return False
+
+    secret = _get_webhook_secret()
+    if not secret:
+        return False
+
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    provided = signature.split("=", 1)[1] if signature.startswith("sha256=") else signature
+    return hmac.compare_digest(expected.encode(), provided.strip().lower().encode())
+
+
+def get_webhook_event_kind(event_type: str) -> Optional[str]:
+    """Map a Zenhub event type to issue, estimate, pipeline or sprint (None if unsupported)"""
+    event_type = (event_type or "").lower()
+    for kind, prefixes in WEBHOOK_EVENT_KINDS:
+        if event_type.startswith(prefixes):
+            return kind
+    return None
+
+
+def evict_for_event(
+    workspace_id: Optional[str] = None,
+    sprint_id: Optional[str] = None,
+    epic_id: Optional[str] = None
+) -> List[str]:
+    """
+    Evict the caches built from the workspace, sprint and epic an event touched.
+
+    - Workspace: its shared snapshot (refreshed in the background, and the
+      source of the epic views), the sprint reports of Projects linked to it,
+      and its Zenhub Issue mirror (resynced in the background)
+    - Sprint: that sprint's per-sprint stakeholder report entries
+
+    Args:
+        workspace_id (str): Zenhub workspace ID from the event
+        sprint_id (str): Zenhub sprint ID from the event
+        epic_id (str): Zenhub epic issue ID from the event
+
+    Returns:
+        list: Descriptions of what was evicted
+    """
+    cache = frappe.cache()
+    evicted = []
+
+    if sprint_id:
+        cache.delete_value(f"{SPRINT_REPORT_CACHE_KEY_PREFIX}open_{sprint_id}")
+        # Closed entries are keyed by end date too, which the event may not carry
+        cache.delete_keys(f"{SPRINT_REPORT_CACHE_KEY_PREFIX}closed_{sprint_id}_")
+        evicted.append(f"sprint:{sprint_id}")
+
+    if workspace_id:
+        evict_workspace_snapshot(workspace_id)
+        evicted.append(f"workspace:{workspace_id}")
+
+        for project_id in _get_workspace_projects(workspace_id):
+            cache.delete_keys(f"{SPRINT_DATA_CACHE_KEY_PREFIX}{project_id}_")
+            cache.delete_value(f"{SPRINT_DATA_CACHE_KEY_PREFIX}stakeholder_{project_id}")
+            evicted.append(f"project:{project_id}")
+
+        queue_workspace_issue_sync(workspace_id)
+        evicted.append(f"issue_mirror:{workspace_id}")
+
+    if epic_id and workspace_id:
+        # Epic groupings live in the workspace snapshot evicted above
+        evicted.append(f"epic:{epic_id}")
+
+    return evicted
+
+
+def _get_workspace_projects(workspace_id: str) -> List[str]:
+    """Projects whose sprint reports are built from a workspace"""
+    if not frappe.db.has_column("Project", "custom_zenhub_workspace_id"):
+        return []
+    return frappe.get_all("Project", filters={"custom_zenhub_workspace_id": workspace_id}, pluck="name")
+
+
+def _get_webhook_secret() -> Optional[str]:
+    """Decrypted webhook secret from Zenhub Settings"""
+    try:
+        from frappe.utils.password import get_decrypted_password
+        return get_decrypted_password("Zenhub Settings", "Zenhub Settings", "webhook_secret", raise_exception=False)
+    except Exception:
+        return None
+
+
+def _get_signature_header() -> Optional[str]:
+    """Signature from the Zenhub header, or the GitHub-style one used by relays"""
+    for header in WEBHOOK_SIGNATURE_HEADERS:
+        value = frappe.get_request_header(header)
+        if value:
+            return value
+    return None
+
+
+def _parse_payload(body: bytes) -> Dict[str, Any]:
+    """JSON body, or the form fields Zenhub's legacy webhooks post"""
+    try:
+        payload = json_lib.loads(body or b"{}")
+        if isinstance(payload, dict):
+            return payload
+    except ValueError:
+        pass
+    return dict(frappe.form_dict)
+
+
+def _first(payload: Dict[str, Any], key: str, nested: tuple) -> Optional[str]:
+    """A flat payload field, or the same value nested as {"workspace": {"id": ...}}"""
+    value = payload.get(key)
+    parent = payload.get(nested[0])
+    if not value and isinstance(parent, dict):
+        value = parent.get(nested[1])
+    return str(value) if value else None
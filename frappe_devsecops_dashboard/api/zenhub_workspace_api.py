@@ -16,6 +16,10 @@ using the ZenhubWorkspaceHelper class. It includes:
 - GET /api/method/frappe_devsecops_dashboard.api.zenhub_workspace_api.get_team_utilization
   Get team member utilization metrics
 
+All endpoints are computed from one shared workspace snapshot (see
+zenhub_workspace_helper.get_workspace_snapshot), so switching between views
+does not refetch the workspace from Zenhub.
+
 All API calls are logged to Zenhub GraphQL API Log for monitoring and debugging.
 
 Author: Frappe DevSecOps Dashboard
@@ -35,7 +39,7 @@ from .zenhub_api_decorator import log_zenhub_api_call
     reference_doctype="Software Product",
     get_reference_docname=lambda kwargs: kwargs.get("workspace_id", "Unknown")
 )
-def get_workspace_summary(workspace_id: str) -> Dict[str, Any]:
+def get_workspace_summary(workspace_id: str, force_refresh: bool = False) -> Dict[str, Any]:
     """
     Get comprehensive JSON summary of a Zenhub workspace.
 
@@ -48,6 +52,7 @@ def get_workspace_summary(workspace_id: str) -> Dict[str, Any]:
 
     Args:
         workspace_id (str): The Zenhub workspace ID
+        force_refresh (bool, optional): Refetch from Zenhub instead of the shared snapshot. Defaults to False
 
     Returns:
         dict: JSON summary with workspace hierarchy and team information
@@ -70,7 +75,10 @@ def get_workspace_summary(workspace_id: str) -> Dict[str, Any]:
                     "total_story_points": 450,
                     "completion_rate": 75.5
                 }
-            }
+            },
+            "_cached": true,
+            "_stale": false,
+            "_fetched_at": "2025-01-15 10:30:00"
         }
     """
     try:
@@ -83,7 +91,7 @@ def get_workspace_summary(workspace_id: str) -> Dict[str, Any]:
             }
 
         # Initialize helper and fetch summary
-        helper = ZenhubWorkspaceHelper(workspace_id)
+        helper = ZenhubWorkspaceHelper(workspace_id, force_refresh=force_refresh)
         summary = helper.get_workspace_summary_json()
 
         return {
@@ -7,6 +7,12 @@ Zenhub workspace data. It includes:
 - Filtering by project, epic, and status
 - Team utilization analysis
 - Kanban pipeline status information
+- An indexed, flat view of the workspace (WorkspaceModel) so filters and
+  utilization are lookups instead of nested traversals
+- An issue lookup by epic and by title token (WorkspaceIssueIndex) for
+  resolving the Zenhub issues related to a Frappe Task
+- A shared Redis snapshot per workspace, served stale while it is refreshed
+  in the background, so every endpoint reuses one fetch across requests
 
 Author: Frappe DevSecOps Dashboard
 License: MIT
@@ -14,9 +20,236 @@ License: MIT
 
 import frappe
 import json as json_lib
+import re
+import time
 from typing import Dict, List, Optional, Any, Tuple
 from . import zenhub
 
+# Shared workspace snapshots: served as-is within the soft TTL, served stale and
+# refreshed in the background until the hard TTL, refetched inline after that
+WORKSPACE_SNAPSHOT_CACHE_KEY_PREFIX = "zenhub_workspace_snapshot_"
+WORKSPACE_SNAPSHOT_SOFT_TTL = 300
+# With webhooks enabled, changed workspaces are evicted on change instead
+WORKSPACE_SNAPSHOT_WEBHOOK_SOFT_TTL = 1800
+WORKSPACE_SNAPSHOT_HARD_TTL = 3600
+WORKSPACE_SNAPSHOT_REFRESH_LOCK_PREFIX = "zenhub_workspace_snapshot_refresh_"
+WORKSPACE_SNAPSHOT_REFRESH_LOCK_TTL = 300
+
+# Delete the refresh lock only while it still holds the caller's token, so a
+# job whose lock was released and re-taken does not drop the newer holder's
+RELEASE_REFRESH_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+COMPLETED_TASK_STATUSES = ("Done", "Completed", "Closed")
+
+# Title tokens shorter than this are too common to narrow an issue lookup
+ISSUE_TITLE_TOKEN_MIN_LENGTH = 2
+
+
+class WorkspaceModel:
+    """
+    Flat, indexed view of a structured workspace.
+
+    The nested Project -> Epic -> Sprint -> Task data is walked once; every task
+    is stored once by ID (even when it appears under several projects) and the
+    project, epic, sprint and assignee relations are kept as ID indexes.
+    """
+
+    def __init__(self, workspace: Dict[str, Any]):
+        """
+        Build the indexes.
+
+        Args:
+            workspace (dict): Workspace with "projects" and "sprints" lists
+        """
+        self.workspace = workspace
+        self.tasks = {}
+        self.projects = {}
+        self.epics = {}
+        self.sprints = {}
+        self.assignees = {}
+        self.project_task_ids = {}
+        self.epic_task_ids = {}
+        self.epic_project_ids = {}
+        self.assignee_task_ids = {}
+        self.sprint_task_ids = {}
+        self._sprint_tasks = {}
+        self._task_sprint_ids = {}
+
+        # Dicts double as ordered sets while indexing
+        for project in workspace.get("projects") or []:
+            project_id = project.get("id")
+            self.projects[project_id] = project
+            project_task_ids = self.project_task_ids.setdefault(project_id, {})
+
+            for epic in project.get("epics") or []:
+                epic_id = epic.get("id")
+                self.epics.setdefault(epic_id, epic)
+                self.epic_project_ids.setdefault(epic_id, {})[project_id] = None
+                epic_task_ids = self.epic_task_ids.setdefault(epic_id, {})
+
+                for sprint in epic.get("sprints") or []:
+                    for task in sprint.get("tasks") or []:
+                        task_id = task.get("id")
+                        project_task_ids[task_id] = None
+                        epic_task_ids[task_id] = None
+                        if task_id in self.tasks:
+                            continue
+
+                        self.tasks[task_id] = task
+                        for assignee in task.get("assignees") or []:
+                            assignee_id = assignee.get("id")
+                            self.assignees.setdefault(assignee_id, assignee)
+                            self.assignee_task_ids.setdefault(assignee_id, {})[task_id] = None
+
+        for sprint in workspace.get("sprints") or []:
+            sprint_id = sprint.get("id")
+            self.sprints[sprint_id] = sprint
+            sprint_tasks = self._sprint_tasks.setdefault(sprint_id, {})
+            for task in sprint.get("tasks") or []:
+                task_id = task.get("id")
+                sprint_tasks.setdefault(task_id, task)
+                self._task_sprint_ids.setdefault(task_id, {})[sprint_id] = None
+
+        for index in (
+            self.project_task_ids,
+            self.epic_task_ids,
+            self.epic_project_ids,
+            self.assignee_task_ids,
+            self._task_sprint_ids
+        ):
+            for key, ids in index.items():
+                index[key] = list(ids)
+
+        self.sprint_task_ids = {
+            sprint_id: list(tasks) for sprint_id, tasks in self._sprint_tasks.items()
+        }
+
+    def get_tasks(self, task_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Look up tasks by ID.
+
+        Args:
+            task_ids (list): Task IDs
+
+        Returns:
+            list: Tasks, skipping unknown IDs
+        """
+        return [self.tasks[task_id] for task_id in task_ids if task_id in self.tasks]
+
+    def get_sprints_for_tasks(self, task_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Workspace sprints narrowed to the given tasks.
+
+        Args:
+            task_ids (list): Task IDs to keep
+
+        Returns:
+            list: Copies of the sprints holding any of the tasks, in sprint order,
+                  each with only those tasks
+        """
+        tasks_by_sprint = {}
+        for task_id in task_ids:
+            for sprint_id in self._task_sprint_ids.get(task_id, []):
+                tasks_by_sprint.setdefault(sprint_id, []).append(self._sprint_tasks[sprint_id][task_id])
+
+        filtered_sprints = []
+        for sprint_id, sprint in self.sprints.items():
+            if sprint_id in tasks_by_sprint:
+                sprint_copy = sprint.copy()
+                sprint_copy["tasks"] = tasks_by_sprint[sprint_id]
+                filtered_sprints.append(sprint_copy)
+
+        return filtered_sprints
+
+
+class WorkspaceIssueIndex:
+    """
+    Issue lookup over a workspace snapshot.
+
+    Issues are indexed once by ID, by the epic they belong to and by the
+    normalized tokens of their titles, so the issues related to a Task are
+    found with dictionary lookups instead of a scan of the workspace.
+    Snapshots taken before the "issues" list existed are indexed from their
+    sprint tasks.
+    """
+
+    def __init__(self, workspace: Dict[str, Any]):
+        """
+        Build the indexes.
+
+        Args:
+            workspace (dict): Workspace data from get_workspace_snapshot()
+        """
+        self.workspace_name = workspace.get("name")
+        self.issues = {}
+        self.epic_issue_ids = {}
+        self.title_token_issue_ids = {}
+
+        issues = workspace.get("issues")
+        if issues is None:
+            issues = [
+                _compact_sprint_task(task)
+                for sprint in workspace.get("sprints") or []
+                for task in sprint.get("tasks") or []
+            ]
+
+        for issue in issues:
+            issue_id = issue.get("id")
+            if not issue_id or issue_id in self.issues:
+                continue
+
+            self.issues[issue_id] = issue
+            if issue.get("epic_id"):
+                self.epic_issue_ids.setdefault(issue["epic_id"], []).append(issue_id)
+            for token in normalize_title_tokens(issue.get("title")):
+                self.title_token_issue_ids.setdefault(token, set()).add(issue_id)
+
+    def has_epic(self, epic_id: str) -> bool:
+        """Whether the epic issue or any of its child issues is in the snapshot"""
+        return epic_id in self.issues or epic_id in self.epic_issue_ids
+
+    def get_epic_issues(self, epic_id: str) -> List[Dict[str, Any]]:
+        """
+        The epic issue followed by its child issues.
+
+        Args:
+            epic_id (str): Zenhub issue ID of the epic
+
+        Returns:
+            list: Compact issues, empty when the epic is not in the snapshot
+        """
+        issue_ids = ([epic_id] if epic_id in self.issues else []) + self.epic_issue_ids.get(epic_id, [])
+        return [self.issues[issue_id] for issue_id in issue_ids]
+
+    def find_issues_by_title(self, text: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Issues whose titles contain every token of a text.
+
+        Args:
+            text (str): Task subject or name
+
+        Returns:
+            list: Compact issues ordered by issue number
+        """
+        tokens = normalize_title_tokens(text)
+        if not tokens:
+            return []
+
+        # Intersect from the rarest token so the work is bounded by the smallest posting list
+        postings = sorted((self.title_token_issue_ids.get(token, set()) for token in tokens), key=len)
+        issue_ids = set(postings[0])
+        for posting in postings[1:]:
+            issue_ids &= posting
+            if not issue_ids:
+                break
+
+        return sorted((self.issues[issue_id] for issue_id in issue_ids), key=lambda i: i.get("number") or 0)
+
 
 class ZenhubWorkspaceHelper:
     """
@@ -26,16 +259,22 @@ class ZenhubWorkspaceHelper:
     Provides methods to fetch, filter, and analyze workspace data.
     """
 
-    def __init__(self, workspace_id: str):
+    def __init__(self, workspace_id: str, force_refresh: bool = False):
         """
         Initialize the Zenhub Workspace Helper.
 
         Args:
             workspace_id (str): The Zenhub workspace ID
+            force_refresh (bool): Refetch from Zenhub instead of using the shared snapshot
         """
         self.workspace_id = workspace_id
+        self.force_refresh = force_refresh
         self.token = zenhub.get_zenhub_token()
         self._workspace_data = None
+        self._summary = None
+        self._model = None
+        self._snapshot_info = {}
+        self._fetch_failed = False
         self._pipelines = {}
         self._projects = {}
         self._epics = {}
@@ -44,36 +283,52 @@ class ZenhubWorkspaceHelper:
         """
         Get a comprehensive JSON summary of the workspace with hierarchical structure.
 
-        Fetches workspace data only once and caches it for subsequent operations.
+        Fetches workspace data and builds the summary only once per helper; callers
+        must not modify the returned structure.
 
         Returns:
             dict: Workspace data organized as Project -> Epic -> Sprint -> Task
         """
         try:
-            # Fetch workspace data using MCP - only once, cached in _workspace_data
+            if self._summary is not None:
+                return self._summary
+
+            # Load the shared workspace snapshot - only once, cached in _workspace_data
             if self._workspace_data is None:
-                self._workspace_data = self._fetch_workspace_data()
+                self._workspace_data, self._snapshot_info = get_workspace_snapshot(
+                    self.workspace_id,
+                    force_refresh=self.force_refresh,
+                    helper=self
+                )
 
             workspace_data = self._workspace_data
 
-            # Structure the data hierarchically
-            summary = {
-                "workspace": {
-                    "id": self.workspace_id,
-                    "name": workspace_data.get("name", "Unknown Workspace"),
-                    "projects": self._structure_projects(workspace_data),
-                    "sprints": self._structure_sprints(workspace_data),
-                    "kanban_statuses": self._extract_kanban_statuses(workspace_data),
-                    "team_members": self._extract_team_members(workspace_data),
-                    "summary": {
-                        "total_issues": self._count_total_issues(workspace_data),
-                        "total_story_points": self._sum_story_points(workspace_data),
-                        "completion_rate": self._calculate_completion_rate(workspace_data)
-                    }
+            # Structure the data hierarchically, then index it once for the totals
+            workspace = {
+                "id": self.workspace_id,
+                "name": workspace_data.get("name", "Unknown Workspace"),
+                "projects": self._structure_projects(workspace_data),
+                "sprints": self._structure_sprints(workspace_data)
+            }
+            model = self._get_model(workspace)
+            workspace.update({
+                "kanban_statuses": self._extract_kanban_statuses(model),
+                "team_members": self._extract_team_members(model),
+                "summary": {
+                    "total_issues": self._count_total_issues(model),
+                    "total_story_points": self._sum_story_points(model),
+                    "completion_rate": self._calculate_completion_rate(model)
                 }
+            })
+
+            self._summary = {
+                "workspace": workspace,
+                "_cached": self._snapshot_info.get("cached", False),
+                "_stale": self._snapshot_info.get("stale", False),
+                "_fetched_at": self._snapshot_info.get("fetched_at")
             }
 
-            return summary
+            return self._summary
         except Exception as e:
             frappe.log_error(
                 title="Zenhub Workspace Summary Error",
@@ -93,52 +348,27 @@ class ZenhubWorkspaceHelper:
         """
         try:
             summary = self.get_workspace_summary_json()
-            workspace = summary.get("workspace", {})
-
-            # Filter projects
-            filtered_projects = [
-                p for p in workspace.get("projects", [])
-                if p.get("id") == project_id
-            ]
+            model = self._get_model(summary.get("workspace", {}))
 
-            if not filtered_projects:
+            project = model.projects.get(project_id)
+            if project is None:
                 return {
                     "success": False,
                     "error": f"Project {project_id} not found in workspace",
                     "project_id": project_id
                 }
 
-            workspace["projects"] = filtered_projects
-
-            # Get all epics and tasks from this project
-            project = filtered_projects[0]
-            all_epics = project.get("epics", [])
-            all_task_ids = set()
-
-            for epic in all_epics:
-                for sprint in epic.get("sprints", []):
-                    for task in sprint.get("tasks", []):
-                        all_task_ids.add(task.get("id"))
-
-            # Filter sprints to only include tasks from this project
-            filtered_sprints = []
-            for sprint in workspace.get("sprints", []):
-                filtered_tasks = [
-                    t for t in sprint.get("tasks", [])
-                    if t.get("id") in all_task_ids
-                ]
-                if filtered_tasks:
-                    sprint_copy = sprint.copy()
-                    sprint_copy["tasks"] = filtered_tasks
-                    filtered_sprints.append(sprint_copy)
-
-            workspace["sprints"] = filtered_sprints
+            # Copy so the shared summary is left intact
+            task_ids = model.project_task_ids[project_id]
+            workspace = dict(model.workspace)
+            workspace["projects"] = [project]
+            workspace["sprints"] = model.get_sprints_for_tasks(task_ids)
 
             return {
                 "success": True,
                 "workspace": workspace,
                 "project_id": project_id,
-                "task_count": len(all_task_ids)
+                "task_count": len(task_ids)
             }
         except Exception as e:
             frappe.log_error(
@@ -159,57 +389,35 @@ class ZenhubWorkspaceHelper:
         """
         try:
             summary = self.get_workspace_summary_json()
-            workspace = summary.get("workspace", {})
-
-            # Find the epic and its tasks
-            epic_found = None
-            epic_tasks = []
-
-            for project in workspace.get("projects", []):
-                for epic in project.get("epics", []):
-                    if epic.get("id") == epic_id:
-                        epic_found = epic
-                        # Collect all tasks from this epic's sprints
-                        for sprint in epic.get("sprints", []):
-                            epic_tasks.extend(sprint.get("tasks", []))
-                        break
-
-            if not epic_found:
+            model = self._get_model(summary.get("workspace", {}))
+
+            epic = model.epics.get(epic_id)
+            if epic is None:
                 return {
                     "success": False,
                     "error": f"Epic {epic_id} not found in workspace",
                     "epic_id": epic_id
                 }
 
-            # Filter to only show the epic
+            # Only show the epic, under each project that holds it
             filtered_projects = []
-            for project in workspace.get("projects", []):
-                filtered_epics = [e for e in project.get("epics", []) if e.get("id") == epic_id]
-                if filtered_epics:
-                    project_copy = project.copy()
-                    project_copy["epics"] = filtered_epics
-                    filtered_projects.append(project_copy)
-
+            for project_id in model.epic_project_ids[epic_id]:
+                project_copy = model.projects[project_id].copy()
+                project_copy["epics"] = [epic]
+                filtered_projects.append(project_copy)
+
+            # Copy so the shared summary is left intact
+            task_ids = model.epic_task_ids[epic_id]
+            workspace = dict(model.workspace)
             workspace["projects"] = filtered_projects
-
-            # Filter sprints to only include tasks from this epic
-            task_ids = {t.get("id") for t in epic_tasks}
-            filtered_sprints = []
-            for sprint in workspace.get("sprints", []):
-                filtered_tasks = [t for t in sprint.get("tasks", []) if t.get("id") in task_ids]
-                if filtered_tasks:
-                    sprint_copy = sprint.copy()
-                    sprint_copy["tasks"] = filtered_tasks
-                    filtered_sprints.append(sprint_copy)
-
-            workspace["sprints"] = filtered_sprints
+            workspace["sprints"] = model.get_sprints_for_tasks(task_ids)
 
             return {
                 "success": True,
                 "workspace": workspace,
                 "epic_id": epic_id,
-                "task_count": len(epic_tasks),
-                "epic_title": epic_found.get("title")
+                "task_count": len(task_ids),
+                "epic_title": epic.get("title")
             }
         except Exception as e:
             frappe.log_error(
@@ -227,44 +435,27 @@ class ZenhubWorkspaceHelper:
         """
         try:
             summary = self.get_workspace_summary_json()
-            workspace = summary.get("workspace", {})
-
-            # Collect all tasks
-            all_tasks = []
-            for project in workspace.get("projects", []):
-                for epic in project.get("epics", []):
-                    for sprint in epic.get("sprints", []):
-                        all_tasks.extend(sprint.get("tasks", []))
-
-            # Aggregate by assignee
-            team_utilization = {}
-
-            for task in all_tasks:
-                for assignee in task.get("assignees", []):
-                    assignee_name = assignee.get("name", "Unknown")
-                    assignee_id = assignee.get("id")
-
-                    if assignee_id not in team_utilization:
-                        team_utilization[assignee_id] = {
-                            "id": assignee_id,
-                            "name": assignee_name,
-                            "task_count": 0,
-                            "story_points": 0,
-                            "completed_points": 0,
-                            "completed_tasks": 0
-                        }
-
-                    team_utilization[assignee_id]["task_count"] += 1
-                    team_utilization[assignee_id]["story_points"] += task.get("estimate", 0)
-
-                    # Count completed tasks
-                    if task.get("status") in ["Done", "Completed", "Closed"]:
-                        team_utilization[assignee_id]["completed_tasks"] += 1
-                        team_utilization[assignee_id]["completed_points"] += task.get("estimate", 0)
+            model = self._get_model(summary.get("workspace", {}))
+
+            # Aggregate by assignee from the assignee -> task index
+            team_utilization = []
+
+            for assignee_id, task_ids in model.assignee_task_ids.items():
+                tasks = model.get_tasks(task_ids)
+                completed = [t for t in tasks if t.get("status") in COMPLETED_TASK_STATUSES]
+
+                team_utilization.append({
+                    "id": assignee_id,
+                    "name": model.assignees[assignee_id].get("name", "Unknown"),
+                    "task_count": len(tasks),
+                    "story_points": sum(t.get("estimate", 0) for t in tasks),
+                    "completed_points": sum(t.get("estimate", 0) for t in completed),
+                    "completed_tasks": len(completed)
+                })
 
             # Calculate utilization percentages
             team_list = []
-            for member in team_utilization.values():
+            for member in team_utilization:
                 total_points = member["story_points"]
                 utilization_pct = (
                     (member["completed_points"] / total_points * 100)
@@ -303,6 +494,20 @@ class ZenhubWorkspaceHelper:
             )
             raise
 
+    def _get_model(self, workspace: Dict[str, Any]) -> WorkspaceModel:
+        """
+        Indexed model of a structured workspace, built once per workspace.
+
+        Args:
+            workspace (dict): Structured workspace from the summary
+
+        Returns:
+            WorkspaceModel: Model indexing the workspace
+        """
+        if self._model is None or self._model.workspace is not workspace:
+            self._model = WorkspaceModel(workspace)
+        return self._model
+
     def _fetch_workspace_data(self) -> Dict[str, Any]:
         """
         Fetch workspace data from Zenhub using GraphQL API.
@@ -310,6 +515,7 @@ class ZenhubWorkspaceHelper:
         This method fetches the complete workspace hierarchy including:
         - Sprints with their issues
         - Issues grouped by repository (as projects)
+        - A compact list of every workspace issue, for WorkspaceIssueIndex
         - Team members and assignees
         - Story points and estimates
 
@@ -325,7 +531,8 @@ class ZenhubWorkspaceHelper:
         """
         try:
             # Fetch workspace name and issues from Zenhub
-            from .zenhub import execute_graphql_query, get_workspace_issues_query, get_workspace_sprints_query
+            from .zenhub import execute_graphql_query, iter_workspace_issues, get_workspace_sprints_query
+            from .zenhub_client import run_concurrently
 
             workspace_data = {
                 "id": self.workspace_id,
@@ -333,33 +540,29 @@ class ZenhubWorkspaceHelper:
                 "projects": [],
                 "sprints": [],
                 "pipelines": {},
-                "team_members": []
+                "team_members": [],
+                "issues": []
             }
 
-            # Fetch workspace issues (includes repositories as projects)
-            try:
-                issues_query = get_workspace_issues_query()
-                issues_response = execute_graphql_query(
-                    issues_query,
-                    {"workspaceId": self.workspace_id},
-                    log_to_db=True,
-                    reference_doctype="Software Product",
-                    reference_docname=self.workspace_id,
-                    operation_name="getWorkspaceIssues"
-                )
-
-                if issues_response and issues_response.get("data"):
-                    workspace = issues_response["data"].get("workspace", {})
-                    workspace_data["name"] = workspace.get("name", "Workspace")
-
-                    # Build projects from repositories
-                    issues = workspace.get("issues", {}).get("nodes", [])
+            def fetch_projects():
+                # Fetch workspace issues (includes repositories as projects), page by page
+                try:
+                    workspace = {}
                     projects_map = {}
+                    issues = []
 
-                    for issue in issues:
+                    # Build projects from repositories
+                    for issue in iter_workspace_issues(
+                        self.workspace_id,
+                        workspace_info=workspace,
+                        reference_doctype="Software Product",
+                        reference_docname=self.workspace_id,
+                        operation_name="getWorkspaceIssues"
+                    ):
                         repo = issue.get("repository") or {}
                         repo_id = repo.get("id", "unknown")
                         repo_name = repo.get("name", "Unknown Repository")
+                        issues.append(compact_workspace_issue(issue))
 
                         if repo_id not in projects_map:
                             projects_map[repo_id] = {
@@ -370,135 +573,143 @@ class ZenhubWorkspaceHelper:
                                 "epics": []
                             }
 
-                    workspace_data["projects"] = list(projects_map.values())
+                    return workspace.get("name"), list(projects_map.values()), issues
 
-            except Exception as e:
-                frappe.log_error(
-                    title="Zenhub Workspace Issues Query Error",
-                    message=f"Failed to fetch workspace issues: {str(e)}"
-                )
+                except Exception as e:
+                    self._fetch_failed = True
+                    frappe.log_error(
+                        title="Zenhub Workspace Issues Query Error",
+                        message=f"Failed to fetch workspace issues: {str(e)}"
+                    )
+                    return None, [], []
+
+            def fetch_sprints():
+                # Fetch sprints with their issues
+                try:
+                    sprints_response = execute_graphql_query(
+                        get_workspace_sprints_query(),
+                        {"workspaceId": self.workspace_id},
+                        log_to_db=True,
+                        reference_doctype="Software Product",
+                        reference_docname=self.workspace_id,
+                        operation_name="getWorkspaceSprints"
+                    )
+
+                    # execute_graphql_query returns the GraphQL "data" object itself
+                    if sprints_response and sprints_response.get("workspace"):
+                        workspace = sprints_response.get("workspace") or {}
+                        return workspace.get("sprints", {}).get("nodes", [])
+
+                except Exception as e:
+                    self._fetch_failed = True
+                    frappe.log_error(
+                        title="Zenhub Workspace Sprints Query Error",
+                        message=f"Failed to fetch workspace sprints: {str(e)}"
+                    )
+                return []
+
+            # The two queries are independent, so they run at the same time
+            results = run_concurrently({"projects": fetch_projects, "sprints": fetch_sprints})
+            workspace_name, workspace_data["projects"], workspace_data["issues"] = results["projects"]
+            workspace_data["name"] = workspace_name or "Workspace"
+
+            # Per project: epic ID -> (epic, sprint ID -> epic sprint entry)
+            project_epics = [{} for _ in workspace_data["projects"]]
 
-            # Fetch sprints with their issues
             try:
-                sprints_query = get_workspace_sprints_query()
-                sprints_response = execute_graphql_query(
-                    sprints_query,
-                    {"workspaceId": self.workspace_id},
-                    log_to_db=True,
-                    reference_doctype="Software Product",
-                    reference_docname=self.workspace_id,
-                    operation_name="getWorkspaceSprints"
-                )
+                # Transform sprints into our structure
+                for sprint in results["sprints"]:
+                    sprint_item = {
+                        "id": sprint.get("id"),
+                        "name": sprint.get("name"),
+                        "state": sprint.get("state"),
+                        "startAt": sprint.get("startDate"),
+                        "endAt": sprint.get("endDate"),
+                        "tasks": []
+                    }
 
-                if sprints_response and sprints_response.get("data"):
-                    workspace = sprints_response["data"].get("workspace", {})
-                    raw_sprints = workspace.get("sprints", {}).get("nodes", [])
-
-                    # Transform sprints into our structure
-                    for sprint in raw_sprints:
-                        sprint_item = {
-                            "id": sprint.get("id"),
-                            "name": sprint.get("name"),
-                            "state": sprint.get("state"),
-                            "startAt": sprint.get("startDate"),
-                            "endAt": sprint.get("endDate"),
-                            "tasks": []
+                    # Get issues for this sprint
+                    issues = sprint.get("issues", {}).get("nodes", [])
+                    for issue in issues:
+                        assignees_container = issue.get("assignees") or {}
+                        assignees_nodes = assignees_container.get("nodes", [])
+
+                        # Process assignees
+                        assignees = []
+                        for a in assignees_nodes:
+                            if isinstance(a, dict) and a.get("id"):
+                                assignees.append({
+                                    "id": a.get("id"),
+                                    "name": a.get("name") or a.get("login") or "Unknown",
+                                    "username": a.get("login") or a.get("username") or ""
+                                })
+
+                        # Get estimate
+                        estimate = issue.get("estimate") or {}
+                        story_points = estimate.get("value", 0) if isinstance(estimate, dict) else 0
+
+                        # Get epic info
+                        epic_data = issue.get("epic")
+                        epic_info = None
+                        if isinstance(epic_data, dict):
+                            epic_issue = epic_data.get("issue") if epic_data.get("issue") else epic_data
+                            if isinstance(epic_issue, dict):
+                                epic_info = {
+                                    "id": epic_issue.get("id"),
+                                    "title": epic_issue.get("title") or "Unnamed Epic"
+                                }
+
+                        task = {
+                            "id": issue.get("id"),
+                            "number": issue.get("number"),
+                            "title": issue.get("title"),
+                            "status": self._map_issue_state_to_status(issue.get("state")),
+                            "state": issue.get("state"),
+                            "kanban_status_id": None,
+                            "estimate": story_points,
+                            "assignees": assignees,
+                            "epic": epic_info,
+                            "pipeline": issue.get("pipeline"),
+                            "pipelineIssue": issue.get("pipelineIssue")
                         }
-
-                        # Get issues for this sprint
-                        issues = sprint.get("issues", {}).get("nodes", [])
-                        for issue in issues:
-                            assignees_container = issue.get("assignees") or {}
-                            assignees_nodes = assignees_container.get("nodes", [])
-
-                            # Process assignees
-                            assignees = []
-                            for a in assignees_nodes:
-                                if isinstance(a, dict) and a.get("id"):
-                                    assignees.append({
-                                        "id": a.get("id"),
-                                        "name": a.get("name") or a.get("login") or "Unknown",
-                                        "username": a.get("login") or a.get("username") or ""
-                                    })
-
-                            # Get estimate
-                            estimate = issue.get("estimate") or {}
-                            story_points = estimate.get("value", 0) if isinstance(estimate, dict) else 0
-
-                            # Get epic info
-                            epic_data = issue.get("epic")
-                            epic_info = None
-                            if isinstance(epic_data, dict):
-                                epic_issue = epic_data.get("issue") if epic_data.get("issue") else epic_data
-                                if isinstance(epic_issue, dict):
-                                    epic_info = {
-                                        "id": epic_issue.get("id"),
-                                        "title": epic_issue.get("title") or "Unnamed Epic"
+                        sprint_item["tasks"].append(task)
+
+                    workspace_data["sprints"].append(sprint_item)
+
+                    # Also add tasks to appropriate project (epic-based grouping)
+                    for task in sprint_item["tasks"]:
+                        if task.get("epic") and task["epic"].get("id"):
+                            epic_id = task["epic"]["id"]
+                            # Find or create epic and its sprint entry in each project
+                            for project, epics in zip(workspace_data["projects"], project_epics):
+                                if epic_id not in epics:
+                                    epic = {
+                                        "id": epic_id,
+                                        "number": 0,
+                                        "title": task["epic"].get("title", "Unnamed Epic"),
+                                        "status": None,
+                                        "estimate": None,
+                                        "sprints": []
                                     }
-
-                            task = {
-                                "id": issue.get("id"),
-                                "number": issue.get("number"),
-                                "title": issue.get("title"),
-                                "status": self._map_issue_state_to_status(issue.get("state")),
-                                "state": issue.get("state"),
-                                "kanban_status_id": None,
-                                "estimate": story_points,
-                                "assignees": assignees,
-                                "epic": epic_info,
-                                "pipeline": issue.get("pipeline"),
-                                "pipelineIssue": issue.get("pipelineIssue")
-                            }
-                            sprint_item["tasks"].append(task)
-
-                        workspace_data["sprints"].append(sprint_item)
-
-                        # Also add tasks to appropriate project (epic-based grouping)
-                        for task in sprint_item["tasks"]:
-                            if task.get("epic") and task["epic"].get("id"):
-                                epic_id = task["epic"]["id"]
-                                # Find or create epic in projects
-                                for project in workspace_data["projects"]:
-                                    epic_found = False
-                                    for epic in project.get("epics", []):
-                                        if epic.get("id") == epic_id:
-                                            epic_found = True
-                                            # Add sprint to epic
-                                            existing_sprint = None
-                                            for sp in epic.get("sprints", []):
-                                                if sp.get("id") == sprint_item["id"]:
-                                                    existing_sprint = sp
-                                                    break
-                                            if not existing_sprint:
-                                                epic["sprints"].append({
-                                                    "id": sprint_item["id"],
-                                                    "name": sprint_item["name"],
-                                                    "startAt": sprint_item.get("startAt"),
-                                                    "endAt": sprint_item.get("endAt"),
-                                                    "tasks": []
-                                                })
-                                            break
-                                    if not epic_found:
-                                        # Create new epic with sprint
-                                        project["epics"].append({
-                                            "id": epic_id,
-                                            "number": 0,
-                                            "title": task["epic"].get("title", "Unnamed Epic"),
-                                            "status": None,
-                                            "estimate": None,
-                                            "sprints": [{
-                                                "id": sprint_item["id"],
-                                                "name": sprint_item["name"],
-                                                "startAt": sprint_item.get("startAt"),
-                                                "endAt": sprint_item.get("endAt"),
-                                                "tasks": [task]
-                                            }]
-                                        })
+                                    project["epics"].append(epic)
+                                    epics[epic_id] = (epic, {})
+
+                                epic, epic_sprints = epics[epic_id]
+                                if sprint_item["id"] not in epic_sprints:
+                                    epic_sprints[sprint_item["id"]] = {
+                                        "id": sprint_item["id"],
+                                        "name": sprint_item["name"],
+                                        "startAt": sprint_item.get("startAt"),
+                                        "endAt": sprint_item.get("endAt"),
+                                        "tasks": []
+                                    }
+                                    epic["sprints"].append(epic_sprints[sprint_item["id"]])
+                                epic_sprints[sprint_item["id"]]["tasks"].append(task)
 
             except Exception as e:
                 frappe.log_error(
                     title="Zenhub Workspace Sprints Query Error",
-                    message=f"Failed to fetch workspace sprints: {str(e)}"
+                    message=f"Failed to process workspace sprints: {str(e)}"
                 )
 
             # Add placeholder epics/tasks to projects that don't have them
@@ -517,6 +728,7 @@ class ZenhubWorkspaceHelper:
             return workspace_data
 
         except Exception as e:
+            self._fetch_failed = True
             frappe.log_error(
                 title="Zenhub Fetch Workspace Data Error",
                 message=f"Failed to fetch workspace {self.workspace_id}: {str(e)}"
@@ -528,7 +740,8 @@ class ZenhubWorkspaceHelper:
                 "projects": [],
                 "sprints": [],
                 "pipelines": {},
-                "team_members": []
+                "team_members": [],
+                "issues": []
             }
 
     def _map_issue_state_to_status(self, state: Optional[str]) -> str:
@@ -655,118 +868,302 @@ class ZenhubWorkspaceHelper:
 
         return tasks
 
-    def _extract_kanban_statuses(self, workspace_data: Dict[str, Any]) -> Dict[str, int]:
+    def _extract_kanban_statuses(self, model: WorkspaceModel) -> Dict[str, int]:
         """
         Extract kanban status distribution.
 
         Args:
-            workspace_data (dict): Workspace data
+            model (WorkspaceModel): Indexed workspace
 
         Returns:
             dict: Status counts
         """
         statuses = {}
 
-        # Collect all tasks and count by status
-        for project in workspace_data.get("projects", []):
-            for epic in project.get("epics", []):
-                for sprint in epic.get("sprints", []):
-                    for task in sprint.get("tasks", []):
-                        status = task.get("status", "Unknown")
-                        statuses[status] = statuses.get(status, 0) + 1
+        for task in model.tasks.values():
+            status = task.get("status", "Unknown")
+            statuses[status] = statuses.get(status, 0) + 1
 
         return statuses
 
-    def _extract_team_members(self, workspace_data: Dict[str, Any]) -> List[Dict[str, str]]:
+    def _extract_team_members(self, model: WorkspaceModel) -> List[Dict[str, str]]:
         """
         Extract unique team members from workspace data.
 
         Args:
-            workspace_data (dict): Workspace data
+            model (WorkspaceModel): Indexed workspace
 
         Returns:
             list: Unique team members
         """
-        team_members_set = set()
-
-        # Collect all team members
-        for project in workspace_data.get("projects", []):
-            for epic in project.get("epics", []):
-                for sprint in epic.get("sprints", []):
-                    for task in sprint.get("tasks", []):
-                        for assignee in task.get("assignees", []):
-                            team_members_set.add((
-                                assignee.get("id"),
-                                assignee.get("name"),
-                                assignee.get("username")
-                            ))
+        team_members_set = {
+            (assignee.get("id"), assignee.get("name"), assignee.get("username"))
+            for assignee in model.assignees.values()
+        }
 
         return [
             {"id": tm[0], "name": tm[1], "username": tm[2]}
-            for tm in sorted(team_members_set, key=lambda x: x[1])
+            for tm in sorted(team_members_set, key=lambda x: x[1] or "")
         ]
 
-    def _count_total_issues(self, workspace_data: Dict[str, Any]) -> int:
+    def _count_total_issues(self, model: WorkspaceModel) -> int:
         """
         Count total issues in workspace.
 
         Args:
-            workspace_data (dict): Workspace data
+            model (WorkspaceModel): Indexed workspace
 
         Returns:
             int: Total issue count
         """
-        count = 0
+        return len(model.tasks)
 
-        for project in workspace_data.get("projects", []):
-            for epic in project.get("epics", []):
-                for sprint in epic.get("sprints", []):
-                    count += len(sprint.get("tasks", []))
-
-        return count
-
-    def _sum_story_points(self, workspace_data: Dict[str, Any]) -> float:
+    def _sum_story_points(self, model: WorkspaceModel) -> float:
         """
         Sum total story points in workspace.
 
         Args:
-            workspace_data (dict): Workspace data
+            model (WorkspaceModel): Indexed workspace
 
         Returns:
             float: Total story points
         """
-        total = 0
+        return sum(task.get("estimate", 0) for task in model.tasks.values())
 
-        for project in workspace_data.get("projects", []):
-            for epic in project.get("epics", []):
-                for sprint in epic.get("sprints", []):
-                    for task in sprint.get("tasks", []):
-                        total += task.get("estimate", 0)
-
-        return total
-
-    def _calculate_completion_rate(self, workspace_data: Dict[str, Any]) -> float:
+    def _calculate_completion_rate(self, model: WorkspaceModel) -> float:
         """
         Calculate completion rate (percentage of completed tasks).
 
         Args:
-            workspace_data (dict): Workspace data
+            model (WorkspaceModel): Indexed workspace
 
         Returns:
             float: Completion rate percentage
         """
-        completed = 0
-        total = 0
-
-        for project in workspace_data.get("projects", []):
-            for epic in project.get("epics", []):
-                for sprint in epic.get("sprints", []):
-                    for task in sprint.get("tasks", []):
-                        total += 1
-                        if task.get("status") in ["Done", "Completed", "Closed"]:
-                            completed += 1
-
+        total = len(model.tasks)
         if total == 0:
             return 0.0
 
+        completed = sum(
+            1 for task in model.tasks.values()
+            if task.get("status") in COMPLETED_TASK_STATUSES
+        )
+
         return round((completed / total) * 100, 2)
+
+
+def normalize_title_tokens(text: Optional[str]) -> List[str]:
+    """
+    Lower-cased word tokens of a title, in order and without duplicates.
+
+    "TASK-2024-0001: Fix Login" -> ["task", "2024", "0001", "fix", "login"]
+    """
+    tokens = re.findall(r"[a-z0-9]+", (text or "").lower())
+    return list(dict.fromkeys(t for t in tokens if len(t) >= ISSUE_TITLE_TOKEN_MIN_LENGTH))
+
+
+def compact_workspace_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """The fields of a raw workspace issue node kept in the snapshot for WorkspaceIssueIndex"""
+    estimate = issue.get("estimate")
+    epic_issue = (issue.get("epic") or {}).get("issue") or {}
+    return {
+        "id": issue.get("id"),
+        "number": issue.get("number"),
+        "title": issue.get("title"),
+        "type": issue.get("type"),
+        "state": issue.get("state"),
+        "estimate": (estimate.get("value") if isinstance(estimate, dict) else None) or 0,
+        "repository": (issue.get("repository") or {}).get("name"),
+        "html_url": issue.get("htmlUrl"),
+        "epic_id": epic_issue.get("id")
+    }
+
+
+def _compact_sprint_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """A structured sprint task in the compact_workspace_issue() shape"""
+    return {
+        "id": task.get("id"),
+        "number": task.get("number"),
+        "title": task.get("title"),
+        "type": None,
+        "state": task.get("state"),
+        "estimate": task.get("estimate") or 0,
+        "repository": None,
+        "html_url": None,
+        "epic_id": (task.get("epic") or {}).get("id")
+    }
+
+
+def get_workspace_issue_index(workspace_id: str) -> WorkspaceIssueIndex:
+    """
+    Issue index of a workspace, built from its shared snapshot.
+
+    Args:
+        workspace_id (str): The Zenhub workspace ID
+
+    Returns:
+        WorkspaceIssueIndex: Index over the (possibly stale) snapshot
+    """
+    workspace_data, _ = get_workspace_snapshot(workspace_id)
+    return WorkspaceIssueIndex(workspace_data)
+
+
+def get_workspace_snapshot(
+    workspace_id: str,
+    force_refresh: bool = False,
+    helper: Optional[ZenhubWorkspaceHelper] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Get the shared workspace snapshot, fetching it from Zenhub when missing.
+
+    A snapshot older than WORKSPACE_SNAPSHOT_SOFT_TTL (or the longer
+    WORKSPACE_SNAPSHOT_WEBHOOK_SOFT_TTL when Zenhub webhooks evict it on
+    change) is still returned immediately, and a background job is queued
+    to refresh it. After
+    WORKSPACE_SNAPSHOT_HARD_TTL it expires from Redis and is refetched inline.
+
+    Args:
+        workspace_id (str): The Zenhub workspace ID
+        force_refresh (bool): Skip the snapshot and refetch from Zenhub
+        helper (ZenhubWorkspaceHelper, optional): Helper used to fetch on a miss
+
+    Returns:
+        tuple: (workspace data, snapshot info with cached, stale and fetched_at)
+    """
+    if frappe.flags.in_test:
+        # Test data is mocked, so it must not reach the shared snapshot
+        helper = helper or ZenhubWorkspaceHelper(workspace_id)
+        return helper._fetch_workspace_data(), {"cached": False, "stale": False, "fetched_at": frappe.utils.now()}
+
+    if not force_refresh:
+        snapshot = _read_workspace_snapshot(workspace_id)
+        if snapshot:
+            age = time.time() - snapshot.get("fetched_at", 0)
+            soft_ttl = (
+                WORKSPACE_SNAPSHOT_WEBHOOK_SOFT_TTL if zenhub.is_zenhub_webhook_enabled()
+                else WORKSPACE_SNAPSHOT_SOFT_TTL
+            )
+            stale = age >= soft_ttl
+            if stale:
+                _queue_workspace_snapshot_refresh(workspace_id)
+
+            return snapshot["data"], {
+                "cached": True,
+                "stale": stale,
+                "fetched_at": snapshot.get("fetched_on")
+            }
+
+    workspace_data = refresh_workspace_snapshot(workspace_id, helper=helper)
+    return workspace_data, {"cached": False, "stale": False, "fetched_at": frappe.utils.now()}
+
+
+def refresh_workspace_snapshot(
+    workspace_id: str,
+    helper: Optional[ZenhubWorkspaceHelper] = None,
+    lock_token: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Fetch a workspace from Zenhub and store it as the shared snapshot.
+
+    Runs inline on a cache miss and as the background refresh job. Partial
+    fetches (a failed issues or sprints query) are returned but not stored.
+
+    Args:
+        workspace_id (str): The Zenhub workspace ID
+        helper (ZenhubWorkspaceHelper, optional): Helper used to fetch
+        lock_token (str, optional): Token of the refresh lock taken when the
+            job was queued; only that lock is released (inline refreshes hold none)
+
+    Returns:
+        dict: The freshly fetched workspace data
+    """
+    try:
+        helper = helper or ZenhubWorkspaceHelper(workspace_id)
+        workspace_data = helper._fetch_workspace_data()
+
+        if not helper._fetch_failed:
+            try:
+                frappe.cache().set_value(
+                    f"{WORKSPACE_SNAPSHOT_CACHE_KEY_PREFIX}{workspace_id}",
+                    json_lib.dumps({
+                        "fetched_at": time.time(),
+                        "fetched_on": frappe.utils.now(),
+                        "data": workspace_data
+                    }),
+                    expires_in_sec=WORKSPACE_SNAPSHOT_HARD_TTL
+                )
+            except Exception as cache_error:
+                # Don't fail if caching fails
+                frappe.log_error(
+                    title="Zenhub Cache Error",
+                    message=f"Failed to cache workspace snapshot {workspace_id}: {str(cache_error)}"
+                )
+
+        return workspace_data
+    finally:
+        if lock_token:
+            _release_workspace_snapshot_refresh_lock(workspace_id, lock_token)
+
+
+def clear_workspace_snapshot(workspace_id: str) -> None:
+    """Drop the shared snapshot of a workspace so the next request refetches it"""
+    try:
+        frappe.cache().delete_value(f"{WORKSPACE_SNAPSHOT_CACHE_KEY_PREFIX}{workspace_id}")
+    except Exception:
+        pass  # Fail silently to not break functionality
+
+
+def _read_workspace_snapshot(workspace_id: str) -> Optional[Dict[str, Any]]:
+    """Read a stored snapshot ({"fetched_at": epoch seconds, "fetched_on": datetime, "data": ...})"""
+    try:
+        cached = frappe.cache().get_value(f"{WORKSPACE_SNAPSHOT_CACHE_KEY_PREFIX}{workspace_id}")
+        if cached:
+            snapshot = json_lib.loads(cached)
+            if isinstance(snapshot, dict) and "data" in snapshot:
+                return snapshot
+    except Exception:
+        pass  # Cache unavailable or corrupted, fetch fresh
+
+    return None
+
+
+def _queue_workspace_snapshot_refresh(workspace_id: str) -> None:
+    """Queue one background refresh per workspace, however many requests see it stale"""
+    try:
+        cache = frappe.cache()
+        lock_key = cache.make_key(f"{WORKSPACE_SNAPSHOT_REFRESH_LOCK_PREFIX}{workspace_id}")
+        lock_token = frappe.generate_hash(length=10)
+        if not cache.set(lock_key, lock_token, nx=True, ex=WORKSPACE_SNAPSHOT_REFRESH_LOCK_TTL):
+            return  # A refresh is already queued or running
+
+        frappe.enqueue(
+            "frappe_devsecops_dashboard.api.zenhub_workspace_helper.refresh_workspace_snapshot",
+            workspace_id=workspace_id,
+            lock_token=lock_token,
+            queue="short",
+            is_async=True
+        )
+    except Exception as e:
+        # A stale snapshot is still served; the next request tries again
+        frappe.logger().warning(f"[zenhub_workspace_snapshot] Could not queue refresh for {workspace_id}: {str(e)}")
+
+
+def evict_workspace_snapshot(workspace_id: str) -> None:
+    """Drop a changed workspace's snapshot and queue its refresh in the background"""
+    clear_workspace_snapshot(workspace_id)
+    # A refresh already running may have read the old data; queue another after it
+    _release_workspace_snapshot_refresh_lock(workspace_id)
+    _queue_workspace_snapshot_refresh(workspace_id)
+
+
+def _release_workspace_snapshot_refresh_lock(workspace_id: str, lock_token: Optional[str] = None) -> None:
+    """Allow the next stale read to queue a refresh again (only if lock_token still holds the lock, when given)"""
+    try:
+        cache = frappe.cache()
+        lock_key = cache.make_key(f"{WORKSPACE_SNAPSHOT_REFRESH_LOCK_PREFIX}{workspace_id}")
+        if lock_token is None:
+            cache.delete(lock_key)
+        else:
+            cache.eval(RELEASE_REFRESH_LOCK_SCRIPT, 1, lock_key, lock_token)
+    except Exception:
+        pass  # The lock expires on its own
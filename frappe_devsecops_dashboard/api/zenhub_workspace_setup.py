@@ -9,22 +9,31 @@ Usage:
 """
 
 import frappe
-import requests
+from frappe_devsecops_dashboard.api.dashboard_cache import bump_cache_version
+from frappe_devsecops_dashboard.api.zenhub_bulk import run_mutation_batches
+from frappe_devsecops_dashboard.api.zenhub_client import post_graphql
+from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.project_extension.project_extension import (
+    PROJECT_ISSUE_TYPE_ID,
+    get_workspace_repository
+)
 import json
 from typing import Dict, Any, Optional, List
 
+# createIssue selection batched by create_project_issues(), as the Project hook sends it
+CREATE_PROJECT_ISSUE_SELECTION = """createIssue(input: $input) {
+            issue {
+                id
+                title
+                number
+            }
+        }"""
+
 
 def get_zenhub_token() -> str:
-    """Get ZenHub API token from Zenhub Settings"""
-    try:
-        from frappe.utils.password import get_password as _get_password
-    except:
-        from frappe.utils.password import get_decrypted_password as _get_password
+    """Get ZenHub API token from Zenhub Settings (shared, cached lookup in api.zenhub)"""
+    from frappe_devsecops_dashboard.api.zenhub import get_zenhub_token as _get_zenhub_token
 
-    token = _get_password("Zenhub Settings", "Zenhub Settings", "zenhub_token")
-    if not token:
-        raise frappe.ValidationError("ZenHub API token not configured in Zenhub Settings")
-    return token
+    return _get_zenhub_token()
 
 
 def create_workspace_graphql(token: str, workspace_name: str, org_id: str) -> Dict[str, Any]:
@@ -39,8 +48,6 @@ def create_workspace_graphql(token: str, workspace_name: str, org_id: str) -> Di
     Returns:
         dict: Contains workspace_id, name, etc.
     """
-    url = "https://api.zenhub.com/public/graphql"
-
     # GraphQL mutation to create workspace
     # NOTE: zenhubOrganizationId is REQUIRED, not optional
     query = """
@@ -59,20 +66,10 @@ def create_workspace_graphql(token: str, workspace_name: str, org_id: str) -> Di
     }
     """ % (workspace_name, f"Workspace for {workspace_name} product development", org_id)
 
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-
     try:
         frappe.logger().info(f"[create_workspace_graphql] Calling ZenHub API to create workspace: {workspace_name}")
 
-        response = requests.post(
-            url,
-            json={"query": query},
-            headers=headers,
-            timeout=30
-        )
+        response = post_graphql(query, token=token, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -134,8 +131,6 @@ def create_project_graphql(token: str, workspace_id: str, project_name: str, pro
     Returns:
         dict: Contains pipeline_id, name, etc.
     """
-    url = "https://api.zenhub.com/public/graphql"
-
     # GraphQL mutation to create pipeline (project container)
     # This is the working alternative to createProject (which doesn't exist)
     query = """
@@ -159,20 +154,10 @@ def create_project_graphql(token: str, workspace_id: str, project_name: str, pro
         }
     }
 
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-
     try:
         frappe.logger().info(f"[create_project_graphql] Creating ZenHub pipeline (project): {project_name}")
 
-        response = requests.post(
-            url,
-            json={"query": query, "variables": variables},
-            headers=headers,
-            timeout=30
-        )
+        response = post_graphql(query, variables, token=token, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -317,15 +302,122 @@ def create_zenhub_project_for_frappe_project(
         }
 
 
+def plan_product_projects(product_name: str) -> List[Dict[str, Any]]:
+    """
+    Linked Frappe projects of a product and what setup has to do for each
+
+    Projects that already have a ZenHub project ID (from an earlier, possibly
+    partial, run or the Project hook) are kept as they are, so running setup
+    again resumes where it stopped.
+
+    Args:
+        product_name: Name of product in Frappe
+
+    Returns:
+        list: {"frappe_project", "project_name", "zenhub_project_id", "zenhub_project_key"}
+              per linked project; zenhub_project_id is None when it must be created
+    """
+    linked_projects = frappe.get_all(
+        "Project",
+        filters={"custom_software_product": product_name},
+        fields=["name", "project_name", "custom_zenhub_project_id"],
+        order_by="name asc"
+    )
+
+    return [
+        {
+            "frappe_project": project.name,
+            "project_name": project.project_name or project.name,
+            "zenhub_project_id": project.custom_zenhub_project_id or None,
+            # Generate a project key from the name
+            "zenhub_project_key": project.name.replace("-", "_").upper()[:10]
+        }
+        for project in linked_projects
+    ]
+
+
+def create_project_issues(
+    projects: List[Dict[str, Any]],
+    workspace_id: str,
+    product_name: str,
+    token: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    Create the ZenHub Project issues of several Frappe projects in batches
+
+    Issues are created with aliased createIssue mutations (see api.zenhub_bulk),
+    the same issues the Project hook creates one job at a time. Each batch
+    writes its IDs to the Project documents as soon as it returns, so a failed
+    batch only leaves its own projects to a later run.
+
+    Args:
+        projects: Planned projects (plan_product_projects) without a ZenHub project ID
+        workspace_id: ZenHub workspace ID
+        product_name: Software Product, for API logging
+        token: ZenHub API token
+
+    Returns:
+        dict: {frappe_project: error} for projects whose issue was not created;
+              created IDs are set on the planned project dicts
+    """
+    if not projects:
+        return {}
+
+    repository_id = get_workspace_repository(workspace_id)
+    if not repository_id or repository_id.startswith(("http://", "https://")):
+        error = f"No usable repository found in workspace {workspace_id}"
+        return {project["frappe_project"]: error for project in projects}
+
+    def record_issue_ids(results):
+        for frappe_project, result in results.items():
+            issue_id = (result.get("issue") or {}).get("id")
+            if issue_id:
+                frappe.db.set_value("Project", frappe_project, "custom_zenhub_project_id", issue_id)
+
+    created, errors = run_mutation_batches(
+        {
+            project["frappe_project"]: {
+                "input": {
+                    "repositoryId": repository_id,
+                    "title": f"{project['frappe_project']}-{project['project_name']}",
+                    "body": f"Project created from Frappe on {frappe.utils.now()}",
+                    "issueTypeId": PROJECT_ISSUE_TYPE_ID
+                }
+            }
+            for project in projects
+        },
+        operation_name="createProjectIssues",
+        selection=CREATE_PROJECT_ISSUE_SELECTION,
+        variable_types={"input": "CreateIssueInput!"},
+        reference_doctype="Software Product",
+        reference_docname=product_name,
+        on_batch_success=record_issue_ids,
+        token=token
+    )
+
+    for project in projects:
+        issue_id = (created.get(project["frappe_project"], {}).get("issue") or {}).get("id")
+        if issue_id:
+            project["zenhub_project_id"] = issue_id
+        elif project["frappe_project"] not in errors:
+            errors[project["frappe_project"]] = "No issue returned"
+
+    return errors
+
+
 @frappe.whitelist()
 def setup_product_workspace(product_name: str, workspace_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Setup ZenHub projects for a product with linked projects
 
-    If workspace_id is not provided, uses existing workspace from ZenHub settings.
+    If workspace_id is not provided, a new workspace is created for the product.
     Then:
-    1. Create ZenHub projects for linked Frappe projects
-    2. Update Project documents with ZenHub IDs
+    1. Link the product's Frappe projects to the workspace
+    2. Create ZenHub projects for linked Frappe projects that have none, in batches
+    3. Update Project documents with ZenHub IDs
+
+    Projects that already have a ZenHub project ID are skipped, so after a
+    partial failure running setup again only creates the missing ones.
 
     Args:
         product_name: Name of product in Frappe
@@ -352,6 +444,14 @@ def setup_product_workspace(product_name: str, workspace_id: Optional[str] = Non
         token = get_zenhub_token()
         frappe.logger().info(f"[setup_product_workspace] Retrieved ZenHub token for product: {product_name}")
 
+        # Plan the whole setup before creating anything in ZenHub
+        planned_projects = plan_product_projects(product_name)
+        pending_projects = [p for p in planned_projects if not p["zenhub_project_id"]]
+        frappe.logger().info(
+            f"[setup_product_workspace] {len(planned_projects)} linked projects, "
+            f"{len(pending_projects)} without a ZenHub project"
+        )
+
         # Organization ID for tiberbu.com
         org_id = "Z2lkOi8vcmFwdG9yL1plbmh1Yk9yZ2FuaXphdGlvbi8xNDUwNjY"
 
@@ -377,14 +477,7 @@ def setup_product_workspace(product_name: str, workspace_id: Optional[str] = Non
         frappe.db.commit()
         frappe.logger().info(f"[setup_product_workspace] Product {product_name} updated with workspace ID: {workspace_id}")
 
-        # Get linked projects
-        linked_projects = frappe.get_all(
-            "Project",
-            filters={"custom_software_product": product_name},
-            fields=["name", "project_name"]
-        )
-
-        if not linked_projects:
+        if not planned_projects:
             warning_msg = f"No projects linked to product {product_name}"
             frappe.logger().warning(f"[setup_product_workspace] {warning_msg}")
             return {
@@ -395,43 +488,37 @@ def setup_product_workspace(product_name: str, workspace_id: Optional[str] = Non
                 "projects": []
             }
 
-        # Prepare projects list (GraphQL project creation not available via public API)
-        frappe.logger().info(f"[setup_product_workspace] Preparing {len(linked_projects)} projects for workspace")
-        created_projects = []
-
-        for project in linked_projects:
-            project_name = project.get("project_name") or project.get("name")
-            # Generate a project key from the name
-            project_key = project.get("name").replace("-", "_").upper()[:10]
+        # Link every project to the workspace in one update. set_value skips the
+        # Project before_save hook, which would queue one issue job per project;
+        # the issues are created in batches below instead
+        frappe.db.set_value(
+            "Project",
+            {"name": ["in", [p["frappe_project"] for p in planned_projects]]},
+            "custom_zenhub_workspace_id",
+            workspace_id
+        )
+        # Committed before the batches, which write to the same rows from their own connections
+        frappe.db.commit()
 
-            frappe.logger().debug(f"[setup_product_workspace] Processing project: {project.get('name')}")
-            created_projects.append({
-                "frappe_project": project.get("name"),
-                "zenhub_project_id": None,  # Will be set manually
-                "zenhub_project_key": project_key
-            })
+        frappe.logger().info(f"[setup_product_workspace] Creating {len(pending_projects)} ZenHub projects")
+        project_errors = create_project_issues(pending_projects, workspace_id, product_name, token=token)
+        frappe.db.commit()
+        bump_cache_version("Project")
 
-        # Update projects with ZenHub workspace ID
-        frappe.logger().info(f"[setup_product_workspace] Updating {len(created_projects)} projects with workspace ID")
-        updated_count = 0
-        failed_projects = []
+        for frappe_project, error in project_errors.items():
+            error_msg = f"Failed to create ZenHub project for {frappe_project}: {error}"[:150]
+            frappe.logger().error(f"[setup_product_workspace] {error_msg}")
+            frappe.log_error(error_msg, "ZenHub Project Creation Error")
 
-        for proj in created_projects:
-            try:
-                frappe_proj = frappe.get_doc("Project", proj["frappe_project"])
-                frappe_proj.custom_zenhub_workspace_id = workspace_id
-                # Only update project_id if it was set
-                if proj.get("zenhub_project_id"):
-                    frappe_proj.custom_zenhub_project_id = proj["zenhub_project_id"]
-                frappe_proj.save()
-                frappe.db.commit()
-                updated_count += 1
-                frappe.logger().info(f"[setup_product_workspace] Updated project: {proj['frappe_project']}")
-            except Exception as e:
-                error_msg = f"Failed to update project {proj['frappe_project']}: {str(e)}"
-                frappe.logger().error(f"[setup_product_workspace] {error_msg}")
-                failed_projects.append(proj["frappe_project"])
-                frappe.log_error(error_msg, "ZenHub Project Update Error")
+        created_projects = [
+            {
+                "frappe_project": p["frappe_project"],
+                "zenhub_project_id": p["zenhub_project_id"],
+                "zenhub_project_key": p["zenhub_project_key"]
+            }
+            for p in planned_projects
+        ]
+        created_count = len(pending_projects) - len(project_errors)
 
         # Log API result summary
         result = {
@@ -439,14 +526,16 @@ def setup_product_workspace(product_name: str, workspace_id: Optional[str] = Non
             "workspace_id": workspace_id,
             "workspace_name": product_name,
             "product_name": product_name,
-            "projects_created": updated_count,
+            "projects_created": created_count,
+            "projects_existing": len(planned_projects) - len(pending_projects),
             "projects": created_projects,
-            "failed_projects": failed_projects if failed_projects else None
+            "failed_projects": list(project_errors) if project_errors else None,
+            "project_errors": project_errors if project_errors else None
         }
 
         frappe.logger().info(
             f"[setup_product_workspace] Setup completed for {product_name}: "
-            f"workspace_id={workspace_id}, updated={updated_count}/{len(created_projects)} projects"
+            f"workspace_id={workspace_id}, created={created_count}/{len(pending_projects)} projects"
         )
 
         # Log full result to error log for audit trail
@@ -0,0 +1,8 @@
+from frappe_devsecops_dashboard.commands.rebuild_dashboard_snapshots import rebuild_dashboard_snapshots
+from frappe_devsecops_dashboard.commands.setup_zenhub_workspace import setup_zenhub_workspace
+
+# bench discovers app CLI commands through this list
+commands = [
+    setup_zenhub_workspace,
+    rebuild_dashboard_snapshots
+]
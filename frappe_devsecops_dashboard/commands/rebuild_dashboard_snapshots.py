@@ -0,0 +1,38 @@
+"""
+Frappe CLI command to reconcile Project Dashboard Snapshots
+
+Usage:
+    bench --site site_name rebuild-dashboard-snapshots
+"""
+
+import click
+import frappe
+from frappe.commands import get_site, pass_context
+from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.project_dashboard_snapshot.project_dashboard_snapshot import (
+    rebuild_all_project_snapshots
+)
+
+
+@click.command("rebuild-dashboard-snapshots")
+@pass_context
+def rebuild_dashboard_snapshots(context):
+    """
+    Rebuild every Project Dashboard Snapshot from the current Task data
+
+    Use after bulk imports, direct SQL edits or if snapshots drift from
+    the live calculation.
+    """
+    site = get_site(context)
+    frappe.init(site=site)
+    frappe.connect()
+
+    try:
+        click.secho("Rebuilding project dashboard snapshots...", fg="blue")
+        count = rebuild_all_project_snapshots()
+        click.secho(f"✅ Rebuilt {count} project snapshots", fg="green", bold=True)
+
+    except Exception as e:
+        click.secho(f"\n❌ ERROR: {str(e)}\n", fg="red", bold=True)
+        raise click.Abort()
+    finally:
+        frappe.destroy()
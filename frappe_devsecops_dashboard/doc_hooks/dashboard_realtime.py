@@ -0,0 +1,165 @@
+"""
+Dashboard Realtime Delta Hooks
+
+Publishes compact deltas through frappe.publish_realtime when Tasks,
+Projects, Change Requests and Incidents change, so the dashboard can patch
+its state in place instead of polling get_dashboard_data.
+
+Deltas are sent to the document room of the affected Project
+("doc:Project/<name>"); the socket.io server only lets users with read
+permission on that Project join it. Change Requests and Incidents without a
+project go to their doctype room, which requires read permission on the
+doctype.
+
+Everyone who can read the Project is in its room, whether or not they can
+read the Task, Change Request or Incident that changed, so only Project
+deltas carry field values. Deltas of other doctypes identify the record
+({doctype, name, action, project, counters_changed}) and clients re-fetch
+what they show with their own permissions. Task counters are never sent
+either, as snapshot counters only match what users with unrestricted Task
+read can see: Task deltas set counters_changed and clients reload the
+project's counters (get_project_details).
+
+Client usage (frontend/src/utils/realtimeUtils.js):
+    subscribeDashboardDeltas(projectNames, (delta) => { ... })
+"""
+
+import frappe
+
+
+DASHBOARD_DELTA_EVENT = "devsecops_dashboard_delta"
+
+# Project fields whose changes are included in Project deltas
+PROJECT_DELTA_FIELDS = ["status", "percent_complete", "priority", "expected_end_date", "project_name"]
+
+
+def publish_task_delta(doc, method=None):
+    """
+    Hook for Task on_update / after_delete events.
+
+    A task moved between projects publishes to both.
+
+    Args:
+        doc: The Task document
+        method: The hook method name
+    """
+    try:
+        projects = [doc.get("project")]
+
+        previous_doc = doc.get_doc_before_save() if method == "on_update" else None
+        if previous_doc and previous_doc.get("project") not in projects:
+            projects.append(previous_doc.get("project"))
+
+        delta = build_delta(doc, method, counters_changed=True)
+
+        for project_name in [p for p in projects if p]:
+            publish_project_room_delta(project_name, delta)
+
+    except Exception as e:
+        # Never block the save - clients can still fall back to a full reload
+        frappe.log_error(
+            f"Error publishing dashboard delta for Task {doc.name}: {str(e)}",
+            "DevSecOps Dashboard Realtime"
+        )
+
+
+def publish_project_delta(doc, method=None):
+    """
+    Hook for Project on_update / after_delete events.
+
+    Args:
+        doc: The Project document
+        method: The hook method name
+    """
+    try:
+        publish_project_room_delta(doc.name, build_delta(doc, method))
+
+    except Exception as e:
+        frappe.log_error(
+            f"Error publishing dashboard delta for Project {doc.name}: {str(e)}",
+            "DevSecOps Dashboard Realtime"
+        )
+
+
+def publish_record_delta(doc, method=None):
+    """
+    Hook for Change Request and Incident on_update / after_delete events.
+
+    Args:
+        doc: The Change Request or Incident document
+        method: The hook method name
+    """
+    try:
+        delta = build_delta(doc, method)
+
+        if doc.get("project"):
+            publish_project_room_delta(doc.get("project"), delta)
+        else:
+            frappe.publish_realtime(DASHBOARD_DELTA_EVENT, delta, doctype=doc.doctype, after_commit=True)
+
+    except Exception as e:
+        frappe.log_error(
+            f"Error publishing dashboard delta for {doc.doctype} {doc.name}: {str(e)}",
+            "DevSecOps Dashboard Realtime"
+        )
+
+
+def publish_project_room_delta(project_name, delta):
+    """Publish a delta to the room of users who can read project_name"""
+    frappe.publish_realtime(
+        DASHBOARD_DELTA_EVENT,
+        dict(delta, project=project_name),
+        doctype="Project",
+        docname=project_name,
+        after_commit=True
+    )
+
+
+def build_delta(doc, method, counters_changed=False):
+    """
+    Build the compact delta payload for a changed document
+
+    Args:
+        doc: The changed document
+        method: The hook method name
+        counters_changed: Whether the project's task counters may have changed
+
+    Returns:
+        dict: {doctype, name, action, counters_changed}, plus changes and
+            modified for Projects
+    """
+    delta = {
+        "doctype": doc.doctype,
+        "name": doc.name,
+        "action": "delete" if method == "after_delete" else "update",
+        "counters_changed": counters_changed
+    }
+
+    # Room members can read the Project itself, so only its fields are sent
+    if doc.doctype == "Project":
+        delta["changes"] = get_changed_fields(doc, method)
+        delta["modified"] = str(doc.get("modified") or "")
+
+    return delta
+
+
+def get_changed_fields(doc, method=None):
+    """
+    Get the watched fields of a Project that changed in this save
+
+    New documents report all watched fields; deleted documents report none.
+
+    Returns:
+        dict: fieldname -> new value
+    """
+    if method == "after_delete":
+        return {}
+
+    fields = [f for f in PROJECT_DELTA_FIELDS if doc.meta.has_field(f)]
+    previous_doc = doc.get_doc_before_save()
+
+    return {
+        field: doc.get(field)
+        for field in fields
+        if not previous_doc or previous_doc.get(field) != doc.get(field)
+    }
@@ -0,0 +1,99 @@
+"""
+Project Dashboard Snapshot Hooks
+
+Keeps the Project Dashboard Snapshot table in sync with Task, Project and
+Task Type changes so the dashboard can read one precomputed row per project
+instead of recalculating phases and progress from raw Task rows.
+"""
+
+import frappe
+
+from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.project_dashboard_snapshot.project_dashboard_snapshot import (
+	refresh_project_snapshot,
+	delete_project_snapshot
+)
+
+
+def update_snapshot_for_task(doc, method=None):
+	"""
+	Hook for Task on_update / after_delete events.
+
+	Refreshes the snapshot of the task's project, and of its previous
+	project when the task was moved.
+
+	Args:
+		doc: The Task document
+		method: The hook method name
+	"""
+	try:
+		projects = {doc.get("project")}
+
+		previous_doc = doc.get_doc_before_save() if method == "on_update" else None
+		if previous_doc and previous_doc.get("project") != doc.get("project"):
+			projects.add(previous_doc.get("project"))
+
+		for project_name in projects:
+			if project_name:
+				refresh_project_snapshot(project_name)
+
+	except Exception as e:
+		# Never block the task save - the reconcile command can repair snapshots
+		frappe.log_error(
+			f"Error updating dashboard snapshot for Task {doc.name}: {str(e)}",
+			"Project Dashboard Snapshot Hook"
+		)
+
+
+def update_snapshot_for_project(doc, method=None):
+	"""
+	Hook for Project on_update event.
+
+	Refreshes the project snapshot (project manager may have changed).
+
+	Args:
+		doc: The Project document
+		method: The hook method name
+	"""
+	try:
+		refresh_project_snapshot(doc.name)
+	except Exception as e:
+		frappe.log_error(
+			f"Error updating dashboard snapshot for Project {doc.name}: {str(e)}",
+			"Project Dashboard Snapshot Hook"
+		)
+
+
+def remove_snapshot_for_project(doc, method=None):
+	"""
+	Hook for Project on_trash event.
+
+	Args:
+		doc: The Project document
+		method: The hook method name
+	"""
+	try:
+		delete_project_snapshot(doc.name)
+	except Exception as e:
+		frappe.log_error(
+			f"Error removing dashboard snapshot for Project {doc.name}: {str(e)}",
+			"Project Dashboard Snapshot Hook"
+		)
+
+
+def rebuild_snapshots_for_task_type(doc, method=None):
+	"""
+	Hook for Task Type on_update and on_trash events.
+
+	Task Type priority drives phase ordering for every project, so all
+	snapshots are rebuilt in the background (after the commit, so a deleted
+	type is already gone).
+
+	Args:
+		doc: The Task Type document
+		method: The hook method name
+	"""
+	frappe.enqueue(
+		"frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.project_dashboard_snapshot.project_dashboard_snapshot.rebuild_all_project_snapshots",
+		queue="long",
+		enqueue_after_commit=True
+	)
@@ -0,0 +1,201 @@
+# Copyright (c) 2026, Salim and contributors
+# License: MIT
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import flt
+import json
+from typing import Dict, Any, List, Optional
+
+
+SNAPSHOT_DOCTYPE = "Project Dashboard Snapshot"
+
+SNAPSHOT_FIELDS = [
+	"project",
+	"project_manager",
+	"current_phase",
+	"task_count",
+	"completed_tasks",
+	"progress",
+	"completion_rate",
+	"delivery_phases",
+	"last_computed"
+]
+
+
+class ProjectDashboardSnapshot(Document):
+	"""Precomputed dashboard summary (phases, progress, counts) for a single Project"""
+	pass
+
+
+def compute_project_snapshot(
+	project_name: str,
+	tasks: List[Dict[str, Any]],
+	task_type_priorities: Dict[str, int],
+	project_manager: Optional[str] = None
+) -> Dict[str, Any]:
+	"""
+	Compute snapshot values for a project using the dashboard calculations
+
+	Args:
+		project_name: Name of the Project
+		tasks: All tasks of the project (needs at least type and status)
+		task_type_priorities: Task Type -> custom_priority map
+		project_manager: Project Manager full name (or user id)
+
+	Returns:
+		Dict of snapshot field values
+	"""
+	from frappe_devsecops_dashboard.api.dashboard import (
+		calculate_project_lifecycle_phases,
+		calculate_actual_progress,
+		determine_current_phase
+	)
+
+	lifecycle_phases = calculate_project_lifecycle_phases(tasks, task_type_priorities) if tasks else []
+	total_tasks = len(tasks)
+	completed_tasks = len([t for t in tasks if t.get("status") == "Completed"])
+
+	return {
+		"project": project_name,
+		"project_manager": project_manager,
+		"current_phase": determine_current_phase(lifecycle_phases) if lifecycle_phases else "Planning",
+		"task_count": total_tasks,
+		"completed_tasks": completed_tasks,
+		"progress": flt(calculate_actual_progress(tasks), 2) if tasks else 0,
+		"completion_rate": flt((completed_tasks / total_tasks * 100), 2) if total_tasks else 0,
+		"delivery_phases": json.dumps(lifecycle_phases),
+		"last_computed": frappe.utils.now()
+	}
+
+
+def save_project_snapshot(values: Dict[str, Any]) -> None:
+	"""Insert or update the snapshot row for values["project"]"""
+	project_name = values["project"]
+
+	if frappe.db.exists(SNAPSHOT_DOCTYPE, project_name):
+		frappe.db.set_value(SNAPSHOT_DOCTYPE, project_name, values)
+		return
+
+	try:
+		frappe.get_doc({"doctype": SNAPSHOT_DOCTYPE, **values}).insert(ignore_permissions=True)
+	except frappe.DuplicateEntryError:
+		# A concurrent save created the row first
+		frappe.db.set_value(SNAPSHOT_DOCTYPE, project_name, values)
+
+
+def refresh_project_snapshot(project_name: str) -> None:
+	"""
+	Recompute and store the snapshot of a single project
+
+	Deletes the snapshot when the project no longer exists.
+	"""
+	if not project_name:
+		return
+
+	if not frappe.db.exists("Project", project_name):
+		delete_project_snapshot(project_name)
+		return
+
+	from frappe_devsecops_dashboard.api.dashboard import get_project_managers, get_task_type_details
+
+	tasks = frappe.get_all(
+		"Task",
+		filters={"project": project_name},
+		fields=["name", "type", "status"]
+	)
+	task_types = get_task_type_details({t.get("type") for t in tasks if t.get("type")})
+
+	save_project_snapshot(compute_project_snapshot(
+		project_name,
+		tasks,
+		{name: details.get("priority") or 999 for name, details in task_types.items()},
+		get_project_managers([project_name]).get(project_name)
+	))
+
+
+def delete_project_snapshot(project_name: str) -> None:
+	"""Remove the snapshot of a project"""
+	if project_name and frappe.db.exists(SNAPSHOT_DOCTYPE, project_name):
+		frappe.db.delete(SNAPSHOT_DOCTYPE, {"name": project_name})
+
+
+def get_project_snapshots(project_names: List[str]) -> Dict[str, Dict[str, Any]]:
+	"""
+	Get stored snapshots for a list of projects in a single query
+
+	Callers are expected to pass project names that were already
+	permission-filtered (e.g. via frappe.get_list("Project")).
+
+	Returns:
+		Dict mapping project name to snapshot values with delivery_phases decoded
+	"""
+	if not project_names:
+		return {}
+
+	snapshots = {}
+	for row in frappe.get_all(
+		SNAPSHOT_DOCTYPE,
+		filters={"name": ["in", project_names]},
+		fields=SNAPSHOT_FIELDS
+	):
+		try:
+			row["delivery_phases"] = json.loads(row.get("delivery_phases") or "[]")
+		except (TypeError, ValueError):
+			# Corrupt snapshot - let the caller fall back to a live calculation
+			continue
+		snapshots[row.get("project")] = row
+
+	return snapshots
+
+
+def rebuild_all_project_snapshots() -> int:
+	"""
+	Rebuild every project snapshot from scratch and drop orphaned rows
+
+	Loads all projects, tasks, Task Types and Project Managers with one query
+	each, so it is safe to run on large sites.
+
+	Returns:
+		Number of snapshots written
+	"""
+	from frappe_devsecops_dashboard.api.dashboard import get_project_managers, get_task_type_details
+
+	project_names = frappe.get_all("Project", pluck="name")
+
+	tasks_by_project = {}
+	for task in frappe.get_all(
+		"Task",
+		filters={"project": ["is", "set"]},
+		fields=["name", "type", "status", "project"],
+		order_by="type asc, idx asc"
+	):
+		tasks_by_project.setdefault(task.pop("project"), []).append(task)
+
+	task_types = get_task_type_details(
+		{t.get("type") for tasks in tasks_by_project.values() for t in tasks if t.get("type")}
+	)
+	task_type_priorities = {name: details.get("priority") or 999 for name, details in task_types.items()}
+	project_managers = get_project_managers(project_names)
+
+	for project_name in project_names:
+		save_project_snapshot(compute_project_snapshot(
+			project_name,
+			tasks_by_project.get(project_name, []),
+			task_type_priorities,
+			project_managers.get(project_name)
+		))
+
+	# Drop snapshots whose project has been deleted
+	if project_names:
+		frappe.db.delete(SNAPSHOT_DOCTYPE, {"name": ["not in", project_names]})
+	else:
+		frappe.db.delete(SNAPSHOT_DOCTYPE)
+
+	frappe.db.commit()
+
+	# Cached dashboard responses were built from the old snapshots
+	from frappe_devsecops_dashboard.api.dashboard_cache import bump_cache_version
+	bump_cache_version("Project")
+
+	return len(project_names)
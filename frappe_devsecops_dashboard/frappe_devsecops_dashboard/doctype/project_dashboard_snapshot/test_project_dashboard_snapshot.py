@@ -0,0 +1,44 @@
+# Copyright (c) 2026, Salim and Contributors
+# See license.txt
+
+import json
+
+from frappe.tests.utils import FrappeTestCase
+
+from frappe_devsecops_dashboard.api.dashboard import build_project_payload
+from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.project_dashboard_snapshot.project_dashboard_snapshot import (
+	compute_project_snapshot
+)
+
+
+class TestProjectDashboardSnapshot(FrappeTestCase):
+	def test_snapshot_matches_live_calculation(self):
+		"""Payload built from a snapshot must equal the live calculation"""
+		tasks = [
+			{"name": "T1", "type": "Planning", "status": "Completed"},
+			{"name": "T2", "type": "Planning", "status": "Completed"},
+			{"name": "T3", "type": "Development", "status": "Working"},
+			{"name": "T4", "type": "Testing", "status": "Open"},
+			{"name": "T5", "type": None, "status": "Cancelled"}
+		]
+		priorities = {"Planning": 1, "Development": 2, "Testing": 3}
+		project = {"name": "SNAP-TEST", "project_name": "Snapshot Test", "percent_complete": 10}
+
+		snapshot = compute_project_snapshot("SNAP-TEST", tasks, priorities, "Jane PM")
+		snapshot["delivery_phases"] = json.loads(snapshot["delivery_phases"])
+
+		live = build_project_payload(dict(project), tasks, priorities)
+		from_snapshot = build_project_payload(dict(project), tasks, priorities, snapshot)
+
+		for key in ("progress", "current_phase", "task_count", "completed_tasks", "completion_rate", "delivery_phases"):
+			self.assertEqual(live[key], from_snapshot[key], key)
+
+	def test_empty_project_uses_percent_complete(self):
+		snapshot = compute_project_snapshot("SNAP-EMPTY", [], {}, None)
+		snapshot["delivery_phases"] = json.loads(snapshot["delivery_phases"])
+
+		payload = build_project_payload({"name": "SNAP-EMPTY", "percent_complete": 42}, [], {}, snapshot)
+
+		self.assertEqual(payload["progress"], 42)
+		self.assertEqual(payload["current_phase"], "Planning")
+		self.assertEqual(payload["task_count"], 0)
@@ -7,10 +7,14 @@ Creates a Zenhub Issue of type Project when a Project is saved
 """
 
 import frappe
-import requests
+from frappe_devsecops_dashboard.api.zenhub_client import post_graphql
 from typing import Optional, Dict, Any, List
 import base64
 
+# Zenhub Project issue type ID (level 2)
+# This is the ID for issues of type "Project"
+PROJECT_ISSUE_TYPE_ID = "Z2lkOi8vcmFwdG9yL0lzc3VlVHlwZS8yMzY4MTM"
+
 
 def verify_issue_exists(issue_id: str, issue_title: str, issue_type: str) -> bool:
     """
@@ -31,8 +35,6 @@ def verify_issue_exists(issue_id: str, issue_title: str, issue_type: str) -> boo
         if not token:
             return False
         
-        url = "https://api.zenhub.com/public/graphql"
-        
         query = """
         query VerifyIssue($issueId: ID!) {
           node(id: $issueId) {
@@ -45,17 +47,7 @@ def verify_issue_exists(issue_id: str, issue_title: str, issue_type: str) -> boo
         }
         """
         
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.post(
-            url,
-            json={"query": query, "variables": {"issueId": issue_id}},
-            headers=headers,
-            timeout=10
-        )
+        response = post_graphql(query, {"issueId": issue_id}, token=token, timeout=10)
         
         data = response.json()
         if data.get("data", {}).get("node"):
@@ -103,10 +95,6 @@ def create_zenhub_project_issue(
             frappe.logger().error(f"[create_zenhub_project_issue] No Zenhub token found")
             return None
 
-        # Zenhub Project issue type ID (level 2)
-        # This is the ID for issues of type "Project"
-        PROJECT_ISSUE_TYPE_ID = "Z2lkOi8vcmFwdG9yL0lzc3VlVHlwZS8yMzY4MTM"
-
         # GraphQL mutation to create issue of type Project
         # NOTE: CreateIssuePayload doesn't have an 'errors' field - errors are at top level
         mutation = """
@@ -237,8 +225,6 @@ def get_workspace_repositories(workspace_id: str) -> Dict[str, Any]:
                 "error_type": "configuration_error"
             }
         
-        url = "https://api.zenhub.com/public/graphql"
-        
         # GraphQL query to get repositories from workspace
         query = """
         query GetWorkspaceRepositories($workspaceId: ID!) {
@@ -260,17 +246,7 @@ def get_workspace_repositories(workspace_id: str) -> Dict[str, Any]:
         }
         """
         
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.post(
-            url,
-            json={"query": query, "variables": {"workspaceId": workspace_id}},
-            headers=headers,
-            timeout=30
-        )
+        response = post_graphql(query, {"workspaceId": workspace_id}, token=token, timeout=30)
         response.raise_for_status()
         data = response.json()
         
@@ -354,8 +330,6 @@ def get_workspace_repository(workspace_id: str) -> Optional[str]:
         if not token:
             return None
 
-        url = "https://api.zenhub.com/public/graphql"
-
         query = """
         query GetWorkspaceRepository($workspaceId: ID!) {
             workspace(id: $workspaceId) {
@@ -371,17 +345,7 @@ def get_workspace_repository(workspace_id: str) -> Optional[str]:
         }
         """
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-
-        response = requests.post(
-            url,
-            json={"query": query, "variables": {"workspaceId": workspace_id}},
-            headers=headers,
-            timeout=30
-        )
+        response = post_graphql(query, {"workspaceId": workspace_id}, token=token, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -413,7 +377,6 @@ def get_workspace_repository(workspace_id: str) -> Optional[str]:
             
             token = get_zenhub_token()
             if token:
-                url = "https://api.zenhub.com/public/graphql"
                 query = """
                 query GetWorkspaceRepos($workspaceId: ID!) {
                   workspace(id: $workspaceId) {
@@ -431,17 +394,7 @@ def get_workspace_repository(workspace_id: str) -> Optional[str]:
                 }
                 """
                 
-                headers = {
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                }
-                
-                response = requests.post(
-                    url,
-                    json={"query": query, "variables": {"workspaceId": workspace_id}},
-                    headers=headers,
-                    timeout=30
-                )
+                response = post_graphql(query, {"workspaceId": workspace_id}, token=token, timeout=30)
                 response.raise_for_status()
                 data = response.json()
                 
@@ -769,7 +722,6 @@ def generate_zenhub_project_id(project_id: str) -> dict:
                 from frappe_devsecops_dashboard.api.zenhub import get_zenhub_token
                 token = get_zenhub_token()
                 if token:
-                    url = "https://api.zenhub.com/public/graphql"
                     query = """
                     query GetIssue($issueId: ID!) {
                       node(id: $issueId) {
@@ -785,16 +737,7 @@ def generate_zenhub_project_id(project_id: str) -> dict:
                       }
                     }
                     """
-                    headers = {
-                        "Authorization": f"Bearer {token}",
-                        "Content-Type": "application/json"
-                    }
-                    response = requests.post(
-                        url,
-                        json={"query": query, "variables": {"issueId": zenhub_issue_id}},
-                        headers=headers,
-                        timeout=10
-                    )
+                    response = post_graphql(query, {"issueId": zenhub_issue_id}, token=token, timeout=10)
                     data = response.json()
                     if data.get("data", {}).get("node"):
                         issue_data = data["data"]["node"]
@@ -7,7 +7,7 @@ Creates a Zenhub Issue of type Epic when a Task is saved
 """
 
 import frappe
-import requests
+from frappe_devsecops_dashboard.api.zenhub_client import post_graphql
 import time
 from typing import Optional
 from frappe_devsecops_dashboard.api.zenhub_graphql_logger import execute_graphql_query_with_logging
@@ -44,8 +44,6 @@ def create_zenhub_epic_issue(
             frappe.logger().error(f"[create_zenhub_epic_issue] No Zenhub token found")
             return None
 
-        url = "https://api.zenhub.com/public/graphql"
-
         # Zenhub Epic issue type ID (level 1)
         # This is the ID for issues of type "Epic"
         # Note: 236811 = Epic (Level 1), 236812 = Initiative (Level 0), 236813 = Project (Level 2)
@@ -82,11 +80,6 @@ def create_zenhub_epic_issue(
             frappe.logger().error(f"[create_zenhub_epic_issue] Repository ID must be a Zenhub ID (starts with Z2lk), not a GitHub URL")
             return None
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-
         frappe.logger().info(f"[create_zenhub_epic_issue] Creating Zenhub Epic issue: {issue_title}")
         frappe.logger().info(f"[create_zenhub_epic_issue] Repository ID: {repository_id}")
         frappe.logger().info(f"[create_zenhub_epic_issue] Parent Issue ID: {parent_issue_id}")
@@ -156,7 +149,6 @@ def create_zenhub_epic_issue(
             from frappe_devsecops_dashboard.api.zenhub import get_zenhub_token
             token = get_zenhub_token()
             if token:
-                url = "https://api.zenhub.com/public/graphql"
                 query = """
                 query VerifyIssue($issueId: ID!) {
                   node(id: $issueId) {
@@ -168,16 +160,7 @@ def create_zenhub_epic_issue(
                   }
                 }
                 """
-                headers = {
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                }
-                response = requests.post(
-                    url,
-                    json={"query": query, "variables": {"issueId": issue_id}},
-                    headers=headers,
-                    timeout=10
-                )
+                response = post_graphql(query, {"issueId": issue_id}, token=token, timeout=10)
                 data = response.json()
                 if data.get("data", {}).get("node"):
                     verified_issue = data["data"]["node"]
@@ -416,7 +399,6 @@ def generate_zenhub_epic_id(task_id: str) -> dict:
             try:
                 from frappe_devsecops_dashboard.api.zenhub import get_zenhub_token
                 token = get_zenhub_token()
-                url = "https://api.zenhub.com/public/graphql"
                 query = """
                 query GetIssue($issueId: ID!) {
                   node(id: $issueId) {
@@ -428,11 +410,7 @@ def generate_zenhub_epic_id(task_id: str) -> dict:
                   }
                 }
                 """
-                headers = {
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                }
-                response = requests.post(url, json={"query": query, "variables": {"issueId": zenhub_epic_id}}, headers=headers, timeout=10)
+                response = post_graphql(query, {"issueId": zenhub_epic_id}, token=token, timeout=10)
                 data = response.json()
                 if data.get("data", {}).get("node"):
                     issue_number = data["data"]["node"].get("number")
@@ -0,0 +1,47 @@
+# Copyright (c) 2026, Salim and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_days, getdate, today
+
+from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_api_log_daily_rollup.zenhub_api_log_daily_rollup import (
+	ROLLUP_DOCTYPE,
+	build_daily_rollups
+)
+
+
+class TestZenhubAPILogDailyRollup(FrappeTestCase):
+	def test_rollup_counts_complete_days_once(self):
+		"""Yesterday's logs are aggregated per operation, and a second run adds nothing"""
+		frappe.db.delete(ROLLUP_DOCTYPE)
+		operation = f"testRollup{frappe.generate_hash(length=8)}"
+		yesterday = f"{add_days(today(), -1)} 12:00:00"
+
+		for status, response_time in (("Success", 100), ("Success", 300), ("Failed", 50)):
+			log = frappe.get_doc({
+				"doctype": "Zenhub GraphQL API Log",
+				"reference_doctype": "DocType",
+				"reference_docname": "Project",
+				"operation_type": "Query",
+				"graphql_operation": operation,
+				"status": status,
+				"response_time_ms": response_time
+			}).insert(ignore_permissions=True)
+			frappe.db.set_value("Zenhub GraphQL API Log", log.name, "creation", yesterday, update_modified=False)
+
+		build_daily_rollups()
+		rollup = frappe.get_all(
+			ROLLUP_DOCTYPE,
+			filters={"graphql_operation": operation},
+			fields=["date", "total_calls", "success_calls", "failed_calls", "avg_response_time_ms", "max_response_time_ms"]
+		)
+
+		self.assertEqual(len(rollup), 1)
+		self.assertEqual(getdate(rollup[0].date), getdate(add_days(today(), -1)))
+		self.assertEqual(rollup[0].total_calls, 3)
+		self.assertEqual(rollup[0].success_calls, 2)
+		self.assertEqual(rollup[0].failed_calls, 1)
+		self.assertEqual(rollup[0].max_response_time_ms, 300)
+
+		self.assertEqual(build_daily_rollups(), 0)
@@ -0,0 +1,104 @@
+# Copyright (c) 2026, Salim and contributors
+# License: MIT
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import add_days, flt, getdate, today
+from typing import Optional
+
+
+ROLLUP_DOCTYPE = "Zenhub API Log Daily Rollup"
+
+ROLLUP_FIELDS = [
+	"name",
+	"date",
+	"graphql_operation",
+	"operation_type",
+	"total_calls",
+	"success_calls",
+	"failed_calls",
+	"avg_response_time_ms",
+	"max_response_time_ms",
+	"creation",
+	"modified",
+	"owner",
+	"modified_by"
+]
+
+
+class ZenhubAPILogDailyRollup(Document):
+	"""Per-day, per-operation call counts kept after raw Zenhub GraphQL API Log rows are purged"""
+	pass
+
+
+def get_last_rollup_date():
+	"""Get the most recent day that has been rolled up (None if none has)"""
+	last = frappe.db.sql(f"select max(`date`) from `tab{ROLLUP_DOCTYPE}`")[0][0]
+	return getdate(last) if last else None
+
+
+def build_daily_rollups() -> int:
+	"""
+	Roll up every complete day of API logs not rolled up yet
+
+	Days after the last rolled-up day and before today are aggregated per
+	GraphQL operation with one GROUP BY query and written with one bulk
+	insert. Each day is rolled up once, before its raw rows can be purged.
+
+	Returns:
+		Number of rollup rows written
+	"""
+	last_rollup_date = get_last_rollup_date()
+	conditions = ["creation < %(end)s"]
+	values = {"end": today()}
+	if last_rollup_date:
+		conditions.append("creation >= %(start)s")
+		values["start"] = add_days(last_rollup_date, 1)
+
+	rows = frappe.db.sql(
+		f"""
+		select
+			date(creation) as date,
+			graphql_operation,
+			operation_type,
+			count(*) as total_calls,
+			sum(case when status = 'Success' then 1 else 0 end) as success_calls,
+			sum(case when status in ('Failed', 'Error', 'Timeout') then 1 else 0 end) as failed_calls,
+			avg(response_time_ms) as avg_response_time_ms,
+			max(response_time_ms) as max_response_time_ms
+		from `tabZenhub GraphQL API Log`
+		where {" and ".join(conditions)}
+		group by date(creation), graphql_operation, operation_type
+		""",
+		values,
+		as_dict=True
+	)
+	if not rows:
+		return 0
+
+	now = frappe.utils.now()
+	frappe.db.bulk_insert(
+		ROLLUP_DOCTYPE,
+		ROLLUP_FIELDS,
+		[
+			[
+				frappe.generate_hash(length=10),
+				row.date,
+				row.graphql_operation,
+				row.operation_type,
+				row.total_calls,
+				row.success_calls or 0,
+				row.failed_calls or 0,
+				flt(row.avg_response_time_ms, 2),
+				row.max_response_time_ms or 0,
+				now,
+				now,
+				"Administrator",
+				"Administrator"
+			]
+			for row in rows
+		]
+	)
+	frappe.db.commit()
+
+	return len(rows)
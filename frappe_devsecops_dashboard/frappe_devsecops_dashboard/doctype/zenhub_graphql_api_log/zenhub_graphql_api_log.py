@@ -3,10 +3,45 @@
 
 import frappe
 from frappe.model.document import Document
+import base64
 import json
+import random
 import traceback
+import zlib
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+
+# Log records are buffered in a Redis list and written in bulk by flush_zenhub_api_log_buffer
+API_LOG_BUFFER_KEY = "zenhub_api_log_buffer"
+API_LOG_FLUSH_BATCH_SIZE = 500
+# Buffer length at which a flush is queued without waiting for the scheduler
+API_LOG_FLUSH_THRESHOLD = 200
+API_LOG_FLUSH_JOB_ID = "zenhub_api_log_flush"
+API_LOG_NAME_PREFIX = "ZHLOG-"
+# Records that could not be inserted even one at a time, kept for inspection
+API_LOG_DEAD_LETTER_KEY = "zenhub_api_log_dead_letter"
+API_LOG_DEAD_LETTER_MAX_LENGTH = 1000
+
+# Payloads longer than this are stored zlib-compressed and base64-encoded
+API_LOG_COMPRESSION_THRESHOLD = 1024
+API_LOG_COMPRESSED_PREFIX = "zlib+base64:"
+
+# Rows deleted per transaction by purge_expired_api_logs
+API_LOG_PURGE_CHUNK_SIZE = 5000
+
+# Defaults when Zenhub Settings does not set them (retention in days, 0 keeps logs forever)
+DEFAULT_SUCCESS_SAMPLE_RATE = 100
+DEFAULT_MAX_PAYLOAD_LENGTH = 10000
+DEFAULT_SUCCESS_RETENTION_DAYS = 7
+DEFAULT_FAILURE_RETENTION_DAYS = 30
+
+API_LOG_FIELDS = [
+	"name", "reference_doctype", "reference_docname", "operation_type", "graphql_operation",
+	"status", "api_endpoint", "request_method", "http_status_code", "response_time_ms",
+	"request_payload", "response_data", "error_message", "error_traceback",
+	"created_by", "creation_timestamp", "creation", "modified", "owner", "modified_by"
+]
 
 
 class ZenhubGraphQLAPILog(Document):
@@ -20,14 +55,19 @@ class ZenhubGraphQLAPILog(Document):
 		if not self.creation_timestamp:
 			self.creation_timestamp = frappe.utils.now()
 
+	def onload(self):
+		"""Show compressed payloads as readable JSON"""
+		self.request_payload = decode_log_payload(self.request_payload)
+		self.response_data = decode_log_payload(self.response_data)
+
 	def validate(self):
 		"""Validate the log entry"""
-		# Ensure JSON fields are valid JSON strings
-		if self.request_payload and isinstance(self.request_payload, dict):
-			self.request_payload = json.dumps(self.request_payload, indent=2)
+		# Ensure JSON fields are valid JSON strings, compressed when large
+		if self.request_payload:
+			self.request_payload = serialize_log_payload(self.request_payload)
 
-		if self.response_data and isinstance(self.response_data, dict):
-			self.response_data = json.dumps(self.response_data, indent=2)
+		if self.response_data:
+			self.response_data = serialize_log_payload(self.response_data)
 
 
 def create_zenhub_api_log(
@@ -46,7 +86,10 @@ def create_zenhub_api_log(
 	request_method: str = "POST"
 ) -> str:
 	"""
-	Create a Zenhub GraphQL API Log entry
+	Create a Zenhub GraphQL API Log entry immediately and commit it
+
+	Use this only when the log name is needed right away (e.g. to update it
+	later); per-call logging goes through queue_zenhub_api_log.
 
 	Args:
 		reference_doctype: DocType being operated on (Software Product, Project, Task)
@@ -67,9 +110,9 @@ def create_zenhub_api_log(
 		Name of the created log document
 	"""
 	try:
-		# Format payloads as JSON strings
-		request_json = json.dumps(request_payload, indent=2) if request_payload else None
-		response_json = json.dumps(response_data, indent=2) if response_data else None
+		# Format payloads as compact, truncated JSON strings
+		request_json = serialize_log_payload(request_payload)
+		response_json = serialize_log_payload(response_data)
 
 		# Create the log document - IMPORTANT: reference_doctype must be set first for Dynamic Link validation
 		log_doc = frappe.get_doc({
@@ -101,8 +144,8 @@ def create_zenhub_api_log(
 		if error_traceback:
 			log_doc.error_traceback = error_traceback
 
-		# Insert without triggering additional hooks
-		log_doc.insert(ignore_permissions=True)
+		# Insert without triggering additional hooks; named from the same series as buffered logs
+		log_doc.insert(ignore_permissions=True, set_name=reserve_api_log_names(1)[0])
 		frappe.db.commit()
 
 		return log_doc.name
@@ -125,14 +168,11 @@ def log_zenhub_success(
 	response_data: Dict[str, Any],
 	http_status_code: int = 200,
 	response_time_ms: Optional[int] = None
-) -> str:
+) -> None:
 	"""
-	Helper function to log successful Zenhub API calls
-
-	Returns:
-		Name of the created log document
+	Helper function to log successful Zenhub API calls (buffered and sampled)
 	"""
-	return create_zenhub_api_log(
+	return queue_zenhub_api_log(
 		reference_doctype=reference_doctype,
 		reference_docname=reference_docname,
 		operation_type=operation_type,
@@ -155,14 +195,11 @@ def log_zenhub_error(
 	http_status_code: Optional[int] = None,
 	response_data: Optional[Dict[str, Any]] = None,
 	error_traceback: Optional[str] = None
-) -> str:
+) -> None:
 	"""
-	Helper function to log failed Zenhub API calls
-
-	Returns:
-		Name of the created log document
+	Helper function to log failed Zenhub API calls (buffered, never sampled)
 	"""
-	return create_zenhub_api_log(
+	return queue_zenhub_api_log(
 		reference_doctype=reference_doctype,
 		reference_docname=reference_docname,
 		operation_type=operation_type,
@@ -174,3 +211,382 @@ def log_zenhub_error(
 		error_message=error_message,
 		error_traceback=error_traceback or traceback.format_exc()
 	)
+
+
+def queue_zenhub_api_log(
+	reference_doctype: str,
+	reference_docname: str,
+	operation_type: str,
+	graphql_operation: str,
+	status: str,
+	request_payload: Optional[Dict[str, Any]] = None,
+	response_data: Optional[Dict[str, Any]] = None,
+	http_status_code: Optional[int] = None,
+	response_time_ms: Optional[int] = None,
+	error_message: Optional[str] = None,
+	error_traceback: Optional[str] = None,
+	api_endpoint: Optional[str] = None,
+	request_method: str = "POST"
+) -> None:
+	"""
+	Buffer a Zenhub GraphQL API Log entry for a bulk insert
+
+	Successful calls are sampled at the Zenhub Settings sample rate; failures
+	are always logged. Payloads are serialized compactly and truncated. The
+	record is pushed to a Redis list and written by flush_zenhub_api_log_buffer
+	(every minute, or sooner when the buffer grows), so the calling request
+	does not open a write transaction. Without Redis the log is created
+	immediately instead.
+
+	Args:
+		Same as create_zenhub_api_log
+	"""
+	try:
+		settings = get_api_log_settings()
+		if status == "Success" and random.random() * 100 >= settings["success_sample_rate"]:
+			return
+
+		now = frappe.utils.now()
+		user = frappe.session.user
+		record = {
+			"reference_doctype": reference_doctype,
+			"reference_docname": reference_docname,
+			"operation_type": operation_type,
+			"graphql_operation": graphql_operation,
+			"status": status,
+			"api_endpoint": api_endpoint or "https://api.zenhub.com/public/graphql",
+			"request_method": request_method,
+			"http_status_code": http_status_code,
+			"response_time_ms": response_time_ms,
+			"request_payload": serialize_log_payload(request_payload, settings["max_payload_length"]),
+			"response_data": serialize_log_payload(response_data, settings["max_payload_length"]),
+			"error_message": error_message,
+			"error_traceback": error_traceback,
+			"created_by": user,
+			"creation_timestamp": now,
+			"creation": now,
+			"modified": now,
+			"owner": user,
+			"modified_by": user
+		}
+	except Exception as e:
+		frappe.log_error(
+			title="Zenhub API Log Creation Failed",
+			message=f"Failed to prepare API log: {str(e)}\n{traceback.format_exc()}"
+		)
+		return
+
+	try:
+		cache = frappe.cache()
+		length = cache.rpush(cache.make_key(API_LOG_BUFFER_KEY), json.dumps(record, default=str))
+	except Exception:
+		# Redis unavailable: write directly so the entry is not lost
+		create_zenhub_api_log(
+			reference_doctype=reference_doctype,
+			reference_docname=reference_docname,
+			operation_type=operation_type,
+			graphql_operation=graphql_operation,
+			status=status,
+			request_payload=request_payload,
+			response_data=response_data,
+			http_status_code=http_status_code,
+			response_time_ms=response_time_ms,
+			error_message=error_message,
+			error_traceback=error_traceback,
+			api_endpoint=api_endpoint,
+			request_method=request_method
+		)
+		return
+
+	if length >= API_LOG_FLUSH_THRESHOLD:
+		try:
+			frappe.enqueue(
+				"frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_graphql_api_log.zenhub_graphql_api_log.flush_zenhub_api_log_buffer",
+				queue="short",
+				job_id=API_LOG_FLUSH_JOB_ID,
+				deduplicate=True
+			)
+		except Exception:
+			pass  # The scheduled flush picks the buffer up
+
+
+def flush_zenhub_api_log_buffer(batch_size: int = API_LOG_FLUSH_BATCH_SIZE) -> int:
+	"""
+	Write buffered API log records with multi-row inserts (scheduled every minute)
+
+	A batch that fails is retried record by record; records that still fail
+	go to the dead-letter list rather than back into the buffer.
+
+	Args:
+		batch_size: Records taken from the buffer and inserted per batch
+
+	Returns:
+		Number of log entries written
+	"""
+	cache = frappe.cache()
+	buffer_key = cache.make_key(API_LOG_BUFFER_KEY)
+	written = 0
+
+	while True:
+		pipeline = cache.pipeline()
+		pipeline.lrange(buffer_key, 0, batch_size - 1)
+		pipeline.ltrim(buffer_key, batch_size, -1)
+		raw_records, _trimmed = pipeline.execute()
+		if not raw_records:
+			break
+
+		records = []
+		for raw in raw_records:
+			try:
+				records.append(json.loads(raw))
+			except (TypeError, ValueError):
+				continue  # Skip a corrupted entry rather than the whole batch
+
+		if records:
+			try:
+				insert_api_log_records(records)
+				frappe.db.commit()
+				written += len(records)
+			except Exception:
+				# One bad record must not hold back the rest: retry them one by one
+				frappe.db.rollback()
+				written += insert_api_log_records_individually(records)
+
+		if len(raw_records) < batch_size:
+			break
+
+	return written
+
+
+def insert_api_log_records(records: List[Dict[str, Any]]):
+	"""Insert buffered log records with one multi-row insert (not committed)"""
+	names = reserve_api_log_names(len(records))
+	frappe.db.bulk_insert(
+		"Zenhub GraphQL API Log",
+		API_LOG_FIELDS,
+		[
+			[name] + [record.get(field) for field in API_LOG_FIELDS[1:]]
+			for name, record in zip(names, records)
+		]
+	)
+
+
+def insert_api_log_records_individually(records: List[Dict[str, Any]]) -> int:
+	"""
+	Insert records one at a time after their batch failed
+
+	Records that still fail are moved to the dead-letter list (capped at
+	API_LOG_DEAD_LETTER_MAX_LENGTH) and reported once, instead of being put
+	back in the buffer where they would fail every flush.
+
+	Args:
+		records: Decoded buffered records
+
+	Returns:
+		Number of records written
+	"""
+	written = 0
+	failed = []
+	for record in records:
+		try:
+			insert_api_log_records([record])
+			frappe.db.commit()
+			written += 1
+		except Exception as e:
+			frappe.db.rollback()
+			failed.append((record, str(e)))
+
+	if failed:
+		try:
+			cache = frappe.cache()
+			dead_letter_key = cache.make_key(API_LOG_DEAD_LETTER_KEY)
+			cache.rpush(dead_letter_key, *[json.dumps(record, default=str) for record, _error in failed])
+			cache.ltrim(dead_letter_key, -API_LOG_DEAD_LETTER_MAX_LENGTH, -1)
+		except Exception:
+			pass  # The errors are still logged below
+
+		frappe.log_error(
+			title="Zenhub API Log Flush Failed",
+			message=f"Dropped {len(failed)} API log record(s) that could not be inserted:\n"
+			+ "\n".join(f"{record.get('graphql_operation')}: {error}" for record, error in failed[:20])
+		)
+
+	return written
+
+
+def reserve_api_log_names(count: int) -> List[str]:
+	"""
+	Reserve count ZHLOG-#### names from the naming series
+
+	Each number comes from frappe.model.naming.getseries, which locks the
+	series row, so concurrent flushes never hand out the same name. The series
+	is seeded from the highest existing log number the first time it is used.
+
+	Args:
+		count: Number of names needed
+
+	Returns:
+		List of log names, in order
+	"""
+	from frappe.model.naming import getseries
+
+	if not frappe.db.sql("select `name` from `tabSeries` where `name` = %s", API_LOG_NAME_PREFIX):
+		seed_api_log_series()
+
+	return [f"{API_LOG_NAME_PREFIX}{getseries(API_LOG_NAME_PREFIX, 4)}" for _ in range(count)]
+
+
+def seed_api_log_series():
+	"""
+	Raise the ZHLOG- series to the highest existing log number
+
+	Logs named before the series existed (or by another series key) are
+	counted, so new names never collide with them. The upsert is atomic and
+	never lowers the series, so concurrent or repeated seeding is safe.
+	"""
+	prefix_length = len(API_LOG_NAME_PREFIX)
+	last = frappe.db.sql(
+		"""
+		select max(cast(substring(`name`, %s) as unsigned))
+		from `tabZenhub GraphQL API Log`
+		where `name` like %s
+		""",
+		(prefix_length + 1, f"{API_LOG_NAME_PREFIX}%")
+	)[0][0]
+
+	frappe.db.sql(
+		"""
+		insert into `tabSeries` (`name`, `current`) values (%s, %s)
+		on duplicate key update `current` = greatest(`current`, values(`current`))
+		""",
+		(API_LOG_NAME_PREFIX, frappe.utils.cint(last))
+	)
+
+
+def get_api_log_settings() -> Dict[str, Any]:
+	"""Get API log sampling, payload length and retention settings from Zenhub Settings"""
+	try:
+		settings = frappe.get_cached_doc("Zenhub Settings")
+	except Exception:
+		settings = frappe._dict()
+
+	sample_rate = settings.get("api_log_success_sample_rate")
+	success_days = settings.get("api_log_success_retention_days")
+	failure_days = settings.get("api_log_failure_retention_days")
+
+	return {
+		"success_sample_rate": DEFAULT_SUCCESS_SAMPLE_RATE if sample_rate is None else float(sample_rate),
+		"max_payload_length": frappe.utils.cint(settings.get("api_log_max_payload_length")) or DEFAULT_MAX_PAYLOAD_LENGTH,
+		"success_retention_days": DEFAULT_SUCCESS_RETENTION_DAYS if success_days is None else frappe.utils.cint(success_days),
+		"failure_retention_days": DEFAULT_FAILURE_RETENTION_DAYS if failure_days is None else frappe.utils.cint(failure_days)
+	}
+
+
+def serialize_log_payload(payload: Any, max_length: Optional[int] = None) -> Optional[str]:
+	"""
+	Serialize a request/response payload for storage
+
+	Payloads are written as compact JSON, truncated to max_length and, when
+	still large, compressed (see encode_log_payload). Already encoded values
+	are returned unchanged.
+
+	Args:
+		payload: Payload to serialize (strings are stored as-is)
+		max_length: Maximum characters kept (defaults to the Zenhub Settings limit)
+
+	Returns:
+		Stored string, or None for an empty payload
+	"""
+	if not payload:
+		return None
+
+	if isinstance(payload, str) and payload.startswith(API_LOG_COMPRESSED_PREFIX):
+		return payload
+
+	text = payload if isinstance(payload, str) else json.dumps(payload, separators=(",", ":"), default=str)
+	max_length = max_length or get_api_log_settings()["max_payload_length"]
+	if len(text) > max_length:
+		text = f"{text[:max_length]}... [truncated {len(text) - max_length} characters]"
+
+	return encode_log_payload(text)
+
+
+def encode_log_payload(text: str) -> str:
+	"""Compress a payload above API_LOG_COMPRESSION_THRESHOLD as zlib + base64"""
+	if len(text) <= API_LOG_COMPRESSION_THRESHOLD:
+		return text
+
+	encoded = API_LOG_COMPRESSED_PREFIX + base64.b64encode(zlib.compress(text.encode("utf-8"), 6)).decode("ascii")
+	return encoded if len(encoded) < len(text) else text
+
+
+def decode_log_payload(value: Optional[str]) -> Optional[str]:
+	"""Decode a stored payload back to JSON text (plain payloads are returned as-is)"""
+	if not value or not isinstance(value, str) or not value.startswith(API_LOG_COMPRESSED_PREFIX):
+		return value
+
+	try:
+		return zlib.decompress(base64.b64decode(value[len(API_LOG_COMPRESSED_PREFIX):])).decode("utf-8")
+	except (ValueError, zlib.error):
+		return value  # Corrupted payload: show it as stored
+
+
+def purge_expired_api_logs(chunk_size: int = API_LOG_PURGE_CHUNK_SIZE) -> int:
+	"""
+	Delete API logs past their retention window (scheduled daily)
+
+	Complete days are rolled up into Zenhub API Log Daily Rollup first, and
+	only rolled-up days are purged. Successful and failed calls use separate
+	retention windows from Zenhub Settings (0 keeps them forever). Rows are
+	deleted in chunks with a commit after each, so locks stay short.
+
+	Args:
+		chunk_size: Rows deleted per transaction
+
+	Returns:
+		Number of log entries deleted
+	"""
+	from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_api_log_daily_rollup.zenhub_api_log_daily_rollup import (
+		build_daily_rollups,
+		get_last_rollup_date
+	)
+
+	build_daily_rollups()
+	last_rollup_date = get_last_rollup_date()
+	if not last_rollup_date:
+		return 0
+
+	# Rows after the last rolled-up day are kept until they are rolled up
+	rolled_up_until = frappe.utils.add_days(last_rollup_date, 1)
+	settings = get_api_log_settings()
+	deleted = 0
+
+	for status_filter, retention_days in (
+		(["=", "Success"], settings["success_retention_days"]),
+		(["!=", "Success"], settings["failure_retention_days"])
+	):
+		if retention_days <= 0:
+			continue
+
+		cutoff = min(
+			frappe.utils.getdate(frappe.utils.add_days(frappe.utils.today(), -retention_days)),
+			frappe.utils.getdate(rolled_up_until)
+		)
+		filters = {"status": status_filter, "creation": ["<", cutoff]}
+
+		while True:
+			names = frappe.get_all(
+				"Zenhub GraphQL API Log",
+				filters=filters,
+				pluck="name",
+				order_by="creation asc",
+				limit_page_length=chunk_size
+			)
+			if not names:
+				break
+
+			frappe.db.delete("Zenhub GraphQL API Log", {"name": ["in", names]})
+			frappe.db.commit()
+			deleted += len(names)
+
+	return deleted
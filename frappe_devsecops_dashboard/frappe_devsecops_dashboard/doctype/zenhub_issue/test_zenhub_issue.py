@@ -0,0 +1,89 @@
+# Copyright (c) 2026, Salim and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_issue.zenhub_issue import (
+	ISSUE_DOCTYPE,
+	get_mirrored_issues,
+	get_mirrored_state_totals,
+	is_workspace_mirrored,
+	sync_workspace_issues
+)
+
+
+def make_issue(issue_id, state="OPEN", estimate=2, assignees=("dev1",)):
+	return {
+		"id": issue_id,
+		"title": f"Issue {issue_id}",
+		"number": int(issue_id.rsplit("-", 1)[-1]),
+		"state": state,
+		"estimate": {"value": estimate},
+		"assignees": {"nodes": [{"id": f"id-{login}", "login": login, "name": login.title()} for login in assignees]},
+		"epic": {"issue": {"id": "epic-1", "title": "Epic One"}}
+	}
+
+
+def fake_pages(issues):
+	def iter_issues(workspace_id, workspace_info=None, **kwargs):
+		if workspace_info is not None:
+			workspace_info.update({"id": workspace_id, "name": "Mirror Workspace"})
+		yield from issues
+	return iter_issues
+
+
+class TestZenhubIssue(FrappeTestCase):
+	def setUp(self):
+		self.workspace_id = f"test-mirror-{frappe.generate_hash(length=8)}"
+
+	def sync(self, issues):
+		with patch("frappe_devsecops_dashboard.api.zenhub.iter_workspace_issues", side_effect=fake_pages(issues)):
+			return sync_workspace_issues(self.workspace_id)
+
+	def test_sync_writes_only_changes(self):
+		"""A second sync rewrites changed issues, removes missing ones and skips the rest"""
+		first = self.sync([make_issue("i-1"), make_issue("i-2"), make_issue("i-3")])
+		self.assertEqual(first, {"inserted": 3, "updated": 0, "removed": 0, "unchanged": 0})
+		unchanged_name = frappe.db.get_value(ISSUE_DOCTYPE, {"workspace_id": self.workspace_id, "zenhub_issue_id": "i-1"})
+
+		second = self.sync([make_issue("i-1"), make_issue("i-2", state="CLOSED", estimate=5)])
+		self.assertEqual(second, {"inserted": 0, "updated": 1, "removed": 1, "unchanged": 1})
+		self.assertEqual(
+			frappe.db.get_value(ISSUE_DOCTYPE, {"workspace_id": self.workspace_id, "zenhub_issue_id": "i-1"}),
+			unchanged_name
+		)
+
+		issues = get_mirrored_issues(self.workspace_id)
+		self.assertEqual([i.zenhub_issue_id for i in issues], ["i-1", "i-2"])
+		self.assertEqual(issues[0].workspace_name, "Mirror Workspace")
+		self.assertEqual([a.login for a in issues[1].assignees], ["dev1"])
+
+	def test_reads_from_mirror(self):
+		"""Filters and state totals come straight from SQL"""
+		self.sync([
+			make_issue("i-1", state="CLOSED", estimate=3),
+			make_issue("i-2", estimate=2, assignees=()),
+			make_issue("i-3", estimate=1)
+		])
+
+		self.assertTrue(is_workspace_mirrored(self.workspace_id))
+		self.assertEqual(len(get_mirrored_issues(self.workspace_id, {"epic_id": "epic-1"})), 3)
+
+		totals = {row.state: row for row in get_mirrored_state_totals(self.workspace_id)}
+		self.assertEqual(totals["closed"].issues, 1)
+		self.assertEqual(totals["open"].issues, 2)
+		self.assertEqual(float(totals["open"].story_points), 3.0)
+
+	def test_unsynced_workspace_is_not_mirrored(self):
+		"""Workspaces that never synced fall back to live Zenhub queries"""
+		self.assertFalse(is_workspace_mirrored(self.workspace_id))
+
+	def test_empty_workspace_is_mirrored(self):
+		"""A synced workspace without issues is served from the mirror too"""
+		self.assertEqual(self.sync([]), {"inserted": 0, "updated": 0, "removed": 0, "unchanged": 0})
+
+		self.assertTrue(is_workspace_mirrored(self.workspace_id))
+		self.assertEqual(get_mirrored_issues(self.workspace_id), [])
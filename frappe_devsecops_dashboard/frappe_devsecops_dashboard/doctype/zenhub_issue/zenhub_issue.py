@@ -0,0 +1,340 @@
+# Copyright (c) 2026, Salim and contributors
+# License: MIT
+
+import hashlib
+import json
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import add_to_date, get_datetime, now_datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+ISSUE_DOCTYPE = "Zenhub Issue"
+ASSIGNEE_DOCTYPE = "Zenhub Issue Assignee"
+
+# A workspace is read from the mirror while its last sync is younger than this;
+# older mirrors (sync not running or failing) fall back to live Zenhub queries
+ISSUE_MIRROR_MAX_AGE = 3600
+ISSUE_MIRROR_SYNC_JOB_PREFIX = "zenhub_issue_mirror_sync::"
+# Last successful sync per workspace ({synced_at, workspace_name}), kept outside
+# the issue rows so a workspace without issues still counts as synced
+ISSUE_MIRROR_SYNC_STATE_KEY_PREFIX = "zenhub_issue_mirror_sync_state::"
+ISSUE_MIRROR_WRITE_CHUNK_SIZE = 500
+
+ISSUE_FIELDS = [
+	"name",
+	"zenhub_issue_id",
+	"workspace_id",
+	"workspace_name",
+	"title",
+	"issue_number",
+	"issue_type",
+	"html_url",
+	"state",
+	"estimate",
+	"epic_id",
+	"epic_title",
+	"repository_name",
+	"last_synced_at",
+	"content_hash",
+	"creation",
+	"modified",
+	"owner",
+	"modified_by"
+]
+
+ISSUE_READ_FIELDS = [
+	"name",
+	"zenhub_issue_id",
+	"workspace_id",
+	"workspace_name",
+	"title",
+	"issue_number",
+	"issue_type",
+	"html_url",
+	"state",
+	"estimate",
+	"epic_id",
+	"epic_title",
+	"repository_name",
+	"last_synced_at"
+]
+
+ASSIGNEE_FIELDS = [
+	"name",
+	"parent",
+	"parenttype",
+	"parentfield",
+	"idx",
+	"assignee_id",
+	"login",
+	"assignee_name",
+	"creation",
+	"modified",
+	"owner",
+	"modified_by"
+]
+
+
+class ZenhubIssue(Document):
+	"""Local copy of a Zenhub issue, kept current by sync_zenhub_issue_mirror"""
+	pass
+
+
+def on_doctype_update():
+	"""Sync looks issues up by workspace and Zenhub ID together"""
+	frappe.db.add_index(ISSUE_DOCTYPE, ["workspace_id", "zenhub_issue_id"])
+
+
+def get_mirrored_workspace_ids() -> List[str]:
+	"""Workspace IDs configured on Software Products and Projects"""
+	workspace_ids = set(frappe.get_all(
+		"Software Product",
+		filters={"zenhub_workspace_id": ["is", "set"]},
+		pluck="zenhub_workspace_id"
+	))
+	if frappe.db.has_column("Project", "custom_zenhub_workspace_id"):
+		workspace_ids.update(frappe.get_all(
+			"Project",
+			filters={"custom_zenhub_workspace_id": ["is", "set"]},
+			pluck="custom_zenhub_workspace_id"
+		))
+	return sorted(workspace_ids)
+
+
+def sync_zenhub_issue_mirror():
+	"""Queue one mirror sync per configured workspace (scheduled)"""
+	for workspace_id in get_mirrored_workspace_ids():
+		queue_workspace_issue_sync(workspace_id)
+
+
+def queue_workspace_issue_sync(workspace_id: str):
+	"""Queue a background sync of one workspace; a sync already queued is not duplicated"""
+	try:
+		frappe.enqueue(
+			"frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_issue.zenhub_issue.sync_workspace_issues",
+			workspace_id=workspace_id,
+			queue="long",
+			job_id=f"{ISSUE_MIRROR_SYNC_JOB_PREFIX}{workspace_id}",
+			deduplicate=True
+		)
+	except Exception as e:
+		frappe.logger().warning(f"[zenhub_issue_mirror] Could not queue sync for {workspace_id}: {str(e)}")
+
+
+def sync_workspace_issues(workspace_id: str) -> Dict[str, int]:
+	"""
+	Bring the mirror of one workspace up to date
+
+	Every page of workspace issues is read, but only issues whose mirrored
+	fields changed (by content hash) are rewritten, and issues no longer in
+	the workspace are removed. Nothing is written if fetching fails part way.
+
+	Args:
+		workspace_id: Zenhub workspace ID
+
+	Returns:
+		Counts of inserted, updated, removed and unchanged issues
+	"""
+	from frappe_devsecops_dashboard.api.zenhub import iter_workspace_issues
+
+	existing = {
+		row.zenhub_issue_id: row
+		for row in frappe.get_all(
+			ISSUE_DOCTYPE,
+			filters={"workspace_id": workspace_id},
+			fields=["name", "zenhub_issue_id", "content_hash"]
+		)
+	}
+
+	now = now_datetime()
+	user = frappe.session.user
+	workspace = {}
+	seen = set()
+	issue_rows = []
+	assignee_rows = []
+	replaced = []
+
+	for issue in iter_workspace_issues(
+		workspace_id,
+		workspace_info=workspace,
+		reference_doctype="Software Product",
+		reference_docname=workspace_id,
+		operation_name="syncZenhubIssueMirror"
+	):
+		issue_id = issue.get("id")
+		if not issue_id or issue_id in seen:
+			continue
+		seen.add(issue_id)
+
+		fields, assignees = build_issue_record(issue)
+		content_hash = hashlib.sha1(
+			json.dumps([fields, assignees], sort_keys=True, default=str).encode()
+		).hexdigest()
+
+		current = existing.get(issue_id)
+		if current and current.content_hash == content_hash:
+			continue
+		if current:
+			replaced.append(current.name)
+
+		name = frappe.generate_hash(length=10)
+		issue_rows.append([
+			name, issue_id, workspace_id, workspace.get("name"), fields["title"], fields["issue_number"], fields["issue_type"],
+			fields["html_url"], fields["state"], fields["estimate"], fields["epic_id"], fields["epic_title"],
+			fields["repository_name"], now, content_hash, now, now, user, user
+		])
+		for idx, assignee in enumerate(assignees, start=1):
+			assignee_rows.append([
+				frappe.generate_hash(length=10), name, ISSUE_DOCTYPE, "assignees", idx,
+				assignee["assignee_id"], assignee["login"], assignee["assignee_name"], now, now, user, user
+			])
+
+	removed = [row.name for issue_id, row in existing.items() if issue_id not in seen]
+	stale = replaced + removed
+
+	for start in range(0, len(stale), ISSUE_MIRROR_WRITE_CHUNK_SIZE):
+		chunk = stale[start:start + ISSUE_MIRROR_WRITE_CHUNK_SIZE]
+		frappe.db.delete(ASSIGNEE_DOCTYPE, {"parent": ["in", chunk], "parenttype": ISSUE_DOCTYPE})
+		frappe.db.delete(ISSUE_DOCTYPE, {"name": ["in", chunk]})
+
+	frappe.db.bulk_insert(ISSUE_DOCTYPE, ISSUE_FIELDS, issue_rows, chunk_size=ISSUE_MIRROR_WRITE_CHUNK_SIZE)
+	frappe.db.bulk_insert(ASSIGNEE_DOCTYPE, ASSIGNEE_FIELDS, assignee_rows, chunk_size=ISSUE_MIRROR_WRITE_CHUNK_SIZE)
+
+	# Unchanged issues were confirmed too, so the whole workspace counts as synced
+	frappe.db.sql(
+		f"update `tab{ISSUE_DOCTYPE}` set last_synced_at = %s, workspace_name = %s where workspace_id = %s",
+		(now, workspace.get("name"), workspace_id)
+	)
+	frappe.db.commit()
+	set_mirror_sync_state(workspace_id, now, workspace.get("name"))
+
+	return {
+		"inserted": len(issue_rows) - len(replaced),
+		"updated": len(replaced),
+		"removed": len(removed),
+		"unchanged": len(seen) - len(issue_rows)
+	}
+
+
+def build_issue_record(issue: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+	"""Mirrored fields and assignees of a raw issue node from get_workspace_issues_query"""
+	estimate = issue.get("estimate")
+	epic_issue = (issue.get("epic") or {}).get("issue") or {}
+	fields = {
+		"title": issue.get("title"),
+		"issue_number": issue.get("number"),
+		"issue_type": issue.get("type"),
+		"html_url": issue.get("htmlUrl"),
+		"state": issue.get("state"),
+		"estimate": (estimate.get("value") if isinstance(estimate, dict) else None) or 0,
+		"epic_id": epic_issue.get("id"),
+		"epic_title": epic_issue.get("title"),
+		"repository_name": (issue.get("repository") or {}).get("name")
+	}
+	assignees = [
+		{"assignee_id": a.get("id"), "login": a.get("login"), "assignee_name": a.get("name")}
+		for a in (issue.get("assignees") or {}).get("nodes") or []
+		if a
+	]
+	return fields, assignees
+
+
+def set_mirror_sync_state(workspace_id: str, synced_at, workspace_name: Optional[str] = None):
+	"""Record a successful sync of a workspace"""
+	frappe.cache().set_value(
+		f"{ISSUE_MIRROR_SYNC_STATE_KEY_PREFIX}{workspace_id}",
+		{"synced_at": str(synced_at), "workspace_name": workspace_name}
+	)
+
+
+def get_mirror_sync_state(workspace_id: str) -> Dict[str, Any]:
+	"""Last successful sync of a workspace ({} if none is recorded)"""
+	return frappe.cache().get_value(f"{ISSUE_MIRROR_SYNC_STATE_KEY_PREFIX}{workspace_id}") or {}
+
+
+def get_mirror_synced_at(workspace_id: str):
+	"""
+	When the workspace mirror was last synced (None if it never was)
+
+	Falls back to the issue rows when the sync state was cleared from the cache.
+	"""
+	synced_at = get_mirror_sync_state(workspace_id).get("synced_at")
+	if not synced_at:
+		synced_at = frappe.db.sql(
+			f"select max(last_synced_at) from `tab{ISSUE_DOCTYPE}` where workspace_id = %s",
+			(workspace_id,)
+		)[0][0]
+	return get_datetime(synced_at) if synced_at else None
+
+
+def is_workspace_mirrored(workspace_id: str) -> bool:
+	"""
+	Whether reads for a workspace can be served from the mirror
+
+	A workspace without a recent sync queues one (outside tests), so the next
+	request can use the mirror while this one falls back to Zenhub.
+	"""
+	synced_at = get_mirror_synced_at(workspace_id)
+	if synced_at and synced_at >= add_to_date(now_datetime(), seconds=-ISSUE_MIRROR_MAX_AGE):
+		return True
+
+	if not frappe.flags.in_test:
+		queue_workspace_issue_sync(workspace_id)
+	return False
+
+
+def get_mirrored_issues(workspace_id: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+	"""
+	Mirrored issues of a workspace with their assignees
+
+	Args:
+		workspace_id: Zenhub workspace ID
+		filters: Extra filters on Zenhub Issue fields (e.g. {"epic_id": ...})
+
+	Returns:
+		Issues ordered by Zenhub issue number, each with an "assignees" list
+	"""
+	issues = frappe.get_all(
+		ISSUE_DOCTYPE,
+		filters={"workspace_id": workspace_id, **(filters or {})},
+		fields=ISSUE_READ_FIELDS,
+		order_by="issue_number asc",
+		limit_page_length=0
+	)
+	if not issues:
+		return []
+
+	# One join on the workspace instead of an IN list of every issue name
+	assignees_by_issue = {}
+	for row in frappe.db.sql(
+		f"""
+		select a.parent, a.assignee_id, a.login, a.assignee_name
+		from `tab{ASSIGNEE_DOCTYPE}` a
+		inner join `tab{ISSUE_DOCTYPE}` i on i.name = a.parent
+		where i.workspace_id = %s and a.parenttype = %s
+		order by a.idx asc
+		""",
+		(workspace_id, ISSUE_DOCTYPE),
+		as_dict=True
+	):
+		assignees_by_issue.setdefault(row.parent, []).append(row)
+
+	for issue in issues:
+		issue["assignees"] = assignees_by_issue.get(issue.name, [])
+	return issues
+
+
+def get_mirrored_state_totals(workspace_id: str) -> List[Dict[str, Any]]:
+	"""Issue count and story points per lower-cased state, aggregated in SQL"""
+	return frappe.db.sql(
+		f"""
+		select lower(ifnull(state, '')) as state, count(*) as issues, ifnull(sum(estimate), 0) as story_points
+		from `tab{ISSUE_DOCTYPE}`
+		where workspace_id = %s
+		group by lower(ifnull(state, ''))
+		""",
+		(workspace_id,),
+		as_dict=True
+	)
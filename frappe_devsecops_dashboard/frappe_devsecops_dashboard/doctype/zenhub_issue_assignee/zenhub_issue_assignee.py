@@ -0,0 +1,9 @@
+# Copyright (c) 2026, Salim and contributors
+# License: MIT
+
+from frappe.model.document import Document
+
+
+class ZenhubIssueAssignee(Document):
+	"""Assignee of a mirrored Zenhub issue"""
+	pass
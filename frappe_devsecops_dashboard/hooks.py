@@ -121,10 +121,62 @@ doc_events = {
 		"before_save": "frappe_devsecops_dashboard.doc_hooks.software_product_zenhub.handle_software_product_zenhub_workspace"
 	},
 	"Project": {
-		"before_save": "frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.project_extension.project_extension.on_project_before_save"
+		"before_save": "frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.project_extension.project_extension.on_project_before_save",
+		"on_update": [
+			"frappe_devsecops_dashboard.doc_hooks.project_dashboard_snapshot.update_snapshot_for_project",
+			"frappe_devsecops_dashboard.api.dashboard_cache.bump_dashboard_cache_version",
+			"frappe_devsecops_dashboard.doc_hooks.dashboard_realtime.publish_project_delta"
+		],
+		"on_trash": "frappe_devsecops_dashboard.doc_hooks.project_dashboard_snapshot.remove_snapshot_for_project",
+		"after_delete": [
+			"frappe_devsecops_dashboard.api.dashboard_cache.bump_dashboard_cache_version",
+			"frappe_devsecops_dashboard.doc_hooks.dashboard_realtime.publish_project_delta"
+		]
 	},
 	"Task": {
-		"before_save": "frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.task_extension.task_extension.on_task_before_save"
+		"before_save": "frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.task_extension.task_extension.on_task_before_save",
+		"on_update": [
+			"frappe_devsecops_dashboard.doc_hooks.project_dashboard_snapshot.update_snapshot_for_task",
+			"frappe_devsecops_dashboard.api.dashboard_cache.bump_dashboard_cache_version",
+			"frappe_devsecops_dashboard.doc_hooks.dashboard_realtime.publish_task_delta"
+		],
+		"after_delete": [
+			"frappe_devsecops_dashboard.doc_hooks.project_dashboard_snapshot.update_snapshot_for_task",
+			"frappe_devsecops_dashboard.api.dashboard_cache.bump_dashboard_cache_version",
+			"frappe_devsecops_dashboard.doc_hooks.dashboard_realtime.publish_task_delta"
+		]
+	},
+	"Task Type": {
+		"on_update": [
+			"frappe_devsecops_dashboard.doc_hooks.project_dashboard_snapshot.rebuild_snapshots_for_task_type",
+			"frappe_devsecops_dashboard.api.dashboard_cache.bump_dashboard_cache_version"
+		],
+		"on_trash": "frappe_devsecops_dashboard.doc_hooks.project_dashboard_snapshot.rebuild_snapshots_for_task_type",
+		"after_delete": "frappe_devsecops_dashboard.api.dashboard_cache.bump_dashboard_cache_version"
+	},
+	"ToDo": {
+		"on_update": "frappe_devsecops_dashboard.api.dashboard_cache.bump_dashboard_cache_version",
+		"after_delete": "frappe_devsecops_dashboard.api.dashboard_cache.bump_dashboard_cache_version"
+	},
+	"Change Request": {
+		"on_update": [
+			"frappe_devsecops_dashboard.api.dashboard_cache.bump_dashboard_cache_version",
+			"frappe_devsecops_dashboard.doc_hooks.dashboard_realtime.publish_record_delta"
+		],
+		"after_delete": [
+			"frappe_devsecops_dashboard.api.dashboard_cache.bump_dashboard_cache_version",
+			"frappe_devsecops_dashboard.doc_hooks.dashboard_realtime.publish_record_delta"
+		]
+	},
+	"Devsecops Dashboard Incident": {
+		"on_update": [
+			"frappe_devsecops_dashboard.api.dashboard_cache.bump_dashboard_cache_version",
+			"frappe_devsecops_dashboard.doc_hooks.dashboard_realtime.publish_record_delta"
+		],
+		"after_delete": [
+			"frappe_devsecops_dashboard.api.dashboard_cache.bump_dashboard_cache_version",
+			"frappe_devsecops_dashboard.doc_hooks.dashboard_realtime.publish_record_delta"
+		]
 	},
 	"Timesheet": {
 		"before_save": "frappe_devsecops_dashboard.overrides.timesheet.recalculate_toil",
@@ -149,8 +201,17 @@ scheduler_events = {
 	"cron": {
 		"0 */4 * * *": [
 			"frappe_devsecops_dashboard.api.change_request_reminders.send_approval_reminders"
+		],
+		"* * * * *": [
+			"frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_graphql_api_log.zenhub_graphql_api_log.flush_zenhub_api_log_buffer"
+		],
+		"*/15 * * * *": [
+			"frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_issue.zenhub_issue.sync_zenhub_issue_mirror"
 		]
-	}
+	},
+	"daily": [
+		"frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_graphql_api_log.zenhub_graphql_api_log.purge_expired_api_logs"
+	]
 	# TOIL tasks moved to system cron for better control:
 	# - expire_toil_allocations (daily)
 	# - send_expiry_reminders (weekly)
@@ -240,6 +301,7 @@ whitelisted_methods = [
 	"frappe_devsecops_dashboard.api.zenhub.get_workspace_summary",
 	"frappe_devsecops_dashboard.api.zenhub.get_project_summary",
 	"frappe_devsecops_dashboard.api.zenhub.get_task_summary",
+	"frappe_devsecops_dashboard.api.zenhub_webhook.receive_zenhub_webhook",
 	# ZenHub Workspace API Methods
 	"frappe_devsecops_dashboard.api.zenhub_workspace_api.get_workspace_summary",
 	"frappe_devsecops_dashboard.api.zenhub_workspace_api.get_workspace_by_project",
@@ -295,9 +357,3 @@ after_migrate = [
 website_route_rules = [
 	{"from_route": "/login", "to_route": "login"},
 ]
-
-# CLI Commands
-# -----------
-commands = [
-	"frappe_devsecops_dashboard.commands.setup_zenhub_workspace.setup_zenhub_workspace"
-]
@@ -0,0 +1,68 @@
+"""
+Migration script to compact existing Zenhub GraphQL API Log payloads
+
+Rewrites pretty-printed request/response JSON as compact JSON, compressed
+with zlib + base64 when large (see encode_log_payload). Payloads are not
+truncated, so existing rows keep their full content. Rows are
+processed in chunks with a commit after each, and already compressed rows
+are skipped, so the patch is safe to re-run.
+"""
+
+import json
+
+import frappe
+from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_graphql_api_log.zenhub_graphql_api_log import (
+    API_LOG_COMPRESSED_PREFIX,
+    decode_log_payload,
+    encode_log_payload
+)
+
+CHUNK_SIZE = 1000
+
+
+def execute():
+    """Compact and compress stored API log payloads"""
+    if not frappe.db.table_exists("Zenhub GraphQL API Log"):
+        return
+
+    last_name = ""
+    compacted = 0
+
+    while True:
+        rows = frappe.db.sql(
+            """
+            select name, request_payload, response_data
+            from `tabZenhub GraphQL API Log`
+            where name > %s
+            order by name
+            limit %s
+            """,
+            (last_name, CHUNK_SIZE),
+            as_dict=True
+        )
+        if not rows:
+            break
+
+        for row in rows:
+            updates = {}
+            for field in ("request_payload", "response_data"):
+                value = row.get(field)
+                if value and not value.startswith(API_LOG_COMPRESSED_PREFIX):
+                    updates[field] = encode_log_payload(compact_json(value))
+
+            if updates:
+                frappe.db.set_value("Zenhub GraphQL API Log", row.name, updates, update_modified=False)
+                compacted += 1
+
+        frappe.db.commit()
+        last_name = rows[-1].name
+
+    frappe.logger().info(f"compress_zenhub_api_log_payloads: compacted {compacted} log entries")
+
+
+def compact_json(value):
+    """Re-serialize stored JSON compactly (invalid JSON is kept as text)"""
+    try:
+        return json.dumps(json.loads(decode_log_payload(value)), separators=(",", ":"), default=str)
+    except Exception:
+        return value
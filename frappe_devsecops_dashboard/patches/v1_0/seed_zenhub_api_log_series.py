@@ -0,0 +1,22 @@
+"""
+Migration script to seed the Zenhub GraphQL API Log naming series
+
+Buffered log inserts reserve ZHLOG-#### names from the "ZHLOG-" series.
+Sites where that series is missing or behind the existing log names would
+hand out names that are already taken, so the series is raised to the
+highest existing log number. Safe to re-run: the series is never lowered.
+"""
+
+import frappe
+from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_graphql_api_log.zenhub_graphql_api_log import (
+    seed_api_log_series
+)
+
+
+def execute():
+    """Seed the ZHLOG- naming series from existing log names"""
+    if not frappe.db.table_exists("Zenhub GraphQL API Log"):
+        return
+
+    seed_api_log_series()
+    frappe.db.commit()
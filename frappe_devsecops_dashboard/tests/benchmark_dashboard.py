@@ -0,0 +1,242 @@
+"""
+Dashboard API Performance Benchmarks
+====================================
+
+Times the dashboard endpoints against synthetic portfolios of increasing
+size (see portfolio_data_generator.py) and records wall time and query
+counts to a JSON baseline. Running again with the baseline reports every
+endpoint that got slower or issues more queries, so regressions are caught
+locally before deploying.
+
+Not part of the unit test run (no test_ prefix): seeding 5,000 projects
+takes a while and writes to the site database.
+
+Usage:
+    # Record a baseline
+    bench --site <site> execute frappe_devsecops_dashboard.tests.benchmark_dashboard.run_benchmarks \\
+        --kwargs "{'output_path': 'dashboard_benchmark.json'}"
+
+    # Compare against it (smaller sizes for a quick check)
+    bench --site <site> execute frappe_devsecops_dashboard.tests.benchmark_dashboard.run_benchmarks \\
+        --kwargs "{'sizes': [10, 100], 'baseline_path': 'dashboard_benchmark.json'}"
+"""
+
+import frappe
+import json
+import os
+import statistics
+import time
+from contextlib import contextmanager
+
+from frappe_devsecops_dashboard.tests.portfolio_data_generator import seed_portfolio, BENCH_PREFIX
+
+
+BENCHMARK_SIZES = [10, 100, 1000, 5000]
+BENCHMARK_ITERATIONS = 3
+
+# Allowed slowdown before an endpoint is reported as a regression
+TIME_TOLERANCE = 0.25
+# Allowed extra queries before an endpoint is reported as a regression
+QUERY_TOLERANCE = 0
+
+
+def get_benchmark_endpoints(project_name):
+    """
+    Get the endpoints to benchmark
+
+    Args:
+        project_name (str): Benchmark project used by the per-project endpoints
+
+    Returns:
+        dict: Endpoint label -> zero-argument callable
+    """
+    from frappe_devsecops_dashboard.api import dashboard
+
+    return {
+        "get_dashboard_data": lambda: dashboard.get_dashboard_data(),
+        "get_dashboard_data[summary]": lambda: dashboard.get_dashboard_data(mode="summary"),
+        "get_dashboard_metrics": lambda: dashboard.get_dashboard_metrics(),
+        "get_dashboard_metrics[metric_type=all]": lambda: dashboard.get_dashboard_metrics(metric_type="all"),
+        "get_project_details": lambda: dashboard.get_project_details(project_name),
+        "get_project_tasks": lambda: dashboard.get_project_tasks(project_name)
+    }
+
+
+def run_benchmarks(sizes=None, iterations=BENCHMARK_ITERATIONS, output_path=None, baseline_path=None):
+    """
+    Seed each portfolio size, time every endpoint and write the results
+
+    Args:
+        sizes (list): Portfolio sizes in projects (defaults to BENCHMARK_SIZES)
+        iterations (int): Timed runs per endpoint (after one warm-up run)
+        output_path (str): JSON file to write, relative to the site directory
+        baseline_path (str): Previous results to compare against
+
+    Returns:
+        dict: Benchmark results, plus "regressions" when a baseline was given
+    """
+    sizes = [int(size) for size in (sizes or BENCHMARK_SIZES)]
+    frappe.set_user("Administrator")
+
+    results = {
+        "generated_at": frappe.utils.now(),
+        "site": frappe.local.site,
+        "frappe_version": frappe.__version__,
+        "iterations": int(iterations),
+        "sizes": {}
+    }
+
+    for size in sorted(sizes):
+        seed_portfolio(size)
+        project_name = f"{BENCH_PREFIX}PROJ-{0:05d}"
+
+        print("\n" + "=" * 60)
+        print(f"BENCHMARKING {size} PROJECTS")
+        print("=" * 60)
+
+        size_results = {}
+        for label, endpoint in get_benchmark_endpoints(project_name).items():
+            size_results[label] = benchmark_endpoint(endpoint, int(iterations))
+            print(
+                f"  {label:<40} {size_results[label]['wall_time_ms']:>10.1f} ms"
+                f"  {size_results[label]['queries']:>6} queries"
+            )
+
+        results["sizes"][str(size)] = size_results
+
+    if baseline_path:
+        results["regressions"] = compare_with_baseline(load_results(baseline_path), results)
+        print_regressions(results["regressions"])
+
+    if output_path:
+        path = frappe.get_site_path(output_path)
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\n✓ Results written to {os.path.abspath(path)}")
+
+    return results
+
+
+def benchmark_endpoint(endpoint, iterations=BENCHMARK_ITERATIONS):
+    """
+    Time an endpoint with cold response caches
+
+    Args:
+        endpoint (callable): Zero-argument endpoint call
+        iterations (int): Timed runs (after one warm-up run)
+
+    Returns:
+        dict: Median and min wall time in ms, and queries per call
+    """
+    reset_request_state()
+    endpoint()  # Warm-up: imports, metadata and the Task Type catalog
+
+    timings = []
+    queries = 0
+    for _iteration in range(iterations):
+        reset_request_state()
+        with count_queries() as counter:
+            start = time.perf_counter()
+            endpoint()
+            timings.append((time.perf_counter() - start) * 1000)
+        queries = counter["queries"]
+
+    return {
+        "wall_time_ms": round(statistics.median(timings), 2),
+        "min_wall_time_ms": round(min(timings), 2),
+        "queries": queries
+    }
+
+
+def reset_request_state():
+    """Start each run like a new request: no cached responses or request memo"""
+    from frappe_devsecops_dashboard.api.dashboard_cache import bump_cache_version
+    from frappe_devsecops_dashboard.api.request_cache import clear_request_memo
+
+    for doctype in ("Project", "Task", "Change Request", "Devsecops Dashboard Incident"):
+        bump_cache_version(doctype)
+    clear_request_memo()
+
+
+@contextmanager
+def count_queries():
+    """Count queries issued through frappe.db.sql inside the block"""
+    counter = {"queries": 0}
+    original_sql = frappe.db.sql
+
+    def counting_sql(*args, **kwargs):
+        counter["queries"] += 1
+        return original_sql(*args, **kwargs)
+
+    frappe.db.sql = counting_sql
+    try:
+        yield counter
+    finally:
+        frappe.db.sql = original_sql
+
+
+def load_results(path):
+    """Load benchmark results from a JSON file relative to the site directory"""
+    with open(frappe.get_site_path(path)) as f:
+        return json.load(f)
+
+
+def compare_with_baseline(baseline, results, time_tolerance=TIME_TOLERANCE, query_tolerance=QUERY_TOLERANCE):
+    """
+    Find endpoints that got slower or issue more queries than in the baseline
+
+    Args:
+        baseline (dict): Previous run_benchmarks results
+        results (dict): Current run_benchmarks results
+        time_tolerance (float): Allowed relative slowdown (0.25 = 25%)
+        query_tolerance (int): Allowed extra queries per call
+
+    Returns:
+        list: Regressions with size, endpoint, metric, baseline and current values
+    """
+    regressions = []
+
+    for size, endpoints in results.get("sizes", {}).items():
+        baseline_endpoints = baseline.get("sizes", {}).get(size, {})
+
+        for label, current in endpoints.items():
+            previous = baseline_endpoints.get(label)
+            if not previous:
+                continue
+
+            if current["wall_time_ms"] > previous["wall_time_ms"] * (1 + time_tolerance):
+                regressions.append({
+                    "size": size,
+                    "endpoint": label,
+                    "metric": "wall_time_ms",
+                    "baseline": previous["wall_time_ms"],
+                    "current": current["wall_time_ms"]
+                })
+
+            if current["queries"] > previous["queries"] + query_tolerance:
+                regressions.append({
+                    "size": size,
+                    "endpoint": label,
+                    "metric": "queries",
+                    "baseline": previous["queries"],
+                    "current": current["queries"]
+                })
+
+    return regressions
+
+
+def print_regressions(regressions):
+    """Print a regression report"""
+    print("\n" + "=" * 60)
+    print("REGRESSIONS AGAINST BASELINE")
+    print("=" * 60)
+
+    if not regressions:
+        print("✓ No regressions")
+        return
+
+    for regression in regressions:
+        print(
+            f"✗ {regression['size']} projects - {regression['endpoint']}: "
+            f"{regression['metric']} {regression['baseline']} -> {regression['current']}"
+        )
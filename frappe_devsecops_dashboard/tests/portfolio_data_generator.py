@@ -0,0 +1,283 @@
+"""
+Synthetic Portfolio Generator for Dashboard Benchmarks
+======================================================
+
+Seeds a synthetic project portfolio for performance testing of the
+dashboard API, following the patterns of the root test_data_generator.py:
+- Benchmark users (assignees and project managers)
+- Task Types with custom priorities (DevSecOps lifecycle phases)
+- Projects with a Project Manager row
+- Tasks with a realistic spread of types and statuses
+- ToDo assignments for most tasks
+
+Projects, Tasks, ToDos and Project Users are written with
+frappe.db.bulk_insert so thousands of projects can be seeded in seconds.
+This skips document hooks (ZenHub sync, snapshots), so snapshots are
+rebuilt once at the end.
+
+All records use the BENCH- prefix and can be removed with
+cleanup_portfolio().
+
+Usage:
+    bench --site <site> execute frappe_devsecops_dashboard.tests.portfolio_data_generator.seed_portfolio --kwargs "{'project_count': 100}"
+    bench --site <site> execute frappe_devsecops_dashboard.tests.portfolio_data_generator.cleanup_portfolio
+"""
+
+import frappe
+from frappe.utils import add_days, now_datetime, today
+import random
+
+
+BENCH_PREFIX = "BENCH-"
+BENCH_USER_DOMAIN = "bench.example.com"
+BENCH_USER_COUNT = 20
+
+# DevSecOps lifecycle phases (Task Type name, custom_priority)
+BENCH_TASK_TYPES = [
+    ("BENCH Planning", 1),
+    ("BENCH Requirements", 2),
+    ("BENCH Design", 3),
+    ("BENCH Development", 4),
+    ("BENCH Security Testing", 5),
+    ("BENCH Deployment", 6),
+    ("BENCH Operations", 7),
+    ("BENCH Monitoring", 8)
+]
+
+# Weighted task status distribution
+TASK_STATUS_WEIGHTS = [
+    ("Completed", 45),
+    ("Open", 25),
+    ("Working", 15),
+    ("Pending Review", 8),
+    ("Overdue", 5),
+    ("Cancelled", 2)
+]
+
+PROJECT_STATUS_WEIGHTS = [
+    ("Open", 80),
+    ("Completed", 15),
+    ("Cancelled", 5)
+]
+
+# Tasks per project (min, max); most projects cluster around the middle
+TASKS_PER_PROJECT = (5, 40)
+
+# Share of tasks with at least one ToDo assignment
+ASSIGNED_TASK_RATIO = 0.7
+
+
+# ==============================================================================
+# SEEDING
+# ==============================================================================
+
+def seed_portfolio(project_count=100, seed=42):
+    """
+    Grow the synthetic portfolio to project_count benchmark projects
+
+    Existing benchmark projects are kept, so calling this with increasing
+    sizes (10, 100, 1000, 5000) only inserts the difference.
+
+    Args:
+        project_count (int): Total number of benchmark projects wanted
+        seed (int): Random seed, so the same sizes produce the same data
+
+    Returns:
+        dict: Number of projects, tasks and ToDos inserted
+    """
+    print("\n" + "=" * 60)
+    print(f"SEEDING SYNTHETIC PORTFOLIO ({project_count} projects)")
+    print("=" * 60)
+
+    project_count = int(project_count)
+    existing = frappe.db.count("Project", {"name": ["like", f"{BENCH_PREFIX}PROJ-%"]})
+    if existing >= project_count:
+        print(f"✓ {existing} benchmark projects already exist")
+        return {"projects": 0, "tasks": 0, "todos": 0}
+
+    users = create_benchmark_users()
+    task_types = create_benchmark_task_types()
+    company = get_benchmark_company()
+
+    rng = random.Random(f"{seed}-{existing}")
+    now = now_datetime()
+    lft = (frappe.db.sql("select max(rgt) from `tabTask`")[0][0] or 0) + 1
+
+    projects, project_users, tasks, todos = [], [], [], []
+
+    for index in range(existing, project_count):
+        project_name = f"{BENCH_PREFIX}PROJ-{index:05d}"
+        start_date = add_days(today(), -rng.randint(0, 365))
+        modified = add_days(now, -rng.randint(0, 90))
+
+        projects.append((
+            project_name, project_name, weighted_choice(rng, PROJECT_STATUS_WEIGHTS), company,
+            rng.randint(0, 100), start_date, add_days(start_date, rng.randint(30, 365)),
+            now, modified, "Administrator", "Administrator"
+        ))
+
+        project_users.append((
+            frappe.generate_hash(length=10), project_name, "Project", "users", 1,
+            rng.choice(users), "Project Manager", now, now, "Administrator", "Administrator"
+        ))
+
+        task_total = int(rng.triangular(TASKS_PER_PROJECT[0], TASKS_PER_PROJECT[1], 15))
+        for task_index in range(task_total):
+            task_name = f"{BENCH_PREFIX}TASK-{index:05d}-{task_index:03d}"
+            # Earlier phases are more likely to be complete than later ones
+            phase = min(int(task_index * len(task_types) / task_total), len(task_types) - 1)
+            status = "Completed" if phase < 2 and rng.random() < 0.8 else weighted_choice(rng, TASK_STATUS_WEIGHTS)
+            exp_start = add_days(start_date, phase * 14)
+
+            tasks.append((
+                task_name, f"Synthetic task {task_index + 1}", project_name, status, task_types[phase],
+                rng.choice(["Low", "Medium", "High", "Urgent"]), exp_start, add_days(exp_start, 14),
+                100 if status == "Completed" else rng.randint(0, 90), company, 0, lft, lft + 1,
+                task_index + 1, now, modified, "Administrator", "Administrator"
+            ))
+            lft += 2
+
+            if rng.random() < ASSIGNED_TASK_RATIO:
+                for assignee in rng.sample(users, rng.choice([1, 1, 1, 2])):
+                    todos.append((
+                        frappe.generate_hash(length=10), f"Synthetic task {task_index + 1}", "Task", task_name,
+                        assignee, "Closed" if status == "Completed" else "Open", "Medium",
+                        add_days(exp_start, 14), now, now, "Administrator", "Administrator"
+                    ))
+
+    standard = ["creation", "modified", "owner", "modified_by"]
+
+    frappe.db.bulk_insert(
+        "Project",
+        ["name", "project_name", "status", "company", "percent_complete",
+         "expected_start_date", "expected_end_date"] + standard,
+        projects
+    )
+    frappe.db.bulk_insert(
+        "Project User",
+        ["name", "parent", "parenttype", "parentfield", "idx", "user", "custom_business_function"] + standard,
+        project_users
+    )
+    frappe.db.bulk_insert(
+        "Task",
+        ["name", "subject", "project", "status", "type", "priority", "exp_start_date", "exp_end_date",
+         "progress", "company", "is_group", "lft", "rgt", "idx"] + standard,
+        tasks
+    )
+    frappe.db.bulk_insert(
+        "ToDo",
+        ["name", "description", "reference_type", "reference_name", "allocated_to", "status",
+         "priority", "date"] + standard,
+        todos
+    )
+    frappe.db.commit()
+
+    print(f"✓ Inserted {len(projects)} projects, {len(tasks)} tasks, {len(todos)} ToDos")
+
+    rebuild_benchmark_snapshots()
+
+    return {"projects": len(projects), "tasks": len(tasks), "todos": len(todos)}
+
+
+def create_benchmark_users():
+    """
+    Create the benchmark assignee users if they do not exist
+
+    Returns:
+        list: User ids
+    """
+    users = []
+    for index in range(1, BENCH_USER_COUNT + 1):
+        email = f"bench.user{index:02d}@{BENCH_USER_DOMAIN}"
+        if not frappe.db.exists("User", email):
+            user = frappe.get_doc({
+                "doctype": "User",
+                "email": email,
+                "first_name": "Bench",
+                "last_name": f"User {index:02d}",
+                "send_welcome_email": 0,
+                "enabled": 1
+            })
+            user.insert(ignore_permissions=True)
+            user.add_roles("Projects User")
+        users.append(email)
+
+    frappe.db.commit()
+    return users
+
+
+def create_benchmark_task_types():
+    """
+    Create the benchmark Task Types if they do not exist
+
+    Returns:
+        list: Task Type names in lifecycle order
+    """
+    for name, priority in BENCH_TASK_TYPES:
+        if not frappe.db.exists("Task Type", name):
+            frappe.get_doc({
+                "doctype": "Task Type",
+                "name": name,
+                "description": f"{name} phase (benchmark data)",
+                "custom_priority": priority
+            }).insert(ignore_permissions=True)
+
+    frappe.db.commit()
+    return [name for name, _priority in BENCH_TASK_TYPES]
+
+
+def get_benchmark_company():
+    """Get the company used for benchmark projects and tasks"""
+    company = frappe.defaults.get_global_default("company") or frappe.db.get_value("Company", {}, "name")
+    if not company:
+        frappe.throw("Create a Company before seeding the benchmark portfolio")
+    return company
+
+
+def rebuild_benchmark_snapshots():
+    """Rebuild dashboard snapshots, since bulk inserts skip the document hooks"""
+    from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.project_dashboard_snapshot.project_dashboard_snapshot import (
+        rebuild_all_project_snapshots
+    )
+
+    count = rebuild_all_project_snapshots()
+    print(f"✓ Rebuilt {count} dashboard snapshots")
+
+
+def weighted_choice(rng, weighted_values):
+    """Pick a value from [(value, weight), ...]"""
+    values, weights = zip(*weighted_values)
+    return rng.choices(values, weights=weights, k=1)[0]
+
+
+# ==============================================================================
+# CLEANUP
+# ==============================================================================
+
+def cleanup_portfolio():
+    """
+    Remove all benchmark data (projects, tasks, ToDos, Task Types, users)
+    """
+    print("\n" + "=" * 60)
+    print("CLEANING UP SYNTHETIC PORTFOLIO")
+    print("=" * 60)
+
+    project_names = frappe.get_all("Project", filters={"name": ["like", f"{BENCH_PREFIX}PROJ-%"]}, pluck="name")
+
+    frappe.db.delete("ToDo", {"reference_type": "Task", "reference_name": ["like", f"{BENCH_PREFIX}TASK-%"]})
+    frappe.db.delete("Task", {"name": ["like", f"{BENCH_PREFIX}TASK-%"]})
+    frappe.db.delete("Project User", {"parenttype": "Project", "parent": ["like", f"{BENCH_PREFIX}PROJ-%"]})
+    frappe.db.delete("Project Dashboard Snapshot", {"name": ["like", f"{BENCH_PREFIX}PROJ-%"]})
+    frappe.db.delete("Project", {"name": ["like", f"{BENCH_PREFIX}PROJ-%"]})
+    frappe.db.delete("Task Type", {"name": ["in", [name for name, _priority in BENCH_TASK_TYPES]]})
+
+    for email in frappe.get_all("User", filters={"name": ["like", f"%@{BENCH_USER_DOMAIN}"]}, pluck="name"):
+        frappe.delete_doc("User", email, ignore_permissions=True, force=True)
+
+    frappe.db.commit()
+
+    from frappe_devsecops_dashboard.api.dashboard_cache import bump_cache_version
+    for doctype in ("Project", "Task", "Task Type"):
+        bump_cache_version(doctype)
+
+    print(f"✓ Removed {len(project_names)} benchmark projects")
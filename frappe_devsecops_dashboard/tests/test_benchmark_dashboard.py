@@ -0,0 +1,37 @@
+"""
+Unit tests for the dashboard benchmark regression check
+"""
+
+import unittest
+from frappe.tests.utils import FrappeTestCase
+from frappe_devsecops_dashboard.tests.benchmark_dashboard import compare_with_baseline
+
+
+def make_results(wall_time_ms, queries):
+    return {"sizes": {"100": {"get_dashboard_data": {"wall_time_ms": wall_time_ms, "queries": queries}}}}
+
+
+class TestBenchmarkDashboard(FrappeTestCase):
+    """Test cases for compare_with_baseline"""
+
+    def test_within_tolerance(self):
+        """Small slowdowns are not reported"""
+        self.assertEqual(compare_with_baseline(make_results(100, 10), make_results(120, 10)), [])
+
+    def test_slowdown_reported(self):
+        """Slowdowns beyond the tolerance are reported"""
+        regressions = compare_with_baseline(make_results(100, 10), make_results(200, 10))
+        self.assertEqual([r["metric"] for r in regressions], ["wall_time_ms"])
+
+    def test_extra_queries_reported(self):
+        """Any extra query is reported"""
+        regressions = compare_with_baseline(make_results(100, 10), make_results(100, 11))
+        self.assertEqual([r["metric"] for r in regressions], ["queries"])
+
+    def test_new_endpoints_ignored(self):
+        """Endpoints missing from the baseline are not regressions"""
+        self.assertEqual(compare_with_baseline({"sizes": {}}, make_results(100, 10)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
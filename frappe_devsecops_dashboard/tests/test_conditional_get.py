@@ -0,0 +1,64 @@
+"""
+Unit tests for conditional GET (ETag) support on polling endpoints
+"""
+
+import unittest
+from unittest.mock import patch
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe_devsecops_dashboard.api.change_request import get_change_requests
+from frappe_devsecops_dashboard.api.conditional_get import get_collection_etag, get_source_validator
+from frappe_devsecops_dashboard.api.dashboard import get_dashboard_data
+from frappe_devsecops_dashboard.api.incidents import get_incidents
+
+
+class TestConditionalGet(FrappeTestCase):
+    """Test cases for ETag validators"""
+
+    def test_etag_is_stable(self):
+        """Unchanged data produces the same ETag"""
+        sources = [("Project", {"status": ["!=", "Cancelled"]})]
+        self.assertEqual(
+            get_collection_etag("get_dashboard_data", sources),
+            get_collection_etag("get_dashboard_data", sources)
+        )
+
+    def test_etag_depends_on_arguments(self):
+        """Different pages or filters get different ETags"""
+        sources = [("Project", {})]
+        self.assertNotEqual(
+            get_collection_etag("get_dashboard_data", sources, {"cursor": None}),
+            get_collection_etag("get_dashboard_data", sources, {"cursor": "abc"})
+        )
+
+    def test_source_validator_counts_rows(self):
+        """The validator count matches the permitted row count"""
+        _doctype, _last_modified, count = get_source_validator("Project", {})
+        self.assertEqual(count, len(frappe.get_list("Project", pluck="name", limit_page_length=None)))
+
+    def test_dashboard_response_includes_etag(self):
+        """Full responses carry the ETag the client sends back in If-None-Match"""
+        result = get_dashboard_data()
+
+        self.assertTrue(result["success"])
+        self.assertTrue(result.get("etag", "").startswith('W/"'))
+
+    def test_matching_etag_short_circuits(self):
+        """Replaying the returned ETag in If-None-Match answers {unchanged: true} without the data"""
+        for endpoint in (get_dashboard_data, get_change_requests, get_incidents):
+            with self.subTest(endpoint=endpoint.__name__):
+                first = endpoint()
+                self.assertTrue(first["success"])
+                self.assertNotIn("unchanged", first)
+
+                with patch(
+                    "frappe_devsecops_dashboard.api.conditional_get.get_if_none_match",
+                    return_value=[first["etag"]]
+                ):
+                    replay = endpoint()
+
+                self.assertEqual(replay, {"success": True, "unchanged": True, "etag": first["etag"]})
+
+
+if __name__ == '__main__':
+    unittest.main()
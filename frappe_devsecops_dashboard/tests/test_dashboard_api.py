@@ -9,13 +9,21 @@ from frappe_devsecops_dashboard.api.dashboard import (
     get_dashboard_data,
     get_projects_with_tasks,
     enhance_project_with_task_data,
+    load_projects_with_tasks,
     calculate_project_lifecycle_phases,
     get_task_type_order,
     determine_current_phase,
     calculate_actual_progress,
     calculate_dashboard_metrics,
     get_devsecops_lifecycle_phases,
-    get_project_details
+    get_project_details,
+    get_dashboard_project_tasks,
+    encode_project_cursor,
+    decode_project_cursor,
+    get_dashboard_metrics,
+    get_grouped_counts,
+    sum_grouped_counts,
+    has_unrestricted_task_read
 )
 
 
@@ -166,6 +174,52 @@ class TestDashboardAPI(FrappeTestCase):
         self.assertIn('current_phase', enhanced_project)
         self.assertIsInstance(enhanced_project['delivery_phases'], list)
 
+    def test_load_projects_with_tasks(self):
+        """Test set-based loading keeps input order and matches single-project enhancement"""
+        basic_project = {
+            'name': 'TEST-DEVSECOPS-001',
+            'project_name': 'Test DevSecOps Project',
+            'status': 'Open',
+            'customer': 'Test Customer',
+            'percent_complete': 45
+        }
+        missing_project = {
+            'name': 'NON-EXISTENT-PROJECT',
+            'project_name': 'Missing Project',
+            'status': 'Open'
+        }
+
+        projects = load_projects_with_tasks([dict(basic_project), dict(missing_project)])
+
+        self.assertEqual([p['id'] for p in projects], ['TEST-DEVSECOPS-001', 'NON-EXISTENT-PROJECT'])
+        self.assertEqual(projects[1]['task_count'], 0)
+        self.assertEqual(projects[1]['tasks'], [])
+
+        single = enhance_project_with_task_data(dict(basic_project))
+        self.assertEqual(projects[0]['task_count'], single['task_count'])
+        self.assertEqual(projects[0]['delivery_phases'], single['delivery_phases'])
+
+        for task in projects[0]['tasks']:
+            self.assertNotIn('project', task)
+            self.assertIn('assigned_users', task)
+            self.assertIn('task_type_priority', task)
+
+    def test_full_mode_counts_match_task_list(self):
+        """Test full mode counts the embedded tasks rather than snapshot counters"""
+        projects = load_projects_with_tasks([{'name': 'TEST-DEVSECOPS-001', 'project_name': 'Test DevSecOps Project'}])
+
+        for project in projects:
+            self.assertEqual(project['task_count'], len(project['tasks']))
+            self.assertEqual(
+                project['completed_tasks'],
+                len([t for t in project['tasks'] if t.get('status') == 'Completed'])
+            )
+
+    def test_snapshot_counters_need_unrestricted_task_read(self):
+        """Test snapshot counters are only served to users who can read every Task"""
+        self.assertTrue(has_unrestricted_task_read("Administrator"))
+        self.assertFalse(has_unrestricted_task_read("Guest"))
+
     def test_calculate_project_lifecycle_phases(self):
         """Test lifecycle phases calculation"""
         # Mock tasks data
@@ -258,6 +312,77 @@ class TestDashboardAPI(FrappeTestCase):
             self.assertIn('name', phase)
             self.assertIn('description', phase)
 
+    def test_get_dashboard_data_summary_mode(self):
+        """Test summary mode omits tasks and pages with a cursor"""
+        response = get_dashboard_data(mode="summary", page_length=1)
+
+        self.assertTrue(response['success'])
+        self.assertEqual(response['mode'], 'summary')
+        self.assertLessEqual(len(response['projects']), 1)
+        self.assertIn('next_cursor', response)
+        self.assertIn('metrics', response)
+        for project in response['projects']:
+            self.assertNotIn('tasks', project)
+            self.assertIn('task_count', project)
+
+        if response['next_cursor']:
+            next_page = get_dashboard_data(mode="summary", cursor=response['next_cursor'], page_length=1)
+            self.assertTrue(next_page['success'])
+            self.assertNotIn('metrics', next_page)
+            seen = {p['id'] for p in response['projects']}
+            for project in next_page['projects']:
+                self.assertNotIn(project['id'], seen)
+
+    def test_project_cursor_round_trip(self):
+        """Test cursor encoding and invalid cursor handling"""
+        cursor = encode_project_cursor({'modified': '2024-01-01 10:00:00.000000', 'name': 'PROJ-0001'})
+        self.assertEqual(decode_project_cursor(cursor), ('2024-01-01 10:00:00.000000', 'PROJ-0001'))
+
+        response = get_dashboard_data(mode="summary", cursor="not-a-cursor")
+        self.assertFalse(response['success'])
+
+    def test_get_dashboard_project_tasks(self):
+        """Test lazy task loading for a single project"""
+        response = get_dashboard_project_tasks('TEST-DEVSECOPS-001')
+
+        self.assertTrue(response['success'])
+        self.assertIsInstance(response['tasks'], list)
+
+        missing = get_dashboard_project_tasks('NON-EXISTENT-PROJECT')
+        self.assertFalse(missing['success'])
+
+    def test_grouped_counts_match_row_counts(self):
+        """Test aggregate counts agree with materialized row counts"""
+        counts = get_grouped_counts("Project", ["status"])
+
+        self.assertEqual(sum_grouped_counts(counts), len(frappe.get_list("Project", fields=["name"], limit_page_length=None)))
+        self.assertEqual(
+            sum_grouped_counts(counts, "status", ["Open"]),
+            len(frappe.get_list("Project", filters={"status": "Open"}, fields=["name"], limit_page_length=None))
+        )
+
+    def test_get_dashboard_metrics_variants(self):
+        """Test the single get_dashboard_metrics serves both response shapes"""
+        summary = get_dashboard_metrics()
+        self.assertTrue(summary['success'])
+        self.assertIn('projects', summary['metrics'])
+        self.assertIn('tasks', summary['metrics'])
+        self.assertIn('pending_approvals', summary['metrics']['change_requests'])
+
+        projects = get_dashboard_metrics(metric_type="projects")
+        self.assertTrue(projects['success'])
+        self.assertIn('on_hold', projects['metrics']['projects'])
+        self.assertIsInstance(projects['data'], list)
+
+    def test_guest_cannot_get_detailed_metrics(self):
+        """Guests only get the summary counts, not the per-type data"""
+        frappe.set_user("Guest")
+        try:
+            with self.assertRaises(frappe.PermissionError):
+                get_dashboard_metrics(metric_type="projects")
+        finally:
+            frappe.set_user("Administrator")
+
     def test_get_project_details(self):
         """Test project details retrieval"""
         response = get_project_details('TEST-DEVSECOPS-001')
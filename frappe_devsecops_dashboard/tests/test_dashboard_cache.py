@@ -0,0 +1,117 @@
+"""
+Unit tests for the permission-fingerprinted dashboard response cache
+"""
+
+import unittest
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe_devsecops_dashboard.api.dashboard_cache import (
+    cache_by_permissions,
+    get_permission_fingerprint,
+    get_cache_versions,
+    bump_cache_version,
+    get_response_cache_key
+)
+
+
+class TestDashboardCache(FrappeTestCase):
+    """Test cases for dashboard cache keys and invalidation"""
+
+    def setUp(self):
+        """Use the cached path, which is bypassed in tests by default"""
+        self.in_test = frappe.flags.in_test
+        frappe.flags.in_test = False
+
+        self.calls = []
+
+        @cache_by_permissions(("Project", "Task"))
+        def get_cached_metrics(project_name):
+            self.calls.append(project_name)
+            return {"success": True, "project": project_name, "call": len(self.calls)}
+
+        self.get_cached_metrics = get_cached_metrics
+
+    def tearDown(self):
+        frappe.flags.in_test = self.in_test
+
+    def test_fingerprint_is_stable(self):
+        """Same user and permissions produce the same fingerprint"""
+        self.assertEqual(
+            get_permission_fingerprint("Administrator"),
+            get_permission_fingerprint("Administrator")
+        )
+
+    def test_fingerprint_differs_by_roles(self):
+        """Guest and Administrator must never share cache entries"""
+        self.assertNotEqual(
+            get_permission_fingerprint("Administrator"),
+            get_permission_fingerprint("Guest")
+        )
+
+    def test_bump_changes_version_and_key(self):
+        """Bumping a doctype version changes the cache key of dependent endpoints"""
+        key_before = get_response_cache_key("get_project_metrics", ("Project", "Task"), ("PROJ-0001",), {})
+        versions_before = get_cache_versions(("Task",))
+
+        bump_cache_version("Task")
+
+        self.assertNotEqual(versions_before, get_cache_versions(("Task",)))
+        self.assertNotEqual(
+            key_before,
+            get_response_cache_key("get_project_metrics", ("Project", "Task"), ("PROJ-0001",), {})
+        )
+
+    def test_key_depends_on_arguments(self):
+        """Different endpoint arguments get different cache entries"""
+        self.assertNotEqual(
+            get_response_cache_key("get_project_metrics", ("Project", "Task"), ("PROJ-0001",), {}),
+            get_response_cache_key("get_project_metrics", ("Project", "Task"), ("PROJ-0002",), {})
+        )
+
+    def test_second_call_is_served_from_cache(self):
+        """A repeated call with the same arguments does not run the endpoint again"""
+        project_name = f"cache-{frappe.generate_hash(length=8)}"
+
+        first = self.get_cached_metrics(project_name)
+        second = self.get_cached_metrics(project_name)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, [project_name])
+
+    def test_failed_response_is_not_cached(self):
+        """Responses with success=False are recomputed on the next call"""
+        calls = []
+
+        @cache_by_permissions(("Project",))
+        def get_failing_metrics():
+            calls.append(1)
+            return {"success": False, "error": "boom"}
+
+        get_failing_metrics()
+        get_failing_metrics()
+
+        self.assertEqual(len(calls), 2)
+
+    def test_saving_project_invalidates_cache(self):
+        """Saving a Project bumps its version through doc_events"""
+        project_name = f"cache-{frappe.generate_hash(length=8)}"
+        self.get_cached_metrics(project_name)
+
+        frappe.get_doc({"doctype": "Project", "project_name": project_name}).insert()
+        self.get_cached_metrics(project_name)
+
+        self.assertEqual(self.calls, [project_name, project_name])
+
+    def test_saving_task_invalidates_cache(self):
+        """Saving a Task bumps its version through doc_events"""
+        project_name = f"cache-{frappe.generate_hash(length=8)}"
+        self.get_cached_metrics(project_name)
+
+        frappe.get_doc({"doctype": "Task", "subject": f"Task for {project_name}"}).insert()
+        self.get_cached_metrics(project_name)
+
+        self.assertEqual(self.calls, [project_name, project_name])
+
+
+if __name__ == '__main__':
+    unittest.main()
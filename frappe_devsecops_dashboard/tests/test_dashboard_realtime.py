@@ -0,0 +1,40 @@
+"""
+Unit tests for dashboard realtime delta payloads
+"""
+
+import unittest
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe_devsecops_dashboard.doc_hooks.dashboard_realtime import build_delta
+
+
+class TestDashboardRealtime(FrappeTestCase):
+    """Test cases for realtime delta payloads"""
+
+    def test_new_project_reports_watched_fields(self):
+        """An unsaved Project reports all watched fields it has"""
+        project = frappe.get_doc({"doctype": "Project", "project_name": "Delta Test", "status": "Open"})
+        delta = build_delta(project, "on_update")
+
+        self.assertEqual(delta["changes"].get("status"), "Open")
+        self.assertEqual(delta["changes"].get("project_name"), "Delta Test")
+
+    def test_delete_delta_has_no_changes(self):
+        """Deleted documents publish only their identity"""
+        project = frappe.get_doc({"doctype": "Project", "project_name": "Delta Test", "status": "Open"})
+        delta = build_delta(project, "after_delete")
+
+        self.assertEqual(delta["action"], "delete")
+        self.assertEqual(delta["changes"], {})
+
+    def test_task_delta_is_identity_only(self):
+        """Project room members may not read the Task, so no Task fields or counters are sent"""
+        task = frappe.get_doc({"doctype": "Task", "subject": "Delta Test", "status": "Completed"})
+        delta = build_delta(task, "on_update", counters_changed=True)
+
+        self.assertEqual(set(delta), {"doctype", "name", "action", "counters_changed"})
+        self.assertTrue(delta["counters_changed"])
+
+
+if __name__ == '__main__':
+    unittest.main()
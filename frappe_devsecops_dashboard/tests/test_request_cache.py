@@ -0,0 +1,42 @@
+"""
+Unit tests for request-scoped User and Task Type memoization
+"""
+
+import unittest
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe_devsecops_dashboard.api.request_cache import (
+    prefetch_users,
+    get_user_full_name,
+    get_request_memo,
+    clear_request_memo
+)
+
+
+class TestRequestCache(FrappeTestCase):
+    """Test cases for request-local memoization"""
+
+    def setUp(self):
+        clear_request_memo()
+
+    def test_prefetch_users_memoizes_rows(self):
+        """Prefetched users are served from the request memo"""
+        users = prefetch_users(["Administrator", "Guest"])
+
+        self.assertEqual(set(users), {"Administrator", "Guest"})
+        self.assertIn("Administrator", get_request_memo("User"))
+
+    def test_unknown_users_are_memoized_as_none(self):
+        """Unknown users fall back to their id and are not queried again"""
+        self.assertEqual(get_user_full_name("nobody@example.invalid"), "nobody@example.invalid")
+        self.assertIsNone(get_request_memo("User")["nobody@example.invalid"])
+
+    def test_clear_request_memo(self):
+        """Clearing drops all memoized values"""
+        prefetch_users(["Administrator"])
+        clear_request_memo()
+        self.assertEqual(get_request_memo("User"), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+"""
+Unit tests for the shared Task Type catalog
+"""
+
+import unittest
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe_devsecops_dashboard.api.task_type_catalog import (
+    get_task_type_catalog,
+    get_catalog_task_type,
+    get_task_type_priorities
+)
+
+
+class TestTaskTypeCatalog(FrappeTestCase):
+    """Test cases for the Task Type catalog"""
+
+    def test_catalog_matches_database(self):
+        """The catalog holds every Task Type"""
+        self.assertEqual(
+            {row["name"] for row in get_task_type_catalog()},
+            set(frappe.get_all("Task Type", pluck="name"))
+        )
+
+    def test_catalog_is_priority_ordered(self):
+        """Rows are ordered by custom_priority like the phase calculations expect"""
+        priorities = [row.get("custom_priority") or 0 for row in get_task_type_catalog()]
+        self.assertEqual(priorities, sorted(priorities))
+
+    def test_priorities_default_to_999(self):
+        """Task Types without a priority sort last"""
+        for name, priority in get_task_type_priorities().items():
+            self.assertEqual(priority, get_catalog_task_type(name).get("custom_priority") or 999)
+
+    def test_unknown_task_type(self):
+        """Unknown names return None"""
+        self.assertIsNone(get_catalog_task_type("No Such Task Type"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Unit tests for buffered, sampled Zenhub API logging
+"""
+
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_graphql_api_log.zenhub_graphql_api_log import (
+    API_LOG_COMPRESSED_PREFIX,
+    API_LOG_DEAD_LETTER_KEY,
+    decode_log_payload,
+    flush_zenhub_api_log_buffer,
+    purge_expired_api_logs,
+    queue_zenhub_api_log,
+    reserve_api_log_names,
+    serialize_log_payload
+)
+
+LOG_MODULE = "frappe_devsecops_dashboard.frappe_devsecops_dashboard.doctype.zenhub_graphql_api_log.zenhub_graphql_api_log"
+
+
+def queue_log(status, operation="testBufferedLog"):
+    queue_zenhub_api_log(
+        reference_doctype="DocType",
+        reference_docname="Project",
+        operation_type="Query",
+        graphql_operation=operation,
+        status=status,
+        request_payload={"query": "query Q { viewer { id } }"},
+        response_data={"data": {"viewer": {"id": "1"}}},
+        http_status_code=200 if status == "Success" else 500
+    )
+
+
+class TestZenhubApiLogBuffer(FrappeTestCase):
+    """Test cases for queue_zenhub_api_log and flush_zenhub_api_log_buffer"""
+
+    def test_payload_is_compact_and_truncated(self):
+        """Payloads are stored without indentation and cut at the limit"""
+        self.assertEqual(serialize_log_payload({"a": 1, "b": [1, 2]}, 100), '{"a":1,"b":[1,2]}')
+
+        text = serialize_log_payload({"data": "x" * 500}, 50)
+        self.assertTrue(text.startswith('{"data":"xxx'))
+        self.assertIn("[truncated", text)
+        self.assertLess(len(text), 100)
+
+    def test_successful_calls_are_sampled(self):
+        """With a 0% sample rate successes are dropped but failures still buffered"""
+        cache = MagicMock()
+        cache.rpush.return_value = 1
+        settings = {"success_sample_rate": 0, "max_payload_length": 1000}
+
+        with patch(f"{LOG_MODULE}.get_api_log_settings", return_value=settings), \
+                patch(f"{LOG_MODULE}.frappe.cache", return_value=cache):
+            queue_log("Success")
+            cache.rpush.assert_not_called()
+
+            queue_log("Failed")
+            cache.rpush.assert_called_once()
+
+        record = json.loads(cache.rpush.call_args[0][1])
+        self.assertEqual(record["status"], "Failed")
+        self.assertEqual(record["response_data"], '{"data":{"viewer":{"id":"1"}}}')
+
+    def test_flush_bulk_inserts_buffered_logs(self):
+        """Buffered entries become Zenhub GraphQL API Log documents on flush"""
+        operation = f"testFlush{frappe.generate_hash(length=8)}"
+        queue_log("Failed", operation)
+        queue_log("Failed", operation)
+
+        written = flush_zenhub_api_log_buffer()
+
+        self.assertGreaterEqual(written, 2)
+        logs = frappe.get_all(
+            "Zenhub GraphQL API Log",
+            filters={"graphql_operation": operation},
+            fields=["name", "status"]
+        )
+        self.assertEqual(len(logs), 2)
+        self.assertTrue(all(log.name.startswith("ZHLOG-") for log in logs))
+
+        frappe.db.delete("Zenhub GraphQL API Log", {"graphql_operation": operation})
+        frappe.db.commit()
+
+    def test_names_continue_after_existing_logs(self):
+        """A missing series is seeded past logs that were named outside it"""
+        number = int(reserve_api_log_names(1)[0].rsplit("-", 1)[1]) + 50
+        frappe.get_doc({
+            "doctype": "Zenhub GraphQL API Log",
+            "reference_doctype": "DocType",
+            "reference_docname": "Project",
+            "operation_type": "Query",
+            "graphql_operation": "testSeriesSeed",
+            "status": "Failed"
+        }).insert(ignore_permissions=True, set_name=f"ZHLOG-{number:04d}")
+        frappe.db.sql("delete from `tabSeries` where `name` = %s", "ZHLOG-")
+
+        names = reserve_api_log_names(2)
+
+        self.assertEqual(names, [f"ZHLOG-{number + 1:04d}", f"ZHLOG-{number + 2:04d}"])
+        frappe.db.rollback()
+
+    def test_bad_record_does_not_block_the_buffer(self):
+        """A failing batch is retried per record; the bad record is dead-lettered, not re-queued"""
+        cache = MagicMock()
+        cache.make_key.side_effect = lambda key: key
+        pipeline = cache.pipeline.return_value
+        pipeline.execute.return_value = (
+            [json.dumps({"graphql_operation": op}) for op in ("good1", "bad", "good2")],
+            True
+        )
+
+        def insert(records):
+            if len(records) > 1 or records[0]["graphql_operation"] == "bad":
+                raise frappe.DuplicateEntryError
+
+        with patch(f"{LOG_MODULE}.frappe.cache", return_value=cache), \
+                patch(f"{LOG_MODULE}.insert_api_log_records", side_effect=insert), \
+                patch(f"{LOG_MODULE}.frappe.log_error") as log_error:
+            written = flush_zenhub_api_log_buffer(batch_size=10)
+
+        self.assertEqual(written, 2)
+        cache.lpush.assert_not_called()
+        dead_letter = cache.rpush.call_args[0]
+        self.assertEqual(dead_letter[0], API_LOG_DEAD_LETTER_KEY)
+        self.assertEqual(json.loads(dead_letter[1])["graphql_operation"], "bad")
+        log_error.assert_called_once()
+
+
+class TestZenhubApiLogRetention(FrappeTestCase):
+    """Test cases for payload compression and log retention"""
+
+    def test_large_payload_is_compressed_and_decoded(self):
+        """Large payloads are stored compressed and decode back to compact JSON"""
+        payload = {"data": {"issues": [{"id": i, "title": "Issue title"} for i in range(200)]}}
+
+        stored = serialize_log_payload(payload, 100000)
+
+        self.assertTrue(stored.startswith(API_LOG_COMPRESSED_PREFIX))
+        self.assertEqual(json.loads(decode_log_payload(stored)), payload)
+        self.assertEqual(decode_log_payload('{"a":1}'), '{"a":1}')
+
+    def test_purge_respects_retention_window(self):
+        """Logs older than the retention window are deleted, newer ones kept"""
+        operation = f"testPurge{frappe.generate_hash(length=8)}"
+        old_log = self.make_log(operation, frappe.utils.add_days(frappe.utils.now_datetime(), -3))
+        new_log = self.make_log(operation, frappe.utils.now_datetime())
+        settings = {
+            "success_sample_rate": 100,
+            "max_payload_length": 10000,
+            "success_retention_days": 1,
+            "failure_retention_days": 0
+        }
+
+        with patch(f"{LOG_MODULE}.get_api_log_settings", return_value=settings):
+            purge_expired_api_logs()
+
+        self.assertFalse(frappe.db.exists("Zenhub GraphQL API Log", old_log))
+        self.assertTrue(frappe.db.exists("Zenhub GraphQL API Log", new_log))
+
+        frappe.db.delete("Zenhub GraphQL API Log", {"graphql_operation": operation})
+        frappe.db.commit()
+
+    def make_log(self, operation, creation):
+        log = frappe.get_doc({
+            "doctype": "Zenhub GraphQL API Log",
+            "reference_doctype": "DocType",
+            "reference_docname": "Project",
+            "operation_type": "Query",
+            "graphql_operation": operation,
+            "status": "Success"
+        }).insert(ignore_permissions=True)
+        frappe.db.set_value("Zenhub GraphQL API Log", log.name, "creation", creation, update_modified=False)
+        return log.name
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Unit tests for batched Zenhub mutations and resumable onboarding
+"""
+
+import unittest
+from unittest.mock import patch
+from frappe_devsecops_dashboard.api.zenhub_bulk import (
+    build_batch_mutation,
+    parse_batch_response,
+    run_mutation_batches
+)
+from frappe_devsecops_dashboard.api.zenhub_create_entities import create_epics, plan_epics
+
+LOGGED_QUERY = "frappe_devsecops_dashboard.api.zenhub_graphql_logger.execute_graphql_query_with_logging"
+
+
+class FakeCache:
+    """Minimal in-memory stand-in for frappe.cache() hashes"""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def hset(self, name, key, value):
+        self.hashes.setdefault(name, {})[key] = value
+
+    def hgetall(self, name):
+        return dict(self.hashes.get(name, {}))
+
+    def expire(self, name, seconds):
+        pass
+
+    def make_key(self, key):
+        return key
+
+
+def answer_creates(query=None, variables=None, **kwargs):
+    """Fake Zenhub: every createIssue alias returns an issue named after its title"""
+    count = sum(1 for name in variables if name.startswith("title"))
+    return {"data": {
+        f"item{i}": {"issue": {"id": f"id-{variables[f'title{i}']}", "title": variables[f"title{i}"]}, "errors": []}
+        for i in range(count)
+    }}, True
+
+
+def answer_links(query=None, variables=None, **kwargs):
+    count = sum(1 for name in variables if name.startswith("issueId"))
+    return {"data": {f"item{i}": {"issue": {"id": variables[f"issueId{i}"]}, "errors": []} for i in range(count)}}, True
+
+
+def answer(query=None, variables=None, **kwargs):
+    return answer_links(query, variables) if "addIssueToProject" in query else answer_creates(query, variables)
+
+
+class TestZenhubBulkMutations(unittest.TestCase):
+    """Test cases for the aliased mutation batches"""
+
+    def test_mutation_aliases_each_item(self):
+        """Per-item variables are numbered, shared variables are declared once"""
+        mutation = build_batch_mutation(
+            "CreateIssues",
+            "createIssue(input: {repositoryId: $repositoryId, title: $title}) { issue { id } }",
+            {"title": "String!"},
+            2,
+            {"repositoryId": "ID!"}
+        )
+
+        self.assertIn("mutation CreateIssues($repositoryId: ID!, $title0: String!, $title1: String!)", mutation)
+        self.assertIn("item1: createIssue(input: {repositoryId: $repositoryId, title: $title1})", mutation)
+
+    def test_partial_batch_failure(self):
+        """An error with an alias path fails only that item"""
+        succeeded, failed = parse_batch_response(
+            {
+                "data": {"item0": {"issue": {"id": "a"}}, "item1": None},
+                "errors": [{"message": "Title too long", "path": ["item1"]}]
+            },
+            ["first", "second"]
+        )
+
+        self.assertEqual(list(succeeded), ["first"])
+        self.assertEqual(failed, {"second": "Title too long"})
+
+    @patch(LOGGED_QUERY)
+    def test_items_are_sent_in_batches(self, mock_query):
+        """25 items cost three requests; a failed request fails its own batch"""
+        mock_query.side_effect = [answer_creates(variables={f"title{i}": str(i) for i in range(10)}),
+                                  Exception("timeout"),
+                                  answer_creates(variables={f"title{i}": str(i) for i in range(5)})]
+        recorded = []
+
+        results, errors = run_mutation_batches(
+            {f"epic-{n}": {"title": f"Epic {n}"} for n in range(25)},
+            operation_name="createEpicIssues",
+            selection="createIssue(input: {title: $title}) { issue { id } }",
+            variable_types={"title": "String!"},
+            reference_doctype="Software Product",
+            reference_docname="ws",
+            on_batch_success=recorded.append
+        )
+
+        self.assertEqual(mock_query.call_count, 3)
+        self.assertEqual(len(results), 15)
+        self.assertEqual(set(errors), {f"epic-{n}" for n in range(10, 20)})
+        self.assertEqual([len(batch) for batch in recorded], [10, 5])
+
+
+@patch("frappe_devsecops_dashboard.api.zenhub_create_entities.get_epic_repository",
+       return_value={"id": "repo-1", "name": "api"})
+class TestCreateEpics(unittest.TestCase):
+    """Test cases for plan validation and resuming epic creation"""
+
+    def test_plan_rejects_duplicates_before_creating(self, mock_repo):
+        """A bad plan fails validation before any request"""
+        with self.assertRaises(Exception):
+            plan_epics(["Auth", " Auth "])
+        mock_repo.assert_not_called()
+
+    @patch(LOGGED_QUERY, side_effect=answer)
+    def test_rerun_only_creates_missing_epics(self, mock_query, mock_repo):
+        """Epics recorded by an earlier run are not created or linked again"""
+        cache = FakeCache()
+        titles = ["Auth", "Billing", "Reports"]
+
+        with patch("frappe.cache", return_value=cache):
+            epics, failed, resumed = create_epics("ws", "project-1", titles[:2])
+            mock_query.reset_mock()
+            # Same plan again: nothing left to send
+            epics, failed, resumed = create_epics("ws", "project-1", titles[:2])
+
+        self.assertEqual(mock_query.call_count, 0)
+        self.assertEqual(resumed, 2)
+        self.assertEqual([e["epic"]["id"] for e in epics], ["id-Auth", "id-Billing"])
+        self.assertEqual(failed, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+"""
+Unit tests for the shared Zenhub HTTP client
+"""
+
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe_devsecops_dashboard.api.zenhub_client import (
+    get_zenhub_session,
+    get_zenhub_headers,
+    get_single_flight_key,
+    get_retry_delay,
+    post_graphql,
+    run_concurrently,
+    single_flight,
+    ZENHUB_POOL_MAXSIZE,
+    ZENHUB_RETRY_MAX_DELAY
+)
+
+CLIENT_MODULE = "frappe_devsecops_dashboard.api.zenhub_client"
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis calls made by single_flight"""
+
+    def __init__(self):
+        self.store = {}
+
+    def make_key(self, key):
+        return f"test|{key}"
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def exists(self, key):
+        return key in self.store
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+class TestZenhubClient(FrappeTestCase):
+    """Test cases for the pooled Zenhub session"""
+
+    def test_session_is_reused(self):
+        """Every call in a worker shares one session"""
+        self.assertIs(get_zenhub_session(), get_zenhub_session())
+
+    def test_https_adapter_is_pooled(self):
+        """The HTTPS adapter uses the tuned pool size"""
+        adapter = get_zenhub_session().get_adapter("https://api.zenhub.com/public/graphql")
+        self.assertEqual(adapter._pool_maxsize, ZENHUB_POOL_MAXSIZE)
+
+    def test_headers_use_given_token(self):
+        """An explicit token is used without reading Zenhub Settings"""
+        headers = get_zenhub_headers("test-token")
+        self.assertEqual(headers["Authorization"], "Bearer test-token")
+        self.assertEqual(headers["Content-Type"], "application/json")
+
+
+    def test_run_concurrently_returns_results_by_key(self):
+        """Every call's return value is returned under its key"""
+        results = run_concurrently({"issues": lambda: [1, 2], "sprints": lambda: []})
+        self.assertEqual(results, {"issues": [1, 2], "sprints": []})
+
+    def test_run_concurrently_reraises_errors(self):
+        """An exception raised by a call reaches the caller"""
+        def failing_call():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            run_concurrently({"ok": lambda: 1, "failing": failing_call})
+
+
+
+class TestSingleFlight(FrappeTestCase):
+    """Test cases for coalescing identical concurrent Zenhub queries"""
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = patch("frappe_devsecops_dashboard.api.zenhub_client.frappe.cache", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def hold_lock(self, key, outcome=None, flight="flight-1"):
+        """Pretend another request is the leader for key"""
+        self.redis.set(self.redis.make_key(f"zenhub_single_flight_lock_{key}"), flight)
+        if outcome is not None:
+            self.publish(key, outcome, flight)
+
+    def publish(self, key, outcome, flight):
+        self.redis.set(self.redis.make_key(f"zenhub_single_flight_result_{key}_{flight}"), json.dumps(outcome))
+
+    def test_key_ignores_variable_order(self):
+        """The same query and variables always map to the same key"""
+        self.assertEqual(
+            get_single_flight_key("query Q { a }", {"a": 1, "b": 2}),
+            get_single_flight_key("query Q { a }", {"b": 2, "a": 1})
+        )
+        self.assertNotEqual(
+            get_single_flight_key("query Q { a }", {"a": 1}),
+            get_single_flight_key("query Q { a }", {"a": 2})
+        )
+
+    def test_leader_calls_and_releases_lock(self):
+        """The first caller makes the call and releases its lock"""
+        call = MagicMock(return_value={"workspace": {"id": "ws-1"}})
+
+        result = single_flight("leader", call)
+
+        self.assertEqual(result, {"workspace": {"id": "ws-1"}})
+        call.assert_called_once()
+        self.assertFalse(self.redis.exists(self.redis.make_key("zenhub_single_flight_lock_leader")))
+
+    def test_follower_reuses_leader_result(self):
+        """A caller arriving while the lock is held does not call Zenhub"""
+        self.hold_lock("follower", {"data": {"workspace": {"id": "ws-1"}}})
+        call = MagicMock()
+
+        result = single_flight("follower", call)
+
+        self.assertEqual(result, {"workspace": {"id": "ws-1"}})
+        call.assert_not_called()
+
+    def test_follower_reraises_leader_error(self):
+        """Followers fail with the leader's Frappe error"""
+        self.hold_lock("failed", {"error": "rate limited", "error_type": "ValidationError"})
+
+        with self.assertRaises(frappe.ValidationError):
+            single_flight("failed", MagicMock())
+
+    @patch("frappe_devsecops_dashboard.api.zenhub_client.time.sleep")
+    def test_follower_ignores_previous_flight(self, mock_sleep):
+        """A result left by an earlier flight of the same key is not reused"""
+        self.publish("stale", {"error": "rate limited", "error_type": "ValidationError"}, "flight-1")
+        self.hold_lock("stale", flight="flight-2")
+        # The current leader goes away without publishing a result
+        mock_sleep.side_effect = lambda _: self.redis.delete(self.redis.make_key("zenhub_single_flight_lock_stale"))
+        call = MagicMock(return_value={"workspace": {"id": "ws-1"}})
+
+        result = single_flight("stale", call)
+
+        self.assertEqual(result, {"workspace": {"id": "ws-1"}})
+        call.assert_called_once()
+
+
+class TestRateLimitRetries(FrappeTestCase):
+    """Test cases for the shared throttle and retry backoff"""
+
+    def setUp(self):
+        for target in ("acquire_rate_limit_token", "pause_rate_limit", "time.sleep"):
+            patcher = patch(f"frappe_devsecops_dashboard.api.zenhub_client.{target}")
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.session = MagicMock()
+        patcher = patch(
+            "frappe_devsecops_dashboard.api.zenhub_client.get_zenhub_session",
+            return_value=self.session
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_response(self, status_code, retry_after=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = {"Retry-After": retry_after} if retry_after else {}
+        return response
+
+    def test_retry_after_seconds_is_honoured(self):
+        """Retry-After in seconds is used as-is, within the cap"""
+        self.assertEqual(get_retry_delay(0, "7"), 7)
+        self.assertEqual(get_retry_delay(0, "3600"), ZENHUB_RETRY_MAX_DELAY)
+
+    def test_backoff_grows_with_jitter(self):
+        """Without Retry-After the delay is jittered within an exponential bound"""
+        for attempt in range(5):
+            delay = get_retry_delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(2 ** attempt, ZENHUB_RETRY_MAX_DELAY))
+
+    def test_rate_limited_query_is_retried(self):
+        """A 429 is retried and the successful response returned"""
+        self.session.post.side_effect = [self.make_response(429, "1"), self.make_response(200)]
+
+        response = post_graphql("query Q { viewer { id } }", token="test-token")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.session.post.call_count, 2)
+
+    @patch(f"{CLIENT_MODULE}.is_interactive_request", return_value=True)
+    def test_web_request_does_not_wait_past_budget(self, mock_interactive):
+        """In a web request a long Retry-After returns the 429 instead of sleeping"""
+        self.session.post.return_value = self.make_response(429, "20")
+
+        response = post_graphql("query Q { viewer { id } }", token="test-token")
+
+        self.assertEqual(response.status_code, 429)
+        self.session.post.assert_called_once()
+
+    @patch(f"{CLIENT_MODULE}.is_interactive_request", return_value=True)
+    def test_web_request_fails_when_throttled(self, mock_interactive):
+        """In a web request a throttle that does not clear in time raises instead of sending"""
+        with patch(f"{CLIENT_MODULE}.acquire_rate_limit_token", return_value=False):
+            with self.assertRaises(frappe.RateLimitExceededError):
+                post_graphql("query Q { viewer { id } }", token="test-token")
+
+        self.session.post.assert_not_called()
+
+    def test_mutation_is_not_retried_on_server_error(self):
+        """A 5xx mutation may have been applied, so it is returned without a retry"""
+        self.session.post.return_value = self.make_response(503)
+
+        response = post_graphql("mutation M { createIssue { id } }", token="test-token")
+
+        self.assertEqual(response.status_code, 503)
+        self.session.post.assert_called_once()
+
+    def test_retries_are_bounded(self):
+        """The last response is returned once retries are exhausted"""
+        self.session.post.return_value = self.make_response(503)
+
+        response = post_graphql("query Q { viewer { id } }", token="test-token", max_retries=2)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.session.post.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
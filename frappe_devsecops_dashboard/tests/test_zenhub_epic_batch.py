@@ -0,0 +1,124 @@
+"""
+Unit tests for batched multi-epic ZenHub queries
+"""
+
+import unittest
+from unittest.mock import patch
+from frappe_devsecops_dashboard.api.zenhub import (
+    ZENHUB_EPIC_BATCH_SIZE,
+    get_issues_by_epics,
+    get_issues_by_epics_query
+)
+
+LOGGED_QUERY = "frappe_devsecops_dashboard.api.zenhub_graphql_logger.execute_graphql_query_with_logging"
+
+
+def make_epic(epic_id, child_ids):
+    return {
+        "id": epic_id,
+        "childIssues": {
+            "nodes": [
+                {
+                    "id": child_id,
+                    "title": f"Issue {child_id}",
+                    "state": "OPEN",
+                    "estimate": {"value": 3},
+                    "assignees": {"nodes": [{"login": "dev1"}]},
+                    "pipeline": {"name": "In Progress"},
+                    "blockedBy": {"nodes": []}
+                }
+                for child_id in child_ids
+            ]
+        }
+    }
+
+
+def answer_batch(query=None, variables=None, **kwargs):
+    """Fake Zenhub: every epic has one child named after it"""
+    return {"data": {
+        f"epic{i}": make_epic(variables[f"id{i}"], [f"{variables[f'id{i}']}-child"])
+        for i in range(len(variables))
+    }}, True
+
+
+class TestZenhubEpicBatch(unittest.TestCase):
+    """Test cases for get_issues_by_epics"""
+
+    def test_query_aliases_each_epic(self):
+        """One aliased node(id:) selection and variable per epic"""
+        query = get_issues_by_epics_query(3)
+
+        self.assertIn("$id0: ID!, $id1: ID!, $id2: ID!", query)
+        self.assertIn("epic2: node(id: $id2)", query)
+        self.assertNotIn("epic3", query)
+
+    @patch(LOGGED_QUERY)
+    def test_epics_are_fetched_in_chunks(self, mock_query):
+        """30 epics cost two requests, and children are keyed by epic"""
+        mock_query.side_effect = answer_batch
+        epic_ids = [f"epic-{n}" for n in range(30)]
+
+        result = get_issues_by_epics(epic_ids)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(mock_query.call_count, -(-30 // ZENHUB_EPIC_BATCH_SIZE))
+        self.assertEqual(list(result["issues_by_epic"]), epic_ids)
+        child = result["issues_by_epic"]["epic-7"][0]
+        self.assertEqual(child["id"], "epic-7-child")
+        self.assertEqual(child["assignees"], ["dev1"])
+        self.assertEqual(child["pipeline"], "In Progress")
+
+    @patch(LOGGED_QUERY)
+    def test_accepts_json_and_drops_duplicates(self, mock_query):
+        """The whitelisted form takes a JSON list; repeated IDs are queried once"""
+        mock_query.side_effect = answer_batch
+
+        result = get_issues_by_epics('["e1", "e2", "e1", ""]')
+
+        self.assertEqual(mock_query.call_args.kwargs["variables"], {"id0": "e1", "id1": "e2"})
+        self.assertEqual(sorted(result["issues_by_epic"]), ["e1", "e2"])
+
+    @patch(LOGGED_QUERY)
+    def test_failed_chunk_only_marks_its_epics(self, mock_query):
+        """A failing chunk is reported per epic without losing the other chunks"""
+        epic_ids = [f"epic-{n}" for n in range(ZENHUB_EPIC_BATCH_SIZE + 1)]
+
+        def side_effect(query=None, variables=None, **kwargs):
+            if "epic-0" in variables.values():
+                raise Exception("complexity exceeded")
+            return answer_batch(query, variables)
+
+        mock_query.side_effect = side_effect
+        result = get_issues_by_epics(epic_ids)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["errors"]["epic-0"], "complexity exceeded")
+        self.assertEqual(list(result["issues_by_epic"]), [epic_ids[-1]])
+
+    @patch(LOGGED_QUERY)
+    def test_missing_epic_is_reported(self, mock_query):
+        """node(id:) returns null for unknown IDs"""
+        mock_query.return_value = ({"data": {"epic0": None}}, True)
+
+        result = get_issues_by_epics(["missing"])
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["errors"], {"missing": "Epic not found"})
+
+    @patch(LOGGED_QUERY)
+    def test_alias_error_only_marks_its_epic(self, mock_query):
+        """A GraphQL error on one alias leaves the rest of the chunk intact"""
+        data, _ = answer_batch(variables={"id0": "e1", "id1": "gone", "id2": "e3"})
+        data["data"]["epic1"] = None
+        data["errors"] = [{"message": "Could not resolve to a node", "path": ["epic1"]}]
+        mock_query.return_value = (data, False)
+
+        result = get_issues_by_epics(["e1", "gone", "e3"])
+
+        self.assertTrue(result["success"])
+        self.assertEqual(list(result["issues_by_epic"]), ["e1", "e3"])
+        self.assertEqual(result["errors"], {"gone": "Could not resolve to a node"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for cursor-paginated ZenHub workspace issue fetching
+"""
+
+import unittest
+from unittest.mock import patch
+from frappe_devsecops_dashboard.api.zenhub import iter_workspace_issues, calculate_sprint_metrics
+
+
+def make_page(issue_ids, end_cursor=None, has_next_page=False):
+    return {
+        "workspace": {
+            "id": "ws-1",
+            "name": "Workspace One",
+            "issues": {
+                "totalCount": 3,
+                "pageInfo": {"hasNextPage": has_next_page, "endCursor": end_cursor},
+                "nodes": [
+                    {"id": issue_id, "state": "closed", "estimate": {"value": 2}, "assignees": {"nodes": []}}
+                    for issue_id in issue_ids
+                ]
+            }
+        }
+    }
+
+
+class TestZenhubPagination(unittest.TestCase):
+    """Test cases for iter_workspace_issues"""
+
+    @patch("frappe_devsecops_dashboard.api.zenhub.execute_graphql_query")
+    def test_follows_cursors_until_last_page(self, mock_query):
+        """Every page is fetched with the previous page's endCursor"""
+        mock_query.side_effect = [
+            make_page(["i1", "i2"], end_cursor="c1", has_next_page=True),
+            make_page(["i3"])
+        ]
+        workspace = {}
+
+        issues = list(iter_workspace_issues("ws-1", page_size=2, workspace_info=workspace))
+
+        self.assertEqual([i["id"] for i in issues], ["i1", "i2", "i3"])
+        self.assertEqual(mock_query.call_args_list[0][0][1]["after"], None)
+        self.assertEqual(mock_query.call_args_list[1][0][1]["after"], "c1")
+        self.assertEqual(mock_query.call_args_list[1][0][1]["first"], 2)
+        self.assertEqual(workspace["name"], "Workspace One")
+        self.assertEqual(workspace["total_count"], 3)
+
+    @patch("frappe_devsecops_dashboard.api.zenhub.execute_graphql_query")
+    def test_page_size_is_capped(self, mock_query):
+        """Zenhub accepts at most 100 issues per page"""
+        mock_query.return_value = make_page([])
+
+        list(iter_workspace_issues("ws-1", page_size=500))
+
+        self.assertEqual(mock_query.call_args[0][1]["first"], 100)
+
+    @patch("frappe_devsecops_dashboard.api.zenhub.execute_graphql_query")
+    def test_metrics_consume_stream(self, mock_query):
+        """calculate_sprint_metrics accepts the iterator and counts every page"""
+        mock_query.side_effect = [
+            make_page(["i1", "i2"], end_cursor="c1", has_next_page=True),
+            make_page(["i3"])
+        ]
+
+        metrics = calculate_sprint_metrics(
+            {"id": "ws-1", "name": "Workspace One", "issues": {"nodes": iter_workspace_issues("ws-1")}},
+            include_issues=False
+        )
+
+        self.assertEqual(metrics["issues_summary"]["total"], 3)
+        self.assertEqual(metrics["completed_story_points"], 6)
+        self.assertEqual(metrics["issues"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Unit tests for per-sprint caching of the stakeholder sprint report
+"""
+
+import unittest
+from unittest.mock import patch
+from frappe_devsecops_dashboard.api.zenhub import (
+    SPRINT_REPORT_OPEN_CACHE_TTL,
+    get_sprint_report_cache_key,
+    get_stakeholder_sprint_reports
+)
+
+
+class FakeCache:
+    """Minimal in-memory stand-in for frappe.cache() get_value/set_value"""
+
+    def __init__(self):
+        self.store = {}
+        self.expiry = {}
+
+    def get_value(self, key):
+        return self.store.get(key)
+
+    def set_value(self, key, value, expires_in_sec=None):
+        self.store[key] = value
+        self.expiry[key] = expires_in_sec
+
+
+def make_sprint(sprint_id, state, end_date="2025-01-14", issue_states=("CLOSED",)):
+    return {
+        "id": sprint_id,
+        "name": f"Sprint {sprint_id}",
+        "state": state,
+        "startDate": "2025-01-01",
+        "endDate": end_date,
+        "issues": {
+            "totalCount": len(issue_states),
+            "nodes": [
+                {"id": f"{sprint_id}-{n}", "state": s, "estimate": {"value": 1}, "assignees": {"nodes": []}}
+                for n, s in enumerate(issue_states)
+            ]
+        }
+    }
+
+
+def listing(sprint):
+    return {k: sprint[k] for k in ("id", "name", "state", "startDate", "endDate")}
+
+
+class TestSprintReportCache(unittest.TestCase):
+    """Test cases for get_stakeholder_sprint_reports"""
+
+    def setUp(self):
+        self.cache = FakeCache()
+        patcher = patch("frappe_devsecops_dashboard.api.zenhub.frappe.cache", return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.closed = make_sprint("s1", "CLOSED")
+        self.active = make_sprint("s2", "ACTIVE", end_date="2025-01-28", issue_states=("OPEN",))
+
+    def answer(self, *sprints):
+        by_id = {s["id"]: s for s in sprints}
+        return lambda query, variables, **kwargs: {
+            f"sprint{i}": by_id.get(variables[f"id{i}"]) for i in range(len(variables))
+        }
+
+    @patch("frappe_devsecops_dashboard.api.zenhub.execute_graphql_query")
+    def test_closed_sprints_are_cached_indefinitely(self, mock_query):
+        """A closed sprint is fetched once and never expires; the active one is refetched"""
+        mock_query.side_effect = self.answer(self.closed, self.active)
+        sprints = [listing(self.closed), listing(self.active)]
+
+        first, cached = get_stakeholder_sprint_reports(sprints, "PROJ-1")
+        self.assertEqual(cached, 0)
+        self.assertEqual(mock_query.call_args[0][1], {"id0": "s1", "id1": "s2"})
+        self.assertIsNone(self.cache.expiry[get_sprint_report_cache_key(self.closed)])
+        self.assertEqual(self.cache.expiry[get_sprint_report_cache_key(self.active)], SPRINT_REPORT_OPEN_CACHE_TTL)
+
+        second, cached = get_stakeholder_sprint_reports(sprints, "PROJ-1")
+        self.assertEqual(cached, 1)
+        self.assertEqual(mock_query.call_args[0][1], {"id0": "s2"})
+        self.assertEqual([r["sprint_id"] for r in second], ["s1", "s2"])
+        self.assertEqual(first, second)
+
+    @patch("frappe_devsecops_dashboard.api.zenhub.transform_stakeholder_sprint_data")
+    @patch("frappe_devsecops_dashboard.api.zenhub.execute_graphql_query")
+    def test_unchanged_open_sprint_is_not_recomputed(self, mock_query, mock_transform):
+        """Metrics are recomputed only when an open sprint's data changes"""
+        mock_transform.side_effect = lambda sprint: {"sprint_id": sprint["id"]}
+        mock_query.side_effect = self.answer(self.active)
+
+        get_stakeholder_sprint_reports([listing(self.active)], "PROJ-1")
+        get_stakeholder_sprint_reports([listing(self.active)], "PROJ-1")
+        self.assertEqual(mock_transform.call_count, 1)
+
+        changed = make_sprint("s2", "ACTIVE", end_date="2025-01-28", issue_states=("CLOSED",))
+        mock_query.side_effect = self.answer(changed)
+        get_stakeholder_sprint_reports([listing(changed)], "PROJ-1")
+        self.assertEqual(mock_transform.call_count, 2)
+
+    @patch("frappe_devsecops_dashboard.api.zenhub.execute_graphql_query")
+    def test_force_refresh_refetches_closed_sprints(self, mock_query):
+        """force_refresh bypasses the per-sprint cache"""
+        mock_query.side_effect = self.answer(self.closed)
+
+        get_stakeholder_sprint_reports([listing(self.closed)], "PROJ-1")
+        _, cached = get_stakeholder_sprint_reports([listing(self.closed)], "PROJ-1", force_refresh=True)
+
+        self.assertEqual(cached, 0)
+        self.assertEqual(mock_query.call_count, 2)
+
+    def test_closed_key_includes_end_date(self):
+        """Editing a closed sprint's end date invalidates its entry"""
+        moved = dict(self.closed, endDate="2025-01-15")
+
+        self.assertNotEqual(get_sprint_report_cache_key(self.closed), get_sprint_report_cache_key(moved))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Unit tests for the workspace issue index behind the task summary
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+from frappe_devsecops_dashboard.api.zenhub import find_task_related_issues
+from frappe_devsecops_dashboard.api.zenhub_workspace_helper import (
+    WorkspaceIssueIndex,
+    normalize_title_tokens
+)
+
+
+def make_issue(issue_id, number, title, epic_id=None):
+    return {
+        "id": issue_id,
+        "number": number,
+        "title": title,
+        "type": None,
+        "state": "OPEN",
+        "estimate": 2,
+        "repository": "api",
+        "html_url": f"https://github.com/org/api/issues/{number}",
+        "epic_id": epic_id
+    }
+
+
+WORKSPACE = {
+    "name": "Platform",
+    "issues": [
+        make_issue("epic-1", 1, "PROJ-0001-Login revamp"),
+        make_issue("i-2", 2, "Add SSO button", epic_id="epic-1"),
+        make_issue("i-3", 3, "Audit login errors"),
+        # Past the first 50 issues the old scan looked at
+        *[make_issue(f"i-{n}", n, f"Unrelated {n}") for n in range(4, 80)],
+        make_issue("i-80", 80, "Revamp login copy")
+    ]
+}
+
+
+def make_task(epic_id=None, subject="Login revamp"):
+    task = MagicMock()
+    task.name = "TASK-2026-00001"
+    task.subject = subject
+    task.get.side_effect = lambda field: {"custom_zenhub_epic_id": epic_id}.get(field)
+    return task
+
+
+class TestWorkspaceIssueIndex(unittest.TestCase):
+    """Test cases for WorkspaceIssueIndex"""
+
+    def test_title_tokens_are_normalized(self):
+        """Punctuation splits tokens; case, duplicates and single characters are dropped"""
+        self.assertEqual(
+            normalize_title_tokens("PROJ-0001: Fix login, fix A"),
+            ["proj", "0001", "fix", "login"]
+        )
+
+    def test_epic_lookup(self):
+        """The epic comes first, followed by its children"""
+        index = WorkspaceIssueIndex(WORKSPACE)
+
+        self.assertEqual([i["id"] for i in index.get_epic_issues("epic-1")], ["epic-1", "i-2"])
+        self.assertFalse(index.has_epic("epic-9"))
+
+    def test_title_lookup_needs_every_token(self):
+        """Issues match regardless of word order, at any position in the workspace"""
+        index = WorkspaceIssueIndex(WORKSPACE)
+
+        matches = index.find_issues_by_title("login revamp")
+
+        self.assertEqual([i["id"] for i in matches], ["epic-1", "i-80"])
+        self.assertEqual(index.find_issues_by_title("login sso"), [])
+
+    def test_snapshot_without_issue_list(self):
+        """Older snapshots are indexed from their sprint tasks"""
+        index = WorkspaceIssueIndex({
+            "sprints": [{"tasks": [{"id": "t1", "number": 7, "title": "Login", "epic": {"id": "e1"}}]}]
+        })
+
+        self.assertEqual([i["id"] for i in index.get_epic_issues("e1")], ["t1"])
+
+
+@patch("frappe_devsecops_dashboard.api.zenhub_workspace_helper.get_workspace_snapshot",
+       return_value=(WORKSPACE, {}))
+class TestFindTaskRelatedIssues(unittest.TestCase):
+    """Test cases for find_task_related_issues"""
+
+    @patch("frappe_devsecops_dashboard.api.zenhub.execute_graphql_query")
+    def test_related_issues_from_snapshot(self, mock_query, mock_snapshot):
+        """Epic and title matches come from the snapshot, without a Zenhub request"""
+        result = find_task_related_issues(make_task(epic_id="epic-1"), "ws-1")
+
+        mock_query.assert_not_called()
+        self.assertEqual(result["workspace_name"], "Platform")
+        self.assertEqual([i["id"] for i in result["related_issues"]], ["epic-1", "i-2", "i-80"])
+        self.assertEqual(result["related_issues"][1]["story_points"], 2)
+
+    @patch("frappe_devsecops_dashboard.api.zenhub.execute_graphql_query")
+    def test_unknown_epic_is_fetched_by_node(self, mock_query, mock_snapshot):
+        """An epic missing from the snapshot costs one node(id:) query"""
+        mock_query.return_value = {"node": {
+            "id": "epic-new",
+            "title": "PROJ-0001-Payments",
+            "number": 90,
+            "estimate": {"value": 5},
+            "childIssues": {"nodes": [{"id": "i-91", "title": "Refunds", "number": 91}]}
+        }}
+
+        result = find_task_related_issues(make_task(epic_id="epic-new", subject="Payments"), "ws-1")
+
+        self.assertEqual(mock_query.call_args[0][1], {"epicId": "epic-new"})
+        self.assertEqual([i["id"] for i in result["related_issues"]], ["epic-new", "i-91"])
+        self.assertEqual(result["related_issues"][0]["story_points"], 5)
+
+    def test_nothing_related(self, mock_snapshot):
+        """No epic and no title match returns None"""
+        self.assertIsNone(find_task_related_issues(make_task(subject="Payroll export"), "ws-1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
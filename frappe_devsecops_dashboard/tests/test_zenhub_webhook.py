@@ -0,0 +1,87 @@
+"""
+Unit tests for the Zenhub webhook receiver and targeted cache eviction
+"""
+
+import hashlib
+import hmac
+import unittest
+from unittest.mock import MagicMock, patch
+from frappe_devsecops_dashboard.api.zenhub_webhook import (
+    evict_for_event,
+    get_webhook_event_kind,
+    verify_webhook_signature
+)
+
+SECRET = "test-webhook-secret"
+MODULE = "frappe_devsecops_dashboard.api.zenhub_webhook"
+
+
+def sign(body):
+    return "sha256=" + hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+
+
+class TestZenhubWebhook(unittest.TestCase):
+    """Test cases for signature checks, event mapping and eviction"""
+
+    @patch(f"{MODULE}._get_webhook_secret", return_value=SECRET)
+    def test_signature(self, mock_secret):
+        """Only a signature made with the configured secret is accepted"""
+        body = b'{"type": "estimate_set"}'
+
+        self.assertTrue(verify_webhook_signature(body, sign(body)))
+        self.assertTrue(verify_webhook_signature(body, sign(body).split("=", 1)[1]))
+        self.assertFalse(verify_webhook_signature(body + b" ", sign(body)))
+        self.assertFalse(verify_webhook_signature(body, None))
+
+    @patch(f"{MODULE}._get_webhook_secret", return_value=SECRET)
+    def test_non_ascii_signature_is_rejected(self, mock_secret):
+        """A header with non-ASCII characters fails the check instead of raising"""
+        self.assertFalse(verify_webhook_signature(b"{}", "sha256=" + "é" * 64))
+
+    @patch(f"{MODULE}._get_webhook_secret", return_value=None)
+    def test_signature_without_secret(self, mock_secret):
+        """Nothing is accepted until a secret is configured"""
+        self.assertFalse(verify_webhook_signature(b"{}", sign(b"{}")))
+
+    def test_event_kinds(self):
+        """Zenhub event types map to the four supported kinds"""
+        self.assertEqual(get_webhook_event_kind("issue_transfer"), "pipeline")
+        self.assertEqual(get_webhook_event_kind("estimate_cleared"), "estimate")
+        self.assertEqual(get_webhook_event_kind("sprint_closed"), "sprint")
+        self.assertEqual(get_webhook_event_kind("issue_reprioritized"), "issue")
+        self.assertIsNone(get_webhook_event_kind("release_created"))
+
+    @patch(f"{MODULE}.queue_workspace_issue_sync")
+    @patch(f"{MODULE}._get_workspace_projects", return_value=["PROJ-1"])
+    @patch(f"{MODULE}.evict_workspace_snapshot")
+    @patch(f"{MODULE}.frappe.cache")
+    def test_evicts_only_affected_keys(self, mock_cache, mock_snapshot, mock_projects, mock_sync):
+        """The event's workspace, its projects and its sprint are evicted, nothing else"""
+        cache = MagicMock()
+        mock_cache.return_value = cache
+
+        evicted = evict_for_event(workspace_id="ws-1", sprint_id="sp-1", epic_id="ep-1")
+
+        self.assertEqual(evicted, ["sprint:sp-1", "workspace:ws-1", "project:PROJ-1", "issue_mirror:ws-1", "epic:ep-1"])
+        mock_snapshot.assert_called_once_with("ws-1")
+        mock_sync.assert_called_once_with("ws-1")
+        deleted = [c.args[0] for c in cache.delete_value.call_args_list]
+        self.assertIn("zenhub_sprint_report_open_sp-1", deleted)
+        self.assertIn("zenhub_sprint_data_stakeholder_PROJ-1", deleted)
+        patterns = [c.args[0] for c in cache.delete_keys.call_args_list]
+        self.assertEqual(patterns, ["zenhub_sprint_report_closed_sp-1_", "zenhub_sprint_data_PROJ-1_"])
+
+    @patch(f"{MODULE}.queue_workspace_issue_sync")
+    @patch(f"{MODULE}.evict_workspace_snapshot")
+    @patch(f"{MODULE}.frappe.cache")
+    def test_sprint_only_event_keeps_workspace(self, mock_cache, mock_snapshot, mock_sync):
+        """An event without a workspace leaves workspace caches alone"""
+        mock_cache.return_value = MagicMock()
+
+        self.assertEqual(evict_for_event(sprint_id="sp-2"), ["sprint:sp-2"])
+        mock_snapshot.assert_not_called()
+        mock_sync.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,8 +18,9 @@ from frappe.test_runner import make_test_objects
 
 # Import the helper class
 try:
-    from frappe_devsecops_dashboard.api.zenhub_workspace_helper import ZenhubWorkspaceHelper
+    from frappe_devsecops_dashboard.api.zenhub_workspace_helper import ZenhubWorkspaceHelper, WorkspaceModel
     from frappe_devsecops_dashboard.api import zenhub_workspace_api
+    from frappe_devsecops_dashboard.api import zenhub_workspace_helper
 except ImportError:
     # In case imports fail, we'll skip the tests
     skip_tests = True
@@ -231,7 +232,7 @@ class TestZenhubWorkspaceAPI(unittest.TestCase):
         # Assertions
         self.assertTrue(result["success"])
         self.assertEqual(result["workspace"]["name"], "Test Workspace")
-        mock_helper_class.assert_called_once_with(self.workspace_id)
+        mock_helper_class.assert_called_once_with(self.workspace_id, force_refresh=False)
 
     def test_get_workspace_summary_api_missing_workspace_id(self):
         """Test get_workspace_summary API with missing workspace_id."""
@@ -306,6 +307,143 @@ class TestZenhubWorkspaceAPI(unittest.TestCase):
         self.assertEqual(result["team_members"][0]["name"], "John Doe")
 
 
+class TestWorkspaceSnapshot(unittest.TestCase):
+    """Test cases for the shared, stale-while-revalidate workspace snapshot."""
+
+    def setUp(self):
+        """Use the shared snapshot path, which is bypassed in tests by default."""
+        self.workspace_id = "test-workspace-snapshot"
+        self.workspace_data = {"id": self.workspace_id, "name": "Snapshot", "projects": [], "sprints": []}
+        self.in_test = frappe.flags.in_test
+        frappe.flags.in_test = False
+
+    def tearDown(self):
+        frappe.flags.in_test = self.in_test
+
+    def make_snapshot(self, age):
+        import time
+        return {"fetched_at": time.time() - age, "fetched_on": "2025-01-15 10:30:00", "data": self.workspace_data}
+
+    @patch('frappe_devsecops_dashboard.api.zenhub_workspace_helper._queue_workspace_snapshot_refresh')
+    @patch('frappe_devsecops_dashboard.api.zenhub_workspace_helper._read_workspace_snapshot')
+    def test_fresh_snapshot_is_served(self, mock_read, mock_queue):
+        """A snapshot within the soft TTL is served without a refresh."""
+        mock_read.return_value = self.make_snapshot(age=10)
+
+        data, info = zenhub_workspace_helper.get_workspace_snapshot(self.workspace_id)
+
+        self.assertEqual(data, self.workspace_data)
+        self.assertTrue(info["cached"])
+        self.assertFalse(info["stale"])
+        mock_queue.assert_not_called()
+
+    @patch('frappe_devsecops_dashboard.api.zenhub_workspace_helper._queue_workspace_snapshot_refresh')
+    @patch('frappe_devsecops_dashboard.api.zenhub_workspace_helper._read_workspace_snapshot')
+    def test_stale_snapshot_is_served_and_refreshed(self, mock_read, mock_queue):
+        """A snapshot past the soft TTL is served immediately and refreshed in the background."""
+        mock_read.return_value = self.make_snapshot(age=zenhub_workspace_helper.WORKSPACE_SNAPSHOT_SOFT_TTL + 1)
+
+        data, info = zenhub_workspace_helper.get_workspace_snapshot(self.workspace_id)
+
+        self.assertEqual(data, self.workspace_data)
+        self.assertTrue(info["stale"])
+        mock_queue.assert_called_once_with(self.workspace_id)
+
+    @patch('frappe_devsecops_dashboard.api.zenhub_workspace_helper.refresh_workspace_snapshot')
+    @patch('frappe_devsecops_dashboard.api.zenhub_workspace_helper._read_workspace_snapshot')
+    def test_missing_snapshot_is_fetched_inline(self, mock_read, mock_refresh):
+        """Without a snapshot (or after the hard TTL) the workspace is fetched inline."""
+        mock_read.return_value = None
+        mock_refresh.return_value = self.workspace_data
+
+        data, info = zenhub_workspace_helper.get_workspace_snapshot(self.workspace_id)
+
+        self.assertEqual(data, self.workspace_data)
+        self.assertFalse(info["cached"])
+        mock_refresh.assert_called_once()
+
+    @patch('frappe_devsecops_dashboard.api.zenhub_workspace_helper._release_workspace_snapshot_refresh_lock')
+    def test_inline_refresh_keeps_queued_lock(self, mock_release):
+        """An inline refresh never took the lock, so it must not release a queued job's."""
+        helper = MagicMock(_fetch_failed=True)
+        helper._fetch_workspace_data.return_value = self.workspace_data
+
+        zenhub_workspace_helper.refresh_workspace_snapshot(self.workspace_id, helper=helper)
+
+        mock_release.assert_not_called()
+
+    @patch('frappe_devsecops_dashboard.api.zenhub_workspace_helper._release_workspace_snapshot_refresh_lock')
+    def test_queued_refresh_releases_its_own_lock(self, mock_release):
+        """The background job releases the lock only through the token it was queued with."""
+        helper = MagicMock(_fetch_failed=True)
+        helper._fetch_workspace_data.return_value = self.workspace_data
+
+        zenhub_workspace_helper.refresh_workspace_snapshot(self.workspace_id, helper=helper, lock_token="token-1")
+
+        mock_release.assert_called_once_with(self.workspace_id, "token-1")
+
+
+class TestWorkspaceModel(unittest.TestCase):
+    """Test cases for the indexed WorkspaceModel."""
+
+    def setUp(self):
+        """A task shared by two projects, as the epic grouping produces."""
+        shared = {"id": "t1", "status": "Done", "estimate": 5, "assignees": [{"id": "u1", "name": "Ann"}]}
+        other = {"id": "t2", "status": "To Do", "estimate": 2, "assignees": [{"id": "u2", "name": "Bo"}]}
+        self.workspace = {
+            "projects": [
+                {"id": "p1", "epics": [{"id": "e1", "title": "Epic 1", "sprints": [{"id": "s1", "tasks": [shared]}]}]},
+                {"id": "p2", "epics": [
+                    {"id": "e1", "title": "Epic 1", "sprints": [{"id": "s1", "tasks": [shared]}]},
+                    {"id": "e2", "title": "Epic 2", "sprints": [{"id": "s2", "tasks": [other]}]}
+                ]}
+            ],
+            "sprints": [
+                {"id": "s1", "name": "Sprint 1", "tasks": [shared]},
+                {"id": "s2", "name": "Sprint 2", "tasks": [other]}
+            ]
+        }
+
+    def test_indexes(self):
+        """Tasks are stored once and related through ID indexes."""
+        model = WorkspaceModel(self.workspace)
+
+        self.assertEqual(list(model.tasks), ["t1", "t2"])
+        self.assertEqual(model.epic_task_ids["e1"], ["t1"])
+        self.assertEqual(model.epic_project_ids["e1"], ["p1", "p2"])
+        self.assertEqual(model.project_task_ids["p2"], ["t1", "t2"])
+        self.assertEqual(model.assignee_task_ids["u2"], ["t2"])
+        self.assertEqual(model.sprint_task_ids["s2"], ["t2"])
+
+    def test_sprints_for_tasks(self):
+        """Sprints are narrowed to the requested tasks without touching the originals."""
+        model = WorkspaceModel(self.workspace)
+
+        sprints = model.get_sprints_for_tasks(["t2"])
+
+        self.assertEqual([s["id"] for s in sprints], ["s2"])
+        self.assertEqual(len(self.workspace["sprints"][0]["tasks"]), 1)
+
+    @patch('frappe_devsecops_dashboard.api.zenhub.get_zenhub_token')
+    def test_filters_do_not_modify_summary(self, mock_get_token):
+        """Filtering returns copies, so the helper's summary stays whole."""
+        helper = ZenhubWorkspaceHelper("ws")
+        summary = {"workspace": self.workspace}
+
+        with patch.object(helper, 'get_workspace_summary_json', return_value=summary):
+            by_epic = helper.filter_by_epic("e2")
+            by_project = helper.filter_by_project("p1")
+            utilization = helper.get_team_utilization()
+
+        self.assertEqual(by_epic["task_count"], 1)
+        self.assertEqual([p["id"] for p in by_epic["workspace"]["projects"]], ["p2"])
+        self.assertEqual([s["id"] for s in by_project["workspace"]["sprints"]], ["s1"])
+        self.assertEqual(len(self.workspace["projects"]), 2)
+        # The shared task counts once for its assignee
+        ann = next(m for m in utilization["team_members"] if m["id"] == "u1")
+        self.assertEqual(ann["task_count"], 1)
+
+
 if __name__ == "__main__":
     if not skip_tests:
         unittest.main()
@@ -0,0 +1,16 @@
+import frappe
+
+
+def get_context(context):
+	"""
+	Provide context for the DevSecOps Dashboard single-page app.
+	"""
+	# The page embeds the session's CSRF token
+	context.no_cache = 1
+
+	# socket.io namespace and, under `bench start`, the port of the realtime
+	# server (behind nginx it is proxied on the same origin)
+	context.site_name = frappe.local.site
+	context.socketio_port = frappe.conf.socketio_port if getattr(frappe.local, "dev_server", False) else ""
+
+	return context
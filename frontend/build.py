@@ -152,6 +152,11 @@ def update_html_template(js_file, css_file):
             csrf_script = "    <script>window.csrf_token='{{ frappe.session.csrf_token }}'</script>"
             html_content = html_content.replace('</body>', f'{csrf_script}\n  </body>')
 
+        # Ensure realtime settings script is present
+        if "window.site_name" not in html_content:
+            realtime_script = "    <script>window.site_name='{{ site_name }}'; window.socketio_port='{{ socketio_port }}'</script>"
+            html_content = html_content.replace('</body>', f'{realtime_script}\n  </body>')
+
         # Write updated HTML
         with open(dest_html, 'w') as f:
             f.write(html_content)
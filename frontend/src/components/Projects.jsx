@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { Row, Col, Card, Spin, Empty, Button, Space, Typography, theme, Input, Select, Table, Tag, Progress, Tooltip, Avatar, Descriptions, Popconfirm, message, Segmented, Collapse, Badge } from 'antd'
 import { PlusOutlined, SearchOutlined, FilterOutlined, ProjectOutlined, ReloadOutlined, TableOutlined, AppstoreOutlined, CalendarOutlined, UserOutlined, TeamOutlined, PrinterOutlined, BarChartOutlined, EditOutlined, CloseCircleOutlined, RightOutlined, DownOutlined, ClearOutlined, SettingOutlined } from '@ant-design/icons'
 import ProjectCard from './ProjectCard'
@@ -6,6 +6,11 @@ import SprintReportDialog from './SprintReportDialog'
 import api from '../services/api'
 import { useResponsive } from '../hooks/useResponsive'
 import { getHeaderBannerStyle, getHeaderIconColor } from '../utils/themeUtils'
+import { getProjectDetails } from '../utils/erpnextApiUtils'
+import { subscribeDashboardDeltas, applyProjectDelta, applyProjectCounters } from '../utils/realtimeUtils'
+
+// Task deltas arriving within this window reload a project's counters once
+const COUNTER_RELOAD_DELAY_MS = 1000
 
 const { Title, Text } = Typography
 const { Panel } = Collapse
@@ -94,6 +99,41 @@ function Projects({ navigateToRoute, showProjectDetail, selectedProjectId }) {
     fetchSoftwareProducts()
   }, [])
 
+  // Pending counter reloads, by project
+  const counterReloadTimers = useRef({})
+
+  // Patch projects in place from realtime deltas instead of reloading the list.
+  // Deltas carry no task counters (they are broadcast to everyone who can read
+  // the project), so counters are reloaded with this user's own permissions.
+  const projectNamesKey = projects.map(project => project.id || project.name).sort().join('\n')
+  useEffect(() => {
+    if (!projectNamesKey) return undefined
+
+    const reloadCounters = (projectName) => {
+      clearTimeout(counterReloadTimers.current[projectName])
+      counterReloadTimers.current[projectName] = setTimeout(async () => {
+        delete counterReloadTimers.current[projectName]
+        const response = await getProjectDetails(projectName)
+        if (response?.success && response.project) {
+          setProjects(prev => applyProjectCounters(prev, response.project))
+        }
+      }, COUNTER_RELOAD_DELAY_MS)
+    }
+
+    const unsubscribe = subscribeDashboardDeltas(projectNamesKey.split('\n'), (delta) => {
+      setProjects(prev => applyProjectDelta(prev, delta))
+      if (delta.counters_changed && delta.project) {
+        reloadCounters(delta.project)
+      }
+    })
+
+    return () => {
+      unsubscribe()
+      Object.values(counterReloadTimers.current).forEach(clearTimeout)
+      counterReloadTimers.current = {}
+    }
+  }, [projectNamesKey])
+
   const fetchProjects = async () => {
     try {
       setLoading(true)
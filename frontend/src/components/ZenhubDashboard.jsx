@@ -148,10 +148,13 @@ const ZenhubDashboard = () => {
     setActiveLevel('project')
     try {
       // Fetch children of the Project Issue -> these are our Epics
-      const response = await zenhubService.getIssuesByEpic(projectId)
-      if (response.success) {
+      const response = await zenhubService.getIssuesByEpics([projectId])
+      const issues = response.issues_by_epic?.[projectId]
+      if (issues) {
         // In Project view, current context is the list of child Epics
-        setCurrentIssues(response.issues || [])
+        setCurrentIssues(issues)
+      } else {
+        setError(response.errors?.[projectId] || response.error || 'Error loading project epics')
       }
     } catch (err) {
       console.error(err)
@@ -166,10 +169,13 @@ const ZenhubDashboard = () => {
     setLoadingText('Gathering Epic Tasks...')
     setActiveLevel('epic')
     try {
-      const response = await zenhubService.getIssuesByEpic(epicId)
-      if (response.success) {
+      const response = await zenhubService.getIssuesByEpics([epicId])
+      const issues = response.issues_by_epic?.[epicId]
+      if (issues) {
         // In Epic view, current context is the list of child Tasks
-        setCurrentIssues(response.issues || [])
+        setCurrentIssues(issues)
+      } else {
+        setError(response.errors?.[epicId] || response.error || 'Error loading epic tasks')
       }
     } catch (err) {
       console.error(err)
@@ -126,14 +126,15 @@ export function useZenhubData() {
     setError(null)
 
     try {
-      const response = await zenhubService.getIssuesByEpic(projectId)
+      const response = await zenhubService.getIssuesByEpics([projectId])
+      const issues = response.issues_by_epic?.[projectId]
 
-      if (response.success) {
-        setCurrentIssues(response.issues || [])
+      if (issues) {
+        setCurrentIssues(issues)
         setSelectedProject(projectId)
         setSelectedEpic(null)
       } else {
-        setError('Failed to load project epics')
+        setError(response.errors?.[projectId] || response.error || 'Failed to load project epics')
       }
     } catch (err) {
       console.error('[useZenhubData] Error loading project:', err)
@@ -154,13 +155,14 @@ export function useZenhubData() {
     setError(null)
 
     try {
-      const response = await zenhubService.getIssuesByEpic(epicId)
+      const response = await zenhubService.getIssuesByEpics([epicId])
+      const issues = response.issues_by_epic?.[epicId]
 
-      if (response.success) {
-        setCurrentIssues(response.issues || [])
+      if (issues) {
+        setCurrentIssues(issues)
         setSelectedEpic(epicId)
       } else {
-        setError('Failed to load epic tasks')
+        setError(response.errors?.[epicId] || response.error || 'Failed to load epic tasks')
       }
     } catch (err) {
       console.error('[useZenhubData] Error loading epic:', err)
@@ -303,6 +303,22 @@ class ZenhubService {
       return response.data
     })
   }
+
+  /**
+   * Get Issues for several Epics in one batched request
+   * @param {string[]} epicIds - Zenhub Issue IDs of the Epics
+   * @returns {Promise<{success: boolean, issues_by_epic: Object, errors: Object}>}
+   */
+  async getIssuesByEpics(epicIds) {
+    if (!epicIds || epicIds.length === 0) return { success: true, issues_by_epic: {}, errors: {} }
+    const client = await this.initClient()
+    return withRetry(async () => {
+      const response = await client.post('/api/method/frappe_devsecops_dashboard.api.zenhub.get_issues_by_epics', {
+        zenhub_issue_ids: epicIds
+      })
+      return response.data
+    })
+  }
 }
 
 export default new ZenhubService()
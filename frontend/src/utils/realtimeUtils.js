@@ -0,0 +1,154 @@
+/**
+ * Realtime (socket.io) utilities for the DevSecOps Dashboard
+ * Subscribes to the compact deltas published by doc_hooks/dashboard_realtime.py
+ * and patches dashboard state in place instead of reloading it
+ */
+
+// Event published by the backend for every dashboard-relevant change
+export const DASHBOARD_DELTA_EVENT = 'devsecops_dashboard_delta'
+
+// Project fields a delta can change -> keys of the get_dashboard_data project payload
+const PROJECT_DELTA_FIELDS = {
+  status: ['status', 'project_status'],
+  percent_complete: ['percent_complete'],
+  priority: ['priority'],
+  expected_end_date: ['expected_end_date'],
+  project_name: ['project_name']
+}
+
+// Task counters of a project, reloaded after task deltas
+export const PROJECT_COUNTER_FIELDS = [
+  'task_count',
+  'total_tasks',
+  'completed_tasks',
+  'progress',
+  'completion_rate',
+  'current_phase',
+  'currentPhase',
+  'delivery_phases',
+  'deliveryPhases'
+]
+
+let socketPromise = null
+
+/**
+ * Base URL of the Frappe socket.io server
+ * Behind nginx it shares the page origin; under `bench start` it has its own port
+ * @returns {string} Realtime server URL
+ */
+const getRealtimeHost = () => {
+  const { protocol, hostname, origin } = window.location
+  return window.socketio_port ? `${protocol}//${hostname}:${window.socketio_port}` : origin
+}
+
+/**
+ * Load the socket.io client served by the Frappe realtime server
+ * @returns {Promise<Function>} The global io() factory
+ */
+const loadSocketIoClient = () => new Promise((resolve, reject) => {
+  if (window.io) {
+    resolve(window.io)
+    return
+  }
+
+  const script = document.createElement('script')
+  script.src = `${getRealtimeHost()}/socket.io/socket.io.js`
+  script.async = true
+  script.onload = () => (window.io ? resolve(window.io) : reject(new Error('socket.io client not available')))
+  script.onerror = () => reject(new Error('Failed to load socket.io client'))
+  document.head.appendChild(script)
+})
+
+/**
+ * Get the shared socket for this site, connecting on first use
+ * @returns {Promise<Object|null>} Connected socket, or null when realtime is unavailable
+ */
+export const getRealtimeSocket = () => {
+  if (!socketPromise) {
+    socketPromise = loadSocketIoClient()
+      .then((io) => io(`${getRealtimeHost()}/${window.site_name || window.location.hostname}`, {
+        withCredentials: true,
+        reconnectionAttempts: 3
+      }))
+      .catch((error) => {
+        console.warn('[realtime] Live dashboard updates unavailable:', error.message)
+        return null
+      })
+  }
+  return socketPromise
+}
+
+/**
+ * Receive dashboard deltas for the given projects
+ * Joining a project's document room requires read permission on that Project
+ * @param {string[]} projectNames - Names of the projects shown
+ * @param {Function} onDelta - Called with each delta ({doctype, name, action, project, counters_changed}; Project deltas add changes)
+ * @returns {Function} Unsubscribe function
+ */
+export const subscribeDashboardDeltas = (projectNames, onDelta) => {
+  let active = true
+  let socket = null
+
+  // Rooms are left on reconnect, so join them again on every connect
+  const joinRooms = () => projectNames.forEach((name) => socket.emit('doc_subscribe', 'Project', name))
+
+  getRealtimeSocket().then((connected) => {
+    if (!active || !connected) return
+    socket = connected
+    socket.on('connect', joinRooms)
+    socket.on(DASHBOARD_DELTA_EVENT, onDelta)
+    if (socket.connected) joinRooms()
+  })
+
+  return () => {
+    active = false
+    if (!socket) return
+    socket.off('connect', joinRooms)
+    socket.off(DASHBOARD_DELTA_EVENT, onDelta)
+    projectNames.forEach((name) => socket.emit('doc_unsubscribe', 'Project', name))
+  }
+}
+
+/**
+ * Apply a delta to a list of dashboard projects
+ * Project deltas patch the project's own fields; a deleted project is removed.
+ * Other doctypes leave the list unchanged (their counters are reloaded separately).
+ * @param {Object[]} projects - Projects as returned by get_dashboard_data
+ * @param {Object} delta - Delta published by the backend
+ * @returns {Object[]} Patched projects (the same array when nothing changed)
+ */
+export const applyProjectDelta = (projects, delta) => {
+  if (delta.doctype !== 'Project') return projects
+
+  const projectId = (project) => project.id || project.name
+
+  if (delta.action === 'delete') {
+    return projects.filter((project) => projectId(project) !== delta.name)
+  }
+
+  return projects.map((project) => {
+    if (projectId(project) !== delta.name) return project
+
+    const patched = { ...project, modified: delta.modified || project.modified }
+    Object.entries(delta.changes || {}).forEach(([field, value]) => {
+      (PROJECT_DELTA_FIELDS[field] || []).forEach((key) => { patched[key] = value })
+    })
+    return patched
+  })
+}
+
+/**
+ * Copy reloaded task counters onto a project
+ * @param {Object[]} projects - Projects as returned by get_dashboard_data
+ * @param {Object} details - Project as returned by get_project_details
+ * @returns {Object[]} Patched projects
+ */
+export const applyProjectCounters = (projects, details) => projects.map((project) => {
+  if ((project.id || project.name) !== details.name) return project
+
+  const patched = { ...project }
+  PROJECT_COUNTER_FIELDS.forEach((field) => {
+    if (details[field] !== undefined) patched[field] = details[field]
+  })
+  return patched
+})